@@ -0,0 +1,30 @@
+"""Add trigram index on organization alias names
+
+Revision ID: 20260210_001
+Revises: 20260205_001
+Create Date: 2026-02-10 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20260210_001"
+down_revision: str | None = "20260205_001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_organization_aliases_alias_trgm
+        ON connect_pos.organization_aliases USING gin (alias gin_trgm_ops)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS connect_pos.ix_organization_aliases_alias_trgm")
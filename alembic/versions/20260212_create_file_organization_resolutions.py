@@ -0,0 +1,52 @@
+"""Create file_organization_resolutions table
+
+Revision ID: 20260212_001
+Revises: 20260210_001
+Create Date: 2026-02-12 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "20260212_001"
+down_revision: str | None = "20260210_001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "file_organization_resolutions",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("exchange_file_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("column_name", sa.String(100), nullable=False),
+        sa.Column("organization_name", sa.String(255), nullable=False),
+        sa.Column("connected_org_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "created_at",
+            postgresql.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(
+            ["exchange_file_id"],
+            ["connect_pos.exchange_files.id"],
+            ondelete="CASCADE",
+        ),
+        sa.UniqueConstraint(
+            "exchange_file_id",
+            "column_name",
+            "organization_name",
+            name="uq_file_organization_resolutions_file_column_name",
+        ),
+        schema="connect_pos",
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("file_organization_resolutions", schema="connect_pos")
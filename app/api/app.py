@@ -1,22 +1,24 @@
 import contextlib
 import os
 import time
+from datetime import timedelta
 from typing import Any
 from urllib.parse import urlparse, urlunparse
 
 from aioinject.ext.fastapi import AioInjectMiddleware
+from commons.db.controller import MultiTenantController
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from loguru import logger
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import configure_mappers
-from sqlalchemy.pool import NullPool
 
 from app.core.config.base_settings import get_settings
 from app.core.config.settings import Settings
 from app.core.config.workos_settings import WorkOSSettings
 from app.core.container import create_container
+from app.core.db.engine_factory import create_pooled_engine, pool_metrics
 from app.graphql.app import create_graphql_app
 from app.tenant_provisioning.database_service import DatabaseCreationService
 from app.tenant_provisioning.migration_service import MigrationService
@@ -25,6 +27,8 @@ from app.tenant_provisioning.service import (
     ProvisioningResult,
     TenantProvisioningService,
 )
+from app.webhooks.workos.event_store import WebhookEventStore
+from app.webhooks.workos.processor import WebhookEventProcessor
 from app.webhooks.workos.router import create_workos_webhook_router
 
 
@@ -38,6 +42,7 @@ class SessionScopedProvisioningService:
     db_host: str
     db_ro_host: str
     db_username: str
+    template_database: str | None
 
     def __init__(
         self,
@@ -48,6 +53,7 @@ class SessionScopedProvisioningService:
         db_host: str,
         db_ro_host: str,
         db_username: str,
+        template_database: str | None = None,
     ) -> None:
         self.session_factory = session_factory
         self.database_service = database_service
@@ -56,6 +62,7 @@ class SessionScopedProvisioningService:
         self.db_host = db_host
         self.db_ro_host = db_ro_host
         self.db_username = db_username
+        self.template_database = template_database
 
     async def provision(self, org_id: str, org_name: str) -> ProvisioningResult:
         async with self.session_factory() as session:
@@ -69,6 +76,7 @@ class SessionScopedProvisioningService:
                     db_host=self.db_host,
                     db_ro_host=self.db_ro_host,
                     db_username=self.db_username,
+                    template_database=self.template_database,
                 )
                 return await service.provision(org_id, org_name)
 
@@ -80,11 +88,7 @@ def create_app() -> FastAPI:
 
     # Create public schema engine for tenant provisioning
     pg_url = settings.pg_url.unicode_string()
-    public_engine = create_async_engine(
-        pg_url,
-        poolclass=NullPool,
-        echo=settings.log_level == "DEBUG",
-    )
+    public_engine = create_pooled_engine("public", pg_url, settings)
     public_session_factory = async_sessionmaker(
         bind=public_engine,
         class_=AsyncSession,
@@ -117,15 +121,32 @@ def create_app() -> FastAPI:
         db_host=db_host,
         db_ro_host=db_ro_host,
         db_username=db_username,
+        template_database=settings.tenant_template_database or None,
+    )
+    event_processor = WebhookEventProcessor(
+        store=WebhookEventStore(
+            public_session_factory,
+            stale_after=timedelta(seconds=settings.webhook_event_stale_seconds),
+        ),
+        provisioning_service=provisioning_service,  # pyright: ignore[reportArgumentType]
+        poll_interval_seconds=settings.webhook_poll_interval_seconds,
+        max_attempts=settings.webhook_event_max_attempts,
     )
 
     @contextlib.asynccontextmanager
     async def lifespan(_app: FastAPI):
         configure_mappers()
         async with container:
+            # Builds the tenant controller and warms its engines before serving
+            async with container.context() as ctx:
+                _ = await ctx.resolve(MultiTenantController)
+            if workos_settings.workos_webhook_secret:
+                await WebhookEventStore.create_table(public_engine)
+                event_processor.start()
             try:
                 yield
             finally:
+                await event_processor.stop()
                 await public_engine.dispose()
                 logger.info("Application shutdown")
 
@@ -144,7 +165,7 @@ def create_app() -> FastAPI:
     if workos_settings.workos_webhook_secret:
         webhook_router = create_workos_webhook_router(
             workos_settings.workos_webhook_secret,
-            provisioning_service=provisioning_service,  # pyright: ignore[reportArgumentType]
+            event_processor=event_processor,
         )
         app.include_router(webhook_router)
         logger.info("WorkOS webhook router registered")
@@ -186,4 +207,8 @@ def create_app() -> FastAPI:
     def health_check():  # pyright: ignore[reportUnusedFunction]
         return {"status": "ok"}
 
+    @app.get("/api/health/db-pools", include_in_schema=False)
+    def db_pool_metrics():  # pyright: ignore[reportUnusedFunction]
+        return pool_metrics()
+
     return app
@@ -1,4 +1,5 @@
 import functools
+from pathlib import Path
 from typing import TypeVar
 
 import dotenv
@@ -6,12 +7,27 @@ from pydantic_settings import BaseSettings
 
 TSettings = TypeVar("TSettings", bound=BaseSettings)
 
+_PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+ENV_FILES = (".env", ".env.local", ".env.dev")
+
 
 @functools.cache
 def load_dotenv_once(dotenv_path: str | None = None) -> None:
     _ = dotenv.load_dotenv(dotenv_path or ".env.dev")
 
 
+@functools.cache
+def load_env_files() -> None:
+    """Load the project's env files into os.environ, without overriding it.
+
+    pydantic-settings reads these files but doesn't set os.environ, so code
+    that checks a variable at import time (such as ORGS_DB_URL) calls this
+    first. Paths are absolute to handle different working directories.
+    """
+    for env_file in ENV_FILES:
+        _ = dotenv.load_dotenv(_PROJECT_ROOT / env_file, override=False)
+
+
 def get_settings(cls: type[TSettings]) -> TSettings:
     load_dotenv_once()
     return cls()
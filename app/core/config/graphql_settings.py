@@ -0,0 +1,22 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class GraphQLSettings(BaseSettings):
+    graphql_document_cache_size: int = 512
+    graphql_persisted_queries_cache_size: int = 1024
+    # JSON object of sha256 hash -> query text for the operations the frontend ships
+    graphql_persisted_queries_manifest: str = ""
+    # Reject any operation that is not listed in the manifest
+    graphql_persisted_queries_only: bool = False
+
+    graphql_max_query_cost: int = 5000
+    # Assumed size of list fields that take no limit argument
+    graphql_default_list_size: int = 20
+    # Cost an organization may spend per minute; 0 disables throttling
+    graphql_org_cost_per_minute: int = 0
+
+    model_config = SettingsConfigDict(
+        env_file_encoding="utf-8",
+        extra="ignore",
+        env_file=(".env", ".env.local", ".env.staging", ".env.production"),
+    )
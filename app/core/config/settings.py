@@ -8,6 +8,62 @@ class Settings(BaseSettings):
     environment: str
     orgs_db_url: PostgresDsn | None = None
 
+    # Route query operations to the tenant's read replica when it is fresh enough
+    replica_routing_enabled: bool = False
+    replica_max_lag_seconds: float = 5.0
+    replica_lag_check_interval_seconds: float = 10.0
+
+    # Connection pools for the orgs, public and replica engines
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
+    # PgBouncer in transaction mode cannot keep prepared statements per connection
+    db_pgbouncer_mode: bool = False
+
+    # Tenant engines are created on first use and evicted once idle or over budget
+    tenant_pool_size: int = 2
+    tenant_max_overflow: int = 3
+    tenant_engine_idle_seconds: float = 900.0
+    tenant_max_connections_per_worker: int = 100
+    # Tenant urls to connect at startup, e.g. TENANT_WARMUP='["app", "acme"]'
+    tenant_warmup: list[str] = []
+
+    # Per-worker cache of each org's connections; the TTL bounds staleness
+    # for writes made by other workers or services
+    connection_graph_max_orgs: int = 10000
+    connection_graph_ttl_seconds: float = 30.0
+
+    # Per-worker field map snapshots; saves elsewhere are picked up within the TTL
+    field_map_cache_max_entries: int = 2048
+    field_map_cache_ttl_seconds: float = 60.0
+
+    # Per-worker dashboard glance numbers; writes on other workers show within the TTL
+    dashboard_glance_cache_max_entries: int = 10000
+    dashboard_glance_cache_ttl_seconds: float = 15.0
+
+    # Exchange files uploaded straight to object storage through presigned POSTs
+    exchange_upload_url_ttl_seconds: int = 900
+    exchange_upload_max_bytes: int = 200 * 1024 * 1024
+
+    # Resumable exchange file uploads backed by S3 multipart uploads
+    exchange_upload_part_max_bytes: int = 64 * 1024 * 1024
+    exchange_upload_digest_max_entries: int = 256
+
+    # Tenant databases run_migrations.py migrates at once on each database host
+    migration_concurrency_per_host: int = 4
+
+    # New tenant databases are copied from this template, kept at head by
+    # run_migrations.py; empty to migrate every new database from scratch
+    tenant_template_database: str = "flow_connect_tenant_template"
+
+    # WorkOS webhook events are stored and acknowledged, then processed in the
+    # background; claims older than the stale timeout are picked up again
+    webhook_poll_interval_seconds: float = 5.0
+    webhook_event_max_attempts: int = 5
+    webhook_event_stale_seconds: float = 1800.0
+
     log_level: str = "INFO"
 
     @property
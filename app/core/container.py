@@ -7,6 +7,12 @@ from app.core.providers import providers
 
 @functools.cache
 def create_container() -> aioinject.Container:
+    """The process's one container.
+
+    The app, the GraphQL schema and background tasks all resolve from it, so
+    singletons such as the S3 client pool and the dashboard glance cache are
+    shared by all of them and closed once, by the app's lifespan.
+    """
     container = aioinject.Container()
     for provider in providers():
         container.register(provider)
@@ -20,6 +20,8 @@ class Context(BaseContext):
         super().__init__()
         self.auth_info: AuthInfo = None  # pyright: ignore[reportAttributeAccessIssue]
         self.aioinject_context: Any = None
+        # Set once the operation type is known; queries run read-only transactions
+        self.read_only: bool = False
 
     def initialize(self, context: ContextModel) -> None:
         self.auth_info = context.auth_info
@@ -5,23 +5,73 @@ from typing import Any
 import aioinject
 from commons.auth import AuthInfo
 from commons.db.controller import MultiTenantController
+from sqlalchemy import Connection, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
 
 from app.core.config.settings import Settings
+from app.core.context_wrapper import ContextWrapper
+from app.core.db.lazy_controller import LazyMultiTenantController
+from app.core.db.replica_router import (
+    TenantReplicaRouter,
+    create_tenant_replica_router,
+)
 from app.core.db.transient_session import TenantSession, TransientSession
 from app.errors.common_errors import TenantNotFoundError
 
 TENANT_NOT_FOUND_PATTERN = "not found"
 
 
+def _set_transaction_read_only(
+    _session: Session, _transaction: SessionTransaction, connection: Connection
+) -> None:
+    _ = connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+
+def _open_session(
+    controller: MultiTenantController,
+    tenant_name: str,
+    replica: AsyncEngine | None,
+) -> contextlib.AbstractAsyncContextManager[AsyncSession]:
+    if replica is None:
+        return controller.scoped_session(tenant_name)
+    return TenantSession(bind=replica, expire_on_commit=False)
+
+
 @contextlib.asynccontextmanager
 async def create_session(
     controller: MultiTenantController,
     auth_info: AuthInfo,
+    context_wrapper: ContextWrapper,
+    replica_router: TenantReplicaRouter,
 ) -> AsyncIterator[TenantSession]:
+    # The session only checks out a connection on its first statement, so
+    # operations that never touch the tenant DB never hold a pooled connection.
+    read_only = context_wrapper.get().read_only
+    replica_engine = (
+        replica_router.engine_for(auth_info.tenant_name)
+        if read_only
+        else contextlib.nullcontext()
+    )
     try:
-        async with controller.scoped_session(auth_info.tenant_name) as session:
-            async with session.begin():
-                yield session  # pyright: ignore[reportReturnType]
+        async with (
+            replica_engine as replica,
+            _open_session(controller, auth_info.tenant_name, replica) as session,
+        ):
+            if read_only:
+                event.listen(
+                    session.sync_session, "after_begin", _set_transaction_read_only
+                )
+            try:
+                async with session.begin():
+                    yield session  # pyright: ignore[reportReturnType]
+            finally:
+                if read_only:
+                    event.remove(
+                        session.sync_session,
+                        "after_begin",
+                        _set_transaction_read_only,
+                    )
     except Exception as e:
         if TENANT_NOT_FOUND_PATTERN in str(e):
             raise TenantNotFoundError(str(e)) from e
@@ -43,8 +93,13 @@ async def create_transient_session(
         raise
 
 
-async def create_multitenant_controller(settings: Settings) -> MultiTenantController:
-    controller = MultiTenantController(
+@contextlib.asynccontextmanager
+async def create_multitenant_controller(
+    settings: Settings,
+) -> AsyncIterator[MultiTenantController]:
+    # Tenant engines are created on demand instead of load_data_sources()
+    controller = LazyMultiTenantController(
+        settings=settings,
         pg_url=settings.pg_url.unicode_string(),
         app_name="Flow Connect App",
         echo=settings.log_level == "DEBUG",
@@ -54,29 +109,16 @@ async def create_multitenant_controller(settings: Settings) -> MultiTenantContro
         },
         env=settings.environment,
     )
-    await controller.load_data_sources()
-    return controller
-
-
-async def create_multitenant_for_migration_controller(
-    pg_url: str, env: str
-) -> MultiTenantController:
-    controller = MultiTenantController(
-        pg_url=pg_url,
-        app_name="Flow Connect (Migration)",
-        echo=True,
-        connect_args={
-            "timeout": 5,
-            "command_timeout": 90,
-        },
-        env=env,
-    )
-    await controller.load_data_sources()
-    return controller
+    await controller.warm_up(settings.tenant_warmup)
+    try:
+        yield controller
+    finally:
+        await controller.dispose_tenant_engines()
 
 
 providers: Iterable[aioinject.Provider[Any]] = [
     aioinject.Singleton(create_multitenant_controller),
+    aioinject.Singleton(create_tenant_replica_router),
     aioinject.Scoped(create_session),
     aioinject.Transient(create_transient_session),
 ]
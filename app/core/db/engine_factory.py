@@ -0,0 +1,73 @@
+import uuid
+from typing import Any
+
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import QueuePool
+
+from app.core.config.settings import Settings
+
+# Engines created here, by name, so their pools can be reported
+_pooled_engines: dict[str, AsyncEngine] = {}
+
+
+def create_pooled_engine(
+    name: str,
+    url: str | URL,
+    settings: Settings,
+    connect_args: dict[str, Any] | None = None,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+) -> AsyncEngine:
+    connect_args = dict(connect_args or {})
+    if settings.db_pgbouncer_mode:
+        # asyncpg caches prepared statements per connection, which breaks once
+        # PgBouncer hands the server connection to another client
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = lambda: (
+            f"__asyncpg_{uuid.uuid4()}__"
+        )
+
+    engine = create_async_engine(
+        url,
+        pool_size=pool_size if pool_size is not None else settings.db_pool_size,
+        max_overflow=(
+            max_overflow if max_overflow is not None else settings.db_max_overflow
+        ),
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        echo=settings.log_level == "DEBUG",
+        connect_args=connect_args,
+    )
+    _pooled_engines[name] = engine
+    return engine
+
+
+async def dispose_pooled_engine(name: str) -> None:
+    engine = _pooled_engines.pop(name, None)
+    if engine is not None:
+        await engine.dispose()
+
+
+def pool_metrics() -> dict[str, dict[str, int]]:
+    """Pool usage summed per kind of engine, e.g. "tenant" or "replica".
+
+    Engine names carry tenant names, so only the part before ":" is reported.
+    """
+    metrics: dict[str, dict[str, int]] = {}
+    for name, engine in _pooled_engines.items():
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            continue
+        totals = metrics.setdefault(
+            name.split(":", 1)[0],
+            {"engines": 0, "size": 0, "checked_in": 0, "checked_out": 0, "overflow": 0},
+        )
+        totals["engines"] += 1
+        totals["size"] += pool.size()
+        totals["checked_in"] += pool.checkedin()
+        totals["checked_out"] += pool.checkedout()
+        totals["overflow"] += pool.overflow()
+    return metrics
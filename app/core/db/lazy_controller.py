@@ -0,0 +1,173 @@
+import asyncio
+import contextlib
+import time
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from functools import partial
+from typing import Any, override
+
+from commons.db.controller import MultiTenantController
+from commons.db.models.tenant import Tenant
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.config.settings import Settings
+from app.core.db.engine_factory import create_pooled_engine, dispose_pooled_engine
+from app.core.db.tenant_url import tenant_database_url
+from app.core.db.transient_session import TenantSession, TransientSession
+
+IDLE_SWEEP_INTERVAL_SECONDS = 60.0
+
+EngineFactory = Callable[[], Awaitable[AsyncEngine]]
+
+
+class LazyMultiTenantController(MultiTenantController):
+    """MultiTenantController that builds tenant engines on first use.
+
+    Replaces `load_data_sources()`, which opened an engine for every tenant in
+    every worker. Engines are kept in LRU order; ones idle for longer than
+    `tenant_engine_idle_seconds` are disposed, and the least recently used are
+    evicted so the pools of all live engines fit in
+    `tenant_max_connections_per_worker`. Engines with open sessions are never
+    evicted. Other per-tenant engines, such as read replicas, join the same
+    budget through `use_engine`.
+
+    Like `load_data_sources()`, only tenants marked `initialize` get an
+    engine; see `tenant_database_url` for how their URL is derived.
+    """
+
+    def __init__(self, *, settings: Settings, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.settings = settings
+        self._pg_url = make_url(settings.pg_url.unicode_string())
+        self._connect_args: dict[str, Any] = dict(kwargs.get("connect_args") or {})
+        self._app_name: str = kwargs.get("app_name", "")
+        self._engines: OrderedDict[str, AsyncEngine] = OrderedDict()
+        self._last_used: dict[str, float] = {}
+        self._in_use: Counter[str] = Counter()
+        self._lock = asyncio.Lock()
+        self._last_sweep = time.monotonic()
+
+    @property
+    def max_engines(self) -> int:
+        per_engine = self.settings.tenant_pool_size + self.settings.tenant_max_overflow
+        return max(self.settings.tenant_max_connections_per_worker // per_engine, 1)
+
+    @override
+    @contextlib.asynccontextmanager
+    async def scoped_session(self, tenant: str) -> AsyncIterator[AsyncSession]:
+        async with self._session(tenant, TenantSession) as session:
+            yield session
+
+    @override
+    @contextlib.asynccontextmanager
+    async def transient_session(self, tenant: str) -> AsyncIterator[AsyncSession]:
+        async with self._session(tenant, TransientSession) as session:
+            yield session
+
+    async def warm_up(self, tenants: Iterable[str]) -> None:
+        for tenant in tenants:
+            try:
+                create = partial(self._create_engine, tenant)
+                async with (
+                    self.use_engine(f"tenant:{tenant}", create) as engine,
+                    engine.connect(),
+                ):
+                    pass
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"Warm-up failed for tenant {tenant}: {e}")
+
+    async def dispose_tenant_engines(self) -> None:
+        for name in list(self._engines):
+            await self._dispose(name)
+
+    @contextlib.asynccontextmanager
+    async def use_engine(
+        self, name: str, create: EngineFactory
+    ) -> AsyncIterator[AsyncEngine]:
+        """The pooled engine `name`, created by `create` within the budget.
+
+        `create` must build the engine with `create_pooled_engine(name, ...)`
+        and the tenant pool size. The engine is not evicted inside the block.
+        """
+        engine = await self._engine(name, create)
+        self._in_use[name] += 1
+        try:
+            yield engine
+        finally:
+            self._in_use[name] -= 1
+            self._last_used[name] = time.monotonic()
+
+    @contextlib.asynccontextmanager
+    async def _session(
+        self, tenant: str, session_class: type[AsyncSession]
+    ) -> AsyncIterator[AsyncSession]:
+        create = partial(self._create_engine, tenant)
+        async with (
+            self.use_engine(f"tenant:{tenant}", create) as engine,
+            session_class(bind=engine, expire_on_commit=False) as session,
+        ):
+            yield session
+
+    async def _engine(self, name: str, create: EngineFactory) -> AsyncEngine:
+        engine = self._engines.get(name)
+        now = time.monotonic()
+        if engine is None or now - self._last_sweep > IDLE_SWEEP_INTERVAL_SECONDS:
+            async with self._lock:
+                await self._evict(reserve=0 if name in self._engines else 1)
+                engine = self._engines.get(name)
+                if engine is None:
+                    engine = await create()
+                    self._engines[name] = engine
+        self._engines.move_to_end(name)
+        self._last_used[name] = now
+        return engine
+
+    async def _create_engine(self, tenant: str) -> AsyncEngine:
+        async with self.base_scoped_session() as session:
+            result = await session.execute(
+                select(Tenant.database, Tenant.username).where(
+                    Tenant.url == tenant,
+                    Tenant.initialize.is_(True),
+                )
+            )
+            row = result.one_or_none()
+        if row is None:
+            raise LookupError(f"Tenant {tenant} not found")
+
+        url = tenant_database_url(
+            self._pg_url, tenant, host=row.database, username=row.username
+        )
+        logger.info(f"Creating engine for tenant {tenant}")
+        return create_pooled_engine(
+            f"tenant:{tenant}",
+            url,
+            self.settings,
+            connect_args={
+                **self._connect_args,
+                "server_settings": {"application_name": self._app_name},
+            },
+            pool_size=self.settings.tenant_pool_size,
+            max_overflow=self.settings.tenant_max_overflow,
+        )
+
+    async def _evict(self, reserve: int) -> None:
+        now = time.monotonic()
+        self._last_sweep = now
+        # Iterates least recently used first
+        for name in list(self._engines):
+            if self._in_use[name]:
+                continue
+            idle = now - self._last_used.get(name, now)
+            over_budget = len(self._engines) + reserve > self.max_engines
+            if over_budget or idle > self.settings.tenant_engine_idle_seconds:
+                await self._dispose(name)
+
+    async def _dispose(self, name: str) -> None:
+        _ = self._engines.pop(name, None)
+        _ = self._last_used.pop(name, None)
+        _ = self._in_use.pop(name, None)
+        await dispose_pooled_engine(name)
+        logger.info(f"Disposed engine {name}")
@@ -1,26 +1,21 @@
 import contextlib
 import os
 from collections.abc import AsyncIterator, Iterable
-from pathlib import Path
 from typing import Any
 
 import aioinject
-import dotenv
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
-    create_async_engine,
 )
-from sqlalchemy.pool import NullPool
 
+from app.core.config.base_settings import load_env_files
 from app.core.config.settings import Settings
+from app.core.db.engine_factory import create_pooled_engine
 
 # Load environment files before checking ORGS_DB_URL
-# Use absolute paths to handle different working directories
-_project_root = Path(__file__).parent.parent.parent.parent
-for env_file in [".env", ".env.local", ".env.dev"]:
-    dotenv.load_dotenv(_project_root / env_file, override=False)
+load_env_files()
 
 
 class OrgsDbEngine:
@@ -38,13 +33,17 @@ class OrgsDbEngine:
             yield session
 
 
-def create_orgs_db_engine(settings: Settings) -> OrgsDbEngine:
-    engine = create_async_engine(
+@contextlib.asynccontextmanager
+async def create_orgs_db_engine(settings: Settings) -> AsyncIterator[OrgsDbEngine]:
+    engine = create_pooled_engine(
+        "orgs",
         settings.orgs_db_url.unicode_string(),  # pyright: ignore[reportOptionalMemberAccess]
-        poolclass=NullPool,
-        echo=settings.log_level == "DEBUG",
+        settings,
     )
-    return OrgsDbEngine(engine)
+    try:
+        yield OrgsDbEngine(engine)
+    finally:
+        await engine.dispose()
 
 
 @contextlib.asynccontextmanager
@@ -0,0 +1,152 @@
+import contextlib
+import time
+from collections.abc import AsyncIterator
+from functools import partial
+
+from commons.db.controller import MultiTenantController
+from commons.db.models.tenant import Tenant
+from loguru import logger
+from sqlalchemy import URL, select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config.settings import Settings
+from app.core.db.engine_factory import create_pooled_engine
+from app.core.db.lazy_controller import LazyMultiTenantController
+from app.core.db.tenant_url import tenant_database_url
+
+# How long a tenant found without a replica keeps going to the primary before
+# its record is read again
+MISSING_REPLICA_RECHECK_SECONDS = 300.0
+
+# Zero when the replica has replayed everything it received, so an idle
+# primary does not make the replica look stale
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+
+
+class TenantReplicaRouter:
+    """Hands out read-replica engines for tenants whose replica is fresh enough.
+
+    Replica hosts come from `Tenant.read_only_database`, reached with the same
+    role as the primary; tenants without one are looked up again every
+    `MISSING_REPLICA_RECHECK_SECONDS`. Lag is probed at most
+    once per check interval; a replica that lags too far or cannot be reached
+    routes to the primary until the next probe. Replica engines live in the
+    controller's engine budget, so they are evicted like tenant engines.
+    """
+
+    def __init__(
+        self, controller: LazyMultiTenantController, settings: Settings
+    ) -> None:
+        self.controller = controller
+        self.settings = settings
+        self._pg_url = make_url(settings.pg_url.unicode_string())
+        # tenant -> (looked_up_at, url)
+        self._urls: dict[str, tuple[float, URL | None]] = {}
+        # tenant -> (checked_at, usable)
+        self._health: dict[str, tuple[float, bool]] = {}
+
+    @contextlib.asynccontextmanager
+    async def engine_for(self, tenant_name: str) -> AsyncIterator[AsyncEngine | None]:
+        """The tenant's replica engine, held for the block, or None for the primary."""
+        url = None
+        if self.settings.replica_routing_enabled:
+            url = await self._cached_replica_url(tenant_name)
+        if url is None:
+            yield None
+            return
+
+        name = f"replica:{tenant_name}"
+        create = partial(self._create_engine, name, url)
+        async with self.controller.use_engine(name, create) as engine:
+            yield engine if await self._is_fresh(tenant_name, engine) else None
+
+    async def _cached_replica_url(self, tenant_name: str) -> URL | None:
+        now = time.monotonic()
+        cached = self._urls.get(tenant_name)
+        if cached is not None:
+            looked_up_at, url = cached
+            if url is not None or now - looked_up_at < MISSING_REPLICA_RECHECK_SECONDS:
+                return url
+
+        url = await self._replica_url(tenant_name)
+        self._urls[tenant_name] = (now, url)
+        return url
+
+    async def _replica_url(self, tenant_name: str) -> URL | None:
+        async with self.controller.base_scoped_session() as session:
+            result = await session.execute(
+                select(
+                    Tenant.database, Tenant.read_only_database, Tenant.username
+                ).where(
+                    Tenant.url == tenant_name,
+                    Tenant.initialize.is_(True),
+                )
+            )
+            row = result.one_or_none()
+        if row is None or not row.read_only_database:
+            return None
+        if row.read_only_database == row.database:
+            return None
+        return tenant_database_url(
+            self._pg_url,
+            tenant_name,
+            host=row.read_only_database,
+            username=row.username,
+        )
+
+    async def _create_engine(self, name: str, url: URL) -> AsyncEngine:
+        return create_pooled_engine(
+            name,
+            url,
+            self.settings,
+            connect_args={
+                "timeout": 5,
+                "command_timeout": 90,
+            },
+            pool_size=self.settings.tenant_pool_size,
+            max_overflow=self.settings.tenant_max_overflow,
+        )
+
+    async def _is_fresh(self, tenant_name: str, engine: AsyncEngine) -> bool:
+        now = time.monotonic()
+        checked_at, usable = self._health.get(tenant_name, (0.0, False))
+        if now - checked_at < self.settings.replica_lag_check_interval_seconds:
+            return usable
+
+        # Claim the probe before awaiting so concurrent requests reuse the old verdict
+        self._health[tenant_name] = (now, usable)
+        try:
+            async with engine.connect() as connection:
+                lag = float((await connection.execute(REPLICA_LAG_QUERY)).scalar_one())
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Replica probe failed for tenant {tenant_name}: {e}")
+            usable = False
+        else:
+            usable = lag <= self.settings.replica_max_lag_seconds
+            if not usable:
+                logger.warning(
+                    f"Replica for tenant {tenant_name} is {lag:.1f}s behind, "
+                    "routing reads to primary"
+                )
+        self._health[tenant_name] = (now, usable)
+        return usable
+
+
+def create_tenant_replica_router(
+    controller: MultiTenantController,
+    settings: Settings,
+) -> TenantReplicaRouter:
+    # Replica engines draw on the lazy controller's connection budget
+    if not isinstance(controller, LazyMultiTenantController):
+        raise TypeError("Replica routing needs the LazyMultiTenantController")
+    return TenantReplicaRouter(controller, settings)
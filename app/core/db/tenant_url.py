@@ -0,0 +1,22 @@
+from sqlalchemy.engine import URL
+
+
+def tenant_database_url(
+    server_url: URL,
+    tenant_url: str,
+    *,
+    host: str | None,
+    username: str | None,
+) -> URL:
+    """The URL of a tenant's database, derived from the tenant record.
+
+    `Tenant.database` holds the host of the tenant's server and
+    `Tenant.username` its role, each falling back to `server_url`'s; the
+    database is named after `Tenant.url`. Tenant records carry no password,
+    so every tenant role is assumed to accept the password in `server_url`.
+    """
+    return server_url.set(
+        host=host or server_url.host,
+        username=username or server_url.username,
+        database=tenant_url,
+    )
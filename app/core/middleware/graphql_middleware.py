@@ -1,3 +1,4 @@
+import time
 from collections.abc import AsyncGenerator
 from typing import override
 
@@ -8,11 +9,17 @@ from loguru import logger
 from sqlalchemy import select
 from starlette.websockets import WebSocket
 from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
 
 from app.core.container import create_container
 from app.core.context import Context
 from app.core.context_wrapper import ContextWrapper
 
+TENANT_URL_TTL_SECONDS = 300.0
+
+# org_id -> (expires_at, tenant url); spares a base DB round trip per request
+_tenant_urls: dict[str, tuple[float, str]] = {}
+
 
 async def _resolve_tenant_url(
     controller: MultiTenantController, auth_info: AuthInfo
@@ -28,6 +35,11 @@ async def _resolve_tenant_url(
         return
 
     original_tenant_name = auth_info.tenant_name
+    cached = _tenant_urls.get(auth_info.tenant_id)
+    if cached and cached[0] > time.monotonic():
+        auth_info.tenant_name = cached[1]
+        return
+
     async with controller.base_scoped_session() as session:
         async with session.begin():
             result = await session.execute(
@@ -36,6 +48,10 @@ async def _resolve_tenant_url(
             tenant_url = result.scalar_one_or_none()
             if tenant_url:
                 auth_info.tenant_name = tenant_url
+                _tenant_urls[auth_info.tenant_id] = (
+                    time.monotonic() + TENANT_URL_TTL_SECONDS,
+                    tenant_url,
+                )
                 logger.info(
                     f"Tenant resolved: {original_tenant_name} -> {tenant_url} "
                     f"(org_id={auth_info.tenant_id})"
@@ -52,6 +68,10 @@ class GraphQLMiddleware(SchemaExtension):
     async def on_execute(self) -> AsyncGenerator[None, None]:
         ctx = self.execution_context
         logger.info(f"[{ctx.query}] vars='{ctx.variables}'")
+        # Resolvers open their tenant session after this point, so they can
+        # start a read-only transaction for queries
+        if ctx.context is not None:
+            ctx.context.read_only = ctx.operation_type == OperationType.QUERY
         yield
 
     @override
@@ -0,0 +1,181 @@
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Iterator, Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Self, override
+
+from graphql import GraphQLError, parse
+from strawberry.extensions import SchemaExtension
+from strawberry.schema.schema import validate_document
+from strawberry.types import ExecutionContext
+
+from app.core.config.graphql_settings import GraphQLSettings
+from app.errors.base_exception import BaseException
+
+
+class PersistedQueryNotFoundError(BaseException):
+    def __init__(self) -> None:
+        # Apollo clients match on this exact message to resend the full query
+        super().__init__("PersistedQueryNotFound")
+        self.extensions = {
+            **(self.extensions or {}),
+            "code": "PERSISTED_QUERY_NOT_FOUND",
+        }
+
+
+class PersistedQueryNotAllowedError(BaseException):
+    def __init__(self) -> None:
+        super().__init__("Only registered operations are accepted")
+        self.extensions = {
+            **(self.extensions or {}),
+            "code": "PERSISTED_QUERY_NOT_ALLOWED",
+        }
+
+
+class PersistedQueryInvalidError(BaseException):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+
+
+def hash_query(query: str) -> str:
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+class PersistedQueryStore:
+    """Process-wide registry of persisted operations and parsed/validated documents.
+
+    Operations from the manifest are always resolvable; automatically persisted
+    queries are kept in a bounded LRU. Documents are cached by query text, so
+    the frontend's fixed set of operations is parsed and validated once.
+    """
+
+    def __init__(
+        self,
+        *,
+        manifest: Mapping[str, str] | None = None,
+        allowlist_only: bool = False,
+        cache_size: int = 1024,
+        document_cache_size: int = 512,
+    ) -> None:
+        self.allowlist_only = allowlist_only
+        self._manifest = dict(manifest or {})
+        self._queries: OrderedDict[str, str] = OrderedDict()
+        self._cache_size = cache_size
+        self.parse = lru_cache(maxsize=document_cache_size)(parse)
+        self.validate = lru_cache(maxsize=document_cache_size)(validate_document)
+
+    @classmethod
+    def from_settings(cls, settings: GraphQLSettings) -> Self:
+        manifest: dict[str, str] = {}
+        if settings.graphql_persisted_queries_manifest:
+            manifest = json.loads(
+                Path(settings.graphql_persisted_queries_manifest).read_text()
+            )
+        return cls(
+            manifest=manifest,
+            allowlist_only=settings.graphql_persisted_queries_only,
+            cache_size=settings.graphql_persisted_queries_cache_size,
+            document_cache_size=settings.graphql_document_cache_size,
+        )
+
+    def get(self, query_hash: str) -> str | None:
+        if query_hash in self._manifest:
+            return self._manifest[query_hash]
+        query = self._queries.get(query_hash)
+        if query is not None:
+            self._queries.move_to_end(query_hash)
+        return query
+
+    def register(self, query_hash: str, query: str) -> None:
+        if query_hash in self._manifest or self.allowlist_only:
+            return
+        self._queries[query_hash] = query
+        self._queries.move_to_end(query_hash)
+        if len(self._queries) > self._cache_size:
+            _ = self._queries.popitem(last=False)
+
+    def is_registered(self, query_hash: str) -> bool:
+        return query_hash in self._manifest
+
+
+class PersistedQueryExtension(SchemaExtension):
+    """Automatic persisted queries plus parse/validation caching.
+
+    Must run before the other extensions so the query is resolved from its
+    hash before authentication and logging see it.
+    """
+
+    def __init__(
+        self,
+        *,
+        store: PersistedQueryStore,
+        execution_context: ExecutionContext | None = None,
+    ) -> None:
+        super().__init__(execution_context=execution_context)  # pyright: ignore[reportArgumentType]
+        self.store = store
+
+    @override
+    async def on_operation(self) -> AsyncGenerator[None]:
+        ctx = self.execution_context
+        ctx.query = self._resolve_query(ctx.query, ctx.operation_extensions)
+        yield
+
+    @override
+    def on_parse(self) -> Iterator[None]:
+        ctx = self.execution_context
+        if ctx.query and not ctx.graphql_document:
+            try:
+                ctx.graphql_document = self.store.parse(ctx.query)
+            except GraphQLError:
+                # Let strawberry parse again and report the syntax error itself
+                pass
+        yield
+
+    @override
+    def on_validate(self) -> Iterator[None]:
+        ctx = self.execution_context
+        if ctx.graphql_document and ctx.validation_rules:
+            ctx.pre_execution_errors = list(
+                self.store.validate(
+                    ctx.schema._schema,  # pyright: ignore[reportPrivateUsage]
+                    ctx.graphql_document,
+                    ctx.validation_rules,
+                )
+            )
+        yield
+
+    def _resolve_query(
+        self, query: str | None, operation_extensions: Mapping[str, Any] | None
+    ) -> str | None:
+        persisted = (operation_extensions or {}).get("persistedQuery")
+        if not persisted:
+            if (
+                query
+                and self.store.allowlist_only
+                and not self.store.is_registered(hash_query(query))
+            ):
+                raise PersistedQueryNotAllowedError()
+            return query
+
+        if persisted.get("version") != 1:
+            raise PersistedQueryInvalidError("Unsupported persisted query version")
+        query_hash = persisted.get("sha256Hash")
+        if not isinstance(query_hash, str):
+            raise PersistedQueryInvalidError("Persisted query hash is missing")
+
+        if query is None:
+            stored = self.store.get(query_hash)
+            if stored is None:
+                if self.store.allowlist_only:
+                    raise PersistedQueryNotAllowedError()
+                raise PersistedQueryNotFoundError()
+            return stored
+
+        if hash_query(query) != query_hash:
+            raise PersistedQueryInvalidError("Provided sha256Hash does not match query")
+        if self.store.allowlist_only and not self.store.is_registered(query_hash):
+            raise PersistedQueryNotAllowedError()
+        self.store.register(query_hash, query)
+        return query
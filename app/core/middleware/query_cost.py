@@ -0,0 +1,304 @@
+import time
+from collections import defaultdict, deque
+from collections.abc import AsyncGenerator, Iterator, Mapping
+from typing import Any, Self, override
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLObjectType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    SelectionSetNode,
+    get_named_type,
+    get_nullable_type,
+    get_operation_ast,
+    is_composite_type,
+    is_interface_type,
+    is_list_type,
+    is_object_type,
+)
+from graphql.execution.values import get_argument_values
+from loguru import logger
+from strawberry.extensions import SchemaExtension
+from strawberry.types import ExecutionContext
+
+from app.core.config.graphql_settings import GraphQLSettings
+from app.errors.base_exception import BaseException
+
+# Resolvers that fan out into heavy queries or large nested payloads
+FIELD_WEIGHTS: dict[str, int] = {
+    "Query.connectionSearch": 10,
+    "Query.fileValidationIssues": 50,
+    "Query.filteredFileValidationIssues": 10,
+    "Query.sentExchangeFiles": 20,
+    "Query.receivedExchangeFiles": 10,
+}
+
+LIMIT_ARGUMENTS = ("limit", "first")
+# Client limits are clamped to this, so a negative or huge value can't
+# shrink or blow up the estimate
+MAX_LIST_SIZE = 10_000
+
+COST_WINDOW_SECONDS = 60.0
+
+ParentType = GraphQLObjectType | GraphQLInterfaceType
+
+
+class QueryCostExceededError(BaseException):
+    def __init__(self, cost: int, max_cost: int) -> None:
+        super().__init__(
+            f"Query cost {cost} exceeds the maximum allowed cost of {max_cost}"
+        )
+
+
+class QueryThrottledError(BaseException):
+    def __init__(self, cost: int, remaining: int) -> None:
+        super().__init__(
+            f"Query cost {cost} exceeds the remaining budget of {remaining}, "
+            "retry later"
+        )
+
+
+class QueryCostCalculator:
+    """Computes operation cost from field weights and list multipliers.
+
+    Each object resolved costs one; heavy resolvers add their `FIELD_WEIGHTS`.
+
+    Without result data every list counts as its `limit`/`first` argument or
+    the default list size; with result data the real list lengths are used, so
+    the same walk yields both the estimate and the cost actually incurred.
+    """
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        variables: Mapping[str, Any] | None,
+        default_list_size: int,
+        weights: Mapping[str, int] = FIELD_WEIGHTS,
+    ) -> None:
+        self.schema = schema
+        self.document = document
+        self.variables = dict(variables or {})
+        self.default_list_size = default_list_size
+        self.weights = weights
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+
+    def operation_cost(
+        self, operation_name: str | None, data: Mapping[str, Any] | None = None
+    ) -> int:
+        operation = get_operation_ast(self.document, operation_name)
+        if operation is None:
+            return 0
+        root_type = self.schema.get_root_type(operation.operation)
+        if root_type is None:
+            return 0
+        return self._selection_cost(operation.selection_set, root_type, data)
+
+    def _selection_cost(
+        self,
+        selection_set: SelectionSetNode,
+        parent_type: ParentType,
+        data: Mapping[str, Any] | None,
+    ) -> int:
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                cost += self._field_cost(selection, parent_type, data)
+            elif isinstance(selection, InlineFragmentNode):
+                cost += self._selection_cost(
+                    selection.selection_set,
+                    self._fragment_type(selection, parent_type),
+                    data,
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments.get(selection.name.value)
+                if fragment is not None:
+                    cost += self._selection_cost(
+                        fragment.selection_set,
+                        self._fragment_type(fragment, parent_type),
+                        data,
+                    )
+        return cost
+
+    def _field_cost(
+        self,
+        node: FieldNode,
+        parent_type: ParentType,
+        data: Mapping[str, Any] | None,
+    ) -> int:
+        field = parent_type.fields.get(node.name.value)
+        if field is None:
+            return 0
+        named_type = get_named_type(field.type)
+        weight = self.weights.get(f"{parent_type.name}.{node.name.value}", 0)
+        if not is_composite_type(named_type) or node.selection_set is None:
+            return weight
+
+        # Every object resolved costs one, plus whatever is selected beneath it
+        child_type = self._object_type(named_type, parent_type)
+        if data is None:
+            item_cost = 1 + self._selection_cost(node.selection_set, child_type, None)
+            if is_list_type(get_nullable_type(field.type)):
+                item_cost *= self._list_size(field, node)
+            return weight + item_cost
+
+        value = data.get(node.alias.value if node.alias else node.name.value)
+        items = value if isinstance(value, list) else [value]
+        return weight + sum(
+            1 + self._selection_cost(node.selection_set, child_type, item)
+            for item in items
+            if isinstance(item, Mapping)
+        )
+
+    def _list_size(self, field: GraphQLField, node: FieldNode) -> int:
+        try:
+            arguments = get_argument_values(field, node, self.variables)
+        except Exception:  # noqa: BLE001
+            return self.default_list_size
+        for name in LIMIT_ARGUMENTS:
+            if isinstance(arguments.get(name), int):
+                return max(0, min(arguments[name], MAX_LIST_SIZE))
+        return self.default_list_size
+
+    def _fragment_type(
+        self,
+        fragment: InlineFragmentNode | FragmentDefinitionNode,
+        parent_type: ParentType,
+    ) -> GraphQLObjectType:
+        if fragment.type_condition is None:
+            return parent_type
+        return self._object_type(
+            self.schema.get_type(fragment.type_condition.name.value), parent_type
+        )
+
+    @staticmethod
+    def _object_type(type_: Any, fallback: ParentType) -> ParentType:
+        # Unions have no fields of their own, only fragments on their members
+        if is_object_type(type_) or is_interface_type(type_):
+            return type_
+        return fallback
+
+
+class OrgCostTracker:
+    """Sliding one-minute window of query cost spent per organization."""
+
+    def __init__(self, budget_per_minute: int) -> None:
+        self.budget_per_minute = budget_per_minute
+        self._spent: defaultdict[str, deque[tuple[float, int]]] = defaultdict(deque)
+
+    @classmethod
+    def from_settings(cls, settings: GraphQLSettings) -> Self:
+        return cls(settings.graphql_org_cost_per_minute)
+
+    def remaining(self, org_id: str) -> int | None:
+        if not self.budget_per_minute:
+            return None
+        return self.budget_per_minute - self.spent(org_id)
+
+    def spent(self, org_id: str) -> int:
+        entries = self._spent[org_id]
+        cutoff = time.monotonic() - COST_WINDOW_SECONDS
+        while entries and entries[0][0] < cutoff:
+            _ = entries.popleft()
+        return sum(cost for _, cost in entries)
+
+    def record(self, org_id: str, cost: int) -> None:
+        self._spent[org_id].append((time.monotonic(), cost))
+
+
+class QueryCostExtension(SchemaExtension):
+    """Rejects over-budget operations and records the cost each org incurs.
+
+    Runs after GraphQLMiddleware so the authenticated org is known.
+    """
+
+    def __init__(
+        self,
+        *,
+        settings: GraphQLSettings,
+        tracker: OrgCostTracker,
+        execution_context: ExecutionContext | None = None,
+    ) -> None:
+        super().__init__(execution_context=execution_context)  # pyright: ignore[reportArgumentType]
+        self.settings = settings
+        self.tracker = tracker
+        self.estimated_cost = 0
+        self.actual_cost = 0
+
+    @override
+    def on_validate(self) -> Iterator[None]:
+        # Strawberry checks pre_execution_errors before leaving the validation
+        # step, so the budget has to be enforced on the way in
+        ctx = self.execution_context
+        if not ctx.pre_execution_errors and ctx.graphql_document is not None:
+            error = self._check_budget()
+            if error is not None:
+                ctx.pre_execution_errors = [error]
+        yield
+
+    def _check_budget(self) -> BaseException | None:
+        self.estimated_cost = self._calculator().operation_cost(
+            self.execution_context.operation_name
+        )
+        if self.estimated_cost > self.settings.graphql_max_query_cost:
+            return QueryCostExceededError(
+                self.estimated_cost, self.settings.graphql_max_query_cost
+            )
+
+        org_id = self._org_id()
+        remaining = self.tracker.remaining(org_id) if org_id else None
+        if remaining is not None and self.estimated_cost > remaining:
+            return QueryThrottledError(self.estimated_cost, max(remaining, 0))
+        return None
+
+    @override
+    async def on_execute(self) -> AsyncGenerator[None]:
+        yield
+        ctx = self.execution_context
+        if ctx.graphql_document is None or ctx.result is None:
+            return
+
+        self.actual_cost = self._calculator().operation_cost(
+            ctx.operation_name, ctx.result.data or {}
+        )
+        org_id = self._org_id()
+        if org_id:
+            self.tracker.record(org_id, self.actual_cost)
+        logger.debug(
+            f"Query cost org={org_id} operation={ctx.operation_name} "
+            f"estimated={self.estimated_cost} actual={self.actual_cost}"
+        )
+
+    @override
+    def get_results(self) -> dict[str, Any]:
+        return {
+            "cost": {
+                "requested": self.estimated_cost,
+                "actual": self.actual_cost,
+            }
+        }
+
+    def _calculator(self) -> QueryCostCalculator:
+        ctx = self.execution_context
+        assert ctx.graphql_document
+        return QueryCostCalculator(
+            ctx.schema._schema,  # pyright: ignore[reportPrivateUsage]
+            ctx.graphql_document,
+            ctx.variables,
+            self.settings.graphql_default_list_size,
+        )
+
+    def _org_id(self) -> str | None:
+        auth_info = getattr(self.execution_context.context, "auth_info", None)
+        tenant_id = getattr(auth_info, "tenant_id", None)
+        return str(tenant_id) if tenant_id else None
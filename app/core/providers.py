@@ -14,18 +14,28 @@ from app.core.context_wrapper import create_context_wrapper
 from app.core.db import db_provider, orgs_db_provider
 from app.core.s3 import provider as s3_provider
 from app.core.s3.settings import S3Settings
+from app.graphql.connections import connection_graph
 from app.graphql.di.api_client_providers import api_client_providers
+from app.graphql.di.loader_providers import loader_providers
 from app.graphql.di.repository_providers import repository_providers
 from app.graphql.di.service_providers import service_providers
+from app.graphql.pos.dashboard import glance_cache
+from app.graphql.pos.data_exchange import upload_digests
+from app.graphql.pos.field_map import field_map_cache
 
 modules: Iterable[Iterable[aioinject.Provider[Any]]] = [
     api_client_providers,
     auth_provider.providers,
+    connection_graph.providers,
     db_provider.providers,
+    field_map_cache.providers,
+    glance_cache.providers,
+    loader_providers,
     orgs_db_provider.providers,
     s3_provider.providers,
     repository_providers,
     service_providers,
+    upload_digests.providers,
 ]
 
 settings_classes: Iterable[type[BaseSettings]] = [
@@ -0,0 +1,70 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from typing import Any
+
+from aiobotocore.config import AioConfig
+from aiobotocore.session import get_session
+
+from app.core.s3.settings import S3Settings
+
+
+class S3ClientPool:
+    """One S3 client per process, shared by every request that touches S3.
+
+    aiobotocore clients are safe to use from concurrent tasks, and the
+    client's HTTP connection pool keeps TLS connections alive between
+    requests, so only the first S3 call pays for client setup and handshakes.
+    The client is created lazily so importing the container never needs
+    credentials.
+    """
+
+    def __init__(self, settings: S3Settings) -> None:
+        self.settings = settings
+        self._client: Any = None
+        self._lock = asyncio.Lock()
+        self._exit_stack = contextlib.AsyncExitStack()
+
+    async def get_client(self) -> Any:
+        if self._client is None:
+            async with self._lock:
+                if self._client is None:
+                    self._client = await self._exit_stack.enter_async_context(
+                        self._create_client()
+                    )
+        return self._client
+
+    @contextlib.asynccontextmanager
+    async def borrow(self) -> AsyncIterator[Any]:
+        """The shared client as a context manager that leaves it open on exit."""
+        yield await self.get_client()
+
+    async def close(self) -> None:
+        await self._exit_stack.aclose()
+        self._client = None
+
+    def _create_client(self) -> contextlib.AbstractAsyncContextManager[Any]:
+        config = AioConfig(
+            max_pool_connections=self.settings.aws_max_pool_connections,
+            connector_args={
+                "keepalive_timeout": self.settings.aws_keepalive_timeout_seconds
+            },
+            tcp_keepalive=True,
+        )
+        return get_session().create_client(
+            "s3",
+            region_name=self.settings.aws_default_region,
+            endpoint_url=self.settings.aws_endpoint_url,
+            aws_access_key_id=self.settings.aws_access_key_id,
+            aws_secret_access_key=self.settings.aws_secret_access_key,
+            config=config,
+        )
+
+
+@contextlib.asynccontextmanager
+async def create_s3_client_pool(settings: S3Settings) -> AsyncIterator[S3ClientPool]:
+    pool = S3ClientPool(settings)
+    try:
+        yield pool
+    finally:
+        await pool.close()
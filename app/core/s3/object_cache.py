@@ -0,0 +1,178 @@
+import asyncio
+import contextlib
+import hashlib
+import mmap
+import os
+import re
+import uuid
+from collections import Counter
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import BinaryIO
+
+from commons.s3.service import S3Service
+from loguru import logger
+
+from app.core.s3.settings import S3Settings
+
+CHUNK_BYTES = 1024 * 1024
+_SHA256_HEX = re.compile(r"^[0-9a-f]{64}$")
+
+
+class S3ObjectCache:
+    """Downloaded S3 objects kept on local disk, addressed by their SHA-256.
+
+    Exchange files never change once stored, so a cached copy stays valid
+    for as long as its content still hashes to its name; every read checks
+    that before using it. The cache is bounded in bytes and evicts the
+    least recently used objects, ordered by modification time. Every worker
+    process shares the directory, so the bound is checked against what is
+    on disk rather than what this process wrote. Files are written under a
+    temporary name and renamed into place, so no worker sees a partial file.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._lock_users: Counter[str] = Counter()
+
+    @contextlib.asynccontextmanager
+    async def open(
+        self,
+        s3_service: S3Service,
+        key: str,
+        file_sha: str,
+    ) -> AsyncIterator[bytes | mmap.mmap]:
+        """The object's content, memory-mapped from the cache when possible."""
+        if not _SHA256_HEX.match(file_sha):
+            raise ValueError(f"Not a SHA-256 hex digest: {file_sha!r}")
+
+        cached = await self._fetch(s3_service, key, file_sha)
+        if isinstance(cached, bytes):
+            yield cached
+            return
+
+        with cached:
+            if os.fstat(cached.fileno()).st_size == 0:
+                # Empty files can't be mapped
+                yield b""
+                return
+            with mmap.mmap(cached.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    def _path(self, file_sha: str) -> Path:
+        return self.directory / file_sha[:2] / file_sha
+
+    @contextlib.asynccontextmanager
+    async def _lock(self, file_sha: str) -> AsyncIterator[None]:
+        # Counted so the lock outlives a woken waiter that hasn't taken it yet
+        lock = self._locks.setdefault(file_sha, asyncio.Lock())
+        self._lock_users[file_sha] += 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._lock_users[file_sha] -= 1
+            if not self._lock_users[file_sha]:
+                del self._lock_users[file_sha]
+                del self._locks[file_sha]
+
+    async def _fetch(
+        self,
+        s3_service: S3Service,
+        key: str,
+        file_sha: str,
+    ) -> BinaryIO | bytes:
+        # Files are handed out open, so another worker evicting them
+        # afterwards doesn't pull them from under the reader
+        async with self._lock(file_sha):
+            path = self._path(file_sha)
+            cached = await asyncio.to_thread(self._open_intact, path, file_sha)
+            if cached is not None:
+                return cached
+
+            file_obj = await s3_service.download(key=key)
+            size = await asyncio.to_thread(self._write, file_obj, path, file_sha)
+            if size is None:
+                logger.warning(
+                    f"S3 object {key} does not hash to {file_sha}; not caching it"
+                )
+                file_obj.seek(0)
+                return file_obj.read()
+
+            return await asyncio.to_thread(self._open_written, path)
+
+    @staticmethod
+    def _open_intact(path: Path, file_sha: str) -> BinaryIO | None:
+        try:
+            f = path.open("rb")
+        except FileNotFoundError:
+            return None
+
+        if hashlib.file_digest(f, "sha256").hexdigest() == file_sha:
+            f.seek(0)
+            # The modification time carries the LRU order between workers
+            with contextlib.suppress(FileNotFoundError):
+                os.utime(path)
+            return f
+
+        f.close()
+        logger.warning(f"Cached object {file_sha} is corrupt; downloading it again")
+        path.unlink(missing_ok=True)
+        return None
+
+    @staticmethod
+    def _write(file_obj: BinaryIO, path: Path, file_sha: str) -> int | None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with temp_path.open("wb") as out:
+                while chunk := file_obj.read(CHUNK_BYTES):
+                    digest.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+            if digest.hexdigest() != file_sha:
+                return None
+            os.replace(temp_path, path)
+            return size
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def _open_written(self, path: Path) -> BinaryIO:
+        f = path.open("rb")
+        self._evict(keep=path)
+        return f
+
+    def _evict(self, keep: Path) -> None:
+        """Trim the directory to the byte limit, least recently used first."""
+        found: list[tuple[int, Path, int]] = []
+        for path in self.directory.glob("*/*"):
+            if not _SHA256_HEX.match(path.name):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Evicted by another worker meanwhile
+                continue
+            found.append((stat.st_mtime_ns, path, stat.st_size))
+
+        total_bytes = sum(size for _, _, size in found)
+        for _, path, size in sorted(found):
+            if total_bytes <= self.max_bytes:
+                break
+            # The newest object stays even if it alone is over the limit
+            if path == keep:
+                continue
+            # Readers that still have the file open keep their copy
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+
+
+def create_s3_object_cache(settings: S3Settings) -> S3ObjectCache:
+    return S3ObjectCache(
+        directory=Path(settings.object_cache_dir),
+        max_bytes=settings.object_cache_max_bytes,
+    )
@@ -5,11 +5,33 @@ import aioinject
 from commons.auth import AuthInfo
 from commons.s3.service import S3Service
 
+from app.core.s3.client_pool import S3ClientPool, create_s3_client_pool
+from app.core.s3.object_cache import create_s3_object_cache
 from app.core.s3.settings import S3Settings
 
 
-def create_s3_service(settings: S3Settings, auth_info: AuthInfo) -> S3Service:
-    return S3Service(
+class PooledS3Service(S3Service):
+    """S3Service that runs every operation on the shared client.
+
+    Only the tenant prefix is per request; `get_client` hands out the pooled
+    client instead of opening a new aiobotocore session and connection pool.
+    """
+
+    def __init__(self, pool: S3ClientPool, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.pool = pool
+
+    async def get_client(self) -> Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return self.pool.borrow()
+
+
+def create_s3_service(
+    settings: S3Settings,
+    auth_info: AuthInfo,
+    pool: S3ClientPool,
+) -> S3Service:
+    return PooledS3Service(
+        pool=pool,
         aws_access_key_id=settings.aws_access_key_id,
         aws_secret_access_key=settings.aws_secret_access_key,
         endpoint_url=settings.aws_endpoint_url,
@@ -19,5 +41,7 @@ def create_s3_service(settings: S3Settings, auth_info: AuthInfo) -> S3Service:
 
 
 providers: Iterable[aioinject.Provider[Any]] = [
+    aioinject.Singleton(create_s3_client_pool),
+    aioinject.Singleton(create_s3_object_cache),
     aioinject.Scoped(create_s3_service),
 ]
@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -7,6 +10,12 @@ class S3Settings(BaseSettings):
     aws_endpoint_url: str = "https://nyc3.digitaloceanspaces.com"
     aws_bucket_name: str = "flowrms-connect"
     aws_default_region: str = "nyc3"
+    # Shared client connection pool
+    aws_max_pool_connections: int = 50
+    aws_keepalive_timeout_seconds: float = 60.0
+    # Local disk cache of downloaded objects, addressed by SHA-256
+    object_cache_dir: str = os.path.join(tempfile.gettempdir(), "flow-connect-objects")
+    object_cache_max_bytes: int = 2 * 1024 * 1024 * 1024
 
     model_config = SettingsConfigDict(
         env_file_encoding="utf-8",
@@ -0,0 +1,131 @@
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import aioinject
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config.settings import Settings
+from app.graphql.connections.models import ConnectionStatus, RemoteConnection
+
+
+@dataclass(frozen=True, slots=True)
+class ConnectionEdge:
+    connection_id: uuid.UUID
+    connected_org_id: uuid.UUID
+    status: str
+
+
+class ConnectionGraph:
+    """Adjacency of each org to the orgs it has a connection with, by any status.
+
+    Entries are loaded from the orgs database on first use, evicted least
+    recently used past `max_orgs` and reloaded after `ttl_seconds`. When a
+    pair has several connections, a live one wins over a declined one.
+    """
+
+    def __init__(self, max_orgs: int, ttl_seconds: float) -> None:
+        self.max_orgs = max_orgs
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[
+            uuid.UUID, tuple[float, dict[uuid.UUID, ConnectionEdge]]
+        ] = OrderedDict()
+
+    async def edges(
+        self,
+        session: AsyncSession,
+        org_id: uuid.UUID,
+    ) -> Mapping[uuid.UUID, ConnectionEdge]:
+        cached = self._get(org_id)
+        if cached is not None:
+            return cached
+
+        stmt = select(
+            RemoteConnection.id,
+            RemoteConnection.requester_org_id,
+            RemoteConnection.target_org_id,
+            RemoteConnection.status,
+        ).where(
+            or_(
+                RemoteConnection.requester_org_id == org_id,
+                RemoteConnection.target_org_id == org_id,
+            )
+        )
+        result = await session.execute(stmt)
+
+        edges: dict[uuid.UUID, ConnectionEdge] = {}
+        for row in result.all():
+            connected_org_id = (
+                row.target_org_id
+                if row.requester_org_id == org_id
+                else row.requester_org_id
+            )
+            existing = edges.get(connected_org_id)
+            if (
+                existing is not None
+                and existing.status != ConnectionStatus.DECLINED.value
+            ):
+                continue
+            edges[connected_org_id] = ConnectionEdge(
+                connection_id=row.id,
+                connected_org_id=connected_org_id,
+                status=row.status,
+            )
+
+        self._put(org_id, edges)
+        return edges
+
+    async def connected_org_ids(
+        self,
+        session: AsyncSession,
+        org_id: uuid.UUID,
+        status: ConnectionStatus,
+    ) -> set[uuid.UUID]:
+        edges = await self.edges(session, org_id)
+        return {
+            connected_org_id
+            for connected_org_id, edge in edges.items()
+            if edge.status == status.value
+        }
+
+    def invalidate(self, *org_ids: uuid.UUID) -> None:
+        for org_id in org_ids:
+            self._entries.pop(org_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _get(self, org_id: uuid.UUID) -> dict[uuid.UUID, ConnectionEdge] | None:
+        entry = self._entries.get(org_id)
+        if entry is None:
+            return None
+
+        loaded_at, edges = entry
+        if time.monotonic() - loaded_at >= self.ttl_seconds:
+            del self._entries[org_id]
+            return None
+
+        self._entries.move_to_end(org_id)
+        return edges
+
+    def _put(self, org_id: uuid.UUID, edges: dict[uuid.UUID, ConnectionEdge]) -> None:
+        self._entries[org_id] = (time.monotonic(), edges)
+        self._entries.move_to_end(org_id)
+        while len(self._entries) > self.max_orgs:
+            self._entries.popitem(last=False)
+
+
+def create_connection_graph(settings: Settings) -> ConnectionGraph:
+    return ConnectionGraph(
+        max_orgs=settings.connection_graph_max_orgs,
+        ttl_seconds=settings.connection_graph_ttl_seconds,
+    )
+
+
+providers: Iterable[aioinject.Provider[Any]] = [
+    aioinject.Singleton(create_connection_graph),
+]
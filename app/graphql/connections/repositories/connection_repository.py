@@ -1,14 +1,17 @@
 import uuid
+from collections import Counter
 
-from sqlalchemy import String, and_, cast, func, or_, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.graphql.connections.connection_graph import ConnectionEdge, ConnectionGraph
 from app.graphql.connections.models import ConnectionStatus, RemoteConnection
 
 
 class ConnectionRepository:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, graph: ConnectionGraph) -> None:
         self.session = session
+        self.graph = graph
 
     async def get_by_id(self, connection_id: uuid.UUID) -> RemoteConnection | None:
         stmt = select(RemoteConnection).where(RemoteConnection.id == connection_id)
@@ -19,21 +22,9 @@ class ConnectionRepository:
         self,
         user_org_id: uuid.UUID,
         connected_org_id: uuid.UUID,
-    ) -> RemoteConnection | None:
-        stmt = select(RemoteConnection).where(
-            or_(
-                and_(
-                    RemoteConnection.requester_org_id == user_org_id,
-                    RemoteConnection.target_org_id == connected_org_id,
-                ),
-                and_(
-                    RemoteConnection.target_org_id == user_org_id,
-                    RemoteConnection.requester_org_id == connected_org_id,
-                ),
-            )
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+    ) -> ConnectionEdge | None:
+        edges = await self.graph.edges(self.session, user_org_id)
+        return edges.get(connected_org_id)
 
     async def get_connected_org_ids(
         self,
@@ -43,42 +34,18 @@ class ConnectionRepository:
         if not candidate_org_ids:
             return set()
 
-        stmt = select(RemoteConnection).where(
-            and_(
-                or_(
-                    and_(
-                        RemoteConnection.requester_org_id == user_org_id,
-                        RemoteConnection.target_org_id.in_(candidate_org_ids),
-                    ),
-                    and_(
-                        RemoteConnection.target_org_id == user_org_id,
-                        RemoteConnection.requester_org_id.in_(candidate_org_ids),
-                    ),
-                ),
-                cast(RemoteConnection.status, String)
-                != ConnectionStatus.DECLINED.value,
-            )
-        )
-
-        result = await self.session.execute(stmt)
-        connections = result.scalars().all()
-
-        connected_ids: set[uuid.UUID] = set()
-        for conn in connections:
-            if conn.requester_org_id == user_org_id:
-                connected_ids.add(conn.target_org_id)
-            else:
-                connected_ids.add(conn.requester_org_id)
-
-        return connected_ids
+        edges = await self.graph.edges(self.session, user_org_id)
+        return {
+            org_id
+            for org_id in candidate_org_ids
+            if org_id in edges
+            and edges[org_id].status != ConnectionStatus.DECLINED.value
+        }
 
     async def count_by_status(self, org_id: uuid.UUID, status: ConnectionStatus) -> int:
-        stmt = select(func.count()).where(
-            or_(
-                RemoteConnection.requester_org_id == org_id,
-                RemoteConnection.target_org_id == org_id,
-            ),
-            cast(RemoteConnection.status, String) == status.value,
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar_one()
+        edges = await self.graph.edges(self.session, org_id)
+        return sum(1 for edge in edges.values() if edge.status == status.value)
+
+    async def count_all_by_status(self, org_id: uuid.UUID) -> Counter[str]:
+        edges = await self.graph.edges(self.session, org_id)
+        return Counter(edge.status for edge in edges.values())
@@ -1,11 +1,37 @@
 import uuid
 
+from commons.auth import AuthInfo
+
 from app.core.flow_connect_api import FlowConnectApiClient, raise_for_api_status
+from app.graphql.connections.connection_graph import ConnectionGraph
+from app.graphql.connections.repositories.user_org_repository import UserOrgRepository
+from app.graphql.pos.dashboard.glance_cache import DashboardGlanceCache
 
 
 class ConnectionRequestService:
-    def __init__(self, api_client: FlowConnectApiClient) -> None:
+    def __init__(
+        self,
+        api_client: FlowConnectApiClient,
+        connection_graph: ConnectionGraph,
+        glance_cache: DashboardGlanceCache,
+        user_org_repository: UserOrgRepository,
+        auth_info: AuthInfo,
+    ) -> None:
         self.api_client = api_client
+        self.connection_graph = connection_graph
+        self.glance_cache = glance_cache
+        self.user_org_repository = user_org_repository
+        self.auth_info = auth_info
+
+    async def _invalidate_connections(self, target_org_id: uuid.UUID) -> None:
+        org_ids = [target_org_id]
+        if self.auth_info.auth_provider_id is not None:
+            user_org_id = await self.user_org_repository.get_user_org_id(
+                self.auth_info.auth_provider_id
+            )
+            org_ids = [user_org_id, target_org_id]
+        self.connection_graph.invalidate(*org_ids)
+        self.glance_cache.invalidate(*org_ids)
 
     async def create_connection_request(
         self,
@@ -22,6 +48,7 @@ class ConnectionRequestService:
             entity_id=str(target_org_id),
             context="Creating connection request",
         )
+        await self._invalidate_connections(target_org_id)
         return True
 
     async def invite_connection(self, target_org_id: uuid.UUID) -> bool:
@@ -34,4 +61,5 @@ class ConnectionRequestService:
             entity_id=str(target_org_id),
             context="Inviting connection",
         )
+        await self._invalidate_connections(target_org_id)
         return True
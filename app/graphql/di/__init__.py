@@ -1,3 +1,4 @@
+from app.graphql.di.batch_loader import BatchLoader
 from app.graphql.di.discovery import (
     discover_classes,
     discover_providers,
@@ -6,6 +7,7 @@ from app.graphql.di.discovery import (
 from app.graphql.di.inject import context_getter, context_setter, inject
 
 __all__ = [
+    "BatchLoader",
     "context_getter",
     "context_setter",
     "discover_classes",
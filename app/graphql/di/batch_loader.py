@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from collections.abc import Hashable, Mapping
+
+from strawberry.dataloader import DataLoader
+
+
+class BatchLoader[K: Hashable, V](ABC):
+    """Request-scoped DataLoader wrapper resolved through aioinject.
+
+    Loaders are registered as Scoped providers, so every GraphQL operation gets
+    its own instance: keys requested in the same event-loop tick are coalesced
+    into a single ``fetch`` call and results are cached for the operation only.
+    """
+
+    def __init__(self) -> None:
+        self._loader: DataLoader[K, V] = DataLoader(load_fn=self._load_batch)
+
+    @abstractmethod
+    async def fetch(self, keys: list[K]) -> Mapping[K, V]:
+        pass
+
+    @abstractmethod
+    def missing(self, key: K) -> V:
+        pass
+
+    async def load(self, key: K) -> V:
+        return await self._loader.load(key)
+
+    async def load_many(self, keys: list[K]) -> list[V]:
+        if not keys:
+            return []
+        return await self._loader.load_many(keys)
+
+    async def _load_batch(self, keys: list[K]) -> list[V]:
+        found = await self.fetch(keys)
+        return [found[key] if key in found else self.missing(key) for key in keys]
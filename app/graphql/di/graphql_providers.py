@@ -0,0 +1,35 @@
+import os
+from typing import Any
+
+import aioinject
+
+import app.graphql.connections
+import app.graphql.geography
+import app.graphql.organizations
+import app.graphql.pos
+import app.graphql.settings
+from app.core.config.base_settings import load_env_files
+from app.graphql.di.discovery import discover_providers
+
+
+def discover_graphql_providers(class_suffix: str) -> list[aioinject.Provider[Any]]:
+    """Providers for the GraphQL packages' `class_suffix` classes.
+
+    They depend on the orgs database, so none are registered unless
+    ORGS_DB_URL is configured.
+    """
+    load_env_files()
+    if not os.environ.get("ORGS_DB_URL"):
+        return []
+    return list(
+        discover_providers(
+            modules=[
+                app.graphql.organizations,
+                app.graphql.connections,
+                app.graphql.geography,
+                app.graphql.pos,
+                app.graphql.settings,
+            ],
+            class_suffix=class_suffix,
+        )
+    )
@@ -0,0 +1,4 @@
+from app.graphql.di.graphql_providers import discover_graphql_providers
+
+# Loaders wrap repositories, so they are only registered alongside them
+loader_providers = discover_graphql_providers("loader")
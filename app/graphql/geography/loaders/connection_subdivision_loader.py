@@ -0,0 +1,19 @@
+import uuid
+
+from app.graphql.di.batch_loader import BatchLoader
+from app.graphql.geography.models import Subdivision
+from app.graphql.geography.repositories.connection_territory_repository import (
+    ConnectionTerritoryRepository,
+)
+
+
+class ConnectionSubdivisionLoader(BatchLoader[uuid.UUID, list[Subdivision]]):
+    def __init__(self, territory_repository: ConnectionTerritoryRepository) -> None:
+        super().__init__()
+        self.territory_repository = territory_repository
+
+    async def fetch(self, keys: list[uuid.UUID]) -> dict[uuid.UUID, list[Subdivision]]:
+        return await self.territory_repository.get_subdivisions_by_connection_ids(keys)
+
+    def missing(self, key: uuid.UUID) -> list[Subdivision]:
+        return []
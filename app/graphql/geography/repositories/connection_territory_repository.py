@@ -30,6 +30,25 @@ class ConnectionTerritoryRepository:
         territories = await self.get_by_connection_id(connection_id)
         return [t.subdivision for t in territories]
 
+    async def get_subdivisions_by_connection_ids(
+        self,
+        connection_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, list[Subdivision]]:
+        if not connection_ids:
+            return {}
+        stmt = (
+            select(ConnectionTerritory)
+            .options(joinedload(ConnectionTerritory.subdivision))
+            .where(ConnectionTerritory.connection_id.in_(connection_ids))
+        )
+        result = await self.session.execute(stmt)
+        subdivisions: dict[uuid.UUID, list[Subdivision]] = {}
+        for territory in result.unique().scalars().all():
+            subdivisions.setdefault(territory.connection_id, []).append(
+                territory.subdivision
+            )
+        return subdivisions
+
     async def set_territories(
         self,
         connection_id: uuid.UUID,
@@ -0,0 +1,7 @@
+from app.graphql.organizations.loaders.org_name_loader import OrgNameLoader
+from app.graphql.organizations.loaders.pos_contact_loader import PosContactLoader
+
+__all__ = [
+    "OrgNameLoader",
+    "PosContactLoader",
+]
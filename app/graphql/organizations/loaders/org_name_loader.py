@@ -0,0 +1,18 @@
+import uuid
+
+from app.graphql.di.batch_loader import BatchLoader
+from app.graphql.organizations.repositories.organization_search_repository import (
+    OrganizationSearchRepository,
+)
+
+
+class OrgNameLoader(BatchLoader[uuid.UUID, str]):
+    def __init__(self, org_search_repository: OrganizationSearchRepository) -> None:
+        super().__init__()
+        self.org_search_repository = org_search_repository
+
+    async def fetch(self, keys: list[uuid.UUID]) -> dict[uuid.UUID, str]:
+        return await self.org_search_repository.get_names_by_ids(keys)
+
+    def missing(self, key: uuid.UUID) -> str:
+        return ""
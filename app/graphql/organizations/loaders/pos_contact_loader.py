@@ -0,0 +1,19 @@
+import uuid
+
+from app.graphql.di.batch_loader import BatchLoader
+from app.graphql.organizations.repositories.pos_contact_repository import (
+    OrgPosContacts,
+    PosContactRepository,
+)
+
+
+class PosContactLoader(BatchLoader[uuid.UUID, OrgPosContacts]):
+    def __init__(self, pos_contact_repository: PosContactRepository) -> None:
+        super().__init__()
+        self.pos_contact_repository = pos_contact_repository
+
+    async def fetch(self, keys: list[uuid.UUID]) -> dict[uuid.UUID, OrgPosContacts]:
+        return await self.pos_contact_repository.get_pos_contacts_for_orgs(keys)
+
+    def missing(self, key: uuid.UUID) -> OrgPosContacts:
+        return OrgPosContacts(contacts=[], total_count=0)
@@ -1,6 +1,22 @@
 import uuid
-
-from sqlalchemy import String, and_, cast, or_, select
+from collections.abc import Collection
+
+from sqlalchemy import (
+    Float,
+    String,
+    Subquery,
+    and_,
+    case,
+    cast,
+    false,
+    func,
+    literal_column,
+    or_,
+    select,
+    text,
+    true,
+    union_all,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -14,9 +30,24 @@ from app.graphql.organizations.models import (
 
 
 class OrganizationSearchRepository:
+    # Whether the orgs database has `pg_trgm`, checked once per process
+    _trigram_available: bool | None = None
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    async def _has_trigram(self) -> bool:
+        cls = type(self)
+        if cls._trigram_available is None:
+            result = await self.session.execute(
+                text(
+                    "SELECT EXISTS "
+                    "(SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"
+                )
+            )
+            cls._trigram_available = bool(result.scalar())
+        return cls._trigram_available
+
     async def get_by_id(self, org_id: uuid.UUID) -> RemoteOrg | None:
         stmt = (
             select(RemoteOrg)
@@ -57,9 +88,18 @@ class OrganizationSearchRepository:
         connected: bool | None = None,
         limit: int = 20,
         exclude_org_id: uuid.UUID | None = None,
+        alias_org_ids: Collection[uuid.UUID] = (),
     ) -> list[tuple[RemoteOrg, bool, ConnectionStatus | None, uuid.UUID | None]]:
-        from app.graphql.connections.models.remote_connection import RemoteConnection
-
+        """Orgs matching the term by name or by one of the user's aliases.
+
+        Name matching uses `pg_trgm` when the orgs database has it, so the
+        ILIKE and `%` similarity filters are served by a GIN `gin_trgm_ops`
+        index on `subscription.orgs.name`. Without the extension it falls back
+        to a plain ILIKE substring match. Results are ranked exact match, then
+        prefix, then trigram similarity when available, with alias matches
+        boosted. The connection with each org is read once
+        through a LATERAL join rather than one correlated subquery per column.
+        """
         tenant_exists = (
             select(TenantRegistry.id)
             .where(
@@ -71,83 +111,35 @@ class OrganizationSearchRepository:
             .exists()
         )
 
-        connection_exists = (
-            select(RemoteConnection.id)
-            .where(
-                and_(
-                    or_(
-                        and_(
-                            RemoteConnection.requester_org_id == user_org_id,
-                            RemoteConnection.target_org_id == RemoteOrg.id,
-                        ),
-                        and_(
-                            RemoteConnection.target_org_id == user_org_id,
-                            RemoteConnection.requester_org_id == RemoteOrg.id,
-                        ),
-                    ),
-                    cast(RemoteConnection.status, String)
-                    != ConnectionStatus.DECLINED.value,
-                )
-            )
-            .exists()
-        )
+        connection = self._connection_lateral(user_org_id)
 
-        connection_status_subquery = (
-            select(cast(RemoteConnection.status, String))
-            .where(
-                and_(
-                    or_(
-                        and_(
-                            RemoteConnection.requester_org_id == user_org_id,
-                            RemoteConnection.target_org_id == RemoteOrg.id,
-                        ),
-                        and_(
-                            RemoteConnection.target_org_id == user_org_id,
-                            RemoteConnection.requester_org_id == RemoteOrg.id,
-                        ),
-                    ),
-                    cast(RemoteConnection.status, String)
-                    != ConnectionStatus.DECLINED.value,
-                )
+        alias_match = RemoteOrg.id.in_(alias_org_ids) if alias_org_ids else false()
+        name_matches = [RemoteOrg.name.icontains(search_term, autoescape=True)]
+        rank = (
+            case((func.lower(RemoteOrg.name) == search_term.lower(), 3.0), else_=0.0)
+            + case(
+                (RemoteOrg.name.istartswith(search_term, autoescape=True), 1.0),
+                else_=0.0,
             )
-            .correlate(RemoteOrg)
-            .scalar_subquery()
-        )
-
-        connection_id_subquery = (
-            select(RemoteConnection.id)
-            .where(
-                and_(
-                    or_(
-                        and_(
-                            RemoteConnection.requester_org_id == user_org_id,
-                            RemoteConnection.target_org_id == RemoteOrg.id,
-                        ),
-                        and_(
-                            RemoteConnection.target_org_id == user_org_id,
-                            RemoteConnection.requester_org_id == RemoteOrg.id,
-                        ),
-                    ),
-                    cast(RemoteConnection.status, String)
-                    != ConnectionStatus.DECLINED.value,
-                )
-            )
-            .correlate(RemoteOrg)
-            .scalar_subquery()
+            + case((alias_match, 2.0), else_=0.0)
         )
+        if await self._has_trigram():
+            name_matches.append(RemoteOrg.name.op("%")(search_term))
+            rank += cast(func.similarity(RemoteOrg.name, search_term), Float)
 
         stmt = (
             select(
                 RemoteOrg,
                 tenant_exists.label("flow_connect_member"),
-                connection_status_subquery.label("connection_status"),
-                connection_id_subquery.label("connection_id"),
+                connection.c.connection_status,
+                connection.c.connection_id,
             )
+            .outerjoin(connection, true())
             .options(selectinload(RemoteOrg.memberships))
             .where(
                 cast(RemoteOrg.org_type, String) == org_type.value,
                 RemoteOrg.deleted_at.is_(None),
-                RemoteOrg.name.ilike(f"%{search_term}%"),
+                or_(*name_matches, alias_match),
             )
         )
 
@@ -169,14 +161,14 @@ class OrganizationSearchRepository:
 
         match connected:
             case True:
-                stmt = stmt.where(connection_exists)
+                stmt = stmt.where(connection.c.connection_id.is_not(None))
             case False:
-                stmt = stmt.where(~connection_exists)
+                stmt = stmt.where(connection.c.connection_id.is_(None))
 
         if exclude_org_id is not None:
             stmt = stmt.where(RemoteOrg.id != exclude_org_id)
 
-        stmt = stmt.limit(limit)
+        stmt = stmt.order_by(rank.desc(), RemoteOrg.name).limit(limit)
 
         result = await self.session.execute(stmt)
         return [
@@ -191,6 +183,52 @@ class OrganizationSearchRepository:
             for row in result.all()
         ]
 
+    @staticmethod
+    def _connection_lateral(user_org_id: uuid.UUID) -> Subquery:
+        """The user's non-declined connection with each org, fetched once per row.
+
+        One branch per direction keeps both predicates sargable: each is
+        served by an index on `(requester_org_id, target_org_id)` or
+        `(target_org_id, requester_org_id)` filtered on `status`, instead of
+        the OR the planner can only satisfy with a scan.
+        """
+        from app.graphql.connections.models.remote_connection import RemoteConnection
+
+        columns = (
+            RemoteConnection.id.label("connection_id"),
+            RemoteConnection.status.label("connection_status"),
+        )
+        # An inline literal rather than a bound parameter: PostgreSQL coerces it
+        # to the column's enum type, and only a constant can match the partial
+        # indexes' `status <> 'declined'` predicate
+        not_declined = RemoteConnection.status != literal_column(
+            f"'{ConnectionStatus.DECLINED.value}'"
+        )
+        as_requester = (
+            select(*columns)
+            .where(
+                RemoteConnection.requester_org_id == user_org_id,
+                RemoteConnection.target_org_id == RemoteOrg.id,
+                not_declined,
+            )
+            .correlate(RemoteOrg)
+        )
+        as_target = (
+            select(*columns)
+            .where(
+                RemoteConnection.target_org_id == user_org_id,
+                RemoteConnection.requester_org_id == RemoteOrg.id,
+                not_declined,
+            )
+            .correlate(RemoteOrg)
+        )
+        directions = union_all(as_requester, as_target).subquery("directions")
+        return (
+            select(directions.c.connection_id, directions.c.connection_status)
+            .limit(1)
+            .lateral("connection")
+        )
+
     async def get_names_by_ids(
         self,
         org_ids: list[uuid.UUID],
@@ -1,41 +1,47 @@
+import asyncio
 import uuid
 
 from commons.auth.auth_info import AuthInfo
 
 from app.graphql.connections.models.enums import ConnectionStatus
 from app.graphql.connections.services import ConnectionService
-from app.graphql.geography.models import Subdivision
-from app.graphql.geography.repositories.connection_territory_repository import (
-    ConnectionTerritoryRepository,
+from app.graphql.geography.loaders.connection_subdivision_loader import (
+    ConnectionSubdivisionLoader,
 )
+from app.graphql.geography.models import Subdivision
+from app.graphql.organizations.loaders.pos_contact_loader import PosContactLoader
 from app.graphql.organizations.models import OrgType, RemoteOrg
 from app.graphql.organizations.repositories import OrganizationSearchRepository
-from app.graphql.organizations.repositories.pos_contact_repository import (
-    OrgPosContacts,
-    PosContactRepository,
-)
 from app.graphql.organizations.services.organization_search_result import (
     OrganizationSearchResult,
 )
+from app.graphql.pos.agreement.loaders.agreement_loader import AgreementLoader
 from app.graphql.pos.agreement.models.agreement import Agreement
 from app.graphql.pos.agreement.services.agreement_service import AgreementService
+from app.graphql.pos.organization_alias.repositories.organization_alias_repository import (
+    OrganizationAliasRepository,
+)
 
 
 class OrganizationSearchService:
     def __init__(
         self,
         org_search_repository: OrganizationSearchRepository,
-        pos_contact_repository: PosContactRepository,
+        pos_contact_loader: PosContactLoader,
         connection_service: ConnectionService,
         agreement_service: AgreementService,
-        territory_repository: ConnectionTerritoryRepository,
+        agreement_loader: AgreementLoader,
+        subdivision_loader: ConnectionSubdivisionLoader,
+        alias_repository: OrganizationAliasRepository,
         auth_info: AuthInfo,
     ) -> None:
         self.org_search_repository = org_search_repository
-        self.pos_contact_repository = pos_contact_repository
+        self.pos_contact_loader = pos_contact_loader
         self.connection_service = connection_service
         self.agreement_service = agreement_service
-        self.territory_repository = territory_repository
+        self.agreement_loader = agreement_loader
+        self.subdivision_loader = subdivision_loader
+        self.alias_repository = alias_repository
         self.auth_info = auth_info
 
     async def search_for_connections(
@@ -99,6 +105,9 @@ class OrganizationSearchService:
             workos_user_id,
         )
 
+        alias_org_ids = await self.alias_repository.search_connected_org_ids(
+            user_org_id, search_term, limit=limit
+        )
         org_results = await self.org_search_repository.search(
             search_term,
             org_type=org_type,
@@ -108,49 +117,54 @@ class OrganizationSearchService:
             connected=connected,
             limit=limit,
             exclude_org_id=user_org_id,
+            alias_org_ids=alias_org_ids,
         )
 
         if not org_results:
             return []
 
         org_ids = [org.id for org, _, _, _ in org_results]
-        pos_contacts_map = await self.pos_contact_repository.get_pos_contacts_for_orgs(
-            org_ids
-        )
-
         accepted_org_ids = [
             org.id
             for org, _, conn_status, _ in org_results
             if conn_status == ConnectionStatus.ACCEPTED
         ]
-        agreements_map: dict[str, tuple[Agreement, str]] = {}
-        for org_id in accepted_org_ids:
-            agreement = await self.agreement_service.get_agreement(org_id)
-            if agreement:
-                presigned_url = await self.agreement_service.get_presigned_url(
-                    agreement
-                )
-                agreements_map[str(org_id)] = (agreement, presigned_url)
-
-        # Fetch subdivisions for connected rep firms
+
+        pos_contacts = await self.pos_contact_loader.load_many(org_ids)
+        pos_contacts_map = dict(zip(org_ids, pos_contacts, strict=True))
+        agreements_map = await self._get_agreements_map(accepted_org_ids)
         subdivisions_map = await self._get_subdivisions_map(org_results, rep_firms)
 
         return [
             OrganizationSearchResult(
                 org=org,
                 flow_connect_member=is_member,
-                pos_contacts=pos_contacts_map.get(
-                    org.id,
-                    OrgPosContacts(contacts=[], total_count=0),
-                ),
+                pos_contacts=pos_contacts_map[org.id],
                 connection_status=conn_status,
                 connection_id=conn_id,
-                agreement_data=agreements_map.get(str(org.id)),
+                agreement_data=agreements_map.get(org.id),
                 subdivisions=subdivisions_map.get(conn_id) if conn_id else None,
             )
             for org, is_member, conn_status, conn_id in org_results
         ]
 
+    async def _get_agreements_map(
+        self,
+        org_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, tuple[Agreement, str]]:
+        agreements = [
+            agreement
+            for agreement in await self.agreement_loader.load_many(org_ids)
+            if agreement is not None
+        ]
+        presigned_urls = await asyncio.gather(
+            *(self.agreement_service.get_presigned_url(a) for a in agreements)
+        )
+        return {
+            agreement.connected_org_id: (agreement, url)
+            for agreement, url in zip(agreements, presigned_urls, strict=True)
+        }
+
     async def _get_subdivisions_map(
         self,
         org_results: list[
@@ -170,13 +184,5 @@ class OrganizationSearchService:
         if not connected_ids:
             return {}
 
-        subdivisions_map: dict[uuid.UUID, list[Subdivision]] = {}
-        for conn_id in connected_ids:
-            subdivisions = (
-                await self.territory_repository.get_subdivisions_by_connection_id(
-                    conn_id
-                )
-            )
-            subdivisions_map[conn_id] = subdivisions
-
-        return subdivisions_map
+        subdivisions = await self.subdivision_loader.load_many(connected_ids)
+        return dict(zip(connected_ids, subdivisions, strict=True))
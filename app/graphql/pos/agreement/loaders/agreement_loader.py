@@ -0,0 +1,20 @@
+import uuid
+
+from app.graphql.di.batch_loader import BatchLoader
+from app.graphql.pos.agreement.models.agreement import Agreement
+from app.graphql.pos.agreement.repositories.agreement_repository import (
+    AgreementRepository,
+)
+
+
+class AgreementLoader(BatchLoader[uuid.UUID, Agreement | None]):
+    def __init__(self, repository: AgreementRepository) -> None:
+        super().__init__()
+        self.repository = repository
+
+    async def fetch(self, keys: list[uuid.UUID]) -> dict[uuid.UUID, Agreement | None]:
+        agreements = await self.repository.get_by_connected_org_ids(keys)
+        return {agreement.connected_org_id: agreement for agreement in agreements}
+
+    def missing(self, key: uuid.UUID) -> Agreement | None:
+        return None
@@ -25,6 +25,18 @@ class AgreementRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_connected_org_ids(
+        self,
+        connected_org_ids: list[uuid.UUID],
+    ) -> list[Agreement]:
+        if not connected_org_ids:
+            return []
+        stmt = select(Agreement).where(
+            Agreement.connected_org_id.in_(connected_org_ids)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def upsert(self, agreement: Agreement) -> Agreement:
         stmt = (
             insert(Agreement)
@@ -96,7 +96,7 @@ class AgreementService:
         return await self.s3_service.generate_presigned_url(agreement.s3_key)
 
     async def _delete_s3_object(self, s3_key: str) -> None:
-        """Delete an object from S3 using the underlying client."""
+        """Delete an object from S3 using the shared client."""
         get_client: Any = self.s3_service.get_client
         client_ctx: Any = await get_client()
         async with client_ctx as client:
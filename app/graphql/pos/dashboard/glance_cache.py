@@ -0,0 +1,85 @@
+import datetime
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import aioinject
+
+from app.core.config.settings import Settings
+
+
+@dataclass(frozen=True, slots=True)
+class DashboardGlanceSnapshot:
+    blocking_sends_count: int
+    connected_count: int
+    pending_count: int
+    last_sent_at: datetime.datetime | None
+    last_sent_row_count: int | None
+
+
+class DashboardGlanceCache:
+    """Dashboard glance numbers per org, shared by every request in a worker.
+
+    Uploads, validations, sends and connection changes invalidate the org.
+    As in the field map cache, a loader reads the org's version before
+    querying and `put` drops its result if an invalidation landed in
+    between. The short TTL bounds staleness for writes made by other workers.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[uuid.UUID, tuple[float, DashboardGlanceSnapshot]] = (
+            OrderedDict()
+        )
+        self._versions: dict[uuid.UUID, int] = {}
+
+    def version(self, org_id: uuid.UUID) -> int:
+        return self._versions.get(org_id, 0)
+
+    def get(self, org_id: uuid.UUID) -> DashboardGlanceSnapshot | None:
+        entry = self._entries.get(org_id)
+        if entry is None:
+            return None
+
+        loaded_at, snapshot = entry
+        if time.monotonic() - loaded_at >= self.ttl_seconds:
+            del self._entries[org_id]
+            return None
+
+        self._entries.move_to_end(org_id)
+        return snapshot
+
+    def put(
+        self,
+        org_id: uuid.UUID,
+        snapshot: DashboardGlanceSnapshot,
+        version: int,
+    ) -> None:
+        if version != self.version(org_id):
+            return
+
+        self._entries[org_id] = (time.monotonic(), snapshot)
+        self._entries.move_to_end(org_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *org_ids: uuid.UUID) -> None:
+        for org_id in org_ids:
+            self._versions[org_id] = self.version(org_id) + 1
+            self._entries.pop(org_id, None)
+
+
+def create_dashboard_glance_cache(settings: Settings) -> DashboardGlanceCache:
+    return DashboardGlanceCache(
+        max_entries=settings.dashboard_glance_cache_max_entries,
+        ttl_seconds=settings.dashboard_glance_cache_ttl_seconds,
+    )
+
+
+providers: Iterable[aioinject.Provider[Any]] = [
+    aioinject.Singleton(create_dashboard_glance_cache),
+]
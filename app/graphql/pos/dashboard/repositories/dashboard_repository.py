@@ -0,0 +1,59 @@
+import datetime
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import func, select, true
+
+from app.core.db.transient_session import TenantSession
+from app.graphql.pos.data_exchange.models.enums import ExchangeFileStatus
+from app.graphql.pos.data_exchange.models.exchange_file import ExchangeFile
+from app.graphql.pos.validations.constants import BLOCKING_VALIDATION_KEYS
+from app.graphql.pos.validations.models import FileValidationIssue
+
+
+@dataclass(frozen=True, slots=True)
+class TenantGlance:
+    blocking_sends_count: int
+    last_sent_at: datetime.datetime | None
+    last_sent_row_count: int | None
+
+
+class DashboardRepository:
+    def __init__(self, session: TenantSession) -> None:
+        self.session = session
+
+    async def get_tenant_glance(self, org_id: uuid.UUID) -> TenantGlance:
+        """The org's tenant database numbers for the dashboard, in one query."""
+        blocking = (
+            select(func.count().label("blocking_sends_count"))
+            .select_from(FileValidationIssue)
+            .join(ExchangeFile, FileValidationIssue.exchange_file_id == ExchangeFile.id)
+            .where(
+                ExchangeFile.org_id == org_id,
+                ExchangeFile.status == ExchangeFileStatus.PENDING.value,
+                FileValidationIssue.validation_key.in_(BLOCKING_VALIDATION_KEYS),
+            )
+            .cte("blocking")
+        )
+        last_sent = (
+            select(ExchangeFile.created_at, ExchangeFile.row_count)
+            .where(
+                ExchangeFile.org_id == org_id,
+                ExchangeFile.status == ExchangeFileStatus.SENT.value,
+            )
+            .order_by(ExchangeFile.created_at.desc())
+            .limit(1)
+            .cte("last_sent")
+        )
+        stmt = select(
+            blocking.c.blocking_sends_count,
+            last_sent.c.created_at,
+            last_sent.c.row_count,
+        ).select_from(blocking.outerjoin(last_sent, true()))
+        result = await self.session.execute(stmt)
+        row = result.one()
+        return TenantGlance(
+            blocking_sends_count=row.blocking_sends_count,
+            last_sent_at=row.created_at,
+            last_sent_row_count=row.row_count,
+        )
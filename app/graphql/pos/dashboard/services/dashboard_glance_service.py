@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 
 from commons.auth import AuthInfo
@@ -7,6 +8,13 @@ from app.graphql.connections.repositories.connection_repository import (
     ConnectionRepository,
 )
 from app.graphql.connections.repositories.user_org_repository import UserOrgRepository
+from app.graphql.pos.dashboard.glance_cache import (
+    DashboardGlanceCache,
+    DashboardGlanceSnapshot,
+)
+from app.graphql.pos.dashboard.repositories.dashboard_repository import (
+    DashboardRepository,
+)
 from app.graphql.pos.dashboard.strawberry.dashboard_types import (
     DashboardIssuesGlance,
     DashboardLastDeliveryGlance,
@@ -14,23 +22,21 @@ from app.graphql.pos.dashboard.strawberry.dashboard_types import (
     DashboardPartnersGlance,
     PosDashboardGlanceResponse,
 )
-from app.graphql.pos.data_exchange.repositories import ExchangeFileRepository
-from app.graphql.pos.validations.repositories import FileValidationIssueRepository
 
 
 class DashboardGlanceService:
     def __init__(
         self,
-        validation_issue_repository: FileValidationIssueRepository,
+        dashboard_repository: DashboardRepository,
         connection_repository: ConnectionRepository,
-        exchange_file_repository: ExchangeFileRepository,
         user_org_repository: UserOrgRepository,
+        glance_cache: DashboardGlanceCache,
         auth_info: AuthInfo,
     ) -> None:
-        self.validation_issue_repository = validation_issue_repository
+        self.dashboard_repository = dashboard_repository
         self.connection_repository = connection_repository
-        self.exchange_file_repository = exchange_file_repository
         self.user_org_repository = user_org_repository
+        self.glance_cache = glance_cache
         self.auth_info = auth_info
 
     async def _get_user_org_id(self) -> uuid.UUID:
@@ -44,30 +50,42 @@ class DashboardGlanceService:
     async def get_glance(self) -> PosDashboardGlanceResponse:
         org_id = await self._get_user_org_id()
 
-        blocking_count = await self.validation_issue_repository.count_blocking_issues_for_all_pending_files(
-            org_id
-        )
-        connected_count = await self.connection_repository.count_by_status(
-            org_id, ConnectionStatus.ACCEPTED
-        )
-        pending_count = await self.connection_repository.count_by_status(
-            org_id, ConnectionStatus.PENDING
-        )
-        last_sent_file = await self.exchange_file_repository.get_last_sent_file(org_id)
+        snapshot = self.glance_cache.get(org_id)
+        if snapshot is None:
+            version = self.glance_cache.version(org_id)
+            snapshot = await self._load(org_id)
+            self.glance_cache.put(org_id, snapshot, version)
 
         last_delivery = None
-        if last_sent_file is not None:
+        if snapshot.last_sent_at is not None:
             last_delivery = DashboardLastDeliveryGlance(
-                date=last_sent_file.created_at,
-                record_count=last_sent_file.row_count,
+                date=snapshot.last_sent_at,
+                record_count=snapshot.last_sent_row_count or 0,
             )
 
         return PosDashboardGlanceResponse(
-            issues=DashboardIssuesGlance(blocking_sends_count=blocking_count),
+            issues=DashboardIssuesGlance(
+                blocking_sends_count=snapshot.blocking_sends_count
+            ),
             partners=DashboardPartnersGlance(
-                connected_count=connected_count,
-                pending_count=pending_count,
+                connected_count=snapshot.connected_count,
+                pending_count=snapshot.pending_count,
             ),
             messages=DashboardMessagesGlance(unread_count=0),
             last_delivery=last_delivery,
         )
+
+    async def _load(self, org_id: uuid.UUID) -> DashboardGlanceSnapshot:
+        # The orgs and tenant databases are separate sessions, so one query
+        # against each runs at once
+        connection_counts, tenant_glance = await asyncio.gather(
+            self.connection_repository.count_all_by_status(org_id),
+            self.dashboard_repository.get_tenant_glance(org_id),
+        )
+        return DashboardGlanceSnapshot(
+            blocking_sends_count=tenant_glance.blocking_sends_count,
+            connected_count=connection_counts[ConnectionStatus.ACCEPTED.value],
+            pending_count=connection_counts[ConnectionStatus.PENDING.value],
+            last_sent_at=tenant_glance.last_sent_at,
+            last_sent_row_count=tenant_glance.last_sent_row_count,
+        )
@@ -9,6 +9,22 @@ class InvalidFileTypeError(ExchangeFileError):
     """File type is not CSV, XLS, or XLSX."""
 
 
+class InvalidUploadRequestError(ExchangeFileError):
+    """Declared upload size or SHA-256 is not acceptable."""
+
+
+class UploadNotFoundError(ExchangeFileError):
+    """No object was uploaded for the file being finalized."""
+
+
+class IncompleteUploadError(ExchangeFileError):
+    """Resumable upload is missing parts."""
+
+
+class UploadVerificationError(ExchangeFileError):
+    """Uploaded object does not match its declared size or SHA-256."""
+
+
 class DuplicateFileForTargetError(ExchangeFileError):
     """Same file already pending for target organization."""
 
@@ -1,18 +1,60 @@
 import uuid
-from typing import Any
 
 import strawberry
 from aioinject import Injected
+from strawberry.file_uploads import Upload
 
 from app.graphql.di import inject
-from app.graphql.pos.data_exchange.services import ExchangeFileService
+from app.graphql.pos.data_exchange.services import (
+    ExchangeFileService,
+    ExchangeFileUploadService,
+    ResumableUploadService,
+)
+from app.graphql.pos.data_exchange.services.exchange_file_upload_service import (
+    FinalizeRequest,
+    UploadRequest,
+)
 from app.graphql.pos.data_exchange.strawberry import (
+    CompleteExchangeFileUploadInput,
     ExchangeFileResponse,
+    ExchangeFileUploadInput,
+    ExchangeFileUploadResultResponse,
+    ExchangeFileUploadTicketResponse,
+    FinalizeExchangeFileUploadInput,
+    FinalizeExchangeFileUploadsInput,
+    RequestExchangeFileUploadsInput,
+    ResumableUploadPartResponse,
+    ResumableUploadResponse,
     SendPendingFilesResponse,
     UploadExchangeFileInput,
 )
 
 
+def _upload_requests(files: list[ExchangeFileUploadInput]) -> list[UploadRequest]:
+    return [
+        UploadRequest(
+            file_name=file.file_name,
+            file_size=file.file_size,
+            file_sha=file.file_sha,
+        )
+        for file in files
+    ]
+
+
+def _finalize_requests(
+    files: list[FinalizeExchangeFileUploadInput],
+) -> list[FinalizeRequest]:
+    return [
+        FinalizeRequest(
+            file_name=file.file_name,
+            file_size=file.file_size,
+            file_sha=file.file_sha,
+            key=file.key,
+        )
+        for file in files
+    ]
+
+
 @strawberry.type
 class ExchangeFileMutations:
     @strawberry.mutation()
@@ -21,26 +63,97 @@ class ExchangeFileMutations:
         self,
         data: UploadExchangeFileInput,
         service: Injected[ExchangeFileService],
+    ) -> list[ExchangeFileUploadResultResponse]:
+        results = await service.upload_files(
+            uploads=list(data.files),
+            reporting_period=data.reporting_period,
+            is_pos=data.is_pos,
+            is_pot=data.is_pot,
+            target_org_ids=[uuid.UUID(str(org_id)) for org_id in data.target_org_ids],
+        )
+        return [ExchangeFileUploadResultResponse.from_result(r) for r in results]
+
+    @strawberry.mutation()
+    @inject
+    async def request_exchange_file_uploads(
+        self,
+        data: RequestExchangeFileUploadsInput,
+        service: Injected[ExchangeFileUploadService],
+    ) -> list[ExchangeFileUploadTicketResponse]:
+        tickets = await service.request_uploads(_upload_requests(data.files))
+        return [ExchangeFileUploadTicketResponse.from_ticket(t) for t in tickets]
+
+    @strawberry.mutation()
+    @inject
+    async def finalize_exchange_file_uploads(
+        self,
+        data: FinalizeExchangeFileUploadsInput,
+        service: Injected[ExchangeFileUploadService],
     ) -> list[ExchangeFileResponse]:
-        target_org_ids = [uuid.UUID(str(org_id)) for org_id in data.target_org_ids]
-        results: list[ExchangeFileResponse] = []
-
-        for upload_file in data.files:
-            file_obj: Any = upload_file
-            file_content = await file_obj.read()
-            file_name = file_obj.filename or "file"
-
-            exchange_file = await service.upload_file(
-                file_content=file_content,
-                file_name=file_name,
-                reporting_period=data.reporting_period,
-                is_pos=data.is_pos,
-                is_pot=data.is_pot,
-                target_org_ids=target_org_ids,
-            )
-            results.append(ExchangeFileResponse.from_model(exchange_file))
-
-        return results
+        exchange_files = await service.finalize_uploads(
+            files=_finalize_requests(data.files),
+            reporting_period=data.reporting_period,
+            is_pos=data.is_pos,
+            is_pot=data.is_pot,
+            target_org_ids=[uuid.UUID(str(org_id)) for org_id in data.target_org_ids],
+        )
+        return [ExchangeFileResponse.from_model(f) for f in exchange_files]
+
+    @strawberry.mutation()
+    @inject
+    async def initiate_exchange_file_upload(
+        self,
+        file_name: str,
+        service: Injected[ResumableUploadService],
+    ) -> ResumableUploadResponse:
+        upload = await service.initiate(file_name)
+        return ResumableUploadResponse.from_upload(upload)
+
+    @strawberry.mutation()
+    @inject
+    async def upload_exchange_file_part(
+        self,
+        upload_id: str,
+        key: str,
+        part_number: int,
+        file: Upload,
+        service: Injected[ResumableUploadService],
+    ) -> ResumableUploadPartResponse:
+        part = await service.upload_part(
+            upload_id=upload_id,
+            key=key,
+            part_number=part_number,
+            content=await service.read_part(file),
+        )
+        return ResumableUploadPartResponse.from_part(part)
+
+    @strawberry.mutation()
+    @inject
+    async def complete_exchange_file_upload(
+        self,
+        data: CompleteExchangeFileUploadInput,
+        service: Injected[ResumableUploadService],
+    ) -> ExchangeFileResponse:
+        exchange_file = await service.complete(
+            upload_id=data.upload_id,
+            key=data.key,
+            file_name=data.file_name,
+            reporting_period=data.reporting_period,
+            is_pos=data.is_pos,
+            is_pot=data.is_pot,
+            target_org_ids=[uuid.UUID(str(org_id)) for org_id in data.target_org_ids],
+        )
+        return ExchangeFileResponse.from_model(exchange_file)
+
+    @strawberry.mutation()
+    @inject
+    async def abort_exchange_file_upload(
+        self,
+        upload_id: str,
+        key: str,
+        service: Injected[ResumableUploadService],
+    ) -> bool:
+        return await service.abort(upload_id, key)
 
     @strawberry.mutation()
     @inject
@@ -4,10 +4,14 @@ import strawberry
 from aioinject import Injected
 
 from app.graphql.di import inject
-from app.graphql.pos.data_exchange.services import ExchangeFileService
+from app.graphql.pos.data_exchange.services import (
+    ExchangeFileService,
+    ResumableUploadService,
+)
 from app.graphql.pos.data_exchange.strawberry import (
     ExchangeFileResponse,
     PendingFilesStatsResponse,
+    ResumableUploadPartResponse,
     SentExchangeFilesByOrgResponse,
     SentExchangeFilesByPeriodResponse,
 )
@@ -72,3 +76,14 @@ class ExchangeFileQueries:
             )
             for group in groups
         ]
+
+    @strawberry.field()
+    @inject
+    async def exchange_file_upload_parts(
+        self,
+        upload_id: str,
+        key: str,
+        service: Injected[ResumableUploadService],
+    ) -> list[ResumableUploadPartResponse]:
+        parts = await service.list_parts(upload_id, key)
+        return [ResumableUploadPartResponse.from_part(part) for part in parts]
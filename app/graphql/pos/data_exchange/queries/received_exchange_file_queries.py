@@ -4,7 +4,7 @@ import strawberry
 from aioinject import Injected
 
 from app.graphql.di import inject
-from app.graphql.organizations.repositories import OrganizationSearchRepository
+from app.graphql.organizations.loaders import OrgNameLoader
 from app.graphql.pos.data_exchange.services import ReceivedExchangeFileService
 from app.graphql.pos.data_exchange.strawberry import ReceivedExchangeFileResponse
 
@@ -16,7 +16,7 @@ class ReceivedExchangeFileQueries:
     async def received_exchange_files(
         self,
         service: Injected[ReceivedExchangeFileService],
-        org_search_repository: Injected[OrganizationSearchRepository],
+        org_name_loader: Injected[OrgNameLoader],
         period: str | None = None,
         senders: list[strawberry.ID] | None = None,
         is_pos: bool | None = None,
@@ -36,13 +36,9 @@ class ReceivedExchangeFileQueries:
         if not files:
             return []
 
-        # Resolve sender org names
-        sender_org_ids = list({f.sender_org_id for f in files})
-        org_names = await org_search_repository.get_names_by_ids(sender_org_ids)
+        sender_names = await org_name_loader.load_many([f.sender_org_id for f in files])
 
         return [
-            ReceivedExchangeFileResponse.from_model(
-                f, sender_org_name=org_names.get(f.sender_org_id, "")
-            )
-            for f in files
+            ReceivedExchangeFileResponse.from_model(f, sender_org_name=name)
+            for f, name in zip(files, sender_names, strict=True)
         ]
@@ -1,10 +1,11 @@
 import uuid
 from typing import Any
 
-from sqlalchemy import delete, func, select, update
-from sqlalchemy.orm import joinedload
+from sqlalchemy import delete, event, func, select, update
+from sqlalchemy.orm import Session, joinedload
 
 from app.core.db.transient_session import TenantSession
+from app.graphql.pos.dashboard.glance_cache import DashboardGlanceCache
 from app.graphql.pos.data_exchange.models import (
     ExchangeFile,
     ExchangeFileStatus,
@@ -13,15 +14,50 @@ from app.graphql.pos.data_exchange.models import (
 
 
 class ExchangeFileRepository:
-    def __init__(self, session: TenantSession) -> None:
+    def __init__(
+        self,
+        session: TenantSession,
+        glance_cache: DashboardGlanceCache,
+    ) -> None:
         self.session = session
+        self.glance_cache = glance_cache
+        self._written_org_ids: set[uuid.UUID] = set()
+
+    def _mark_written(self, *org_ids: uuid.UUID) -> None:
+        # Drop the orgs' dashboard glance now and again once the transaction
+        # commits, so no reader caches the pre-commit numbers in between
+        cache = self.glance_cache
+        cache.invalidate(*org_ids)
+        new_org_ids = set(org_ids) - self._written_org_ids
+        if not new_org_ids:
+            return
+        self._written_org_ids |= new_org_ids
+
+        def _invalidate_on_commit(_session: Session) -> None:
+            cache.invalidate(*new_org_ids)
+            self._written_org_ids -= new_org_ids
+
+        event.listen(
+            self.session.sync_session,
+            "after_commit",
+            _invalidate_on_commit,
+            once=True,
+        )
 
     async def create(self, file: ExchangeFile) -> ExchangeFile:
+        self._mark_written(file.org_id)
         self.session.add(file)
         await self.session.flush([file])
         return file
 
+    async def create_bulk(self, files: list[ExchangeFile]) -> list[ExchangeFile]:
+        self._mark_written(*(file.org_id for file in files))
+        self.session.add_all(files)
+        await self.session.flush(files)
+        return files
+
     async def update(self, file: ExchangeFile) -> ExchangeFile:
+        self._mark_written(file.org_id)
         await self.session.flush([file])
         return file
 
@@ -70,10 +106,41 @@ class ExchangeFileRepository:
         count = result.scalar_one_or_none()
         return count is not None and count > 0
 
+    async def pending_shas_with_targets(
+        self,
+        org_id: uuid.UUID,
+        file_shas: list[str],
+        target_org_ids: list[uuid.UUID],
+    ) -> set[str]:
+        """Which of `file_shas` a pending file already sends to any target."""
+        if not file_shas:
+            return set()
+        stmt = (
+            select(ExchangeFile.file_sha)
+            .distinct()
+            .join(ExchangeFileTargetOrg)
+            .where(
+                ExchangeFile.org_id == org_id,
+                ExchangeFile.file_sha.in_(file_shas),
+                ExchangeFile.status == ExchangeFileStatus.PENDING.value,
+                ExchangeFileTargetOrg.connected_org_id.in_(target_org_ids),
+            )
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
     async def delete(self, file_id: uuid.UUID) -> bool:
-        stmt = delete(ExchangeFile).where(ExchangeFile.id == file_id)
-        result: Any = await self.session.execute(stmt)
-        return result.rowcount > 0
+        stmt = (
+            delete(ExchangeFile)
+            .where(ExchangeFile.id == file_id)
+            .returning(ExchangeFile.org_id)
+        )
+        result = await self.session.execute(stmt)
+        org_id = result.scalar_one_or_none()
+        if org_id is None:
+            return False
+        self._mark_written(org_id)
+        return True
 
     async def get_pending_stats(self, org_id: uuid.UUID) -> tuple[int, int]:
         stmt = select(
@@ -138,6 +205,7 @@ class ExchangeFileRepository:
         return result.scalar_one_or_none()
 
     async def update_pending_to_sent(self, org_id: uuid.UUID) -> int:
+        self._mark_written(org_id)
         stmt = (
             update(ExchangeFile)
             .where(
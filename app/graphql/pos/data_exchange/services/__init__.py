@@ -4,12 +4,20 @@ from app.graphql.pos.data_exchange.services.cross_tenant_delivery_service import
 from app.graphql.pos.data_exchange.services.exchange_file_service import (
     ExchangeFileService,
 )
+from app.graphql.pos.data_exchange.services.exchange_file_upload_service import (
+    ExchangeFileUploadService,
+)
 from app.graphql.pos.data_exchange.services.received_exchange_file_service import (
     ReceivedExchangeFileService,
 )
+from app.graphql.pos.data_exchange.services.resumable_upload_service import (
+    ResumableUploadService,
+)
 
 __all__ = [
     "CrossTenantDeliveryService",
     "ExchangeFileService",
+    "ExchangeFileUploadService",
     "ReceivedExchangeFileService",
+    "ResumableUploadService",
 ]
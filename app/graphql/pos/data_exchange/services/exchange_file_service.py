@@ -1,10 +1,12 @@
+import asyncio
 import hashlib
-import io
 import uuid
 from dataclasses import dataclass, field
+from typing import Any
 
 from commons.auth import AuthInfo
 from commons.s3.service import S3Service
+from loguru import logger
 
 from app.graphql.connections.repositories.user_org_repository import UserOrgRepository
 from app.graphql.organizations.repositories import OrganizationSearchRepository
@@ -14,6 +16,7 @@ from app.graphql.pos.data_exchange.exceptions import (
     ExchangeFileError,
     ExchangeFileNotFoundError,
     HasBlockingValidationIssuesError,
+    InvalidFileTypeError,
     NoPendingFilesError,
 )
 from app.graphql.pos.data_exchange.models import (
@@ -32,6 +35,41 @@ from app.graphql.pos.data_exchange.services.file_validators import (
 from app.graphql.pos.validations.repositories import FileValidationIssueRepository
 from app.graphql.pos.validations.services.validation_task import trigger_validation_task
 
+# Files of one multi-file upload that are hashed, counted or stored at once
+UPLOAD_CONCURRENCY = 4
+
+DUPLICATE_FILE_MESSAGE = (
+    "A pending file with the same content already targets "
+    "one of the selected organizations"
+)
+
+
+def exchange_file_s3_key(org_id: uuid.UUID, file_sha: str, file_type: str) -> str:
+    return f"exchange-files/{org_id}/{file_sha}.{file_type}"
+
+
+def _hash_and_count(file_content: bytes, file_type: str) -> tuple[str, int]:
+    return hashlib.sha256(file_content).hexdigest(), count_rows(file_content, file_type)
+
+
+@dataclass
+class FileUploadResult:
+    """Outcome of one file in a multi-file upload: the created file or an error."""
+
+    file_name: str
+    exchange_file: ExchangeFile | None = None
+    error: str | None = None
+
+
+@dataclass
+class _PreparedUpload:
+    result: FileUploadResult
+    upload: Any
+    file_type: str = ""
+    file_sha: str = ""
+    file_size: int = 0
+    row_count: int = 0
+
 
 @dataclass
 class SentFilesByOrg:
@@ -59,7 +97,7 @@ class ExchangeFileService:
         org_search_repository: OrganizationSearchRepository,
         validation_issue_repository: FileValidationIssueRepository,
         auth_info: AuthInfo,
-        delivery_service: CrossTenantDeliveryService | None = None,
+        delivery_service: CrossTenantDeliveryService,
     ) -> None:
         self.repository = repository
         self.s3_service = s3_service
@@ -76,43 +114,167 @@ class ExchangeFileService:
             self.auth_info.auth_provider_id
         )
 
-    async def upload_file(
+    async def upload_files(
         self,
-        file_content: bytes,
-        file_name: str,
+        uploads: list[Any],
         reporting_period: str,
         is_pos: bool,
         is_pot: bool,
         target_org_ids: list[uuid.UUID],
-    ) -> ExchangeFile:
+    ) -> list[FileUploadResult]:
+        """Upload a batch of GraphQL file uploads, reporting errors per file.
+
+        Files are read, hashed, counted and stored concurrently, at most
+        `UPLOAD_CONCURRENCY` at a time, so only that many are held in memory.
+        Duplicates are checked with one query, and every accepted file is
+        inserted in one flush. A file that fails doesn't stop the others.
+        """
         org_id = await self._get_user_org_id()
-        file_type = validate_file_type(file_name)
-        file_sha = hashlib.sha256(file_content).hexdigest()
+        semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
 
-        has_duplicate = await self.repository.has_pending_with_sha_and_target(
+        prepared = await asyncio.gather(
+            *(self._prepare_upload(upload, semaphore) for upload in uploads)
+        )
+        uploads = [upload for upload in prepared if upload.result.error is None]
+
+        pending_shas = await self.repository.pending_shas_with_targets(
             org_id=org_id,
-            file_sha=file_sha,
+            file_shas=list({upload.file_sha for upload in uploads}),
             target_org_ids=target_org_ids,
         )
-        if has_duplicate:
-            raise DuplicateFileForTargetError(
-                "A pending file with the same content already targets "
-                "one of the selected organizations"
-            )
-
-        row_count = count_rows(file_content, file_type)
-        s3_key = f"exchange-files/{org_id}/{file_sha}.{file_type}"
+        seen_shas: set[str] = set()
+        for upload in uploads:
+            if upload.file_sha in pending_shas or upload.file_sha in seen_shas:
+                upload.result.error = DUPLICATE_FILE_MESSAGE
+            seen_shas.add(upload.file_sha)
+        uploads = [upload for upload in uploads if upload.result.error is None]
+
+        await asyncio.gather(
+            *(self._store_upload(org_id, upload, semaphore) for upload in uploads)
+        )
 
-        await self.s3_service.upload(
-            key=s3_key,
-            file_obj=io.BytesIO(file_content),
+        exchange_files: list[ExchangeFile] = []
+        for upload in uploads:
+            if upload.result.error is not None:
+                continue
+            upload.result.exchange_file = self._build_file(
+                org_id=org_id,
+                s3_key=exchange_file_s3_key(org_id, upload.file_sha, upload.file_type),
+                file_name=upload.result.file_name,
+                file_size=upload.file_size,
+                file_sha=upload.file_sha,
+                file_type=upload.file_type,
+                row_count=upload.row_count,
+                reporting_period=reporting_period,
+                is_pos=is_pos,
+                is_pot=is_pot,
+                target_org_ids=target_org_ids,
+            )
+            exchange_files.append(upload.result.exchange_file)
+
+        if exchange_files:
+            await self.repository.create_bulk(exchange_files)
+            for exchange_file in exchange_files:
+                trigger_validation_task(exchange_file.id)
+
+        return [upload.result for upload in prepared]
+
+    @staticmethod
+    async def _prepare_upload(
+        file_upload: Any,
+        semaphore: asyncio.Semaphore,
+    ) -> _PreparedUpload:
+        file_name = file_upload.filename or "file"
+        upload = _PreparedUpload(
+            result=FileUploadResult(file_name=file_name),
+            upload=file_upload,
         )
+        try:
+            upload.file_type = validate_file_type(file_name)
+            async with semaphore:
+                file_content = await file_upload.read()
+                upload.file_size = len(file_content)
+                # Counting rows parses the whole file, so it runs off the loop
+                upload.file_sha, upload.row_count = await asyncio.to_thread(
+                    _hash_and_count, file_content, upload.file_type
+                )
+        except InvalidFileTypeError as e:
+            upload.result.error = e.message
+        except UnicodeDecodeError:
+            upload.result.error = f"{file_name} is not a UTF-8 encoded CSV file"
+        return upload
+
+    async def _store_upload(
+        self,
+        org_id: uuid.UUID,
+        upload: _PreparedUpload,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        s3_key = exchange_file_s3_key(org_id, upload.file_sha, upload.file_type)
+        async with semaphore:
+            # noinspection PyBroadException
+            # A failed store is reported on its file; the rest of the batch goes on
+            try:
+                # Stored from the upload's spooled file rather than kept in memory
+                await upload.upload.seek(0)
+                await self.s3_service.upload(key=s3_key, file_obj=upload.upload.file)
+            except Exception as e:
+                logger.error(f"Failed to store exchange file {s3_key}: {e}")
+                upload.result.error = f"{upload.result.file_name} could not be stored"
+
+    async def create_file(
+        self,
+        *,
+        org_id: uuid.UUID,
+        s3_key: str,
+        file_name: str,
+        file_size: int,
+        file_sha: str,
+        file_type: str,
+        row_count: int,
+        reporting_period: str,
+        is_pos: bool,
+        is_pot: bool,
+        target_org_ids: list[uuid.UUID],
+    ) -> ExchangeFile:
+        """Record a file already stored at `s3_key` and queue its validation."""
+        exchange_file = self._build_file(
+            org_id=org_id,
+            s3_key=s3_key,
+            file_name=file_name,
+            file_size=file_size,
+            file_sha=file_sha,
+            file_type=file_type,
+            row_count=row_count,
+            reporting_period=reporting_period,
+            is_pos=is_pos,
+            is_pot=is_pot,
+            target_org_ids=target_org_ids,
+        )
+        created_file = await self.repository.create(exchange_file)
+        trigger_validation_task(created_file.id)
+        return created_file
 
+    def _build_file(
+        self,
+        *,
+        org_id: uuid.UUID,
+        s3_key: str,
+        file_name: str,
+        file_size: int,
+        file_sha: str,
+        file_type: str,
+        row_count: int,
+        reporting_period: str,
+        is_pos: bool,
+        is_pot: bool,
+        target_org_ids: list[uuid.UUID],
+    ) -> ExchangeFile:
         exchange_file = ExchangeFile(
             org_id=org_id,
             s3_key=s3_key,
             file_name=file_name,
-            file_size=len(file_content),
+            file_size=file_size,
             file_sha=file_sha,
             file_type=file_type,
             row_count=row_count,
@@ -126,10 +288,21 @@ class ExchangeFileService:
         for target_org_id in target_org_ids:
             target = ExchangeFileTargetOrg(connected_org_id=target_org_id)
             exchange_file.target_organizations.append(target)
+        return exchange_file
 
-        created_file = await self.repository.create(exchange_file)
-        trigger_validation_task(created_file.id)
-        return created_file
+    async def check_duplicate(
+        self,
+        org_id: uuid.UUID,
+        file_sha: str,
+        target_org_ids: list[uuid.UUID],
+    ) -> None:
+        has_duplicate = await self.repository.has_pending_with_sha_and_target(
+            org_id=org_id,
+            file_sha=file_sha,
+            target_org_ids=target_org_ids,
+        )
+        if has_duplicate:
+            raise DuplicateFileForTargetError(DUPLICATE_FILE_MESSAGE)
 
     async def delete_file(self, file_id: uuid.UUID) -> bool:
         org_id = await self._get_user_org_id()
@@ -222,7 +395,7 @@ class ExchangeFileService:
             raise NoPendingFilesError("No pending files to send")
 
         # Deliver files to target organizations' tenant databases
-        if self.delivery_service is not None and pending_files:
+        if pending_files:
             await self.delivery_service.deliver_files(pending_files)
 
         return count
@@ -0,0 +1,322 @@
+import asyncio
+import base64
+import contextlib
+import datetime
+import hashlib
+import re
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+from commons.auth import AuthInfo
+from commons.s3.service import S3Service
+
+from app.core.config.settings import Settings
+from app.core.s3.object_cache import S3ObjectCache
+from app.graphql.connections.repositories.user_org_repository import UserOrgRepository
+from app.graphql.pos.data_exchange.exceptions import (
+    ExchangeFileError,
+    InvalidUploadRequestError,
+    UploadNotFoundError,
+    UploadVerificationError,
+)
+from app.graphql.pos.data_exchange.models import ExchangeFile
+from app.graphql.pos.data_exchange.services.exchange_file_service import (
+    ExchangeFileService,
+    exchange_file_s3_key,
+)
+from app.graphql.pos.data_exchange.services.file_validators import (
+    count_rows,
+    validate_file_type,
+)
+
+CHECKSUM_ALGORITHM = "SHA256"
+# Objects without a stored checksum are hashed in chunks of this size
+HASH_CHUNK_BYTES = 1024 * 1024
+_SHA256_HEX = re.compile(r"^[0-9a-f]{64}$")
+UPLOAD_NAME = re.compile(r"^[0-9a-f-]{36}\.(csv|xls|xlsx)$")
+
+
+def upload_key_prefix(org_id: uuid.UUID) -> str:
+    """Where an org's uploads are staged before they are recorded.
+
+    Keys under it are unique per upload, so a failed upload never touches a
+    stored file; a bucket lifecycle rule expires the ones never finalized.
+    """
+    return f"exchange-files/{org_id}/uploads/"
+
+
+def sha256_checksum(file_sha: str) -> str:
+    """The base64 form S3 uses for `x-amz-checksum-sha256` of a hex digest."""
+    return base64.b64encode(bytes.fromhex(file_sha)).decode()
+
+
+async def object_sha256(client: Any, bucket: str, key: str) -> bytes:
+    """SHA-256 digest of a stored object, read in `HASH_CHUNK_BYTES` chunks."""
+    response = await client.get_object(Bucket=bucket, Key=key)
+    digest = hashlib.sha256()
+    async with response["Body"] as body:
+        async for chunk in body.iter_chunks(HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.digest()
+
+
+async def promote_staged_object(
+    s3_service: S3Service,
+    client: Any,
+    staging_key: str,
+    s3_key: str,
+) -> None:
+    """Move a verified upload from its staging key to its content key.
+
+    The content key is addressed by SHA-256 and the staged bytes were
+    verified, so replacing an existing object there changes nothing.
+    """
+    bucket = s3_service.bucket_name
+    staging_full_key = s3_service.get_full_key(staging_key)
+    await client.copy_object(
+        Bucket=bucket,
+        Key=s3_service.get_full_key(s3_key),
+        CopySource={"Bucket": bucket, "Key": staging_full_key},
+    )
+    await client.delete_object(Bucket=bucket, Key=staging_full_key)
+
+
+async def count_staged_rows(
+    s3_service: S3Service,
+    object_cache: S3ObjectCache,
+    client: Any,
+    staging_key: str,
+    file_name: str,
+    file_sha: str,
+    file_type: str,
+) -> int:
+    """Data rows of a verified upload, counted as single-request uploads are.
+
+    The object is read through the local cache, so the validation task that
+    follows reads it from disk. A CSV that isn't UTF-8 is deleted and
+    rejected, as a single-request upload of it would be.
+    """
+    try:
+        async with object_cache.open(s3_service, staging_key, file_sha) as content:
+            return await asyncio.to_thread(count_rows, content, file_type)
+    except UnicodeDecodeError as e:
+        await client.delete_object(
+            Bucket=s3_service.bucket_name, Key=s3_service.get_full_key(staging_key)
+        )
+        raise InvalidUploadRequestError(
+            f"{file_name} is not a UTF-8 encoded CSV file"
+        ) from e
+
+
+@dataclass
+class UploadRequest:
+    file_name: str
+    file_size: int
+    file_sha: str
+
+
+@dataclass
+class FinalizeRequest(UploadRequest):
+    key: str
+
+
+@dataclass
+class UploadTicket:
+    file_name: str
+    file_sha: str
+    key: str
+    url: str
+    fields: dict[str, str]
+    expires_at: datetime.datetime
+
+
+class ExchangeFileUploadService:
+    """Exchange file uploads that go from the browser straight to object storage.
+
+    `request_uploads` hands out presigned POSTs whose policy pins a fresh
+    staging key, the exact size and the SHA-256 checksum, so storage
+    rejects any other body. `finalize_uploads` checks the staged object
+    against the same values, counts its rows and only then copies it to the
+    file's content key, so a bad upload can't replace a file other rows
+    point at.
+
+    Stores that don't return `ChecksumSHA256` from `head_object` (DigitalOcean
+    Spaces among them) get each staged object streamed through the API once
+    to hash it, so there finalizing costs the file's size in bandwidth.
+    """
+
+    def __init__(
+        self,
+        exchange_file_service: ExchangeFileService,
+        s3_service: S3Service,
+        object_cache: S3ObjectCache,
+        user_org_repository: UserOrgRepository,
+        settings: Settings,
+        auth_info: AuthInfo,
+    ) -> None:
+        self.exchange_file_service = exchange_file_service
+        self.s3_service = s3_service
+        self.object_cache = object_cache
+        self.user_org_repository = user_org_repository
+        self.settings = settings
+        self.auth_info = auth_info
+
+    async def _get_user_org_id(self) -> uuid.UUID:
+        if self.auth_info.auth_provider_id is None:
+            raise ExchangeFileError("User not authenticated")
+        return await self.user_org_repository.get_user_org_id(
+            self.auth_info.auth_provider_id
+        )
+
+    @contextlib.asynccontextmanager
+    async def _client(self) -> AsyncIterator[Any]:
+        get_client: Any = self.s3_service.get_client
+        client_ctx: Any = await get_client()
+        async with client_ctx as client:
+            yield client
+
+    async def request_uploads(self, files: list[UploadRequest]) -> list[UploadTicket]:
+        org_id = await self._get_user_org_id()
+        expires_in = self.settings.exchange_upload_url_ttl_seconds
+        expires_at = datetime.datetime.now(datetime.UTC) + datetime.timedelta(
+            seconds=expires_in
+        )
+
+        tickets: list[UploadTicket] = []
+        async with self._client() as client:
+            for upload in files:
+                file_type = self._validate(upload)
+                s3_key = f"{upload_key_prefix(org_id)}{uuid.uuid4()}.{file_type}"
+                checksum = sha256_checksum(upload.file_sha)
+                post = await client.generate_presigned_post(
+                    Bucket=self.s3_service.bucket_name,
+                    Key=self.s3_service.get_full_key(s3_key),
+                    Fields={
+                        "x-amz-checksum-algorithm": CHECKSUM_ALGORITHM,
+                        "x-amz-checksum-sha256": checksum,
+                    },
+                    Conditions=[
+                        {"x-amz-checksum-algorithm": CHECKSUM_ALGORITHM},
+                        {"x-amz-checksum-sha256": checksum},
+                        ["content-length-range", upload.file_size, upload.file_size],
+                    ],
+                    ExpiresIn=expires_in,
+                )
+                tickets.append(
+                    UploadTicket(
+                        file_name=upload.file_name,
+                        file_sha=upload.file_sha,
+                        key=s3_key,
+                        url=post["url"],
+                        fields=post["fields"],
+                        expires_at=expires_at,
+                    )
+                )
+        return tickets
+
+    async def finalize_uploads(
+        self,
+        files: list[FinalizeRequest],
+        reporting_period: str,
+        is_pos: bool,
+        is_pot: bool,
+        target_org_ids: list[uuid.UUID],
+    ) -> list[ExchangeFile]:
+        org_id = await self._get_user_org_id()
+
+        created: list[ExchangeFile] = []
+        async with self._client() as client:
+            for upload in files:
+                file_type = self._validate(upload)
+                self._check_staging_key(org_id, upload.key, file_type)
+                await self.exchange_file_service.check_duplicate(
+                    org_id, upload.file_sha, target_org_ids
+                )
+                await self._verify_object(client, upload.key, upload)
+                row_count = await count_staged_rows(
+                    self.s3_service,
+                    self.object_cache,
+                    client,
+                    upload.key,
+                    upload.file_name,
+                    upload.file_sha,
+                    file_type,
+                )
+                s3_key = exchange_file_s3_key(org_id, upload.file_sha, file_type)
+                await promote_staged_object(self.s3_service, client, upload.key, s3_key)
+
+                exchange_file = await self.exchange_file_service.create_file(
+                    org_id=org_id,
+                    s3_key=s3_key,
+                    file_name=upload.file_name,
+                    file_size=upload.file_size,
+                    file_sha=upload.file_sha,
+                    file_type=file_type,
+                    row_count=row_count,
+                    reporting_period=reporting_period,
+                    is_pos=is_pos,
+                    is_pot=is_pot,
+                    target_org_ids=target_org_ids,
+                )
+                created.append(exchange_file)
+        return created
+
+    def _validate(self, upload: UploadRequest) -> str:
+        file_type = validate_file_type(upload.file_name)
+        upload.file_sha = upload.file_sha.lower()
+        if not _SHA256_HEX.match(upload.file_sha):
+            raise InvalidUploadRequestError(
+                f"Invalid SHA-256 for {upload.file_name}: expected 64 hex characters"
+            )
+        if not 0 < upload.file_size <= self.settings.exchange_upload_max_bytes:
+            raise InvalidUploadRequestError(
+                f"Invalid size for {upload.file_name}: must be between 1 and "
+                f"{self.settings.exchange_upload_max_bytes} bytes"
+            )
+        return file_type
+
+    @staticmethod
+    def _check_staging_key(org_id: uuid.UUID, key: str, file_type: str) -> None:
+        prefix = upload_key_prefix(org_id)
+        name = key[len(prefix) :]
+        if (
+            not key.startswith(prefix)
+            or not UPLOAD_NAME.match(name)
+            or not name.endswith(f".{file_type}")
+        ):
+            raise UploadNotFoundError("Upload not found")
+
+    async def _verify_object(
+        self,
+        client: Any,
+        s3_key: str,
+        upload: FinalizeRequest,
+    ) -> None:
+        bucket = self.s3_service.bucket_name
+        full_key = self.s3_service.get_full_key(s3_key)
+        try:
+            head = await client.head_object(
+                Bucket=bucket, Key=full_key, ChecksumMode="ENABLED"
+            )
+        except client.exceptions.ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                raise UploadNotFoundError(
+                    f"{upload.file_name} has not been uploaded"
+                ) from e
+            raise
+
+        checksum = head.get("ChecksumSHA256")
+        if checksum is None:
+            # Stores that don't keep checksums get the object hashed here
+            digest = await object_sha256(client, bucket, full_key)
+            checksum = base64.b64encode(digest).decode()
+
+        expected = sha256_checksum(upload.file_sha)
+        if head["ContentLength"] != upload.file_size or checksum != expected:
+            await client.delete_object(Bucket=bucket, Key=full_key)
+            raise UploadVerificationError(
+                f"Uploaded {upload.file_name} does not match its declared "
+                "size and SHA-256; upload it again"
+            )
@@ -1,5 +1,6 @@
 import csv
 import io
+import mmap
 
 from app.graphql.pos.data_exchange.exceptions import InvalidFileTypeError
 
@@ -15,7 +16,7 @@ def validate_file_type(file_name: str) -> str:
     return extension
 
 
-def count_rows(file_content: bytes, file_type: str) -> int:
+def count_rows(file_content: bytes | mmap.mmap, file_type: str) -> int:
     if file_type == "csv":
         return _count_csv_rows(file_content)
     if file_type == "xls":
@@ -25,8 +26,8 @@ def count_rows(file_content: bytes, file_type: str) -> int:
     return 0
 
 
-def _count_csv_rows(file_content: bytes) -> int:
-    text = file_content.decode("utf-8")
+def _count_csv_rows(file_content: bytes | mmap.mmap) -> int:
+    text = str(file_content, "utf-8")
     reader = csv.reader(io.StringIO(text))
     rows = list(reader)
     return max(0, len(rows) - 1)
@@ -34,11 +35,11 @@ def _count_csv_rows(file_content: bytes) -> int:
 
 # noinspection PyBroadException
 # User files can fail in unpredictable ways; return 0 rather than crash
-def _count_xls_rows(file_content: bytes) -> int:
+def _count_xls_rows(file_content: bytes | mmap.mmap) -> int:
     try:
         import xlrd
 
-        workbook = xlrd.open_workbook(file_contents=file_content)
+        workbook = xlrd.open_workbook(file_contents=bytes(file_content))
         sheet = workbook.sheet_by_index(0)
         return max(0, sheet.nrows - 1)
     except Exception:
@@ -47,7 +48,7 @@ def _count_xls_rows(file_content: bytes) -> int:
 
 # noinspection PyBroadException
 # User files can fail in unpredictable ways; return 0 rather than crash
-def _count_xlsx_rows(file_content: bytes) -> int:
+def _count_xlsx_rows(file_content: bytes | mmap.mmap) -> int:
     try:
         from openpyxl import load_workbook
 
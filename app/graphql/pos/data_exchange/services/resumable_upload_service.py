@@ -0,0 +1,339 @@
+import contextlib
+import hashlib
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+from commons.auth import AuthInfo
+from commons.s3.service import S3Service
+
+from app.core.config.settings import Settings
+from app.core.s3.object_cache import S3ObjectCache
+from app.graphql.connections.repositories.user_org_repository import UserOrgRepository
+from app.graphql.pos.data_exchange.exceptions import (
+    DuplicateFileForTargetError,
+    ExchangeFileError,
+    IncompleteUploadError,
+    InvalidUploadRequestError,
+    UploadNotFoundError,
+)
+from app.graphql.pos.data_exchange.models import ExchangeFile
+from app.graphql.pos.data_exchange.services.exchange_file_service import (
+    ExchangeFileService,
+    exchange_file_s3_key,
+)
+from app.graphql.pos.data_exchange.services.exchange_file_upload_service import (
+    CHECKSUM_ALGORITHM,
+    UPLOAD_NAME,
+    count_staged_rows,
+    object_sha256,
+    promote_staged_object,
+    sha256_checksum,
+    upload_key_prefix,
+)
+from app.graphql.pos.data_exchange.services.file_validators import validate_file_type
+from app.graphql.pos.data_exchange.upload_digests import UploadDigests
+
+# S3 limits: part numbers run 1-10000 and every part but the last must be
+# at least 5 MiB, which S3 enforces when the upload is completed
+MAX_PART_NUMBER = 10_000
+MIN_PART_BYTES = 5 * 1024 * 1024
+
+
+@dataclass
+class ResumableUpload:
+    upload_id: str
+    key: str
+    min_part_size: int
+    max_part_size: int
+
+
+@dataclass
+class UploadedPart:
+    part_number: int
+    size: int
+    checksum: str
+    etag: str
+
+
+class ResumableUploadService:
+    """Resumable exchange file uploads mapped onto S3 multipart uploads.
+
+    S3 keeps the received parts, so an interrupted client asks which parts
+    arrived and sends only the rest. Every part carries its SHA-256, which
+    S3 checks on receipt. Completing the upload runs the same duplicate
+    check and validation trigger as a single-request upload.
+    """
+
+    def __init__(
+        self,
+        exchange_file_service: ExchangeFileService,
+        s3_service: S3Service,
+        object_cache: S3ObjectCache,
+        user_org_repository: UserOrgRepository,
+        upload_digests: UploadDigests,
+        settings: Settings,
+        auth_info: AuthInfo,
+    ) -> None:
+        self.exchange_file_service = exchange_file_service
+        self.s3_service = s3_service
+        self.object_cache = object_cache
+        self.user_org_repository = user_org_repository
+        self.upload_digests = upload_digests
+        self.settings = settings
+        self.auth_info = auth_info
+
+    async def _get_user_org_id(self) -> uuid.UUID:
+        if self.auth_info.auth_provider_id is None:
+            raise ExchangeFileError("User not authenticated")
+        return await self.user_org_repository.get_user_org_id(
+            self.auth_info.auth_provider_id
+        )
+
+    @contextlib.asynccontextmanager
+    async def _client(self) -> AsyncIterator[Any]:
+        get_client: Any = self.s3_service.get_client
+        client_ctx: Any = await get_client()
+        async with client_ctx as client:
+            yield client
+
+    async def initiate(self, file_name: str) -> ResumableUpload:
+        org_id = await self._get_user_org_id()
+        file_type = validate_file_type(file_name)
+        key = f"{upload_key_prefix(org_id)}{uuid.uuid4()}.{file_type}"
+
+        async with self._client() as client:
+            response = await client.create_multipart_upload(
+                Bucket=self.s3_service.bucket_name,
+                Key=self.s3_service.get_full_key(key),
+                ChecksumAlgorithm=CHECKSUM_ALGORITHM,
+            )
+        return ResumableUpload(
+            upload_id=response["UploadId"],
+            key=key,
+            min_part_size=MIN_PART_BYTES,
+            max_part_size=self.settings.exchange_upload_part_max_bytes,
+        )
+
+    async def read_part(self, upload: Any) -> bytes:
+        """An uploaded part's content, read no further than the part size limit.
+
+        One byte past the limit is enough for `upload_part` to reject an
+        oversized part without holding all of it in memory.
+        """
+        return await upload.read(self.settings.exchange_upload_part_max_bytes + 1)
+
+    async def upload_part(
+        self,
+        upload_id: str,
+        key: str,
+        part_number: int,
+        content: bytes,
+    ) -> UploadedPart:
+        await self._check_key(key)
+        if not 1 <= part_number <= MAX_PART_NUMBER:
+            raise InvalidUploadRequestError(
+                f"Part number must be between 1 and {MAX_PART_NUMBER}"
+            )
+        if not 0 < len(content) <= self.settings.exchange_upload_part_max_bytes:
+            raise InvalidUploadRequestError(
+                "Part size must be between 1 and "
+                f"{self.settings.exchange_upload_part_max_bytes} bytes"
+            )
+
+        checksum = sha256_checksum(hashlib.sha256(content).hexdigest())
+        async with self._client() as client, self._upload_errors(client):
+            response = await client.upload_part(
+                Bucket=self.s3_service.bucket_name,
+                Key=self.s3_service.get_full_key(key),
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=content,
+                ChecksumAlgorithm=CHECKSUM_ALGORITHM,
+                ChecksumSHA256=checksum,
+            )
+
+        self.upload_digests.add_part(upload_id, part_number, checksum, content)
+        return UploadedPart(
+            part_number=part_number,
+            size=len(content),
+            checksum=checksum,
+            etag=response["ETag"],
+        )
+
+    async def list_parts(self, upload_id: str, key: str) -> list[UploadedPart]:
+        await self._check_key(key)
+        async with self._client() as client, self._upload_errors(client):
+            return await self._list_parts(client, upload_id, key)
+
+    async def complete(
+        self,
+        upload_id: str,
+        key: str,
+        file_name: str,
+        reporting_period: str,
+        is_pos: bool,
+        is_pot: bool,
+        target_org_ids: list[uuid.UUID],
+    ) -> ExchangeFile:
+        org_id = await self._check_key(key)
+        file_type = validate_file_type(file_name)
+        if not key.endswith(f".{file_type}"):
+            raise InvalidUploadRequestError(
+                f"{file_name} does not match the type the upload was started with"
+            )
+
+        bucket = self.s3_service.bucket_name
+        full_key = self.s3_service.get_full_key(key)
+        async with self._client() as client:
+            async with self._upload_errors(client):
+                parts = await self._list_parts(client, upload_id, key)
+            self._check_parts(parts)
+
+            async with self._upload_errors(client):
+                await client.complete_multipart_upload(
+                    Bucket=bucket,
+                    Key=full_key,
+                    UploadId=upload_id,
+                    MultipartUpload={
+                        "Parts": [
+                            {
+                                "PartNumber": part.part_number,
+                                "ETag": part.etag,
+                                "ChecksumSHA256": part.checksum,
+                            }
+                            for part in parts
+                        ]
+                    },
+                )
+
+            file_sha = self.upload_digests.hexdigest(
+                upload_id, [part.checksum for part in parts]
+            )
+            self.upload_digests.discard(upload_id)
+            if file_sha is None:
+                # The parts weren't all hashed in this worker
+                file_sha = (await object_sha256(client, bucket, full_key)).hex()
+
+            try:
+                await self.exchange_file_service.check_duplicate(
+                    org_id, file_sha, target_org_ids
+                )
+            except DuplicateFileForTargetError:
+                await client.delete_object(Bucket=bucket, Key=full_key)
+                raise
+
+            row_count = await count_staged_rows(
+                self.s3_service,
+                self.object_cache,
+                client,
+                key,
+                file_name,
+                file_sha,
+                file_type,
+            )
+            # Off the uploads prefix, which expires, onto the key every other
+            # upload path stores its files under
+            s3_key = exchange_file_s3_key(org_id, file_sha, file_type)
+            await promote_staged_object(self.s3_service, client, key, s3_key)
+
+        return await self.exchange_file_service.create_file(
+            org_id=org_id,
+            s3_key=s3_key,
+            file_name=file_name,
+            file_size=sum(part.size for part in parts),
+            file_sha=file_sha,
+            file_type=file_type,
+            row_count=row_count,
+            reporting_period=reporting_period,
+            is_pos=is_pos,
+            is_pot=is_pot,
+            target_org_ids=target_org_ids,
+        )
+
+    async def abort(self, upload_id: str, key: str) -> bool:
+        await self._check_key(key)
+        self.upload_digests.discard(upload_id)
+        async with self._client() as client, self._upload_errors(client):
+            await client.abort_multipart_upload(
+                Bucket=self.s3_service.bucket_name,
+                Key=self.s3_service.get_full_key(key),
+                UploadId=upload_id,
+            )
+        return True
+
+    async def _check_key(self, key: str) -> uuid.UUID:
+        """The caller's org id, if `key` is an upload the org could have started."""
+        org_id = await self._get_user_org_id()
+        prefix = upload_key_prefix(org_id)
+        if not key.startswith(prefix) or not UPLOAD_NAME.match(key[len(prefix) :]):
+            raise UploadNotFoundError("Upload not found")
+        return org_id
+
+    def _check_parts(self, parts: list[UploadedPart]) -> None:
+        if not parts:
+            raise IncompleteUploadError("No parts have been uploaded")
+
+        missing = [
+            number
+            for number, part in enumerate(parts, start=1)
+            if part.part_number != number
+        ]
+        if missing:
+            raise IncompleteUploadError(f"Part {missing[0]} has not been uploaded")
+
+        for part in parts[:-1]:
+            if part.size < MIN_PART_BYTES:
+                raise InvalidUploadRequestError(
+                    f"Part {part.part_number} is smaller than {MIN_PART_BYTES} "
+                    "bytes; only the last part may be smaller"
+                )
+
+        if sum(part.size for part in parts) > self.settings.exchange_upload_max_bytes:
+            raise InvalidUploadRequestError(
+                f"File is larger than {self.settings.exchange_upload_max_bytes} bytes"
+            )
+
+    async def _list_parts(
+        self,
+        client: Any,
+        upload_id: str,
+        key: str,
+    ) -> list[UploadedPart]:
+        parts: list[UploadedPart] = []
+        marker = 0
+        while True:
+            response = await client.list_parts(
+                Bucket=self.s3_service.bucket_name,
+                Key=self.s3_service.get_full_key(key),
+                UploadId=upload_id,
+                PartNumberMarker=marker,
+            )
+            parts.extend(
+                UploadedPart(
+                    part_number=part["PartNumber"],
+                    size=part["Size"],
+                    checksum=part.get("ChecksumSHA256", ""),
+                    etag=part["ETag"],
+                )
+                for part in response.get("Parts", [])
+            )
+            if not response.get("IsTruncated"):
+                return parts
+            marker = response["NextPartNumberMarker"]
+
+    @staticmethod
+    @contextlib.asynccontextmanager
+    async def _upload_errors(client: Any) -> AsyncIterator[None]:
+        try:
+            yield
+        except client.exceptions.ClientError as e:
+            code = e.response["Error"]["Code"]
+            if code in ("NoSuchUpload", "404"):
+                raise UploadNotFoundError("Upload not found") from e
+            if code in ("EntityTooSmall", "InvalidPart", "BadDigest"):
+                raise InvalidUploadRequestError(
+                    f"Storage rejected the upload parts ({code})"
+                ) from e
+            raise
@@ -1,4 +1,9 @@
 from app.graphql.pos.data_exchange.strawberry.exchange_file_inputs import (
+    CompleteExchangeFileUploadInput,
+    ExchangeFileUploadInput,
+    FinalizeExchangeFileUploadInput,
+    FinalizeExchangeFileUploadsInput,
+    RequestExchangeFileUploadsInput,
     UploadExchangeFileInput,
 )
 from app.graphql.pos.data_exchange.strawberry.exchange_file_types import (
@@ -6,7 +11,11 @@ from app.graphql.pos.data_exchange.strawberry.exchange_file_types import (
     ExchangeFileResponse,
     ExchangeFileStatusEnum,
     ExchangeFileTargetOrgResponse,
+    ExchangeFileUploadResultResponse,
+    ExchangeFileUploadTicketResponse,
     PendingFilesStatsResponse,
+    ResumableUploadPartResponse,
+    ResumableUploadResponse,
     SendPendingFilesResponse,
     SentExchangeFilesByOrgResponse,
     SentExchangeFilesByPeriodResponse,
@@ -18,14 +27,23 @@ from app.graphql.pos.data_exchange.strawberry.received_exchange_file_types impor
 )
 
 __all__ = [
+    "CompleteExchangeFileUploadInput",
     "DownloadReceivedFileResponse",
     "ExchangeFileLiteResponse",
     "ExchangeFileResponse",
     "ExchangeFileStatusEnum",
     "ExchangeFileTargetOrgResponse",
+    "ExchangeFileUploadInput",
+    "ExchangeFileUploadResultResponse",
+    "ExchangeFileUploadTicketResponse",
+    "FinalizeExchangeFileUploadInput",
+    "FinalizeExchangeFileUploadsInput",
     "PendingFilesStatsResponse",
     "ReceivedExchangeFileResponse",
     "ReceivedExchangeFileStatusEnum",
+    "RequestExchangeFileUploadsInput",
+    "ResumableUploadPartResponse",
+    "ResumableUploadResponse",
     "SendPendingFilesResponse",
     "SentExchangeFilesByOrgResponse",
     "SentExchangeFilesByPeriodResponse",
@@ -9,3 +9,43 @@ class UploadExchangeFileInput:
     is_pos: bool
     is_pot: bool
     target_org_ids: list[strawberry.ID]
+
+
+@strawberry.input
+class ExchangeFileUploadInput:
+    file_name: str
+    file_size: int
+    file_sha: str
+
+
+@strawberry.input
+class RequestExchangeFileUploadsInput:
+    files: list[ExchangeFileUploadInput]
+
+
+@strawberry.input
+class FinalizeExchangeFileUploadInput:
+    file_name: str
+    file_size: int
+    file_sha: str
+    key: str
+
+
+@strawberry.input
+class FinalizeExchangeFileUploadsInput:
+    files: list[FinalizeExchangeFileUploadInput]
+    reporting_period: str
+    is_pos: bool
+    is_pot: bool
+    target_org_ids: list[strawberry.ID]
+
+
+@strawberry.input
+class CompleteExchangeFileUploadInput:
+    upload_id: str
+    key: str
+    file_name: str
+    reporting_period: str
+    is_pos: bool
+    is_pot: bool
+    target_org_ids: list[strawberry.ID]
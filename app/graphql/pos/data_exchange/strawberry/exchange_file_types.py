@@ -2,6 +2,7 @@ import datetime
 from enum import Enum
 
 import strawberry
+from strawberry.scalars import JSON
 
 from app.graphql.pos.data_exchange.models import (
     ExchangeFile,
@@ -9,6 +10,16 @@ from app.graphql.pos.data_exchange.models import (
     ExchangeFileTargetOrg,
     ValidationStatus,
 )
+from app.graphql.pos.data_exchange.services.exchange_file_service import (
+    FileUploadResult,
+)
+from app.graphql.pos.data_exchange.services.exchange_file_upload_service import (
+    UploadTicket,
+)
+from app.graphql.pos.data_exchange.services.resumable_upload_service import (
+    ResumableUpload,
+    UploadedPart,
+)
 
 
 @strawberry.enum
@@ -104,6 +115,25 @@ class ExchangeFileResponse(ExchangeFileLiteResponse):
         )
 
 
+@strawberry.type
+class ExchangeFileUploadResultResponse:
+    file_name: str
+    file: ExchangeFileResponse | None
+    error: str | None
+
+    @staticmethod
+    def from_result(result: FileUploadResult) -> "ExchangeFileUploadResultResponse":
+        return ExchangeFileUploadResultResponse(
+            file_name=result.file_name,
+            file=(
+                ExchangeFileResponse.from_model(result.exchange_file)
+                if result.exchange_file is not None
+                else None
+            ),
+            error=result.error,
+        )
+
+
 @strawberry.type
 class PendingFilesStatsResponse:
     file_count: int
@@ -128,3 +158,56 @@ class SentExchangeFilesByPeriodResponse:
 class SendPendingFilesResponse:
     success: bool
     files_sent: int
+
+
+@strawberry.type
+class ExchangeFileUploadTicketResponse:
+    file_name: str
+    file_sha: str
+    key: str
+    url: str
+    fields: JSON
+    expires_at: datetime.datetime
+
+    @staticmethod
+    def from_ticket(ticket: UploadTicket) -> "ExchangeFileUploadTicketResponse":
+        return ExchangeFileUploadTicketResponse(
+            file_name=ticket.file_name,
+            file_sha=ticket.file_sha,
+            key=ticket.key,
+            url=ticket.url,
+            fields=ticket.fields,
+            expires_at=ticket.expires_at,
+        )
+
+
+@strawberry.type
+class ResumableUploadResponse:
+    upload_id: str
+    key: str
+    min_part_size: int
+    max_part_size: int
+
+    @staticmethod
+    def from_upload(upload: ResumableUpload) -> "ResumableUploadResponse":
+        return ResumableUploadResponse(
+            upload_id=upload.upload_id,
+            key=upload.key,
+            min_part_size=upload.min_part_size,
+            max_part_size=upload.max_part_size,
+        )
+
+
+@strawberry.type
+class ResumableUploadPartResponse:
+    part_number: int
+    size: int
+    checksum: str
+
+    @staticmethod
+    def from_part(part: UploadedPart) -> "ResumableUploadPartResponse":
+        return ResumableUploadPartResponse(
+            part_number=part.part_number,
+            size=part.size,
+            checksum=part.checksum,
+        )
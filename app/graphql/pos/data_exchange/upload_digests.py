@@ -0,0 +1,78 @@
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import aioinject
+
+from app.core.config.settings import Settings
+
+
+@dataclass
+class _RunningDigest:
+    sha: Any = field(default_factory=hashlib.sha256)
+    part_checksums: list[str] = field(default_factory=list)
+
+
+class UploadDigests:
+    """Running SHA-256 of resumable uploads whose parts arrived in order.
+
+    Each part is hashed into its upload's digest as it lands, so completing
+    an upload needs no second read of the file. The digest only exists in
+    the worker that received the parts; a part that arrives out of order or
+    in another worker drops it, and completion falls back to hashing the
+    assembled object.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._digests: OrderedDict[str, _RunningDigest] = OrderedDict()
+
+    def add_part(
+        self,
+        upload_id: str,
+        part_number: int,
+        checksum: str,
+        content: bytes,
+    ) -> None:
+        running = self._digests.get(upload_id)
+        if running is None and part_number == 1:
+            running = self._digests[upload_id] = _RunningDigest()
+        if running is None:
+            return
+
+        received = len(running.part_checksums)
+        if part_number == received + 1:
+            running.sha.update(content)
+            running.part_checksums.append(checksum)
+        elif (
+            part_number > received
+            or running.part_checksums[part_number - 1] != checksum
+        ):
+            # A retried part with the same bytes leaves the digest valid
+            del self._digests[upload_id]
+            return
+
+        self._digests.move_to_end(upload_id)
+        while len(self._digests) > self.max_entries:
+            self._digests.popitem(last=False)
+
+    def hexdigest(self, upload_id: str, part_checksums: list[str]) -> str | None:
+        """The file's SHA-256 if the digest covers exactly `part_checksums`."""
+        running = self._digests.get(upload_id)
+        if running is None or running.part_checksums != part_checksums:
+            return None
+        return running.sha.hexdigest()
+
+    def discard(self, upload_id: str) -> None:
+        self._digests.pop(upload_id, None)
+
+
+def create_upload_digests(settings: Settings) -> UploadDigests:
+    return UploadDigests(max_entries=settings.exchange_upload_digest_max_entries)
+
+
+providers: Iterable[aioinject.Provider[Any]] = [
+    aioinject.Singleton(create_upload_digests),
+]
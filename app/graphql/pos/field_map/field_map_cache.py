@@ -0,0 +1,175 @@
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import aioinject
+
+from app.core.config.settings import Settings
+from app.graphql.pos.field_map.models.field_map import FieldMap, FieldMapField
+
+# (tenant, organization_id, map_type, direction)
+FieldMapCacheKey = tuple[str, uuid.UUID | None, str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class FieldMapFieldSnapshot:
+    id: uuid.UUID
+    field_map_id: uuid.UUID
+    standard_field_key: str
+    category: str
+    standard_field_name: str
+    status: str
+    field_type: str
+    standard_field_name_description: str | None
+    organization_field_name: str | None
+    manufacturer: bool | None
+    rep: bool | None
+    linked: bool
+    preferred: bool
+    is_default: bool
+    display_order: int
+
+    @classmethod
+    def from_model(cls, field: FieldMapField) -> "FieldMapFieldSnapshot":
+        return cls(
+            id=field.id,
+            field_map_id=field.field_map_id,
+            standard_field_key=field.standard_field_key,
+            category=field.category,
+            standard_field_name=field.standard_field_name,
+            status=field.status,
+            field_type=field.field_type,
+            standard_field_name_description=field.standard_field_name_description,
+            organization_field_name=field.organization_field_name,
+            manufacturer=field.manufacturer,
+            rep=field.rep,
+            linked=field.linked,
+            preferred=field.preferred,
+            is_default=field.is_default,
+            display_order=field.display_order,
+        )
+
+    def to_model(self) -> FieldMapField:
+        field = FieldMapField(
+            field_map_id=self.field_map_id,
+            standard_field_key=self.standard_field_key,
+            category=self.category,
+            standard_field_name=self.standard_field_name,
+            status=self.status,
+            field_type=self.field_type,
+            standard_field_name_description=self.standard_field_name_description,
+            organization_field_name=self.organization_field_name,
+            manufacturer=self.manufacturer,
+            rep=self.rep,
+            linked=self.linked,
+            preferred=self.preferred,
+            is_default=self.is_default,
+            display_order=self.display_order,
+        )
+        field.id = self.id
+        return field
+
+
+@dataclass(frozen=True, slots=True)
+class FieldMapSnapshot:
+    id: uuid.UUID
+    organization_id: uuid.UUID | None
+    map_type: str
+    direction: str
+    created_by_id: uuid.UUID
+    fields: tuple[FieldMapFieldSnapshot, ...]
+
+    @classmethod
+    def from_model(cls, field_map: FieldMap) -> "FieldMapSnapshot":
+        return cls(
+            id=field_map.id,
+            organization_id=field_map.organization_id,
+            map_type=field_map.map_type,
+            direction=field_map.direction,
+            created_by_id=field_map.created_by_id,
+            fields=tuple(
+                FieldMapFieldSnapshot.from_model(field) for field in field_map.fields
+            ),
+        )
+
+    def to_model(self) -> FieldMap:
+        """A transient copy, so callers can never mutate the cached snapshot."""
+        field_map = FieldMap(
+            map_type=self.map_type,
+            direction=self.direction,
+            organization_id=self.organization_id,
+        )
+        field_map.id = self.id
+        field_map.created_by_id = self.created_by_id
+        field_map.fields = [field.to_model() for field in self.fields]
+        return field_map
+
+
+class FieldMapCache:
+    """Field map snapshots shared by every request and validation job in a worker.
+
+    Each tenant has a version counter that saves bump. A loader reads the
+    version before querying and `put` drops its result if a save landed in
+    between, so a read racing a save can never cache the pre-save map. The
+    TTL bounds staleness for saves made by other workers.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[
+            FieldMapCacheKey, tuple[float, FieldMapSnapshot | None]
+        ] = OrderedDict()
+        self._versions: dict[str, int] = {}
+
+    def version(self, tenant: str) -> int:
+        return self._versions.get(tenant, 0)
+
+    def get(self, key: FieldMapCacheKey) -> tuple[bool, FieldMapSnapshot | None]:
+        """Returns `(found, snapshot)`; a found `None` means the org has no map."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        loaded_at, snapshot = entry
+        if time.monotonic() - loaded_at >= self.ttl_seconds:
+            del self._entries[key]
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, snapshot
+
+    def put(
+        self,
+        key: FieldMapCacheKey,
+        snapshot: FieldMapSnapshot | None,
+        version: int,
+    ) -> None:
+        tenant = key[0]
+        if version != self.version(tenant):
+            return
+
+        self._entries[key] = (time.monotonic(), snapshot)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_tenant(self, tenant: str) -> None:
+        self._versions[tenant] = self.version(tenant) + 1
+        for key in [key for key in self._entries if key[0] == tenant]:
+            del self._entries[key]
+
+
+def create_field_map_cache(settings: Settings) -> FieldMapCache:
+    return FieldMapCache(
+        max_entries=settings.field_map_cache_max_entries,
+        ttl_seconds=settings.field_map_cache_ttl_seconds,
+    )
+
+
+providers: Iterable[aioinject.Provider[Any]] = [
+    aioinject.Singleton(create_field_map_cache),
+]
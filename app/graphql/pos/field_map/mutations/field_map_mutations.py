@@ -1,8 +1,9 @@
 import uuid
-from typing import Annotated
+from typing import Annotated, Any
 
 import strawberry
 from aioinject import Injected
+from strawberry.file_uploads import Upload
 
 from app.graphql.di import inject
 from app.graphql.pos.field_map.services.field_map_service import (
@@ -11,7 +12,11 @@ from app.graphql.pos.field_map.services.field_map_service import (
 from app.graphql.pos.field_map.services.field_map_service import (
     FieldMapService,
 )
+from app.graphql.pos.field_map.services.field_mapping_suggestion_service import (
+    FieldMappingSuggestionService,
+)
 from app.graphql.pos.field_map.strawberry.field_map_types import (
+    ColumnSuggestionResponse,
     FieldMapResponse,
     SaveFieldMapInput,
 )
@@ -56,3 +61,14 @@ class FieldMapMutations:
         )
 
         return FieldMapResponse.from_model(updated_map)
+
+    @strawberry.mutation()
+    @inject
+    async def suggest_field_mappings(
+        self,
+        file: Upload,
+        service: Injected[FieldMappingSuggestionService],
+    ) -> list[ColumnSuggestionResponse]:
+        upload_file: Any = file
+        columns = await service.suggest_for_upload(upload_file)
+        return [ColumnSuggestionResponse.from_model(c) for c in columns]
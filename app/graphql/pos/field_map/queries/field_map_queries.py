@@ -28,7 +28,9 @@ class FieldMapQueries:
         direction: FieldMapDirection = FieldMapDirection.SEND,
     ) -> FieldMapResponse:
         org_uuid = uuid.UUID(str(organization_id)) if organization_id else None
-        field_map = await repository.get_by_org_and_type(org_uuid, map_type, direction)
+        field_map = await repository.get_cached_by_org_and_type(
+            org_uuid, map_type, direction
+        )
         if not field_map:
             return FieldMapResponse.from_defaults(org_uuid, map_type, direction)
         return FieldMapResponse.from_model(field_map)
@@ -1,22 +1,66 @@
 import uuid
 from typing import Any
 
-from sqlalchemy import delete, select
-from sqlalchemy.orm import joinedload
+from commons.auth import AuthInfo
+from sqlalchemy import cast, column, delete, event, insert, select, update, values
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.db.transient_session import TenantSession
+from app.graphql.pos.field_map.field_map_cache import (
+    FieldMapCache,
+    FieldMapCacheKey,
+    FieldMapSnapshot,
+)
 from app.graphql.pos.field_map.models.field_map import FieldMap, FieldMapField
 from app.graphql.pos.field_map.models.field_map_enums import (
     FieldMapDirection,
     FieldMapType,
 )
 
+# Columns `FieldMapService.save_fields` may change on an existing field
+RECONCILED_COLUMNS = (
+    "organization_field_name",
+    "linked",
+    "manufacturer",
+    "rep",
+    "standard_field_name",
+    "field_type",
+)
+
 
 class FieldMapRepository:
-    def __init__(self, session: TenantSession) -> None:
+    def __init__(
+        self,
+        session: TenantSession,
+        cache: FieldMapCache,
+        auth_info: AuthInfo,
+    ) -> None:
         self.session = session
+        self.cache = cache
+        self.auth_info = auth_info
+        self._has_writes = False
+
+    def _mark_written(self) -> None:
+        # Drop cached maps now and again once the transaction commits, so no
+        # reader caches the pre-commit map in between
+        tenant = self.auth_info.tenant_name
+        self.cache.invalidate_tenant(tenant)
+        if not self._has_writes:
+            self._has_writes = True
+
+            def _invalidate_on_commit(_session: Session) -> None:
+                self.cache.invalidate_tenant(tenant)
+
+            event.listen(
+                self.session.sync_session,
+                "after_commit",
+                _invalidate_on_commit,
+                once=True,
+            )
 
     async def create(self, field_map: FieldMap) -> FieldMap:
+        self._mark_written()
         self.session.add(field_map)
         await self.session.flush([field_map])
         return field_map
@@ -46,26 +90,148 @@ class FieldMapRepository:
         result = await self.session.execute(stmt)
         return result.unique().scalar_one_or_none()
 
+    async def get_cached_by_org_and_type(
+        self,
+        organization_id: uuid.UUID | None,
+        map_type: FieldMapType,
+        direction: FieldMapDirection = FieldMapDirection.SEND,
+    ) -> FieldMap | None:
+        """Read-only copy of the field map, served from the shared cache.
+
+        Falls back to `get_by_org_and_type` once this session has written a
+        field map, so a mutation reads its own uncommitted changes.
+        """
+        if self._has_writes:
+            return await self.get_by_org_and_type(organization_id, map_type, direction)
+
+        key: FieldMapCacheKey = (
+            self.auth_info.tenant_name,
+            organization_id,
+            map_type.value,
+            direction.value,
+        )
+        found, snapshot = self.cache.get(key)
+        if not found:
+            version = self.cache.version(key[0])
+            field_map = await self.get_by_org_and_type(
+                organization_id, map_type, direction
+            )
+            snapshot = FieldMapSnapshot.from_model(field_map) if field_map else None
+            self.cache.put(key, snapshot, version)
+
+        return snapshot.to_model() if snapshot else None
+
     async def add_field(self, field: FieldMapField) -> FieldMapField:
+        self._mark_written()
         self.session.add(field)
         await self.session.flush([field])
         return field
 
     async def add_fields(self, fields: list[FieldMapField]) -> list[FieldMapField]:
+        self._mark_written()
         for field in fields:
             self.session.add(field)
         await self.session.flush(fields)
         return fields
 
     async def update_field(self, field: FieldMapField) -> FieldMapField:
+        self._mark_written()
         await self.session.flush([field])
         return field
 
     async def delete_field(self, field_id: uuid.UUID) -> bool:
+        self._mark_written()
         stmt = delete(FieldMapField).where(FieldMapField.id == field_id)
         result: Any = await self.session.execute(stmt)
         return result.rowcount > 0
 
+    @staticmethod
+    def _insert_rows(fields: list[FieldMapField]) -> list[dict[str, Any]]:
+        """Column values for inserting `fields` with one multi-row INSERT.
+
+        Every row must name the same columns, so a column is sent only when
+        some field has a value for it; the others keep their server defaults
+        instead of being overridden with NULL. As in
+        `OrganizationAliasRepository.bulk_create`, the `id` is generated here.
+        """
+        keys = [
+            col.key
+            for col in FieldMapField.__table__.c
+            if col.key == "id"
+            or any(getattr(field, col.key) is not None for field in fields)
+        ]
+        return [
+            {
+                key: (field.id or uuid.uuid4()) if key == "id" else getattr(field, key)
+                for key in keys
+            }
+            for field in fields
+        ]
+
+    async def reconcile_fields(
+        self,
+        field_map: FieldMap,
+        updates: list[dict[str, Any]],
+        new_fields: list[FieldMapField],
+        deleted_ids: list[uuid.UUID],
+    ) -> FieldMap:
+        """Apply a computed field diff with at most one UPDATE, INSERT and DELETE.
+
+        Each entry in `updates` carries the field `id` and every column in
+        `RECONCILED_COLUMNS`. Returns `field_map` with its fields replaced by
+        the persisted rows, so callers don't need to reload it.
+        """
+        self._mark_written()
+        table = FieldMapField.__table__
+
+        updated: dict[uuid.UUID, FieldMapField] = {}
+        if updates:
+            names = ("id", *RECONCILED_COLUMNS)
+            changes = values(
+                *(column(name, table.c[name].type) for name in names),
+                name="changes",
+            ).data([tuple(row[name] for name in names) for row in updates])
+            update_stmt = (
+                update(FieldMapField)
+                .where(FieldMapField.id == changes.c.id)
+                .values(
+                    {
+                        # An all-NULL VALUES column is typed text by Postgres
+                        name: cast(changes.c[name], table.c[name].type)
+                        for name in RECONCILED_COLUMNS
+                    }
+                )
+                .returning(FieldMapField)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            result = await self.session.execute(update_stmt)
+            updated = {field.id: field for field in result.scalars().all()}
+
+        inserted: list[FieldMapField] = []
+        if new_fields:
+            insert_stmt = (
+                insert(FieldMapField)
+                .values(self._insert_rows(new_fields))
+                .returning(FieldMapField)
+            )
+            result = await self.session.execute(insert_stmt)
+            inserted = list(result.scalars().all())
+
+        if deleted_ids:
+            delete_stmt = delete(FieldMapField).where(FieldMapField.id.in_(deleted_ids))
+            await self.session.execute(delete_stmt)
+
+        # The deleted rows are already gone, so the collection is replaced as
+        # committed state instead of letting delete-orphan cascade run again
+        removed = set(deleted_ids)
+        fields = [
+            updated.get(field.id, field)
+            for field in field_map.fields
+            if field.id not in removed
+        ]
+        set_committed_value(field_map, "fields", [*fields, *inserted])
+        return field_map
+
     async def get_field_by_id(self, field_id: uuid.UUID) -> FieldMapField | None:
         stmt = select(FieldMapField).where(FieldMapField.id == field_id)
         result = await self.session.execute(stmt)
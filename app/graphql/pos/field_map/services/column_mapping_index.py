@@ -0,0 +1,319 @@
+import math
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from app.graphql.pos.field_map.models.field_map_config import (
+    DEFAULT_FIELDS,
+    DefaultFieldConfig,
+)
+from app.graphql.pos.field_map.models.field_map_enums import FieldCategory, FieldType
+
+# Header spellings distributors commonly use that share few words with the
+# standard field name
+FIELD_ALIASES: dict[str, tuple[str, ...]] = {
+    "transaction_date": ("invoice date", "sale date", "ship date", "date"),
+    "order_type": ("order class", "sale type"),
+    "selling_branch_number": ("branch number", "store number", "location number"),
+    "selling_branch_name_city": ("branch name", "branch city", "store name"),
+    "selling_branch_zip_code": ("branch zip", "customer zip", "sold to zip"),
+    "shipping_branch_number": ("ship from branch", "ship branch number"),
+    "shipping_branch_name_city": ("ship from name", "ship from city"),
+    "shipping_branch_zip_code": ("ship from zip", "ship zip"),
+    "bill_to_account_code": ("customer number", "account number", "customer code"),
+    "bill_to_branch_name_city": ("customer name", "bill to name", "sold to name"),
+    "bill_to_branch_zip_code": ("bill to zip", "billing zip"),
+    "manufacturer_catalog_number": ("catalog number", "part number", "item number"),
+    "manufacturer_sku_number": ("sku", "vendor sku", "product code"),
+    "upc_code": ("upc", "gtin", "barcode"),
+    "unit_of_measure": ("uom", "unit", "pack"),
+    "quantity_units_sold": ("quantity", "units sold", "quantity shipped"),
+    "distributor_unit_cost": ("unit cost", "unit price", "cost"),
+    "extended_net_price": ("extended price", "net sales", "sales amount", "total"),
+}
+
+# Abbreviations expanded before matching, applied to headers and index alike
+ABBREVIATIONS: dict[str, tuple[str, ...]] = {
+    "#": ("number",),
+    "no": ("number",),
+    "num": ("number",),
+    "nbr": ("number",),
+    "qty": ("quantity",),
+    "uom": ("unit", "measure"),
+    "zipcode": ("zip",),
+    "postal": ("zip",),
+    "postcode": ("zip",),
+    "mfr": ("manufacturer",),
+    "mfg": ("manufacturer",),
+    "cat": ("catalog",),
+    "catalogue": ("catalog",),
+    "dist": ("distributor",),
+    "ext": ("extended",),
+    "amt": ("amount",),
+    "inv": ("invoice",),
+    "txn": ("transaction",),
+    "trans": ("transaction",),
+    "dt": ("date",),
+    "acct": ("account",),
+    "cust": ("customer",),
+    "desc": ("description",),
+    "shipped": ("ship",),
+    "shipping": ("ship",),
+    "billing": ("bill",),
+}
+
+STOPWORDS = frozenset(
+    {"a", "an", "and", "as", "be", "by", "e", "eg", "for", "from", "g", "if"}
+    | {"in", "is", "it", "of", "on", "or", "the", "this", "to", "where", "with"}
+)
+
+# Description words only hint at a field, so they count for a fraction of a
+# name match
+DESCRIPTION_WEIGHT = 0.15
+TOKEN_WEIGHT = 0.7
+TRIGRAM_WEIGHT = 0.3
+# How much a mismatched sample type can pull a score down
+TYPE_WEIGHT = 0.25
+
+_CAMEL_CASE = re.compile(r"([a-z0-9])([A-Z])")
+_NON_WORD = re.compile(r"[^a-z0-9#]+")
+_INTEGER = re.compile(r"^[-+]?\d{1,3}(,\d{3})*$|^[-+]?\d+$")
+_DECIMAL = re.compile(r"^[-+]?(\d{1,3}(,\d{3})*|\d*)\.\d+$")
+_DATE = re.compile(
+    r"^\d{4}-\d{1,2}-\d{1,2}([ T].*)?$|^\d{1,2}[/-]\d{1,2}[/-](\d{2}|\d{4})$"
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase words of a header, with abbreviations expanded."""
+    text = _CAMEL_CASE.sub(r"\1 \2", text).lower().replace("#", " # ")
+    tokens: list[str] = []
+    for word in _NON_WORD.split(text):
+        if not word or word in STOPWORDS:
+            continue
+        expanded = ABBREVIATIONS.get(word, (word,))
+        tokens.extend(_singular(token) for token in expanded)
+    return tokens
+
+
+def _singular(token: str) -> str:
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def trigrams(phrase: str) -> frozenset[str]:
+    padded = f"  {phrase} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def sniff_field_type(values: Iterable[Any]) -> FieldType | None:
+    """The type most sample values parse as, or None if every value is empty.
+
+    Numbers with leading zeros (ZIP codes, UPCs) are identifiers, so they
+    count as text.
+    """
+    counts = dict.fromkeys(FieldType, 0)
+    for value in values:
+        if value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        counts[_value_type(value)] += 1
+
+    total = sum(counts.values())
+    if total == 0:
+        return None
+
+    if counts[FieldType.DATE] == total:
+        return FieldType.DATE
+    if counts[FieldType.INTEGER] == total:
+        return FieldType.INTEGER
+    if counts[FieldType.INTEGER] + counts[FieldType.DECIMAL] == total:
+        return FieldType.DECIMAL
+    return FieldType.TEXT
+
+
+def _value_type(value: Any) -> FieldType:
+    if isinstance(value, (date, datetime)):
+        return FieldType.DATE
+    if isinstance(value, bool):
+        return FieldType.TEXT
+    if isinstance(value, int):
+        return FieldType.INTEGER
+    if isinstance(value, (float, Decimal)):
+        return FieldType.INTEGER if value == int(value) else FieldType.DECIMAL
+
+    text = str(value).strip().lstrip("$")
+    if _DATE.match(text):
+        return FieldType.DATE
+    if _INTEGER.match(text):
+        digits = text.lstrip("+-")
+        if len(digits) > 1 and digits.startswith("0"):
+            return FieldType.TEXT
+        return FieldType.INTEGER
+    if _DECIMAL.match(text):
+        return FieldType.DECIMAL
+    return FieldType.TEXT
+
+
+def type_compatibility(detected: FieldType | None, expected: FieldType) -> float:
+    """How plausible it is for a column of `detected` values to hold `expected`."""
+    if detected is None or detected == expected:
+        return 1.0
+    if expected == FieldType.DECIMAL and detected == FieldType.INTEGER:
+        return 0.8
+    if expected == FieldType.TEXT and detected == FieldType.INTEGER:
+        # Branch numbers and account codes are often all digits
+        return 0.7
+    if expected == FieldType.INTEGER and detected == FieldType.DECIMAL:
+        return 0.4
+    return 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class FieldSuggestion:
+    standard_field_key: str
+    standard_field_name: str
+    category: FieldCategory
+    field_type: FieldType
+    score: float
+
+
+@dataclass(frozen=True, slots=True)
+class _Phrase:
+    tokens: frozenset[str]
+    trigrams: frozenset[str]
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexedField:
+    config: DefaultFieldConfig
+    phrases: tuple[_Phrase, ...]
+    description_tokens: frozenset[str]
+
+
+class StandardFieldIndex:
+    """Token and trigram postings over the standard field names, built once.
+
+    Scoring a header only touches fields that share a token or trigram with
+    it, so suggesting a mapping for a whole file is a handful of dict lookups
+    per column.
+    """
+
+    def __init__(self, fields: list[_IndexedField]) -> None:
+        self.fields = fields
+        self.idf: dict[str, float] = {}
+        self.token_postings: dict[str, set[int]] = {}
+        self.trigram_postings: dict[str, set[int]] = {}
+
+        document_frequency: dict[str, int] = {}
+        for position, field in enumerate(fields):
+            name_tokens = frozenset().union(*(p.tokens for p in field.phrases))
+            for token in name_tokens | field.description_tokens:
+                document_frequency[token] = document_frequency.get(token, 0) + 1
+                self.token_postings.setdefault(token, set()).add(position)
+            for phrase in field.phrases:
+                for trigram in phrase.trigrams:
+                    self.trigram_postings.setdefault(trigram, set()).add(position)
+
+        for token, frequency in document_frequency.items():
+            self.idf[token] = math.log(1 + len(fields) / frequency)
+        self.unknown_idf = math.log(1 + len(fields))
+
+    @classmethod
+    def build(
+        cls,
+        configs: Iterable[DefaultFieldConfig] = DEFAULT_FIELDS,
+        aliases: dict[str, tuple[str, ...]] = FIELD_ALIASES,
+    ) -> "StandardFieldIndex":
+        fields: list[_IndexedField] = []
+        for config in configs:
+            names = (
+                config.standard_field_name,
+                config.key.replace("_", " "),
+                *aliases.get(config.key, ()),
+            )
+            phrases = tuple(cls._phrase(tokenize(name)) for name in names)
+            fields.append(
+                _IndexedField(
+                    config=config,
+                    phrases=phrases,
+                    description_tokens=frozenset(tokenize(config.description)),
+                )
+            )
+        return cls(fields)
+
+    @staticmethod
+    def _phrase(tokens: list[str]) -> _Phrase:
+        return _Phrase(tokens=frozenset(tokens), trigrams=trigrams(" ".join(tokens)))
+
+    def suggest(
+        self,
+        header: str,
+        detected_type: FieldType | None = None,
+        limit: int = 3,
+        min_score: float = 0.3,
+    ) -> list[FieldSuggestion]:
+        """Standard fields that `header` most likely holds, best first."""
+        tokens = tokenize(header)
+        if not tokens:
+            return []
+        header_phrase = self._phrase(tokens)
+
+        candidates: set[int] = set()
+        for token in header_phrase.tokens:
+            candidates |= self.token_postings.get(token, set())
+        for trigram in header_phrase.trigrams:
+            candidates |= self.trigram_postings.get(trigram, set())
+
+        suggestions: list[FieldSuggestion] = []
+        for position in candidates:
+            field = self.fields[position]
+            name_score = self._name_score(header_phrase, field)
+            compatibility = type_compatibility(detected_type, field.config.field_type)
+            score = name_score * (1 - TYPE_WEIGHT + TYPE_WEIGHT * compatibility)
+            if score >= min_score:
+                suggestions.append(
+                    FieldSuggestion(
+                        standard_field_key=field.config.key,
+                        standard_field_name=field.config.standard_field_name,
+                        category=field.config.category,
+                        field_type=field.config.field_type,
+                        score=round(score, 3),
+                    )
+                )
+
+        suggestions.sort(key=lambda s: (-s.score, s.standard_field_key))
+        return suggestions[:limit]
+
+    def _name_score(self, header: _Phrase, field: _IndexedField) -> float:
+        best = max(
+            TOKEN_WEIGHT * self._weighted_dice(header.tokens, phrase.tokens)
+            + TRIGRAM_WEIGHT * _dice(header.trigrams, phrase.trigrams)
+            for phrase in field.phrases
+        )
+        described = header.tokens & field.description_tokens
+        if described:
+            coverage = self._weight(described) / self._weight(header.tokens)
+            best += DESCRIPTION_WEIGHT * coverage * (1 - best)
+        return min(best, 1.0)
+
+    def _weight(self, tokens: Iterable[str]) -> float:
+        return sum(self.idf.get(token, self.unknown_idf) for token in tokens)
+
+    def _weighted_dice(self, left: frozenset[str], right: frozenset[str]) -> float:
+        total = self._weight(left) + self._weight(right)
+        if total == 0:
+            return 0.0
+        return 2 * self._weight(left & right) / total
+
+
+def _dice(left: frozenset[str], right: frozenset[str]) -> float:
+    if not left or not right:
+        return 0.0
+    return 2 * len(left & right) / (len(left) + len(right))
+
+
+STANDARD_FIELD_INDEX = StandardFieldIndex.build()
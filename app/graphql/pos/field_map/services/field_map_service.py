@@ -1,5 +1,6 @@
 import uuid
 from dataclasses import dataclass
+from typing import Any
 
 from commons.auth import AuthInfo
 
@@ -59,7 +60,7 @@ class FieldMapService:
         map_type: FieldMapType,
         direction: FieldMapDirection = FieldMapDirection.SEND,
     ) -> FieldMap | None:
-        return await self.repository.get_by_org_and_type(
+        return await self.repository.get_cached_by_org_and_type(
             organization_id, map_type, direction
         )
 
@@ -101,7 +102,11 @@ class FieldMapService:
         fields: list[FieldInput],
         direction: FieldMapDirection = FieldMapDirection.SEND,
     ) -> FieldMap:
-        """Save fields using declarative approach - reconcile desired state with current."""
+        """Save fields using declarative approach - reconcile desired state with current.
+
+        The whole diff is validated in memory first and then applied in one
+        repository call, so an invalid field never leaves a partial save.
+        """
         field_map = await self.get_or_create_map(organization_id, map_type, direction)
 
         # Build lookup of existing fields by key
@@ -110,40 +115,47 @@ class FieldMapService:
 
         # Build set of incoming keys
         incoming_keys: set[str] = {f.standard_field_key for f in fields}
+        taken_keys = set(existing_by_key)
 
-        # Process incoming fields
+        updates: list[dict[str, Any]] = []
+        new_fields: list[FieldMapField] = []
         for field_input in fields:
             existing_field = existing_by_key.get(field_input.standard_field_key)
             if existing_field:
-                # Update existing field
-                await self._update_field(existing_field, field_input)
+                changes = self._field_changes(existing_field, field_input)
+                if any(
+                    getattr(existing_field, name) != value
+                    for name, value in changes.items()
+                ):
+                    updates.append({"id": existing_field.id, **changes})
             else:
                 # Add new field (must be custom since defaults are auto-created)
-                await self._add_custom_field(field_map.id, field_input, existing_by_key)
+                new_field = self._build_custom_field(
+                    field_map.id, field_input, taken_keys
+                )
+                taken_keys.add(new_field.standard_field_key)
+                new_fields.append(new_field)
 
         # Delete fields not in incoming list (only custom fields)
+        deleted_ids: list[uuid.UUID] = []
         for key, existing_field in existing_by_key.items():
             if key not in incoming_keys:
                 if existing_field.is_default:
                     raise CannotDeleteDefaultFieldError(
                         f"Cannot delete default field '{existing_field.standard_field_name}'"
                     )
-                await self.repository.delete_field(existing_field.id)
+                deleted_ids.append(existing_field.id)
 
-        # Reload and return updated map
-        updated_map = await self.repository.get_by_org_and_type(
-            organization_id, map_type, direction
+        return await self.repository.reconcile_fields(
+            field_map, updates, new_fields, deleted_ids
         )
-        if not updated_map:
-            raise RuntimeError("Field map not found after save")
-        return updated_map
 
-    async def _update_field(
+    def _field_changes(
         self,
         field: FieldMapField,
         field_input: FieldInput,
-    ) -> None:
-        """Update an existing field with input values."""
+    ) -> dict[str, Any]:
+        """Validate an update and return the field's new column values."""
         # Validate: cannot edit standard_field_name or field_type for default fields
         if field.is_default:
             if field_input.standard_field_name is not None:
@@ -171,31 +183,31 @@ class FieldMapService:
                 "manufacturer and rep must be set when organization_field_name is provided"
             )
 
-        # Apply updates
-        field.organization_field_name = field_input.organization_field_name
-        field.linked = will_be_linked
-
-        if field_input.manufacturer is not None:
-            field.manufacturer = field_input.manufacturer
-        if field_input.rep is not None:
-            field.rep = field_input.rep
-
+        standard_field_name = field.standard_field_name
+        field_type = field.field_type
         # For custom fields, allow updating name and type
         if not field.is_default:
             if field_input.standard_field_name is not None:
-                field.standard_field_name = field_input.standard_field_name
+                standard_field_name = field_input.standard_field_name
             if field_input.field_type is not None:
-                field.field_type = field_input.field_type.value
-
-        await self.repository.update_field(field)
-
-    async def _add_custom_field(
+                field_type = field_input.field_type.value
+
+        return {
+            "organization_field_name": field_input.organization_field_name,
+            "linked": will_be_linked,
+            "manufacturer": new_manufacturer,
+            "rep": new_rep,
+            "standard_field_name": standard_field_name,
+            "field_type": field_type,
+        }
+
+    def _build_custom_field(
         self,
         field_map_id: uuid.UUID,
         field_input: FieldInput,
-        existing_by_key: dict[str, FieldMapField],
-    ) -> None:
-        """Add a new custom field."""
+        taken_keys: set[str],
+    ) -> FieldMapField:
+        """Validate and build a new custom field."""
         # Custom fields require these attributes
         if not field_input.standard_field_name:
             raise ValueError("standard_field_name is required for custom fields")
@@ -205,8 +217,7 @@ class FieldMapService:
             raise ValueError("category is required for custom fields")
 
         # Generate unique key if needed
-        existing_keys = set(existing_by_key.keys())
-        key = generate_unique_field_key(field_input.standard_field_name, existing_keys)
+        key = generate_unique_field_key(field_input.standard_field_name, taken_keys)
 
         # Validate linked fields
         will_be_linked = self._calculate_linked(field_input.organization_field_name)
@@ -217,7 +228,7 @@ class FieldMapService:
                 "manufacturer and rep must be set when organization_field_name is provided"
             )
 
-        field = FieldMapField(
+        return FieldMapField(
             field_map_id=field_map_id,
             standard_field_key=key,
             category=field_input.category.value,
@@ -230,7 +241,6 @@ class FieldMapService:
             linked=will_be_linked,
             is_default=False,
         )
-        await self.repository.add_field(field)
 
     @staticmethod
     def _create_default_fields(field_map_id: uuid.UUID) -> list[FieldMapField]:
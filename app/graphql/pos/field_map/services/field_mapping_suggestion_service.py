@@ -0,0 +1,136 @@
+import csv
+import io
+from dataclasses import dataclass
+from typing import Any
+
+from app.graphql.pos.data_exchange.services.file_validators import validate_file_type
+from app.graphql.pos.field_map.models.field_map_enums import FieldType
+from app.graphql.pos.field_map.services.column_mapping_index import (
+    STANDARD_FIELD_INDEX,
+    FieldSuggestion,
+    StandardFieldIndex,
+    sniff_field_type,
+)
+
+# Rows after the header used to sniff column types
+SAMPLE_ROWS = 20
+# CSV uploads are only read this far; a header plus SAMPLE_ROWS fits easily
+CSV_SAMPLE_BYTES = 64 * 1024
+
+
+@dataclass
+class HeaderSample:
+    headers: list[str]
+    rows: list[list[Any]]
+
+    def column_values(self, index: int) -> list[Any]:
+        return [row[index] for row in self.rows if index < len(row)]
+
+
+@dataclass
+class ColumnSuggestion:
+    column_index: int
+    column_name: str
+    detected_type: FieldType | None
+    suggestions: list[FieldSuggestion]
+
+
+def read_header_sample(
+    content: bytes,
+    file_type: str,
+    max_rows: int = SAMPLE_ROWS,
+) -> HeaderSample:
+    """The header row and up to `max_rows` rows after it, without parsing the rest."""
+    if file_type == "csv":
+        return _read_csv_sample(content, max_rows)
+    if file_type == "xls":
+        return _read_xls_sample(content, max_rows)
+    return _read_xlsx_sample(content, max_rows)
+
+
+def _read_csv_sample(content: bytes, max_rows: int) -> HeaderSample:
+    head = content[:CSV_SAMPLE_BYTES]
+    if len(content) > CSV_SAMPLE_BYTES:
+        # Drop the line cut off by the byte limit
+        head = head[: head.rfind(b"\n") + 1]
+    text = head.decode("utf-8-sig", errors="replace")
+
+    reader = csv.reader(io.StringIO(text))
+    headers = next(reader, [])
+    rows = [row for _, row in zip(range(max_rows), reader, strict=False)]
+    return HeaderSample(headers=headers, rows=rows)
+
+
+def _read_xlsx_sample(content: bytes, max_rows: int) -> HeaderSample:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(filename=io.BytesIO(content), read_only=True)
+    try:
+        sheet = workbook.active
+        if sheet is None:
+            return HeaderSample(headers=[], rows=[])
+
+        rows_iter = sheet.iter_rows(max_row=max_rows + 1, values_only=True)
+        headers = next(rows_iter, None) or ()
+        return HeaderSample(
+            headers=[str(h) if h is not None else "" for h in headers],
+            rows=[list(row) for row in rows_iter],
+        )
+    finally:
+        workbook.close()
+
+
+def _read_xls_sample(content: bytes, max_rows: int) -> HeaderSample:
+    import xlrd
+
+    workbook = xlrd.open_workbook(file_contents=content, on_demand=True)
+    sheet = workbook.sheet_by_index(0)
+    if sheet.nrows == 0:
+        return HeaderSample(headers=[], rows=[])
+
+    headers = [str(value) for value in sheet.row_values(0)]
+    last_row = min(sheet.nrows, max_rows + 1)
+    rows = [sheet.row_values(row_idx) for row_idx in range(1, last_row)]
+    return HeaderSample(headers=headers, rows=rows)
+
+
+class FieldMappingSuggestionService:
+    """Suggests standard fields for the columns of an uploaded file."""
+
+    def __init__(self) -> None:
+        self.index: StandardFieldIndex = STANDARD_FIELD_INDEX
+
+    async def suggest_for_upload(
+        self,
+        upload: Any,
+        limit: int = 3,
+    ) -> list[ColumnSuggestion]:
+        file_type = validate_file_type(upload.filename or "")
+        # One byte past the limit tells the CSV reader its last line is cut off.
+        # Excel workbooks are zip archives, so they can't be read from the head
+        size = CSV_SAMPLE_BYTES + 1 if file_type == "csv" else -1
+        content = await upload.read(size)
+        return self.suggest(content, file_type, limit)
+
+    def suggest(
+        self,
+        content: bytes,
+        file_type: str,
+        limit: int = 3,
+    ) -> list[ColumnSuggestion]:
+        sample = read_header_sample(content, file_type)
+
+        result: list[ColumnSuggestion] = []
+        for index, header in enumerate(sample.headers):
+            if not header.strip():
+                continue
+            detected_type = sniff_field_type(sample.column_values(index))
+            result.append(
+                ColumnSuggestion(
+                    column_index=index,
+                    column_name=header,
+                    detected_type=detected_type,
+                    suggestions=self.index.suggest(header, detected_type, limit),
+                )
+            )
+        return result
@@ -16,6 +16,10 @@ from app.graphql.pos.field_map.models.field_map_enums import (
     FieldStatus,
     FieldType,
 )
+from app.graphql.pos.field_map.services.column_mapping_index import FieldSuggestion
+from app.graphql.pos.field_map.services.field_mapping_suggestion_service import (
+    ColumnSuggestion,
+)
 
 # Register enums with Strawberry
 FieldMapTypeEnum = strawberry.enum(FieldMapType)
@@ -179,3 +183,41 @@ class SaveFieldMapInput:
     fields: list[FieldInput]
     organization_id: strawberry.ID | None = None
     direction: FieldMapDirection = FieldMapDirection.SEND
+
+
+@strawberry.type
+class FieldSuggestionResponse:
+    standard_field_key: str
+    standard_field_name: str
+    category: FieldCategory
+    field_type: FieldType
+    score: float
+
+    @staticmethod
+    def from_model(suggestion: FieldSuggestion) -> "FieldSuggestionResponse":
+        return FieldSuggestionResponse(
+            standard_field_key=suggestion.standard_field_key,
+            standard_field_name=suggestion.standard_field_name,
+            category=suggestion.category,
+            field_type=suggestion.field_type,
+            score=suggestion.score,
+        )
+
+
+@strawberry.type
+class ColumnSuggestionResponse:
+    column_index: int
+    column_name: str
+    detected_type: FieldType | None
+    suggestions: list[FieldSuggestionResponse]
+
+    @staticmethod
+    def from_model(column: ColumnSuggestion) -> "ColumnSuggestionResponse":
+        return ColumnSuggestionResponse(
+            column_index=column.column_index,
+            column_name=column.column_name,
+            detected_type=column.detected_type,
+            suggestions=[
+                FieldSuggestionResponse.from_model(s) for s in column.suggestions
+            ],
+        )
@@ -1,29 +1,73 @@
 import uuid
+from collections.abc import Mapping
 from typing import Any
 
-from sqlalchemy import String, and_, cast, delete, func, or_, select
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db.transient_session import TenantSession
-from app.graphql.connections.models import ConnectionStatus, RemoteConnection
+from app.graphql.connections.connection_graph import ConnectionGraph
+from app.graphql.connections.models import ConnectionStatus
 from app.graphql.organizations.models import RemoteOrg
 from app.graphql.pos.organization_alias.models import OrganizationAlias
 
+# Six bind parameters per row keeps each batch well under asyncpg's 32767 limit
+BULK_INSERT_BATCH_SIZE = 1000
+
 
 class OrganizationAliasRepository:
     def __init__(
         self,
         session: TenantSession,
         orgs_session: AsyncSession,
+        connection_graph: ConnectionGraph,
     ) -> None:
         self.session = session
         self.orgs_session = orgs_session
+        self.connection_graph = connection_graph
 
     async def create(self, alias: OrganizationAlias) -> OrganizationAlias:
         self.session.add(alias)
         await self.session.flush([alias])
         return alias
 
+    async def bulk_create(
+        self,
+        org_id: uuid.UUID,
+        aliases: Mapping[uuid.UUID, str],
+        created_by_id: uuid.UUID,
+    ) -> set[uuid.UUID]:
+        """Insert one alias per connected org, skipping rows that hit a unique index.
+
+        Returns the connected org ids whose alias was inserted.
+        """
+        items = list(aliases.items())
+        inserted: set[uuid.UUID] = set()
+        for start in range(0, len(items), BULK_INSERT_BATCH_SIZE):
+            stmt = (
+                insert(OrganizationAlias)
+                .values(
+                    [
+                        {
+                            "id": uuid.uuid4(),
+                            "organization_id": org_id,
+                            "connected_org_id": connected_org_id,
+                            "alias": alias,
+                            "created_by_id": created_by_id,
+                        }
+                        for connected_org_id, alias in items[
+                            start : start + BULK_INSERT_BATCH_SIZE
+                        ]
+                    ]
+                )
+                .on_conflict_do_nothing()
+                .returning(OrganizationAlias.connected_org_id)
+            )
+            result = await self.session.execute(stmt)
+            inserted.update(result.scalars().all())
+        return inserted
+
     async def get_by_id(self, alias_id: uuid.UUID) -> OrganizationAlias | None:
         stmt = select(OrganizationAlias).where(OrganizationAlias.id == alias_id)
         result = await self.session.execute(stmt)
@@ -59,11 +103,54 @@ class OrganizationAliasRepository:
         count = result.scalar_one_or_none()
         return count is not None and count > 0
 
+    async def search_connected_org_ids(
+        self,
+        org_id: uuid.UUID,
+        search_term: str,
+        limit: int = 20,
+    ) -> list[uuid.UUID]:
+        """Connected orgs whose alias matches the term, best match first.
+
+        Served by the `ix_organization_aliases_alias_trgm` GIN index.
+        """
+        similarity = func.similarity(OrganizationAlias.alias, search_term)
+        stmt = (
+            select(OrganizationAlias.connected_org_id)
+            .where(
+                OrganizationAlias.organization_id == org_id,
+                or_(
+                    OrganizationAlias.alias.icontains(search_term, autoescape=True),
+                    OrganizationAlias.alias.op("%")(search_term),
+                ),
+            )
+            .order_by(similarity.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def delete(self, alias_id: uuid.UUID) -> bool:
         stmt = delete(OrganizationAlias).where(OrganizationAlias.id == alias_id)
         result: Any = await self.session.execute(stmt)
         return result.rowcount > 0
 
+    async def get_connected_org_names(
+        self,
+        user_org_id: uuid.UUID,
+    ) -> dict[uuid.UUID, str]:
+        connected_org_ids = await self.connection_graph.connected_org_ids(
+            self.orgs_session, user_org_id, ConnectionStatus.ACCEPTED
+        )
+        if not connected_org_ids:
+            return {}
+
+        stmt = select(RemoteOrg.id, RemoteOrg.name).where(
+            RemoteOrg.id.in_(connected_org_ids),
+            RemoteOrg.deleted_at.is_(None),
+        )
+        result = await self.orgs_session.execute(stmt)
+        return {row.id: row.name for row in result.all()}
+
     async def get_connected_orgs_by_name(
         self,
         user_org_id: uuid.UUID,
@@ -74,31 +161,16 @@ class OrganizationAliasRepository:
 
         lower_names = [name.lower() for name in org_names]
 
-        connection_exists = (
-            select(RemoteConnection.id)
-            .where(
-                and_(
-                    or_(
-                        and_(
-                            RemoteConnection.requester_org_id == user_org_id,
-                            RemoteConnection.target_org_id == RemoteOrg.id,
-                        ),
-                        and_(
-                            RemoteConnection.target_org_id == user_org_id,
-                            RemoteConnection.requester_org_id == RemoteOrg.id,
-                        ),
-                    ),
-                    cast(RemoteConnection.status, String)
-                    == ConnectionStatus.ACCEPTED.value,
-                )
-            )
-            .exists()
+        connected_org_ids = await self.connection_graph.connected_org_ids(
+            self.orgs_session, user_org_id, ConnectionStatus.ACCEPTED
         )
+        if not connected_org_ids:
+            return {}
 
         stmt = select(RemoteOrg).where(
             func.lower(RemoteOrg.name).in_(lower_names),
             RemoteOrg.deleted_at.is_(None),
-            connection_exists,
+            RemoteOrg.id.in_(connected_org_ids),
         )
 
         result = await self.orgs_session.execute(stmt)
@@ -5,16 +5,13 @@ from commons.auth import AuthInfo
 
 from app.graphql.connections.repositories.user_org_repository import UserOrgRepository
 from app.graphql.pos.organization_alias.exceptions import (
-    AliasAlreadyExistsError,
     OrganizationNotConnectedError,
 )
 from app.graphql.pos.organization_alias.repositories import OrganizationAliasRepository
 from app.graphql.pos.organization_alias.services.organization_alias_csv_parser import (
+    CsvRow,
     parse_csv,
 )
-from app.graphql.pos.organization_alias.services.organization_alias_service import (
-    OrganizationAliasService,
-)
 
 
 @dataclass
@@ -34,12 +31,10 @@ class BulkCreateResult:
 class OrganizationAliasBulkService:
     def __init__(
         self,
-        alias_service: OrganizationAliasService,
         repository: OrganizationAliasRepository,
         user_org_repository: UserOrgRepository,
         auth_info: AuthInfo,
     ) -> None:
-        self.alias_service = alias_service
         self.repository = repository
         self.user_org_repository = user_org_repository
         self.auth_info = auth_info
@@ -51,6 +46,15 @@ class OrganizationAliasBulkService:
             self.auth_info.auth_provider_id
         )
 
+    @staticmethod
+    def _failure(row: CsvRow, reason: str) -> BulkFailure:
+        return BulkFailure(
+            row_number=row.row_number,
+            organization_name=row.organization_name,
+            alias=row.alias,
+            reason=reason,
+        )
+
     async def bulk_create_from_csv(self, content: bytes) -> BulkCreateResult:
         rows = parse_csv(content)
 
@@ -61,53 +65,48 @@ class OrganizationAliasBulkService:
             user_org_id, org_names
         )
 
-        inserted_count = 0
+        existing = await self.repository.get_all_by_org(user_org_id)
+        taken_aliases = {alias.alias.lower() for alias in existing}
+        aliased_org_ids = {alias.connected_org_id for alias in existing}
+
         failures: list[BulkFailure] = []
+        pending: dict[uuid.UUID, CsvRow] = {}
 
         for row in rows:
             if not row.alias:
-                failures.append(
-                    BulkFailure(
-                        row_number=row.row_number,
-                        organization_name=row.organization_name,
-                        alias=row.alias,
-                        reason="Missing alias value",
-                    )
-                )
+                failures.append(self._failure(row, "Missing alias value"))
                 continue
 
             org = orgs_by_name.get(row.organization_name.lower())
             if org is None:
-                failures.append(
-                    BulkFailure(
-                        row_number=row.row_number,
-                        organization_name=row.organization_name,
-                        alias=row.alias,
-                        reason="Organization not found",
-                    )
-                )
+                failures.append(self._failure(row, "Organization not found"))
                 continue
 
-            try:
-                await self.alias_service.create_alias(org.id, row.alias)
-                inserted_count += 1
-            except OrganizationNotConnectedError:
-                failures.append(
-                    BulkFailure(
-                        row_number=row.row_number,
-                        organization_name=row.organization_name,
-                        alias=row.alias,
-                        reason="Organization not connected",
-                    )
-                )
-            except AliasAlreadyExistsError:
-                failures.append(
-                    BulkFailure(
-                        row_number=row.row_number,
-                        organization_name=row.organization_name,
-                        alias=row.alias,
-                        reason="Alias already exists",
-                    )
-                )
-
-        return BulkCreateResult(inserted_count=inserted_count, failures=failures)
+            if row.alias.lower() in taken_aliases or org.id in aliased_org_ids:
+                failures.append(self._failure(row, "Alias already exists"))
+                continue
+
+            taken_aliases.add(row.alias.lower())
+            aliased_org_ids.add(org.id)
+            pending[org.id] = row
+
+        inserted_org_ids: set[uuid.UUID] = set()
+        if pending:
+            inserted_org_ids = await self.repository.bulk_create(
+                user_org_id,
+                {org_id: row.alias for org_id, row in pending.items()},
+                created_by_id=self.auth_info.flow_user_id,
+            )
+
+        # Rows skipped by ON CONFLICT lost a race with a concurrent insert
+        failures.extend(
+            self._failure(row, "Alias already exists")
+            for org_id, row in pending.items()
+            if org_id not in inserted_org_ids
+        )
+        failures.sort(key=lambda failure: failure.row_number)
+
+        return BulkCreateResult(
+            inserted_count=len(inserted_org_ids),
+            failures=failures,
+        )
@@ -37,6 +37,7 @@ ISSUE_TITLE_MAPPING: dict[tuple[str, str | None], str] = {
     ("ship_from_location", None): "Ship-from location differs",
     ("lost_flag", None): "Lost flag is set",
     ("catalog_number_format", None): "Catalog number format warning",
+    ("unresolved_organization", None): "Organization not recognized",
 }
 
 
@@ -1,6 +1,9 @@
+from app.graphql.pos.validations.models.file_organization_resolution import (
+    FileOrganizationResolution,
+)
 from app.graphql.pos.validations.models.file_validation_issue import (
     FileValidationIssue,
 )
 from app.graphql.pos.validations.models.prefix_pattern import PrefixPattern
 
-__all__ = ["FileValidationIssue", "PrefixPattern"]
+__all__ = ["FileOrganizationResolution", "FileValidationIssue", "PrefixPattern"]
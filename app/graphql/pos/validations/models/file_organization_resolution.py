@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING
+
+from commons.db.v6.base import HasCreatedAt
+from sqlalchemy import ForeignKey, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.db.base_models import PyConnectPosBaseModel
+
+if TYPE_CHECKING:
+    from app.graphql.pos.data_exchange.models.exchange_file import ExchangeFile
+
+
+class FileOrganizationResolution(PyConnectPosBaseModel, HasCreatedAt, kw_only=True):
+    """A connected org an organization name in a file resolved to on validation."""
+
+    __tablename__ = "file_organization_resolutions"
+    __table_args__ = (
+        UniqueConstraint(
+            "exchange_file_id",
+            "column_name",
+            "organization_name",
+            name="uq_file_organization_resolutions_file_column_name",
+        ),
+        {"schema": "connect_pos", "extend_existing": True},
+    )
+
+    exchange_file_id: Mapped[uuid.UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("connect_pos.exchange_files.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    column_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    # Normalized as the name index matches it
+    organization_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    connected_org_id: Mapped[uuid.UUID] = mapped_column(
+        PG_UUID(as_uuid=True), nullable=False
+    )
+
+    exchange_file: Mapped[ExchangeFile] = relationship(
+        "ExchangeFile",
+        init=False,
+    )
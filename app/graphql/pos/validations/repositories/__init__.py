@@ -1,3 +1,6 @@
+from app.graphql.pos.validations.repositories.file_organization_resolution_repository import (
+    FileOrganizationResolutionRepository,
+)
 from app.graphql.pos.validations.repositories.file_validation_issue_repository import (
     FileValidationIssueRepository,
 )
@@ -5,4 +8,8 @@ from app.graphql.pos.validations.repositories.prefix_pattern_repository import (
     PrefixPatternRepository,
 )
 
-__all__ = ["FileValidationIssueRepository", "PrefixPatternRepository"]
+__all__ = [
+    "FileOrganizationResolutionRepository",
+    "FileValidationIssueRepository",
+    "PrefixPatternRepository",
+]
@@ -0,0 +1,37 @@
+import uuid
+from typing import Any
+
+from sqlalchemy import delete, select
+
+from app.core.db.transient_session import TenantSession
+from app.graphql.pos.validations.models import FileOrganizationResolution
+
+
+class FileOrganizationResolutionRepository:
+    def __init__(self, session: TenantSession) -> None:
+        self.session = session
+
+    async def create_bulk(self, resolutions: list[FileOrganizationResolution]) -> None:
+        self.session.add_all(resolutions)
+        await self.session.flush(resolutions)
+
+    async def get_by_file_id(
+        self, exchange_file_id: uuid.UUID
+    ) -> list[FileOrganizationResolution]:
+        stmt = (
+            select(FileOrganizationResolution)
+            .where(FileOrganizationResolution.exchange_file_id == exchange_file_id)
+            .order_by(
+                FileOrganizationResolution.column_name,
+                FileOrganizationResolution.organization_name,
+            )
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def delete_by_file_id(self, exchange_file_id: uuid.UUID) -> int:
+        stmt = delete(FileOrganizationResolution).where(
+            FileOrganizationResolution.exchange_file_id == exchange_file_id
+        )
+        result: Any = await self.session.execute(stmt)
+        return result.rowcount
@@ -1,10 +1,14 @@
+import contextlib
 import csv
 import io
+import mmap
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any
 
 from commons.s3.service import S3Service
 
+from app.core.s3.object_cache import S3ObjectCache
 from app.graphql.pos.field_map.models.field_map import FieldMap
 
 
@@ -21,49 +25,76 @@ class FileRow:
 class FileReaderService:
     SUPPORTED_TYPES = {"csv", "xls", "xlsx"}
 
-    def __init__(self, s3_service: S3Service) -> None:
+    def __init__(
+        self,
+        s3_service: S3Service,
+        object_cache: S3ObjectCache,
+    ) -> None:
         self.s3_service = s3_service
+        self.object_cache = object_cache
 
     async def read_file(
         self,
         s3_key: str,
         file_type: str,
         field_map: FieldMap | None = None,
+        file_sha: str | None = None,
     ) -> list[FileRow]:
+        """Rows of the file at `s3_key`.
+
+        With `file_sha`, the file is read through the local object cache, so
+        reading it again (another field map, a revalidation) skips S3.
+        """
         if file_type not in self.SUPPORTED_TYPES:
             raise UnsupportedFileTypeError(
                 f"Unsupported file type: {file_type}. "
                 f"Supported: {', '.join(self.SUPPORTED_TYPES)}"
             )
 
-        file_obj = await self.s3_service.download(key=s3_key)
-        content = file_obj.read()
-
-        if file_type == "csv":
-            rows = self._parse_csv(content)
-        elif file_type == "xls":
-            rows = self._parse_xls(content)
-        else:
-            rows = self._parse_xlsx(content)
+        async with self._open(s3_key, file_sha) as content:
+            if file_type == "csv":
+                rows = self._parse_csv(content)
+            elif file_type == "xls":
+                rows = self._parse_xls(content)
+            else:
+                rows = self._parse_xlsx(content)
 
         if field_map:
             rows = self._apply_field_mapping(rows, field_map)
 
         return rows
 
+    @contextlib.asynccontextmanager
+    async def _open(
+        self,
+        s3_key: str,
+        file_sha: str | None,
+    ) -> AsyncIterator[bytes | mmap.mmap]:
+        if file_sha:
+            async with self.object_cache.open(
+                self.s3_service, s3_key, file_sha
+            ) as content:
+                yield content
+            return
+
+        file_obj = await self.s3_service.download(key=s3_key)
+        yield file_obj.read()
+
     @staticmethod
-    def _parse_csv(content: bytes) -> list[FileRow]:
-        text = content.decode("utf-8")
+    def _parse_csv(content: bytes | mmap.mmap) -> list[FileRow]:
+        text = str(content, "utf-8")
         reader = csv.DictReader(io.StringIO(text))
         return [
             FileRow(row_number=i + 2, data=dict(row)) for i, row in enumerate(reader)
         ]
 
     @staticmethod
-    def _parse_xlsx(content: bytes) -> list[FileRow]:
+    def _parse_xlsx(content: bytes | mmap.mmap) -> list[FileRow]:
         from openpyxl import load_workbook
 
-        workbook = load_workbook(filename=io.BytesIO(content), read_only=True)
+        # A mapped file is read in place; zip archives only need seek and read
+        file_obj = content if isinstance(content, mmap.mmap) else io.BytesIO(content)
+        workbook = load_workbook(filename=file_obj, read_only=True)
         sheet = workbook.active
         if sheet is None:
             return []
@@ -85,10 +116,12 @@ class FileReaderService:
         return result
 
     @staticmethod
-    def _parse_xls(content: bytes) -> list[FileRow]:
+    def _parse_xls(content: bytes | mmap.mmap) -> list[FileRow]:
         import xlrd
 
-        workbook = xlrd.open_workbook(file_contents=content)
+        # xlrd keeps slices of its input around; the legacy format tops out
+        # at 65536 rows, so a copy is small
+        workbook = xlrd.open_workbook(file_contents=bytes(content))
         sheet = workbook.sheet_by_index(0)
         if sheet.nrows == 0:
             return []
@@ -0,0 +1,110 @@
+import uuid
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from app.graphql.pos.field_map.models.field_map import FieldMap
+from app.graphql.pos.organization_alias.models import OrganizationAlias
+from app.graphql.pos.validations.models.enums import ValidationType
+from app.graphql.pos.validations.services.file_reader_service import FileRow
+from app.graphql.pos.validations.services.validators.base import (
+    BaseRowTransform,
+    ValidationIssue,
+)
+
+# Name columns checked against connected orgs (custom columns slugify to these keys)
+ORGANIZATION_NAME_COLUMNS = ("manufacturer_name", "distributor_name")
+
+
+def maps_organization_names(field_map: FieldMap) -> bool:
+    return any(
+        field.standard_field_key in ORGANIZATION_NAME_COLUMNS
+        for field in field_map.fields
+    )
+
+
+def normalize_organization_name(name: str) -> str:
+    return " ".join(name.casefold().split())
+
+
+class OrganizationNameIndex:
+    """Case-folded names and aliases of an org's connected orgs, built once per file.
+
+    Aliases win over org names, since they are what the user maintains for
+    the names their partners actually send.
+    """
+
+    def __init__(self, org_ids_by_name: dict[str, uuid.UUID]) -> None:
+        self.org_ids_by_name = org_ids_by_name
+
+    @classmethod
+    def build(
+        cls,
+        org_names: Mapping[uuid.UUID, str],
+        aliases: Iterable[OrganizationAlias],
+    ) -> "OrganizationNameIndex":
+        org_ids_by_name = {
+            normalize_organization_name(name): org_id
+            for org_id, name in org_names.items()
+        }
+        for alias in aliases:
+            org_ids_by_name[normalize_organization_name(alias.alias)] = (
+                alias.connected_org_id
+            )
+        return cls(org_ids_by_name)
+
+    def resolve(self, name: str) -> uuid.UUID | None:
+        return self.org_ids_by_name.get(normalize_organization_name(name))
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedOrganization:
+    column_name: str
+    organization_name: str
+    connected_org_id: uuid.UUID
+
+
+class OrganizationAliasResolutionStage(BaseRowTransform):
+    """Resolves organization names to connected orgs, flagging those that don't.
+
+    Each distinct name resolved is collected in `resolutions`, keyed by column
+    and normalized name, for the caller to store with the file once every row
+    has been seen. Rows themselves are left as they are.
+    """
+
+    validation_key = "unresolved_organization"
+    validation_type = ValidationType.VALIDATION_WARNING
+
+    def __init__(self, index: OrganizationNameIndex) -> None:
+        self.index = index
+        self.resolutions: dict[tuple[str, str], ResolvedOrganization] = {}
+
+    def transform(self, row: FileRow, field_map: FieldMap) -> list[ValidationIssue]:
+        issues: list[ValidationIssue] = []
+
+        for name_column in ORGANIZATION_NAME_COLUMNS:
+            value = row.data.get(name_column)
+            if value is None or not str(value).strip():
+                continue
+            name = normalize_organization_name(str(value))
+            org_id = self.index.org_ids_by_name.get(name)
+            if org_id is not None:
+                self.resolutions.setdefault(
+                    (name_column, name),
+                    ResolvedOrganization(name_column, name, org_id),
+                )
+                continue
+
+            issues.append(
+                ValidationIssue(
+                    row_number=row.row_number,
+                    column_name=name_column,
+                    validation_key=self.validation_key,
+                    message=(
+                        f"'{value}' does not match a connected organization "
+                        f"or one of its aliases"
+                    ),
+                    row_data=row.data,
+                )
+            )
+
+        return issues
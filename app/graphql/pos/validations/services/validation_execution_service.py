@@ -10,14 +10,26 @@ from app.graphql.pos.field_map.models.field_map_enums import (
 from app.graphql.pos.field_map.repositories.field_map_repository import (
     FieldMapRepository,
 )
+from app.graphql.pos.organization_alias.repositories import OrganizationAliasRepository
 from app.graphql.pos.validations.constants import BLOCKING_VALIDATION_KEYS
 from app.graphql.pos.validations.exceptions import FieldMapNotFoundError
-from app.graphql.pos.validations.models import FileValidationIssue
-from app.graphql.pos.validations.repositories import FileValidationIssueRepository
+from app.graphql.pos.validations.models import (
+    FileOrganizationResolution,
+    FileValidationIssue,
+)
+from app.graphql.pos.validations.repositories import (
+    FileOrganizationResolutionRepository,
+    FileValidationIssueRepository,
+)
 from app.graphql.pos.validations.services.file_reader_service import (
     FileReaderService,
     FileRow,
 )
+from app.graphql.pos.validations.services.organization_alias_resolution import (
+    OrganizationAliasResolutionStage,
+    OrganizationNameIndex,
+    maps_organization_names,
+)
 from app.graphql.pos.validations.services.validation_pipeline import ValidationPipeline
 from app.graphql.pos.validations.services.validators.base import ValidationIssue
 from app.graphql.pos.validations.services.validators.date_format_validator import (
@@ -56,11 +68,15 @@ class ValidationExecutionService:
         file_reader_service: FileReaderService,
         validation_issue_repository: FileValidationIssueRepository,
         field_map_repository: FieldMapRepository,
+        alias_repository: OrganizationAliasRepository,
+        resolution_repository: FileOrganizationResolutionRepository,
     ) -> None:
         self.exchange_file_repository = exchange_file_repository
         self.file_reader_service = file_reader_service
         self.validation_issue_repository = validation_issue_repository
         self.field_map_repository = field_map_repository
+        self.alias_repository = alias_repository
+        self.resolution_repository = resolution_repository
 
     async def validate_file(self, file_id: uuid.UUID) -> None:
         file = await self.exchange_file_repository.get_by_id(file_id)
@@ -71,6 +87,7 @@ class ValidationExecutionService:
         await self.exchange_file_repository.update(file)
 
         await self.validation_issue_repository.delete_by_file_id(file_id)
+        await self.resolution_repository.delete_by_file_id(file_id)
 
         field_maps = await self._get_applicable_field_maps(
             file.org_id, file.is_pos, file.is_pot
@@ -80,6 +97,14 @@ class ValidationExecutionService:
                 f"No field map found for organization {file.org_id}"
             )
 
+        # The index costs a query per database, so only files mapping a name
+        # column pay for it
+        resolution_stage = None
+        if any(maps_organization_names(field_map) for field_map in field_maps):
+            resolution_stage = OrganizationAliasResolutionStage(
+                await self._build_name_index(file.org_id)
+            )
+
         all_issues: list[ValidationIssue] = []
         has_blocking_errors = False
 
@@ -88,9 +113,11 @@ class ValidationExecutionService:
                 s3_key=file.s3_key,
                 file_type=file.file_type,
                 field_map=field_map,
+                file_sha=file.file_sha,
+            )
+            issues, has_blocking = self._run_validation(
+                rows, field_map, resolution_stage
             )
-
-            issues, has_blocking = self._run_validation(rows, field_map)
             all_issues.extend(issues)
             if has_blocking:
                 has_blocking_errors = True
@@ -109,6 +136,19 @@ class ValidationExecutionService:
             ]
             await self.validation_issue_repository.create_bulk(issue_models)
 
+        if resolution_stage is not None and resolution_stage.resolutions:
+            await self.resolution_repository.create_bulk(
+                [
+                    FileOrganizationResolution(
+                        exchange_file_id=file_id,
+                        column_name=resolved.column_name,
+                        organization_name=resolved.organization_name,
+                        connected_org_id=resolved.connected_org_id,
+                    )
+                    for resolved in resolution_stage.resolutions.values()
+                ]
+            )
+
         file.validation_status = (
             ValidationStatus.INVALID.value
             if has_blocking_errors
@@ -125,14 +165,14 @@ class ValidationExecutionService:
         field_maps: list[FieldMap] = []
 
         if is_pos:
-            pos_map = await self.field_map_repository.get_by_org_and_type(
+            pos_map = await self.field_map_repository.get_cached_by_org_and_type(
                 org_id, FieldMapType.POS, FieldMapDirection.SEND
             )
             if pos_map:
                 field_maps.append(pos_map)
 
         if is_pot:
-            pot_map = await self.field_map_repository.get_by_org_and_type(
+            pot_map = await self.field_map_repository.get_cached_by_org_and_type(
                 org_id, FieldMapType.POT, FieldMapDirection.SEND
             )
             if pot_map:
@@ -140,12 +180,18 @@ class ValidationExecutionService:
 
         return field_maps
 
+    async def _build_name_index(self, org_id: uuid.UUID) -> OrganizationNameIndex:
+        org_names = await self.alias_repository.get_connected_org_names(org_id)
+        aliases = await self.alias_repository.get_all_by_org(org_id)
+        return OrganizationNameIndex.build(org_names, aliases)
+
     def _run_validation(
         self,
         rows: list[FileRow],
         field_map: FieldMap,
+        resolution_stage: OrganizationAliasResolutionStage | None,
     ) -> tuple[list[ValidationIssue], bool]:
-        pipeline = self._create_pipeline()
+        pipeline = self._create_pipeline(resolution_stage)
         all_issues = pipeline.validate_rows(rows, field_map)
 
         has_blocking = any(
@@ -155,7 +201,11 @@ class ValidationExecutionService:
         return all_issues, has_blocking
 
     @staticmethod
-    def _create_pipeline() -> ValidationPipeline:
+    def _create_pipeline(
+        resolution_stage: OrganizationAliasResolutionStage | None,
+    ) -> ValidationPipeline:
+        # One stage serves every field map, so a name is stored once per file
+        transforms = [resolution_stage] if resolution_stage is not None else []
         return ValidationPipeline(
             blocking_validators=[
                 RequiredFieldValidator(),
@@ -170,4 +220,5 @@ class ValidationExecutionService:
                 ShipFromLocationValidator(),
                 LostFlagValidator(),
             ],
+            transforms=transforms,
         )
@@ -1,6 +1,7 @@
 from app.graphql.pos.field_map.models.field_map import FieldMap
 from app.graphql.pos.validations.services.file_reader_service import FileRow
 from app.graphql.pos.validations.services.validators.base import (
+    BaseRowTransform,
     BaseValidator,
     ValidationIssue,
 )
@@ -11,15 +12,21 @@ class ValidationPipeline:
         self,
         blocking_validators: list[BaseValidator],
         warning_validators: list[BaseValidator],
+        transforms: list[BaseRowTransform] | None = None,
     ) -> None:
         self.blocking_validators = blocking_validators
         self.warning_validators = warning_validators
+        self.transforms = transforms or []
 
     def validate_row(
         self,
         row: FileRow,
         field_map: FieldMap,
     ) -> list[ValidationIssue]:
+        transform_issues: list[ValidationIssue] = []
+        for transform in self.transforms:
+            transform_issues.extend(transform.transform(row, field_map))
+
         all_issues: list[ValidationIssue] = []
 
         for validator in self.blocking_validators:
@@ -27,13 +34,13 @@ class ValidationPipeline:
             all_issues.extend(issues)
 
         if all_issues:
-            return all_issues
+            return transform_issues + all_issues
 
         for validator in self.warning_validators:
             issues = validator.validate(row, field_map)
             all_issues.extend(issues)
 
-        return all_issues
+        return transform_issues + all_issues
 
     def validate_rows(
         self,
@@ -13,6 +13,10 @@ async def _run_validation_task(file_id: uuid.UUID) -> None:
     try:
         from app.core.container import create_container
 
+        # The app's container, so validation reuses its S3 client pool rather
+        # than opening one per task, and its writes invalidate the dashboard
+        # glance cache requests read. The request's ContextWrapper value,
+        # copied into this task, supplies the tenant.
         container = create_container()
         async with container.context() as ctx:
             from app.graphql.pos.validations.services.validation_execution_service import (
@@ -23,3 +23,18 @@ class BaseValidator(ABC):
     @abstractmethod
     def validate(self, row: FileRow, field_map: FieldMap) -> list[ValidationIssue]:
         pass
+
+
+class BaseRowTransform(ABC):
+    """Runs over each row ahead of the validators, reporting rows it cannot handle.
+
+    Transforms may collect what they derive from the rows, but leave the rows
+    themselves unchanged for the validators.
+    """
+
+    validation_key: str
+    validation_type: ValidationType
+
+    @abstractmethod
+    def transform(self, row: FileRow, field_map: FieldMap) -> list[ValidationIssue]:
+        pass
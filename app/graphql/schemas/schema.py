@@ -1,5 +1,6 @@
 import datetime
 import decimal
+from functools import partial
 from typing import Any
 
 import strawberry
@@ -8,8 +9,15 @@ from fastapi import UploadFile
 from strawberry.extensions.mask_errors import MaskErrors
 from strawberry.file_uploads import Upload
 
+from app.core.config.base_settings import get_settings
+from app.core.config.graphql_settings import GraphQLSettings
 from app.core.container import create_container
 from app.core.middleware.graphql_middleware import GraphQLMiddleware
+from app.core.middleware.persisted_queries import (
+    PersistedQueryExtension,
+    PersistedQueryStore,
+)
+from app.core.middleware.query_cost import OrgCostTracker, QueryCostExtension
 from app.graphql.connections.mutations import ConnectionMutations
 from app.graphql.di import context_setter
 from app.graphql.error_handler import should_mask_error
@@ -96,15 +104,26 @@ scalar_overrides: dict[object, Any] = {
     strawberry.scalars.JSON: JsonScalar,
 }
 
+graphql_settings = get_settings(GraphQLSettings)
+persisted_query_store = PersistedQueryStore.from_settings(graphql_settings)
+org_cost_tracker = OrgCostTracker.from_settings(graphql_settings)
+
 schema = strawberry.Schema(
     Query,
     mutation=Mutation,
     extensions=[
+        # Resolves persisted hashes first so the other extensions see the query
+        partial(PersistedQueryExtension, store=persisted_query_store),  # pyright: ignore[reportArgumentType]
         AioInjectExtension(
             container=create_container(),
             context_setter=context_setter,
         ),
         GraphQLMiddleware,
+        partial(  # pyright: ignore[reportArgumentType]
+            QueryCostExtension,
+            settings=graphql_settings,
+            tracker=org_cost_tracker,
+        ),
         MaskErrors(should_mask_error=should_mask_error),
     ],
     scalar_overrides=scalar_overrides,
@@ -35,9 +35,9 @@ class DatabaseCreationService:
         finally:
             await conn.close()
 
-    async def create_database(self, db_name: str) -> None:
+    async def create_database(self, db_name: str, template: str | None = None) -> None:
         """
-        Create a new PostgreSQL database.
+        Create a new PostgreSQL database, optionally as a copy of `template`.
 
         The database name is quoted as an identifier to handle special
         characters (like hyphens) safely.
@@ -45,11 +45,50 @@ class DatabaseCreationService:
         # Quote the database name as an identifier to prevent SQL injection
         # and handle special characters like hyphens
         quoted_name = f'"{db_name}"'
+        statement = f"CREATE DATABASE {quoted_name}"
+        if template:
+            statement = f'{statement} TEMPLATE "{template}"'
 
         conn = await self._get_connection()
         try:
-            logger.info("Creating database", db_name=db_name)
-            await conn.execute(f"CREATE DATABASE {quoted_name}")
+            logger.info("Creating database", db_name=db_name, template=template)
+            await conn.execute(statement)
             logger.info("Database created successfully", db_name=db_name)
         finally:
             await conn.close()
+
+    async def clone_database(self, db_name: str, template: str) -> bool:
+        """
+        Create a database as a copy of `template`.
+
+        Returns False, without creating anything, when the template does not
+        exist or is being refreshed; PostgreSQL refuses to copy a database
+        that has other sessions connected.
+        """
+        try:
+            await self.create_database(db_name, template=template)
+        except (asyncpg.InvalidCatalogNameError, asyncpg.ObjectInUseError) as e:
+            logger.warning(
+                "Cannot copy template database",
+                db_name=db_name,
+                template=template,
+                error=str(e),
+            )
+            return False
+        return True
+
+    async def set_template_connections(self, db_name: str, allow: bool) -> None:
+        """
+        Mark a database as a template and allow or refuse connections to it.
+
+        Templates refuse connections except while they are being migrated,
+        so nothing holds a session open that would block copying them.
+        """
+        conn = await self._get_connection()
+        try:
+            await conn.execute(
+                f'ALTER DATABASE "{db_name}" '
+                f"WITH IS_TEMPLATE true ALLOW_CONNECTIONS {str(allow).lower()}"
+            )
+        finally:
+            await conn.close()
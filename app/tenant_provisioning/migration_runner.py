@@ -0,0 +1,197 @@
+import asyncio
+import multiprocessing
+import time
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+
+from commons.db.models.tenant import Tenant
+from loguru import logger
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.db.tenant_url import tenant_database_url
+from app.tenant_provisioning.migration_service import MigrationService
+from app.tenant_provisioning.repository import TenantRepository
+
+
+@dataclass
+class TenantMigrationResult:
+    tenant_url: str
+    host: str
+    from_revision: str | None
+    to_revision: str | None
+    seconds: float
+    error: str | None = None
+
+    @property
+    def migrated(self) -> bool:
+        return self.error is None and self.from_revision != self.to_revision
+
+
+class TenantMigrationRunner:
+    """
+    Migrates every initialized tenant database to head.
+
+    Each tenant record's alembic_version is the checkpoint: it is updated
+    as soon as that tenant is migrated, and tenants already recorded at
+    head are skipped without connecting. A rerun after a partial failure
+    therefore only touches the tenants that didn't finish. With `verify`,
+    every tenant's actual revision is read instead.
+
+    Up to `concurrency_per_host` tenants on the same database host are
+    migrated at once. Each upgrade runs in its own process, since Alembic
+    can't run two upgrades in one.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        migration_service: MigrationService,
+        pg_url: str,
+        concurrency_per_host: int,
+        verify: bool = False,
+    ) -> None:
+        self.session_factory = session_factory
+        self.migration_service = migration_service
+        # Alembic runs on the sync driver
+        self.server_url = make_url(pg_url).set(drivername="postgresql")
+        self.concurrency_per_host = concurrency_per_host
+        self.verify = verify
+
+    async def run(self) -> list[TenantMigrationResult]:
+        head = await self.migration_service.get_head_revision()
+        async with self.session_factory() as session:
+            tenants = await TenantRepository(session).list_initialized()
+
+        pending = [t for t in tenants if self.verify or t.alembic_version != head]
+        logger.info(
+            f"{len(tenants) - len(pending)} of {len(tenants)} tenants are recorded "
+            f"at {head}; checking {len(pending)}"
+        )
+        if not pending:
+            return []
+
+        by_host: defaultdict[str, list[Tenant]] = defaultdict(list)
+        for tenant in pending:
+            by_host[self._host(tenant)].append(tenant)
+
+        workers = min(len(pending), self.concurrency_per_host * len(by_host))
+        progress = _Progress(total=len(pending))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            per_host = await asyncio.gather(
+                *(
+                    self._migrate_host(host_tenants, head, executor, progress)
+                    for host_tenants in by_host.values()
+                )
+            )
+        results = [result for host_results in per_host for result in host_results]
+        self._log_summary(results)
+        return results
+
+    async def _migrate_host(
+        self,
+        tenants: list[Tenant],
+        head: str,
+        executor: Executor,
+        progress: "_Progress",
+    ) -> list[TenantMigrationResult]:
+        semaphore = asyncio.Semaphore(self.concurrency_per_host)
+
+        async def migrate(tenant: Tenant) -> TenantMigrationResult:
+            async with semaphore:
+                result = await self._migrate_tenant(tenant, head, executor)
+            progress.report(result)
+            return result
+
+        return list(await asyncio.gather(*(migrate(tenant) for tenant in tenants)))
+
+    async def _migrate_tenant(
+        self,
+        tenant: Tenant,
+        head: str,
+        executor: Executor,
+    ) -> TenantMigrationResult:
+        started = time.perf_counter()
+        db_url = self._db_url(tenant)
+        current: str | None = None
+        # noinspection PyBroadException
+        try:
+            current = await self.migration_service.get_current_revision(db_url)
+            revision = current
+            if current != head:
+                revision = await self.migration_service.run_migrations(
+                    db_url, executor=executor
+                )
+            if revision and revision != tenant.alembic_version:
+                await self._checkpoint(tenant, revision)
+        except Exception as e:
+            # One tenant failing doesn't stop the others; a rerun retries it
+            return TenantMigrationResult(
+                tenant_url=tenant.url,
+                host=self._host(tenant),
+                from_revision=current,
+                to_revision=None,
+                seconds=time.perf_counter() - started,
+                error=str(e) or type(e).__name__,
+            )
+
+        return TenantMigrationResult(
+            tenant_url=tenant.url,
+            host=self._host(tenant),
+            from_revision=current,
+            to_revision=revision,
+            seconds=time.perf_counter() - started,
+        )
+
+    async def _checkpoint(self, tenant: Tenant, revision: str) -> None:
+        async with self.session_factory() as session, session.begin():
+            await TenantRepository(session).update_alembic_version(tenant.id, revision)
+
+    def _host(self, tenant: Tenant) -> str:
+        return tenant.database or self.server_url.host or ""
+
+    def _db_url(self, tenant: Tenant) -> str:
+        # The same URL the app's tenant engines connect with
+        url = tenant_database_url(
+            self.server_url,
+            tenant.url,
+            host=tenant.database,
+            username=tenant.username,
+        )
+        return url.render_as_string(hide_password=False)
+
+    @staticmethod
+    def _log_summary(results: list[TenantMigrationResult]) -> None:
+        failed = [result for result in results if result.error is not None]
+        migrated = sum(1 for result in results if result.migrated)
+        slowest = sorted(results, key=lambda result: result.seconds, reverse=True)
+        logger.info(
+            f"Migrated {migrated} tenants, {len(results) - migrated - len(failed)} "
+            f"were already at head, {len(failed)} failed"
+        )
+        for result in slowest[:5]:
+            logger.info(f"Slowest: {result.tenant_url} took {result.seconds:.1f}s")
+        for result in failed:
+            logger.error(f"Tenant {result.tenant_url} failed: {result.error}")
+
+
+class _Progress:
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.done = 0
+
+    def report(self, result: TenantMigrationResult) -> None:
+        self.done += 1
+        outcome = (
+            f"failed: {result.error}"
+            if result.error is not None
+            else f"{result.from_revision} -> {result.to_revision}"
+        )
+        logger.info(
+            f"[{self.done}/{self.total}] {result.tenant_url} on {result.host} "
+            f"in {result.seconds:.1f}s ({outcome})"
+        )
@@ -1,13 +1,27 @@
 import asyncio
+from concurrent.futures import Executor
 
 from alembic.config import Config
 from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
 from loguru import logger
 from sqlalchemy import create_engine
 
 from alembic import command
 
 
+def upgrade_to_head(alembic_config_path: str, db_url: str) -> None:
+    """
+    Apply all pending migrations to a database.
+
+    Alembic keeps the running migration's context in module globals, so
+    upgrades that run at the same time each need their own process.
+    """
+    config = Config(alembic_config_path)
+    config.set_main_option("sqlalchemy.url", db_url)
+    command.upgrade(config, "head")
+
+
 class MigrationService:
     """
     Service for running Alembic migrations on tenant databases.
@@ -18,12 +32,18 @@ class MigrationService:
 
     def __init__(self, alembic_config_path: str = "alembic.ini") -> None:
         self.alembic_config_path = alembic_config_path
+        self._head_revision: str | None = None
+
+    async def get_head_revision(self) -> str:
+        """The head revision of the migration scripts, read once per process."""
+        if self._head_revision is None:
+            self._head_revision = await asyncio.to_thread(self._get_head_revision_sync)
+        return self._head_revision
 
-    def _get_alembic_config(self, db_url: str) -> Config:
-        """Create Alembic config with the target database URL."""
-        config = Config(self.alembic_config_path)
-        config.set_main_option("sqlalchemy.url", db_url)
-        return config
+    def _get_head_revision_sync(self) -> str:
+        """Synchronous implementation of get_head_revision."""
+        script = ScriptDirectory.from_config(Config(self.alembic_config_path))
+        return script.get_current_head() or ""
 
     async def get_current_revision(self, db_url: str) -> str | None:
         """
@@ -47,15 +67,25 @@ class MigrationService:
         finally:
             engine.dispose()
 
-    async def run_migrations(self, db_url: str) -> str:
+    async def run_migrations(
+        self,
+        db_url: str,
+        executor: Executor | None = None,
+    ) -> str:
         """
         Run all pending migrations on the target database.
 
-        Returns the new revision after migrations are applied.
+        Pass a process pool as `executor` to migrate several databases at
+        once. Returns the new revision after migrations are applied.
         """
         logger.info("Running migrations", db_url=db_url.split("@")[-1])
 
-        await asyncio.to_thread(self._run_migrations_sync, db_url)
+        if executor is None:
+            await asyncio.to_thread(self._run_migrations_sync, db_url)
+        else:
+            await asyncio.get_running_loop().run_in_executor(
+                executor, upgrade_to_head, self.alembic_config_path, db_url
+            )
 
         # Get the new revision
         new_revision = await self.get_current_revision(db_url)
@@ -65,5 +95,4 @@ class MigrationService:
 
     def _run_migrations_sync(self, db_url: str) -> None:
         """Synchronous implementation of run_migrations."""
-        config = self._get_alembic_config(db_url)
-        command.upgrade(config, "head")
+        upgrade_to_head(self.alembic_config_path, db_url)
@@ -1,7 +1,7 @@
 import uuid
 
 from commons.db.models.tenant import Tenant
-from sqlalchemy import select
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -9,6 +9,12 @@ class TenantRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    async def lock_org(self, org_id: str) -> None:
+        """Hold a per-org advisory lock until the transaction ends."""
+        await self.session.execute(
+            select(func.pg_advisory_xact_lock(func.hashtext(org_id)))
+        )
+
     async def get_by_org_id(self, org_id: str) -> Tenant | None:
         stmt = select(Tenant).where(Tenant.org_id == org_id)
         result = await self.session.execute(stmt)
@@ -19,9 +25,27 @@ class TenantRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def list_initialized(self) -> list[Tenant]:
+        stmt = select(Tenant).where(Tenant.initialize.is_(True)).order_by(Tenant.url)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_urls_with_prefix(self, base_url: str) -> set[str]:
+        """The base url and every url that extends it with a `-suffix`."""
+        stmt = select(Tenant.url).where(
+            or_(
+                Tenant.url == base_url,
+                Tenant.url.startswith(f"{base_url}-", autoescape=True),
+            )
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
     async def create(self, tenant: Tenant) -> Tenant:
-        self.session.add(tenant)
-        await self.session.flush([tenant])
+        # A savepoint keeps the transaction usable if the url is already taken
+        async with self.session.begin_nested():
+            self.session.add(tenant)
+            await self.session.flush([tenant])
         return tenant
 
     async def update_initialize(
@@ -38,3 +62,15 @@ class TenantRepository:
             if alembic_version is not None:
                 tenant.alembic_version = alembic_version
             await self.session.flush([tenant])
+
+    async def update_alembic_version(
+        self,
+        tenant_id: uuid.UUID,
+        alembic_version: str,
+    ) -> None:
+        stmt = (
+            update(Tenant)
+            .where(Tenant.id == tenant_id)
+            .values(alembic_version=alembic_version)
+        )
+        await self.session.execute(stmt)
@@ -8,9 +8,14 @@ from urllib.parse import urlparse, urlunparse
 
 from commons.db.models.tenant import Tenant
 from loguru import logger
+from sqlalchemy.exc import IntegrityError
 
 from app.tenant_provisioning.repository import TenantRepository
 
+# Attempts at creating the tenant record when other provisioning takes the
+# chosen url first
+URL_RESERVE_ATTEMPTS = 3
+
 
 class ProvisioningStatus(Enum):
     CREATED = "created"
@@ -27,13 +32,31 @@ class ProvisioningResult:
 
 class DatabaseServiceProtocol(Protocol):
     async def database_exists(self, db_name: str) -> bool: ...
-    async def create_database(self, db_name: str) -> None: ...
+    async def create_database(
+        self, db_name: str, template: str | None = None
+    ) -> None: ...
+    async def clone_database(self, db_name: str, template: str) -> bool: ...
+    async def set_template_connections(self, db_name: str, allow: bool) -> None: ...
 
 
 class MigrationServiceProtocol(Protocol):
+    async def get_head_revision(self) -> str: ...
+    async def get_current_revision(self, db_url: str) -> str | None: ...
     async def run_migrations(self, db_url: str) -> str: ...
 
 
+def build_db_url(db_connection_url: str, db_name: str) -> str:
+    """Build a database URL for the given database name, preserving query params."""
+    parsed = urlparse(db_connection_url)
+    # Replace the path (database name) while keeping everything else
+    new_parsed = parsed._replace(path=f"/{db_name}")
+    url = urlunparse(new_parsed)
+    # Ensure sslmode=require for cloud databases (Neon, etc.)
+    if "sslmode" not in url and "neon.tech" in url:
+        url = f"{url}?sslmode=require"
+    return url
+
+
 class TenantProvisioningService:
     def __init__(
         self,
@@ -44,6 +67,7 @@ class TenantProvisioningService:
         db_host: str,
         db_ro_host: str,
         db_username: str,
+        template_database: str | None = None,
     ) -> None:
         self.repository = repository
         self.database_service = database_service
@@ -54,6 +78,7 @@ class TenantProvisioningService:
         self.db_host = db_host  # Just hostname for tenant record
         self.db_ro_host = db_ro_host  # Read-only hostname for tenant record
         self.db_username = db_username  # Username for tenant record
+        self.template_database = template_database  # Copied instead of migrating
 
     async def provision(
         self,
@@ -64,14 +89,15 @@ class TenantProvisioningService:
         Provision a new tenant for an organization.
 
         Flow:
-        1. Check if tenant already exists
+        1. Lock the org and check if tenant already exists
         2. Generate unique tenant URL from org name
         3. Create tenant record
-        4. Create database if needed
-        5. Run migrations
+        4. Create database if needed, copying the template database
+        5. Run migrations the copy is missing
         6. Mark tenant as initialized
         """
-        # Check if tenant already exists
+        # Serialize provisioning per org, then check if tenant already exists
+        await self.repository.lock_org(org_id)
         existing = await self.repository.get_by_org_id(org_id)
         if existing:
             logger.info("Tenant already exists", org_id=org_id, tenant_id=existing.id)
@@ -80,33 +106,19 @@ class TenantProvisioningService:
                 tenant_id=existing.id,
             )
 
-        # Generate tenant URL
-        tenant_url = await self._generate_unique_url(org_name)
-        logger.info("Generated tenant URL", org_id=org_id, tenant_url=tenant_url)
-
-        # Create tenant record
-        tenant = Tenant(
-            id=uuid.uuid4(),
-            org_id=org_id,
-            name=org_name,
-            url=tenant_url,
-            initialize=False,
-            database=self.db_host,
-            read_only_database=self.db_ro_host,
-            username=self.db_username,
-            alembic_version="",
-        )
-        tenant = await self.repository.create(tenant)
+        # Generate tenant URL and create tenant record
+        tenant = await self._create_tenant(org_id, org_name)
+        tenant_url = tenant.url
         logger.info("Created tenant record", tenant_id=tenant.id)
 
         # Create database if needed
+        cloned = False
         if not await self.database_service.database_exists(tenant_url):
-            await self.database_service.create_database(tenant_url)
-            logger.info("Created database", db_name=tenant_url)
+            cloned = await self._create_database(tenant_url)
 
         # Run migrations
         db_url = self._build_db_url(tenant_url)
-        alembic_version = await self.migration_service.run_migrations(db_url)
+        alembic_version = await self._migrate(db_url, cloned)
         logger.info("Migrations complete", version=alembic_version)
 
         # Mark as initialized with alembic version
@@ -122,29 +134,72 @@ class TenantProvisioningService:
             tenant_id=tenant.id,
         )
 
+    async def _create_database(self, db_name: str) -> bool:
+        """Create the tenant database; True if it was copied from the template."""
+        if self.template_database and await self.database_service.clone_database(
+            db_name, self.template_database
+        ):
+            logger.info(
+                "Created database from template",
+                db_name=db_name,
+                template=self.template_database,
+            )
+            return True
+
+        await self.database_service.create_database(db_name)
+        logger.info("Created database", db_name=db_name)
+        return False
+
+    async def _migrate(self, db_url: str, cloned: bool) -> str:
+        """Bring the database to head; a copy of a current template already is."""
+        if cloned:
+            current = await self.migration_service.get_current_revision(db_url)
+            if current and current == await self.migration_service.get_head_revision():
+                return current
+            # The template is behind; only the migrations it lacks are run
+        return await self.migration_service.run_migrations(db_url)
+
     def _build_db_url(self, db_name: str) -> str:
-        """Build a database URL for the given database name, preserving query params."""
-        parsed = urlparse(self.db_connection_url)
-        # Replace the path (database name) while keeping everything else
-        new_parsed = parsed._replace(path=f"/{db_name}")
-        url = urlunparse(new_parsed)
-        # Ensure sslmode=require for cloud databases (Neon, etc.)
-        if "sslmode" not in url and "neon.tech" in url:
-            url = f"{url}?sslmode=require"
-        return url
+        return build_db_url(self.db_connection_url, db_name)
+
+    async def _create_tenant(self, org_id: str, org_name: str) -> Tenant:
+        """Create the tenant record, under a new url if its url gets taken."""
+        attempt = 1
+        while True:
+            tenant_url = await self._generate_unique_url(org_name)
+            logger.info("Generated tenant URL", org_id=org_id, tenant_url=tenant_url)
+            tenant = Tenant(
+                id=uuid.uuid4(),
+                org_id=org_id,
+                name=org_name,
+                url=tenant_url,
+                initialize=False,
+                database=self.db_host,
+                read_only_database=self.db_ro_host,
+                username=self.db_username,
+                alembic_version="",
+            )
+            try:
+                return await self.repository.create(tenant)
+            except IntegrityError:
+                # The unique url constraint caught concurrent provisioning
+                if attempt >= URL_RESERVE_ATTEMPTS:
+                    raise
+                logger.info("Tenant URL taken concurrently", tenant_url=tenant_url)
+                attempt += 1
 
     async def _generate_unique_url(self, org_name: str) -> str:
-        """Generate a unique tenant URL, appending suffix if needed."""
+        """Generate a unique tenant URL, appending the lowest free suffix if needed."""
         base_url = self.generate_tenant_url(org_name)
-        url = base_url
+        # One query for every collision, however many there are
+        taken = await self.repository.get_urls_with_prefix(base_url)
+        if base_url not in taken:
+            return base_url
 
-        # Check for collisions and append suffix if needed
         suffix = 1
-        while await self.repository.get_by_url(url):
-            url = f"{base_url}-{suffix}"
+        while f"{base_url}-{suffix}" in taken:
             suffix += 1
-
-        return url
+        return f"{base_url}-{suffix}"
 
     @staticmethod
     def generate_tenant_url(org_name: str) -> str:
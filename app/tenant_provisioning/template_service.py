@@ -0,0 +1,59 @@
+from loguru import logger
+
+from app.tenant_provisioning.service import (
+    DatabaseServiceProtocol,
+    MigrationServiceProtocol,
+    build_db_url,
+)
+
+
+class TemplateDatabaseService:
+    """
+    Keeps the template database that new tenant databases are copied from.
+
+    The template is an ordinary tenant database migrated to head. It refuses
+    connections between refreshes, since PostgreSQL won't copy a database
+    while other sessions are connected to it. Provisioning that runs during
+    a refresh falls back to migrating an empty database.
+    """
+
+    def __init__(
+        self,
+        database_service: DatabaseServiceProtocol,
+        migration_service: MigrationServiceProtocol,
+        db_connection_url: str,
+        template_database: str,
+    ) -> None:
+        self.database_service = database_service
+        self.migration_service = migration_service
+        self.db_connection_url = db_connection_url
+        self.template_database = template_database
+
+    async def refresh(self) -> str:
+        """
+        Create the template if needed and migrate it to head.
+
+        Returns the template's revision.
+        """
+        if not await self.database_service.database_exists(self.template_database):
+            await self.database_service.create_database(self.template_database)
+            logger.info("Created template database", db_name=self.template_database)
+
+        await self.database_service.set_template_connections(
+            self.template_database, allow=True
+        )
+        try:
+            revision = await self.migration_service.run_migrations(
+                build_db_url(self.db_connection_url, self.template_database)
+            )
+        finally:
+            await self.database_service.set_template_connections(
+                self.template_database, allow=False
+            )
+
+        logger.info(
+            "Template database refreshed",
+            db_name=self.template_database,
+            revision=revision,
+        )
+        return revision
@@ -0,0 +1,165 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    and_,
+    func,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+PENDING = "pending"
+PROCESSING = "processing"
+DONE = "done"
+FAILED = "failed"
+
+# pg_advisory_xact_lock key serializing `create_table` across workers
+CREATE_TABLE_LOCK_ID = 4_120_517_003
+
+# Lives in the public database next to the tenants table, which the tenant
+# migrations don't manage, so it has its own metadata
+metadata = MetaData()
+
+webhook_events = Table(
+    "workos_webhook_events",
+    metadata,
+    Column("event_id", Text, primary_key=True),
+    Column("event_type", Text, nullable=False),
+    Column("payload", Text, nullable=False),
+    Column("status", Text, nullable=False, server_default=PENDING, index=True),
+    Column("attempts", Integer, nullable=False, server_default="0"),
+    Column("last_error", Text),
+    Column(
+        "received_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    Column(
+        "available_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    Column("locked_at", DateTime(timezone=True)),
+    Column("processed_at", DateTime(timezone=True)),
+)
+
+
+@dataclass
+class StoredEvent:
+    event_id: str
+    payload: str
+    attempts: int
+
+
+class WebhookEventStore:
+    """
+    Received webhook events, keyed by event id.
+
+    The primary key makes redelivered events no-ops. Workers claim pending
+    events with SKIP LOCKED, so each event is processed by one worker; a
+    claim older than `stale_after` is taken to belong to a worker that died.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        stale_after: timedelta,
+    ) -> None:
+        self.session_factory = session_factory
+        self.stale_after = stale_after
+
+    @staticmethod
+    async def create_table(engine: AsyncEngine) -> None:
+        # Workers start together; IF NOT EXISTS alone still lets concurrent
+        # creates collide on the table's row type, so they take turns
+        async with engine.begin() as conn:
+            await conn.execute(select(func.pg_advisory_xact_lock(CREATE_TABLE_LOCK_ID)))
+            await conn.execute(CreateTable(webhook_events, if_not_exists=True))
+            for index in webhook_events.indexes:
+                await conn.execute(CreateIndex(index, if_not_exists=True))
+
+    async def save(self, event_id: str, event_type: str, payload: str) -> bool:
+        """Store a received event; False if it was already received."""
+        stmt = (
+            insert(webhook_events)
+            .values(event_id=event_id, event_type=event_type, payload=payload)
+            .on_conflict_do_nothing(index_elements=[webhook_events.c.event_id])
+            .returning(webhook_events.c.event_id)
+        )
+        async with self.session_factory() as session, session.begin():
+            result = await session.execute(stmt)
+            return result.scalar_one_or_none() is not None
+
+    async def claim(self, limit: int) -> list[StoredEvent]:
+        """Mark up to `limit` due events as being processed and return them."""
+        t = webhook_events
+        due = (
+            select(t.c.event_id)
+            .where(
+                or_(
+                    and_(t.c.status == PENDING, t.c.available_at <= func.now()),
+                    and_(
+                        t.c.status == PROCESSING,
+                        t.c.locked_at < func.now() - self.stale_after,
+                    ),
+                )
+            )
+            .order_by(t.c.received_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(t)
+            .where(t.c.event_id.in_(due.scalar_subquery()))
+            .values(status=PROCESSING, attempts=t.c.attempts + 1, locked_at=func.now())
+            .returning(t.c.event_id, t.c.payload, t.c.attempts)
+        )
+        async with self.session_factory() as session, session.begin():
+            result = await session.execute(stmt)
+            return [
+                StoredEvent(
+                    event_id=row.event_id, payload=row.payload, attempts=row.attempts
+                )
+                for row in result
+            ]
+
+    async def mark_done(self, event_id: str) -> None:
+        await self._set(event_id, status=DONE, processed_at=func.now(), last_error=None)
+
+    async def mark_failed(
+        self,
+        event_id: str,
+        error: str,
+        retry_in: timedelta | None,
+    ) -> None:
+        """Record a failure; the event is retried after `retry_in`, if given."""
+        if retry_in is None:
+            await self._set(event_id, status=FAILED, last_error=error)
+            return
+        await self._set(
+            event_id,
+            status=PENDING,
+            last_error=error,
+            available_at=func.now() + retry_in,
+        )
+
+    async def _set(self, event_id: str, **values: object) -> None:
+        stmt = (
+            update(webhook_events)
+            .where(webhook_events.c.event_id == event_id)
+            .values(locked_at=None, **values)
+        )
+        async with self.session_factory() as session, session.begin():
+            await session.execute(stmt)
@@ -0,0 +1,109 @@
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+
+from loguru import logger
+
+from app.tenant_provisioning.service import TenantProvisioningService
+from app.webhooks.workos.event_store import StoredEvent, WebhookEventStore
+from app.webhooks.workos.handlers import handle_organization_created
+from app.webhooks.workos.schemas import WorkOSEvent
+
+type EventHandler = Callable[[WorkOSEvent, TenantProvisioningService], Awaitable[None]]
+
+HANDLERS: dict[str, EventHandler] = {
+    "organization.created": handle_organization_created,
+}
+
+CLAIM_BATCH_SIZE = 10
+RETRY_BASE_DELAY = timedelta(seconds=30)
+MAX_RETRY_DELAY = timedelta(hours=1)
+
+
+class WebhookEventProcessor:
+    """
+    Processes stored webhook events in the background.
+
+    The webhook endpoint only stores the event and wakes the processor, so
+    WorkOS gets its response before provisioning starts. Pending events are
+    also polled for, which picks up events stored by other workers and
+    retries that are due. Failed events are retried with exponential
+    backoff until `max_attempts`.
+    """
+
+    def __init__(
+        self,
+        store: WebhookEventStore,
+        provisioning_service: TenantProvisioningService,
+        poll_interval_seconds: float,
+        max_attempts: int,
+    ) -> None:
+        self.store = store
+        self.provisioning_service = provisioning_service
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_attempts = max_attempts
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def enqueue(self, event: WorkOSEvent, payload: str) -> bool:
+        """Store an event for processing; False if it was already received."""
+        stored = await self.store.save(event.id, event.event, payload)
+        if stored:
+            self._wake.set()
+        return stored
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def process_pending(self) -> int:
+        """Process one batch of due events; returns how many were claimed."""
+        events = await self.store.claim(CLAIM_BATCH_SIZE)
+        for stored in events:
+            await self._process(stored)
+        return len(events)
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            # noinspection PyBroadException
+            try:
+                if await self.process_pending():
+                    continue
+            except Exception:
+                # The database may be briefly unavailable; retry on the next poll
+                logger.exception("Failed to process webhook events")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval_seconds)
+
+    async def _process(self, stored: StoredEvent) -> None:
+        # noinspection PyBroadException
+        try:
+            event = WorkOSEvent.model_validate_json(stored.payload)
+            await HANDLERS[event.event](event, self.provisioning_service)
+        except Exception as e:
+            retry_in = self._retry_delay(stored.attempts)
+            logger.exception(
+                "Webhook event processing failed",
+                event_id=stored.event_id,
+                attempts=stored.attempts,
+                retrying=retry_in is not None,
+            )
+            await self.store.mark_failed(stored.event_id, str(e), retry_in)
+            return
+        await self.store.mark_done(stored.event_id)
+
+    def _retry_delay(self, attempts: int) -> timedelta | None:
+        if attempts >= self.max_attempts:
+            return None
+        delay = RETRY_BASE_DELAY * 2 ** min(attempts - 1, 16)
+        return min(delay, MAX_RETRY_DELAY)
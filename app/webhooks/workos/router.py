@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Header, HTTPException, Request
 from loguru import logger
 
-from app.tenant_provisioning.service import TenantProvisioningService
-from app.webhooks.workos.handlers import handle_organization_created
+from app.webhooks.workos.processor import HANDLERS, WebhookEventProcessor
 from app.webhooks.workos.schemas import WorkOSEvent
 from app.webhooks.workos.signature import (
     InvalidSignatureError,
@@ -11,20 +10,18 @@ from app.webhooks.workos.signature import (
     verify_signature,
 )
 
-SUPPORTED_EVENTS = {"organization.created"}
-
 
 def create_workos_webhook_router(
     webhook_secret: str,
     *,
-    provisioning_service: TenantProvisioningService,
+    event_processor: WebhookEventProcessor,
 ) -> APIRouter:
     """
     Create a FastAPI router for WorkOS webhooks.
 
     Args:
         webhook_secret: The webhook secret from WorkOS dashboard
-        provisioning_service: Service for provisioning new tenants
+        event_processor: Stores events and processes them in the background
     """
     router = APIRouter(tags=["webhooks"])
 
@@ -36,7 +33,8 @@ def create_workos_webhook_router(
         """
         Handle incoming WorkOS webhook events.
 
-        Verifies the signature and routes to appropriate handlers.
+        Verifies the signature and stores the event for background
+        processing, so WorkOS is answered without waiting on provisioning.
         """
         # Get raw body for signature verification
         body = await request.body()
@@ -62,13 +60,14 @@ def create_workos_webhook_router(
             "Received WorkOS webhook", event_type=event.event, event_id=event.id
         )
 
-        # Route to handler
-        if event.event not in SUPPORTED_EVENTS:
+        if event.event not in HANDLERS:
             logger.debug("Ignoring unsupported event type", event_type=event.event)
             return {"status": "ok", "message": "Event ignored"}
 
-        if event.event == "organization.created":
-            await handle_organization_created(event, provisioning_service)
+        # Redeliveries of a stored event are acknowledged without reprocessing
+        if not await event_processor.enqueue(event, body.decode()):
+            logger.info("Ignoring duplicate webhook event", event_id=event.id)
+            return {"status": "ok", "message": "Duplicate event"}
 
         return {"status": "ok"}
 
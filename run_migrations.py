@@ -1,26 +1,69 @@
 """Run database migrations for multi-tenant setup."""
 
 import asyncio
+from urllib.parse import urlparse, urlunparse
 
 from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.config.base_settings import load_dotenv_once
 from app.core.config.settings import Settings
 from app.core.container import create_container
-from app.core.db.db_provider import create_multitenant_for_migration_controller
-from commons.migrations.migrations import MultiTenantMigration
+from app.core.db.engine_factory import create_pooled_engine
+from app.tenant_provisioning.database_service import DatabaseCreationService
+from app.tenant_provisioning.migration_runner import TenantMigrationRunner
+from app.tenant_provisioning.migration_service import MigrationService
+from app.tenant_provisioning.template_service import TemplateDatabaseService
 
 
-async def run_migration() -> None:
-    """Execute database migrations across all tenants."""
+async def run_migration(
+    concurrency_per_host: int | None = None,
+    verify: bool = False,
+) -> bool:
+    """Execute database migrations across all tenants; False if any failed."""
     async with create_container().context() as conn_ctx:
         settings = await conn_ctx.resolve(Settings)
-        controller = await create_multitenant_for_migration_controller(
-            settings.pg_url.unicode_string(), settings.environment
-        )
-        await MultiTenantMigration(controller, config_file="alembic.ini").run(
-            chunk_size=2
-        )
+        pg_url = settings.pg_url.unicode_string()
+        public_engine = create_pooled_engine("public", pg_url, settings)
+        try:
+            runner = TenantMigrationRunner(
+                session_factory=async_sessionmaker(
+                    bind=public_engine,
+                    class_=AsyncSession,
+                    expire_on_commit=False,
+                ),
+                migration_service=MigrationService("alembic.ini"),
+                pg_url=pg_url,
+                concurrency_per_host=(
+                    concurrency_per_host or settings.migration_concurrency_per_host
+                ),
+                verify=verify,
+            )
+            results = await runner.run()
+        finally:
+            await public_engine.dispose()
+
+        if settings.tenant_template_database:
+            await refresh_tenant_template(settings)
+        return all(result.error is None for result in results)
+
+
+async def refresh_tenant_template(settings: Settings) -> None:
+    """Bring the template new tenant databases are copied from to head."""
+    pg_url = settings.pg_url.unicode_string()
+    sync_pg_url = pg_url.replace("postgresql+asyncpg://", "postgresql://")
+    template_service = TemplateDatabaseService(
+        database_service=DatabaseCreationService(pg_url),
+        migration_service=MigrationService("alembic.ini"),
+        db_connection_url=urlunparse(urlparse(sync_pg_url)._replace(path="")),
+        template_database=settings.tenant_template_database,
+    )
+    # noinspection PyBroadException
+    try:
+        await template_service.refresh()
+    except Exception:
+        # Tenants are migrated; new ones copy the stale template and catch up
+        logger.exception("Failed to refresh the tenant template database")
 
 
 def main() -> None:
@@ -34,10 +77,25 @@ def main() -> None:
         help="The environment to run the app in (e.g., dev, staging, prod).",
     )
 
-    _ = load_dotenv_once(f".env.{parser.parse_args().env}")
+    _ = parser.add_argument(
+        "--concurrency-per-host",
+        type=int,
+        default=None,
+        help="Tenants migrated at once on each database host.",
+    )
+    _ = parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Read every tenant's revision instead of trusting tenant records.",
+    )
+    args = parser.parse_args()
+
+    _ = load_dotenv_once(f".env.{args.env}")
     """Main entry point for running migrations."""
     logger.info("Running migration")
-    asyncio.run(run_migration())
+    if not asyncio.run(run_migration(args.concurrency_per_host, args.verify)):
+        logger.error("Migration failed for some tenants; rerun to retry them")
+        raise SystemExit(1)
     logger.success("Migration complete")
 
 
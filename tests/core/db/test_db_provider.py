@@ -1,8 +1,16 @@
+import contextlib
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-
-from app.core.db.db_provider import create_session, create_transient_session
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db.db_provider import (
+    _set_transaction_read_only,  # pyright: ignore[reportPrivateUsage]
+    create_session,
+    create_transient_session,
+)
 from app.errors.common_errors import TenantNotFoundError
 
 
@@ -18,12 +26,34 @@ def mock_controller() -> MagicMock:
     return MagicMock()
 
 
+@pytest.fixture
+def mock_context_wrapper() -> MagicMock:
+    context_wrapper = MagicMock()
+    context_wrapper.get.return_value.read_only = False
+    return context_wrapper
+
+
+@pytest.fixture
+def mock_replica_router() -> MagicMock:
+    replica_router = MagicMock()
+    replica_router.replica = None
+
+    @contextlib.asynccontextmanager
+    async def engine_for(_tenant: str) -> AsyncIterator[MagicMock | None]:
+        yield replica_router.replica
+
+    replica_router.engine_for = MagicMock(side_effect=engine_for)
+    return replica_router
+
+
 class TestCreateSession:
     @pytest.mark.asyncio
     async def test_raises_tenant_not_found_error(
         self,
         mock_controller: MagicMock,
         mock_auth_info: MagicMock,
+        mock_context_wrapper: MagicMock,
+        mock_replica_router: MagicMock,
     ) -> None:
         mock_controller.scoped_session.return_value.__aenter__ = AsyncMock(
             side_effect=Exception("Tenant test_tenant not found"),
@@ -31,7 +61,12 @@ class TestCreateSession:
         mock_controller.scoped_session.return_value.__aexit__ = AsyncMock()
 
         with pytest.raises(TenantNotFoundError, match="Tenant test_tenant not found"):
-            async with create_session(mock_controller, mock_auth_info):  # type: ignore[arg-type]
+            async with create_session(  # type: ignore[arg-type]
+                mock_controller,
+                mock_auth_info,
+                mock_context_wrapper,
+                mock_replica_router,
+            ):
                 pass
 
     @pytest.mark.asyncio
@@ -39,6 +74,8 @@ class TestCreateSession:
         self,
         mock_controller: MagicMock,
         mock_auth_info: MagicMock,
+        mock_context_wrapper: MagicMock,
+        mock_replica_router: MagicMock,
     ) -> None:
         mock_controller.scoped_session.return_value.__aenter__ = AsyncMock(
             side_effect=RuntimeError("Connection refused"),
@@ -46,9 +83,92 @@ class TestCreateSession:
         mock_controller.scoped_session.return_value.__aexit__ = AsyncMock()
 
         with pytest.raises(RuntimeError, match="Connection refused"):
-            async with create_session(mock_controller, mock_auth_info):  # type: ignore[arg-type]
+            async with create_session(  # type: ignore[arg-type]
+                mock_controller,
+                mock_auth_info,
+                mock_context_wrapper,
+                mock_replica_router,
+            ):
                 pass
 
+    @pytest.mark.asyncio
+    async def test_read_only_operations_use_read_only_transactions(
+        self,
+        mock_controller: MagicMock,
+        mock_auth_info: MagicMock,
+        mock_context_wrapper: MagicMock,
+        mock_replica_router: MagicMock,
+    ) -> None:
+        session = AsyncSession()
+        mock_context_wrapper.get.return_value.read_only = True
+
+        @contextlib.asynccontextmanager
+        async def scoped_session(_tenant: str) -> AsyncIterator[AsyncSession]:
+            yield session
+
+        mock_controller.scoped_session = scoped_session
+
+        async with create_session(  # type: ignore[arg-type]
+            mock_controller,
+            mock_auth_info,
+            mock_context_wrapper,
+            mock_replica_router,
+        ):
+            assert event.contains(
+                session.sync_session, "after_begin", _set_transaction_read_only
+            )
+
+        assert not event.contains(
+            session.sync_session, "after_begin", _set_transaction_read_only
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_only_operations_use_the_replica_when_available(
+        self,
+        mock_controller: MagicMock,
+        mock_auth_info: MagicMock,
+        mock_context_wrapper: MagicMock,
+        mock_replica_router: MagicMock,
+    ) -> None:
+        replica = MagicMock()
+        mock_replica_router.replica = replica
+        mock_context_wrapper.get.return_value.read_only = True
+
+        async with create_session(  # type: ignore[arg-type]
+            mock_controller,
+            mock_auth_info,
+            mock_context_wrapper,
+            mock_replica_router,
+        ) as session:
+            assert session.bind is replica
+
+        mock_replica_router.engine_for.assert_called_once_with("test_tenant")
+        mock_controller.scoped_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_writes_never_consult_the_replica(
+        self,
+        mock_controller: MagicMock,
+        mock_auth_info: MagicMock,
+        mock_context_wrapper: MagicMock,
+        mock_replica_router: MagicMock,
+    ) -> None:
+        @contextlib.asynccontextmanager
+        async def scoped_session(_tenant: str) -> AsyncIterator[AsyncSession]:
+            yield AsyncSession()
+
+        mock_controller.scoped_session = scoped_session
+
+        async with create_session(  # type: ignore[arg-type]
+            mock_controller,
+            mock_auth_info,
+            mock_context_wrapper,
+            mock_replica_router,
+        ):
+            pass
+
+        mock_replica_router.engine_for.assert_not_called()
+
 
 class TestCreateTransientSession:
     @pytest.mark.asyncio
@@ -0,0 +1,117 @@
+from functools import partial
+from unittest.mock import patch
+
+import pytest
+import strawberry
+
+from app.core.middleware.persisted_queries import (
+    PersistedQueryExtension,
+    PersistedQueryStore,
+    hash_query,
+)
+
+QUERY = "query Health { health }"
+
+
+@strawberry.type
+class Query:
+    @strawberry.field()
+    def health(self) -> str:
+        return "ok"
+
+
+def _persisted(query_hash: str) -> dict[str, dict[str, object]]:
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+
+class TestPersistedQueryExtension:
+    @pytest.fixture
+    def store(self) -> PersistedQueryStore:
+        return PersistedQueryStore(cache_size=2)
+
+    @staticmethod
+    def _create_schema(store: PersistedQueryStore) -> strawberry.Schema:
+        return strawberry.Schema(
+            Query,
+            extensions=[partial(PersistedQueryExtension, store=store)],  # pyright: ignore[reportArgumentType]
+        )
+
+    @pytest.mark.asyncio
+    async def test_unknown_hash_asks_client_for_full_query(
+        self, store: PersistedQueryStore
+    ) -> None:
+        schema = self._create_schema(store)
+
+        result = await schema.execute(
+            None, operation_extensions=_persisted(hash_query(QUERY))
+        )
+
+        assert result.errors is not None
+        assert result.errors[0].message == "PersistedQueryNotFound"
+
+    @pytest.mark.asyncio
+    async def test_registered_hash_executes_without_query(
+        self, store: PersistedQueryStore
+    ) -> None:
+        schema = self._create_schema(store)
+        extensions = _persisted(hash_query(QUERY))
+        _ = await schema.execute(QUERY, operation_extensions=extensions)
+
+        result = await schema.execute(None, operation_extensions=extensions)
+
+        assert result.errors is None
+        assert result.data == {"health": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_mismatched_hash_is_rejected(
+        self, store: PersistedQueryStore
+    ) -> None:
+        schema = self._create_schema(store)
+
+        result = await schema.execute(
+            QUERY, operation_extensions=_persisted(hash_query("{ health }"))
+        )
+
+        assert result.errors is not None
+        assert store.get(hash_query("{ health }")) is None
+
+    @pytest.mark.asyncio
+    async def test_documents_are_parsed_and_validated_once(
+        self, store: PersistedQueryStore
+    ) -> None:
+        schema = self._create_schema(store)
+
+        with patch("strawberry.schema.schema.validate_document") as mock_validate:
+            for _ in range(3):
+                result = await schema.execute(QUERY)
+                assert result.data == {"health": "ok"}
+
+        assert store.parse.cache_info().misses == 1
+        assert store.validate.cache_info().misses == 1
+        mock_validate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_allowlist_rejects_unregistered_operations(self) -> None:
+        store = PersistedQueryStore(
+            manifest={hash_query(QUERY): QUERY}, allowlist_only=True
+        )
+        schema = self._create_schema(store)
+
+        allowed = await schema.execute(
+            None, operation_extensions=_persisted(hash_query(QUERY))
+        )
+        rejected = await schema.execute("{ health }")
+
+        assert allowed.data == {"health": "ok"}
+        assert rejected.errors is not None
+        assert rejected.errors[0].extensions is not None
+        assert rejected.errors[0].extensions["code"] == "PERSISTED_QUERY_NOT_ALLOWED"
+
+    def test_automatic_registrations_are_bounded(
+        self, store: PersistedQueryStore
+    ) -> None:
+        for query in ("{ a }", "{ b }", "{ c }"):
+            store.register(hash_query(query), query)
+
+        assert store.get(hash_query("{ a }")) is None
+        assert store.get(hash_query("{ c }")) == "{ c }"
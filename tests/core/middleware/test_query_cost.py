@@ -0,0 +1,126 @@
+from functools import partial
+from types import SimpleNamespace
+
+import pytest
+import strawberry
+
+from app.core.config.graphql_settings import GraphQLSettings
+from app.core.middleware.query_cost import (
+    MAX_LIST_SIZE,
+    OrgCostTracker,
+    QueryCostExtension,
+)
+
+
+@strawberry.type
+class Child:
+    name: str
+
+
+@strawberry.type
+class Item:
+    name: str
+
+    @strawberry.field()
+    def children(self) -> list[Child]:
+        return [Child(name="a"), Child(name="b")]
+
+
+@strawberry.type
+class Query:
+    @strawberry.field()
+    def items(self, limit: int = 10) -> list[Item]:
+        return [Item(name=str(i)) for i in range(min(limit, 3))]
+
+
+def _context(org_id: str) -> SimpleNamespace:
+    return SimpleNamespace(auth_info=SimpleNamespace(tenant_id=org_id))
+
+
+class TestQueryCostExtension:
+    @staticmethod
+    def _create_schema(
+        max_cost: int = 1000, cost_per_minute: int = 0
+    ) -> tuple[strawberry.Schema, OrgCostTracker]:
+        settings = GraphQLSettings(
+            graphql_max_query_cost=max_cost,
+            graphql_default_list_size=5,
+            graphql_org_cost_per_minute=cost_per_minute,
+        )
+        tracker = OrgCostTracker.from_settings(settings)
+        schema = strawberry.Schema(
+            Query,
+            extensions=[
+                partial(QueryCostExtension, settings=settings, tracker=tracker)  # pyright: ignore[reportArgumentType]
+            ],
+        )
+        return schema, tracker
+
+    @pytest.mark.asyncio
+    async def test_estimate_uses_limit_argument_and_default_list_size(self) -> None:
+        schema, _ = self._create_schema()
+
+        result = await schema.execute(
+            "query Items($limit: Int!) { items(limit: $limit) { children { name } } }",
+            variable_values={"limit": 4},
+        )
+
+        # Estimated 4 items * (1 + 5 children); resolved 3 items * (1 + 2 children)
+        assert result.errors is None
+        assert result.extensions is not None
+        assert result.extensions["cost"] == {"requested": 24, "actual": 9}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("limit", "requested"),
+        [(-100, 0), (MAX_LIST_SIZE * 10, MAX_LIST_SIZE)],
+    )
+    async def test_estimate_clamps_limit_argument(
+        self, limit: int, requested: int
+    ) -> None:
+        schema, _ = self._create_schema(max_cost=MAX_LIST_SIZE)
+
+        result = await schema.execute(
+            "query Items($limit: Int!) { items(limit: $limit) { name } }",
+            variable_values={"limit": limit},
+        )
+
+        assert result.extensions is not None
+        assert result.extensions["cost"]["requested"] == requested
+
+    @pytest.mark.asyncio
+    async def test_over_budget_operation_is_rejected(self) -> None:
+        schema, _ = self._create_schema(max_cost=5)
+
+        result = await schema.execute("{ items(limit: 100) { name } }")
+
+        assert result.data is None
+        assert result.errors is not None
+        assert "exceeds the maximum allowed cost" in result.errors[0].message
+
+    @pytest.mark.asyncio
+    async def test_incurred_cost_is_recorded_per_org(self) -> None:
+        schema, tracker = self._create_schema(cost_per_minute=100)
+
+        _ = await schema.execute(
+            "{ items { children { name } } }", context_value=_context("org-1")
+        )
+
+        assert tracker.spent("org-1") == 9
+        assert tracker.spent("org-2") == 0
+
+    @pytest.mark.asyncio
+    async def test_org_over_its_minute_budget_is_throttled(self) -> None:
+        schema, tracker = self._create_schema(cost_per_minute=10)
+        tracker.record("org-1", 9)
+
+        throttled = await schema.execute(
+            "{ items(limit: 2) { name } }", context_value=_context("org-1")
+        )
+        other_org = await schema.execute(
+            "{ items(limit: 2) { name } }", context_value=_context("org-2")
+        )
+
+        assert throttled.errors is not None
+        assert "retry later" in throttled.errors[0].message
+        assert other_org.errors is None
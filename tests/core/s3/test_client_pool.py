@@ -0,0 +1,81 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.s3.client_pool import S3ClientPool, create_s3_client_pool
+from app.core.s3.settings import S3Settings
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.clients_created = 0
+        self.clients_closed = 0
+        self.config: object = None
+
+    @contextlib.asynccontextmanager
+    async def _client(self) -> AsyncIterator[MagicMock]:
+        self.clients_created += 1
+        await asyncio.sleep(0)
+        try:
+            yield MagicMock()
+        finally:
+            self.clients_closed += 1
+
+    def create_client(self, *_args: object, **kwargs: object) -> object:
+        self.config = kwargs["config"]
+        return self._client()
+
+
+@pytest.fixture
+def fake_session() -> _FakeSession:
+    return _FakeSession()
+
+
+@pytest.fixture
+def pool(fake_session: _FakeSession) -> Iterator[S3ClientPool]:
+    settings = S3Settings(aws_max_pool_connections=7)
+    with patch("app.core.s3.client_pool.get_session", return_value=fake_session):
+        yield S3ClientPool(settings)
+
+
+class TestS3ClientPool:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_client(
+        self,
+        pool: S3ClientPool,
+        fake_session: _FakeSession,
+    ) -> None:
+        """The client is created once, even when first requested concurrently."""
+        clients = await asyncio.gather(*(pool.get_client() for _ in range(5)))
+
+        assert fake_session.clients_created == 1
+        assert all(client is clients[0] for client in clients)
+        assert fake_session.config.max_pool_connections == 7  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_borrow_leaves_client_open(
+        self,
+        pool: S3ClientPool,
+        fake_session: _FakeSession,
+    ) -> None:
+        async with pool.borrow() as first:
+            pass
+        async with pool.borrow() as second:
+            pass
+
+        assert first is second
+        assert fake_session.clients_closed == 0
+
+    @pytest.mark.asyncio
+    async def test_provider_closes_client_on_shutdown(
+        self,
+        fake_session: _FakeSession,
+    ) -> None:
+        with patch("app.core.s3.client_pool.get_session", return_value=fake_session):
+            async with create_s3_client_pool(S3Settings()) as pool:
+                await pool.get_client()
+
+        assert fake_session.clients_closed == 1
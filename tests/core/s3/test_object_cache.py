@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+import io
+import mmap
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.s3.object_cache import S3ObjectCache
+
+CONTENT = b"col1,col2\nval1,val2\n"
+CONTENT_SHA = hashlib.sha256(CONTENT).hexdigest()
+
+
+def _s3_service(*contents: bytes) -> AsyncMock:
+    s3_service = AsyncMock()
+    s3_service.download.side_effect = [io.BytesIO(content) for content in contents]
+    return s3_service
+
+
+async def _read(
+    cache: S3ObjectCache,
+    s3_service: AsyncMock,
+    content_sha: str = CONTENT_SHA,
+) -> bytes:
+    async with cache.open(s3_service, "exchange-files/x.csv", content_sha) as content:
+        return bytes(content)
+
+
+class TestS3ObjectCache:
+    @pytest.mark.asyncio
+    async def test_second_read_is_served_from_disk(self, tmp_path: Path) -> None:
+        cache = S3ObjectCache(tmp_path, max_bytes=1024)
+        s3_service = _s3_service(CONTENT)
+
+        assert await _read(cache, s3_service) == CONTENT
+        assert await _read(cache, s3_service) == CONTENT
+
+        s3_service.download.assert_awaited_once_with(key="exchange-files/x.csv")
+        assert (tmp_path / CONTENT_SHA[:2] / CONTENT_SHA).read_bytes() == CONTENT
+
+    @pytest.mark.asyncio
+    async def test_cached_content_is_memory_mapped(self, tmp_path: Path) -> None:
+        cache = S3ObjectCache(tmp_path, max_bytes=1024)
+
+        async with cache.open(_s3_service(CONTENT), "k", CONTENT_SHA) as content:
+            assert isinstance(content, mmap.mmap)
+            assert content[:4] == b"col1"
+
+    @pytest.mark.asyncio
+    async def test_corrupt_cached_file_is_downloaded_again(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        cache = S3ObjectCache(tmp_path, max_bytes=1024)
+        s3_service = _s3_service(CONTENT, CONTENT)
+        await _read(cache, s3_service)
+
+        (tmp_path / CONTENT_SHA[:2] / CONTENT_SHA).write_bytes(b"tampered")
+
+        assert await _read(cache, s3_service) == CONTENT
+        assert s3_service.download.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_object_not_matching_sha_is_served_but_not_cached(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        cache = S3ObjectCache(tmp_path, max_bytes=1024)
+        wrong_sha = hashlib.sha256(b"other").hexdigest()
+
+        assert await _read(cache, _s3_service(CONTENT), wrong_sha) == CONTENT
+        assert not (tmp_path / wrong_sha[:2] / wrong_sha).exists()
+        assert list(tmp_path.rglob("*.tmp")) == []
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_by_bytes(self, tmp_path: Path) -> None:
+        contents = [bytes([i]) * 100 for i in range(3)]
+        shas = [hashlib.sha256(content).hexdigest() for content in contents]
+        cache = S3ObjectCache(tmp_path, max_bytes=250)
+
+        await _read(cache, _s3_service(contents[0]), shas[0])
+        await _read(cache, _s3_service(contents[1]), shas[1])
+        # Reading the first object again makes the second the oldest
+        await _read(cache, _s3_service(), shas[0])
+        await _read(cache, _s3_service(contents[2]), shas[2])
+
+        assert (tmp_path / shas[0][:2] / shas[0]).exists()
+        assert not (tmp_path / shas[1][:2] / shas[1]).exists()
+        assert (tmp_path / shas[2][:2] / shas[2]).exists()
+
+    @pytest.mark.asyncio
+    async def test_bound_holds_across_workers_sharing_the_directory(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        contents = [bytes([i]) * 100 for i in range(4)]
+        shas = [hashlib.sha256(content).hexdigest() for content in contents]
+        workers = [S3ObjectCache(tmp_path, max_bytes=250) for _ in range(2)]
+
+        for i, content in enumerate(contents):
+            await _read(workers[i % 2], _s3_service(content), shas[i])
+
+        cached = [sha for sha in shas if (tmp_path / sha[:2] / sha).exists()]
+        assert cached == shas[2:]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_download(self, tmp_path: Path) -> None:
+        cache = S3ObjectCache(tmp_path, max_bytes=1024)
+        s3_service = _s3_service(CONTENT)
+
+        results = await asyncio.gather(*(_read(cache, s3_service) for _ in range(3)))
+
+        assert results == [CONTENT] * 3
+        s3_service.download.assert_awaited_once()
+        assert cache._locks == {}
+
+    @pytest.mark.asyncio
+    async def test_picks_up_objects_cached_by_earlier_processes(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        await _read(S3ObjectCache(tmp_path, max_bytes=1024), _s3_service(CONTENT))
+        s3_service = _s3_service()
+
+        assert await _read(S3ObjectCache(tmp_path, max_bytes=1024), s3_service) == (
+            CONTENT
+        )
+        s3_service.download.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejects_keys_that_are_not_sha256(self, tmp_path: Path) -> None:
+        cache = S3ObjectCache(tmp_path, max_bytes=1024)
+
+        with pytest.raises(ValueError, match="SHA-256"):
+            await _read(cache, _s3_service(CONTENT), "../../etc/passwd")
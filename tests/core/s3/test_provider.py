@@ -0,0 +1,19 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.s3.provider import PooledS3Service, create_s3_service
+from app.core.s3.settings import S3Settings
+
+
+class TestCreateS3Service:
+    @pytest.mark.asyncio
+    async def test_service_borrows_shared_client(self) -> None:
+        """Per-request services keep the tenant prefix but reuse the pool's client."""
+        pool = MagicMock()
+        auth_info = MagicMock(tenant_name="acme")
+
+        service = create_s3_service(S3Settings(), auth_info, pool)
+
+        assert isinstance(service, PooledS3Service)
+        assert await service.get_client() is pool.borrow.return_value
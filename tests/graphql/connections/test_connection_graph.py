@@ -0,0 +1,98 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.graphql.connections.connection_graph import ConnectionGraph
+from app.graphql.connections.models import ConnectionStatus
+
+
+class TestConnectionGraph:
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        session.execute.return_value = mock_result
+        return session
+
+    @staticmethod
+    def _create_mock_row(
+        requester_org_id: uuid.UUID,
+        target_org_id: uuid.UUID,
+        status: ConnectionStatus,
+    ) -> MagicMock:
+        row = MagicMock()
+        row.id = uuid.uuid4()
+        row.requester_org_id = requester_org_id
+        row.target_org_id = target_org_id
+        row.status = status.value
+        return row
+
+    @pytest.mark.asyncio
+    async def test_live_connection_wins_over_declined(
+        self,
+        mock_session: AsyncMock,
+    ) -> None:
+        """A declined request does not hide a later accepted connection."""
+        org_id = uuid.uuid4()
+        other_org_id = uuid.uuid4()
+        mock_session.execute.return_value.all.return_value = [
+            self._create_mock_row(org_id, other_org_id, ConnectionStatus.ACCEPTED),
+            self._create_mock_row(other_org_id, org_id, ConnectionStatus.DECLINED),
+        ]
+        graph = ConnectionGraph(max_orgs=10, ttl_seconds=60)
+
+        edges = await graph.edges(mock_session, org_id)
+
+        assert edges[other_org_id].status == ConnectionStatus.ACCEPTED.value
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reload(self, mock_session: AsyncMock) -> None:
+        """Invalidated orgs are loaded again on next use."""
+        org_id = uuid.uuid4()
+        graph = ConnectionGraph(max_orgs=10, ttl_seconds=60)
+
+        await graph.edges(mock_session, org_id)
+        graph.invalidate(org_id)
+        await graph.edges(mock_session, org_id)
+
+        assert mock_session.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self, mock_session: AsyncMock) -> None:
+        """Entries older than the TTL are reloaded."""
+        org_id = uuid.uuid4()
+        graph = ConnectionGraph(max_orgs=10, ttl_seconds=30)
+
+        with patch(
+            "app.graphql.connections.connection_graph.time.monotonic"
+        ) as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            await graph.edges(mock_session, org_id)
+            mock_monotonic.return_value = 129.0
+            await graph.edges(mock_session, org_id)
+            mock_monotonic.return_value = 131.0
+            await graph.edges(mock_session, org_id)
+
+        assert mock_session.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_org_is_evicted(
+        self,
+        mock_session: AsyncMock,
+    ) -> None:
+        """The graph holds at most `max_orgs` orgs."""
+        first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        graph = ConnectionGraph(max_orgs=2, ttl_seconds=60)
+
+        await graph.edges(mock_session, first)
+        await graph.edges(mock_session, second)
+        await graph.edges(mock_session, first)
+        await graph.edges(mock_session, third)
+        mock_session.execute.reset_mock()
+
+        await graph.edges(mock_session, first)
+        await graph.edges(mock_session, second)
+
+        assert mock_session.execute.call_count == 1
@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.graphql.connections.connection_graph import ConnectionGraph
 from app.graphql.connections.models import ConnectionStatus
 from app.graphql.connections.repositories.connection_repository import (
     ConnectionRepository,
@@ -16,16 +17,22 @@ class TestConnectionRepository:
 
     @pytest.fixture
     def repository(self, mock_session: AsyncMock) -> ConnectionRepository:
-        return ConnectionRepository(session=mock_session)
+        return ConnectionRepository(
+            session=mock_session,
+            graph=ConnectionGraph(max_orgs=10, ttl_seconds=60),
+        )
 
     @staticmethod
     def _create_mock_connection(
         requester_org_id: uuid.UUID,
         target_org_id: uuid.UUID,
+        status: ConnectionStatus = ConnectionStatus.ACCEPTED,
     ) -> MagicMock:
         mock_connection = MagicMock()
+        mock_connection.id = uuid.uuid4()
         mock_connection.requester_org_id = requester_org_id
         mock_connection.target_org_id = target_org_id
+        mock_connection.status = status.value
         return mock_connection
 
     @staticmethod
@@ -34,7 +41,7 @@ class TestConnectionRepository:
         connections: list[MagicMock],
     ) -> None:
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = connections
+        mock_result.all.return_value = connections
         mock_session.execute.return_value = mock_result
 
     @pytest.mark.asyncio
@@ -66,9 +73,7 @@ class TestConnectionRepository:
         mock_connection = self._create_mock_connection(user_org_id, connected_org_id)
         self._setup_mock_result(mock_session, [mock_connection])
 
-        result = await repository.get_connected_org_ids(
-            user_org_id, [connected_org_id]
-        )
+        result = await repository.get_connected_org_ids(user_org_id, [connected_org_id])
 
         assert connected_org_id in result
 
@@ -85,9 +90,7 @@ class TestConnectionRepository:
         mock_connection = self._create_mock_connection(connected_org_id, user_org_id)
         self._setup_mock_result(mock_session, [mock_connection])
 
-        result = await repository.get_connected_org_ids(
-            user_org_id, [connected_org_id]
-        )
+        result = await repository.get_connected_org_ids(user_org_id, [connected_org_id])
 
         assert connected_org_id in result
 
@@ -108,6 +111,50 @@ class TestConnectionRepository:
         assert result == set()
         mock_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_connected_org_ids_excludes_declined(
+        self,
+        repository: ConnectionRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Declined connections do not count as connected."""
+        user_org_id = uuid.uuid4()
+        declined_org_id = uuid.uuid4()
+        self._setup_mock_result(
+            mock_session,
+            [
+                self._create_mock_connection(
+                    user_org_id, declined_org_id, ConnectionStatus.DECLINED
+                )
+            ],
+        )
+
+        result = await repository.get_connected_org_ids(user_org_id, [declined_org_id])
+
+        assert result == set()
+
+    @pytest.mark.asyncio
+    async def test_get_connection_by_org_id_returns_edge(
+        self,
+        repository: ConnectionRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Returns the connection id and status for the connected org."""
+        user_org_id = uuid.uuid4()
+        connected_org_id = uuid.uuid4()
+        mock_connection = self._create_mock_connection(
+            connected_org_id, user_org_id, ConnectionStatus.PENDING
+        )
+        self._setup_mock_result(mock_session, [mock_connection])
+
+        result = await repository.get_connection_by_org_id(
+            user_org_id, connected_org_id
+        )
+
+        assert result is not None
+        assert result.connection_id == mock_connection.id
+        assert result.status == ConnectionStatus.PENDING.value
+
     @pytest.mark.asyncio
     async def test_count_by_status_returns_count(
         self,
@@ -116,14 +163,20 @@ class TestConnectionRepository:
     ) -> None:
         """Returns count of connections with the given status."""
         org_id = uuid.uuid4()
-
-        mock_result = MagicMock()
-        mock_result.scalar_one.return_value = 3
-        mock_session.execute.return_value = mock_result
+        self._setup_mock_result(
+            mock_session,
+            [
+                self._create_mock_connection(org_id, uuid.uuid4()),
+                self._create_mock_connection(uuid.uuid4(), org_id),
+                self._create_mock_connection(
+                    org_id, uuid.uuid4(), ConnectionStatus.PENDING
+                ),
+            ],
+        )
 
         result = await repository.count_by_status(org_id, ConnectionStatus.ACCEPTED)
 
-        assert result == 3
+        assert result == 2
         mock_session.execute.assert_called_once()
 
     @pytest.mark.asyncio
@@ -134,11 +187,50 @@ class TestConnectionRepository:
     ) -> None:
         """Returns 0 when no connections with the given status."""
         org_id = uuid.uuid4()
-
-        mock_result = MagicMock()
-        mock_result.scalar_one.return_value = 0
-        mock_session.execute.return_value = mock_result
+        self._setup_mock_result(mock_session, [])
 
         result = await repository.count_by_status(org_id, ConnectionStatus.PENDING)
 
         assert result == 0
+
+    @pytest.mark.asyncio
+    async def test_count_all_by_status_counts_each_status(
+        self,
+        repository: ConnectionRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Counts every status from a single load of the org's connections."""
+        org_id = uuid.uuid4()
+        self._setup_mock_result(
+            mock_session,
+            [
+                self._create_mock_connection(org_id, uuid.uuid4()),
+                self._create_mock_connection(uuid.uuid4(), org_id),
+                self._create_mock_connection(
+                    org_id, uuid.uuid4(), ConnectionStatus.PENDING
+                ),
+            ],
+        )
+
+        result = await repository.count_all_by_status(org_id)
+
+        assert result[ConnectionStatus.ACCEPTED.value] == 2
+        assert result[ConnectionStatus.PENDING.value] == 1
+        assert result[ConnectionStatus.DECLINED.value] == 0
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_repeated_lookups_are_answered_from_graph(
+        self,
+        repository: ConnectionRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """The org's connections are loaded once and reused across calls."""
+        org_id = uuid.uuid4()
+        self._setup_mock_result(mock_session, [])
+
+        await repository.count_by_status(org_id, ConnectionStatus.ACCEPTED)
+        await repository.count_by_status(org_id, ConnectionStatus.PENDING)
+        await repository.get_connected_org_ids(org_id, [uuid.uuid4()])
+
+        mock_session.execute.assert_called_once()
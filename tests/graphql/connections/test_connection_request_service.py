@@ -20,8 +20,32 @@ class TestConnectionRequestService:
         return AsyncMock()
 
     @pytest.fixture
-    def service(self, mock_api_client: AsyncMock) -> ConnectionRequestService:
-        return ConnectionRequestService(api_client=mock_api_client)
+    def mock_connection_graph(self) -> MagicMock:
+        return MagicMock()
+
+    @pytest.fixture
+    def mock_glance_cache(self) -> MagicMock:
+        return MagicMock()
+
+    @pytest.fixture
+    def mock_user_org_repository(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def service(
+        self,
+        mock_api_client: AsyncMock,
+        mock_connection_graph: MagicMock,
+        mock_glance_cache: MagicMock,
+        mock_user_org_repository: AsyncMock,
+    ) -> ConnectionRequestService:
+        return ConnectionRequestService(
+            api_client=mock_api_client,
+            connection_graph=mock_connection_graph,
+            glance_cache=mock_glance_cache,
+            user_org_repository=mock_user_org_repository,
+            auth_info=MagicMock(auth_provider_id="user_123"),
+        )
 
     @pytest.mark.asyncio
     async def test_create_returns_true_on_201(
@@ -38,6 +62,48 @@ class TestConnectionRequestService:
 
         assert result is True
 
+    @pytest.mark.asyncio
+    async def test_create_invalidates_both_orgs_in_connection_graph(
+        self,
+        service: ConnectionRequestService,
+        mock_api_client: AsyncMock,
+        mock_connection_graph: MagicMock,
+        mock_user_org_repository: AsyncMock,
+    ) -> None:
+        """Cached connections of the requester and the target are dropped."""
+        user_org_id = uuid.uuid4()
+        target_org_id = uuid.uuid4()
+        mock_user_org_repository.get_user_org_id.return_value = user_org_id
+        mock_response = MagicMock()
+        mock_response.status_code = 201
+        mock_api_client.post.return_value = mock_response
+
+        await service.create_connection_request(target_org_id)
+
+        mock_connection_graph.invalidate.assert_called_once_with(
+            user_org_id, target_org_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_invalidates_both_orgs_dashboard_glance(
+        self,
+        service: ConnectionRequestService,
+        mock_api_client: AsyncMock,
+        mock_glance_cache: MagicMock,
+        mock_user_org_repository: AsyncMock,
+    ) -> None:
+        """Cached dashboard partner counts of both orgs are dropped."""
+        user_org_id = uuid.uuid4()
+        target_org_id = uuid.uuid4()
+        mock_user_org_repository.get_user_org_id.return_value = user_org_id
+        mock_response = MagicMock()
+        mock_response.status_code = 201
+        mock_api_client.post.return_value = mock_response
+
+        await service.create_connection_request(target_org_id)
+
+        mock_glance_cache.invalidate.assert_called_once_with(user_org_id, target_org_id)
+
     @pytest.mark.asyncio
     async def test_create_returns_true_on_200(
         self,
@@ -191,8 +257,32 @@ class TestInviteConnection:
         return AsyncMock()
 
     @pytest.fixture
-    def service(self, mock_api_client: AsyncMock) -> ConnectionRequestService:
-        return ConnectionRequestService(api_client=mock_api_client)
+    def mock_connection_graph(self) -> MagicMock:
+        return MagicMock()
+
+    @pytest.fixture
+    def mock_glance_cache(self) -> MagicMock:
+        return MagicMock()
+
+    @pytest.fixture
+    def mock_user_org_repository(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def service(
+        self,
+        mock_api_client: AsyncMock,
+        mock_connection_graph: MagicMock,
+        mock_glance_cache: MagicMock,
+        mock_user_org_repository: AsyncMock,
+    ) -> ConnectionRequestService:
+        return ConnectionRequestService(
+            api_client=mock_api_client,
+            connection_graph=mock_connection_graph,
+            glance_cache=mock_glance_cache,
+            user_org_repository=mock_user_org_repository,
+            auth_info=MagicMock(auth_provider_id="user_123"),
+        )
 
     @pytest.mark.asyncio
     async def test_invite_calls_correct_endpoint(
@@ -1,7 +1,11 @@
+import os
 import uuid
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import create_async_engine
 
 from app.graphql.organizations.models import OrgType
 from app.graphql.organizations.repositories.organization_search_repository import (
@@ -9,6 +13,11 @@ from app.graphql.organizations.repositories.organization_search_repository impor
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_trigram_check(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(OrganizationSearchRepository, "_trigram_available", None)
+
+
 class TestOrganizationSearchRepositoryOrgTypeFilter:
     @pytest.fixture
     def mock_session(self) -> AsyncMock:
@@ -92,3 +101,220 @@ class TestOrganizationSearchRepositoryOrgTypeFilter:
         assert OrgType.DISTRIBUTOR.value in distributor_query
         assert OrgType.MANUFACTURER.value not in distributor_query
         assert OrgType.DISTRIBUTOR.value not in manufacturer_query
+
+
+class TestOrganizationSearchRepositoryRanking:
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        session.execute.return_value = mock_result
+        return session
+
+    @pytest.fixture
+    def repository(self, mock_session: AsyncMock) -> OrganizationSearchRepository:
+        return OrganizationSearchRepository(session=mock_session)
+
+    @staticmethod
+    def _get_query_string(mock_session: AsyncMock) -> str:
+        stmt = mock_session.execute.call_args[0][0]
+        return str(
+            stmt.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_by_trigram_similarity(
+        self,
+        repository: OrganizationSearchRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Matches use the trigram operator and are ordered by similarity."""
+        await repository.search(
+            "acme",
+            org_type=OrgType.MANUFACTURER,
+            user_org_id=uuid.uuid4(),
+        )
+
+        query = self._get_query_string(mock_session)
+        assert "subscription.orgs.name %% 'acme'" in query
+        order_by = query[query.index("ORDER BY") :]
+        assert "similarity(subscription.orgs.name, 'acme')" in order_by
+
+    @pytest.mark.asyncio
+    async def test_search_escapes_like_wildcards(
+        self,
+        repository: OrganizationSearchRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Wildcards typed by the user are matched literally."""
+        await repository.search(
+            "100%_pure",
+            org_type=OrgType.MANUFACTURER,
+            user_org_id=uuid.uuid4(),
+        )
+
+        query = self._get_query_string(mock_session)
+        assert "100/%%/_pure" in query
+
+    @pytest.mark.asyncio
+    async def test_search_falls_back_to_ilike_without_pg_trgm(
+        self,
+        repository: OrganizationSearchRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Without the extension, names match by ILIKE and rank without similarity."""
+        mock_session.execute.return_value.scalar.return_value = False
+
+        await repository.search(
+            "acme",
+            org_type=OrgType.MANUFACTURER,
+            user_org_id=uuid.uuid4(),
+        )
+
+        query = self._get_query_string(mock_session)
+        assert "ILIKE '%%' || 'acme' || '%%'" in query
+        assert "%% 'acme'" not in query
+        assert "similarity(" not in query
+
+    @pytest.mark.asyncio
+    async def test_search_checks_for_pg_trgm_once(
+        self,
+        repository: OrganizationSearchRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """The extension lookup is cached across searches."""
+        for _ in range(2):
+            await repository.search(
+                "acme",
+                org_type=OrgType.MANUFACTURER,
+                user_org_id=uuid.uuid4(),
+            )
+
+        statements = [str(call.args[0]) for call in mock_session.execute.call_args_list]
+        assert sum("pg_extension" in stmt for stmt in statements) == 1
+        assert len(statements) == 3
+
+    @pytest.mark.asyncio
+    async def test_search_includes_and_boosts_alias_matches(
+        self,
+        repository: OrganizationSearchRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Orgs matched through an alias are included even without a name match."""
+        aliased_org_id = uuid.uuid4()
+
+        await repository.search(
+            "acme",
+            org_type=OrgType.MANUFACTURER,
+            user_org_id=uuid.uuid4(),
+            alias_org_ids=[aliased_org_id],
+        )
+
+        query = self._get_query_string(mock_session)
+        where, order_by = query.split("ORDER BY")
+        assert str(aliased_org_id) in where
+        assert str(aliased_org_id) in order_by
+
+
+class TestOrganizationSearchRepositoryConnectionJoin:
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        session.execute.return_value = mock_result
+        return session
+
+    @pytest.fixture
+    def repository(self, mock_session: AsyncMock) -> OrganizationSearchRepository:
+        return OrganizationSearchRepository(session=mock_session)
+
+    @staticmethod
+    def _get_query_string(mock_session: AsyncMock) -> str:
+        stmt = mock_session.execute.call_args[0][0]
+        return str(
+            stmt.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("connected", [None, True, False])
+    async def test_connection_is_fetched_through_single_lateral_join(
+        self,
+        repository: OrganizationSearchRepository,
+        mock_session: AsyncMock,
+        connected: bool | None,
+    ) -> None:
+        """Status, id and the connected filter share one LATERAL join."""
+        await repository.search(
+            "acme",
+            org_type=OrgType.MANUFACTURER,
+            user_org_id=uuid.uuid4(),
+            connected=connected,
+        )
+
+        query = self._get_query_string(mock_session)
+        assert query.count("LATERAL") == 1
+        assert query.count("FROM subscription.connections") == 2
+        assert "FROM subscription.connections, subscription.orgs" not in query
+
+    @pytest.mark.asyncio
+    async def test_connection_status_predicate_is_sargable(
+        self,
+        repository: OrganizationSearchRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """The status column is compared uncast so the partial index applies."""
+        await repository.search(
+            "acme",
+            org_type=OrgType.MANUFACTURER,
+            user_org_id=uuid.uuid4(),
+            connected=True,
+        )
+
+        # Compiled as asyncpg sends it, without inlining bound parameters
+        stmt = mock_session.execute.call_args[0][0]
+        query = str(stmt.compile(dialect=asyncpg.dialect()))
+        assert "CAST(subscription.connections.status" not in query
+        assert query.count("subscription.connections.status != 'declined'") == 2
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TEST_ORGS_DB_URL"),
+    reason="TEST_ORGS_DB_URL is not set",
+)
+class TestOrganizationSearchRepositoryExplain:
+    @pytest.mark.asyncio
+    async def test_search_plan_does_not_scan_connections(self) -> None:
+        """The connection lookup stays on the connections indexes."""
+        engine = create_async_engine(os.environ["TEST_ORGS_DB_URL"])
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+        await OrganizationSearchRepository(session=mock_session).search(
+            "acme",
+            org_type=OrgType.MANUFACTURER,
+            user_org_id=uuid.uuid4(),
+            connected=True,
+        )
+        stmt = mock_session.execute.call_args[0][0]
+
+        try:
+            async with engine.connect() as conn:
+                await conn.exec_driver_sql("SET enable_seqscan = off")
+                sql = stmt.compile(
+                    dialect=conn.dialect,
+                    compile_kwargs={"literal_binds": True},
+                )
+                result = await conn.exec_driver_sql(f"EXPLAIN {sql}")
+                plan = "\n".join(row[0] for row in result)
+        finally:
+            await engine.dispose()
+
+        assert "Seq Scan on connections" not in plan
+        assert "SubPlan" not in plan
@@ -8,6 +8,10 @@ from app.graphql.connections.exceptions import (
     UserOrganizationRequiredError,
 )
 from app.graphql.connections.models.enums import ConnectionStatus
+from app.graphql.geography.loaders.connection_subdivision_loader import (
+    ConnectionSubdivisionLoader,
+)
+from app.graphql.organizations.loaders import PosContactLoader
 from app.graphql.organizations.models import OrgType
 from app.graphql.organizations.repositories.pos_contact_repository import (
     OrgPosContacts,
@@ -16,6 +20,7 @@ from app.graphql.organizations.repositories.pos_contact_repository import (
 from app.graphql.organizations.services.organization_search_service import (
     OrganizationSearchService,
 )
+from app.graphql.pos.agreement.loaders.agreement_loader import AgreementLoader
 
 
 class TestOrganizationSearchService:
@@ -35,10 +40,20 @@ class TestOrganizationSearchService:
     def mock_agreement_service(self) -> AsyncMock:
         return AsyncMock()
 
+    @pytest.fixture
+    def mock_agreement_repo(self) -> AsyncMock:
+        return AsyncMock()
+
     @pytest.fixture
     def mock_territory_repo(self) -> AsyncMock:
         return AsyncMock()
 
+    @pytest.fixture
+    def mock_alias_repo(self) -> AsyncMock:
+        alias_repo = AsyncMock()
+        alias_repo.search_connected_org_ids.return_value = []
+        return alias_repo
+
     @pytest.fixture
     def mock_auth_info(self) -> MagicMock:
         auth_info = MagicMock()
@@ -52,15 +67,19 @@ class TestOrganizationSearchService:
         mock_pos_contact_repo: AsyncMock,
         mock_connection_service: AsyncMock,
         mock_agreement_service: AsyncMock,
+        mock_agreement_repo: AsyncMock,
         mock_territory_repo: AsyncMock,
+        mock_alias_repo: AsyncMock,
         mock_auth_info: MagicMock,
     ) -> OrganizationSearchService:
         return OrganizationSearchService(
             org_search_repository=mock_org_search_repo,
-            pos_contact_repository=mock_pos_contact_repo,
+            pos_contact_loader=PosContactLoader(mock_pos_contact_repo),
             connection_service=mock_connection_service,
             agreement_service=mock_agreement_service,
-            territory_repository=mock_territory_repo,
+            agreement_loader=AgreementLoader(mock_agreement_repo),
+            subdivision_loader=ConnectionSubdivisionLoader(mock_territory_repo),
+            alias_repository=mock_alias_repo,
             auth_info=mock_auth_info,
         )
 
@@ -92,6 +111,32 @@ class TestOrganizationSearchService:
         call_kwargs = mock_org_search_repo.search.call_args.kwargs
         assert call_kwargs.get("org_type") == org_type
 
+    @pytest.mark.asyncio
+    async def test_search_includes_orgs_matched_by_alias(
+        self,
+        service: OrganizationSearchService,
+        mock_org_search_repo: AsyncMock,
+        mock_connection_service: AsyncMock,
+        mock_alias_repo: AsyncMock,
+    ) -> None:
+        """Orgs whose alias matches the term are passed on to the org search."""
+        user_org_id = uuid.uuid4()
+        aliased_org_id = uuid.uuid4()
+        mock_connection_service.get_user_org_and_connections.return_value = (
+            user_org_id,
+            set(),
+        )
+        mock_alias_repo.search_connected_org_ids.return_value = [aliased_org_id]
+        mock_org_search_repo.search.return_value = []
+
+        await service.search(OrgType.MANUFACTURER, "acme", limit=5)
+
+        mock_alias_repo.search_connected_org_ids.assert_awaited_once_with(
+            user_org_id, "acme", limit=5
+        )
+        call_kwargs = mock_org_search_repo.search.call_args.kwargs
+        assert call_kwargs.get("alias_org_ids") == [aliased_org_id]
+
     @pytest.mark.asyncio
     async def test_search_returns_empty_list_when_no_results(
         self,
@@ -206,6 +251,46 @@ class TestOrganizationSearchService:
 
         assert result[0].connection_status is expected_status
 
+    @pytest.mark.asyncio
+    async def test_search_batches_agreements_and_subdivisions(
+        self,
+        service: OrganizationSearchService,
+        mock_org_search_repo: AsyncMock,
+        mock_pos_contact_repo: AsyncMock,
+        mock_connection_service: AsyncMock,
+        mock_agreement_service: AsyncMock,
+        mock_agreement_repo: AsyncMock,
+        mock_territory_repo: AsyncMock,
+    ) -> None:
+        """Connected partners are resolved with one query per relation."""
+        user_org_id = uuid.uuid4()
+        orgs = [self._create_mock_org() for _ in range(20)]
+        connection_ids = [uuid.uuid4() for _ in orgs]
+        agreements = [MagicMock(connected_org_id=org.id) for org in orgs]
+
+        mock_connection_service.get_user_org_and_connections.return_value = (
+            user_org_id,
+            set(),
+        )
+        mock_org_search_repo.search.return_value = [
+            (org, True, ConnectionStatus.ACCEPTED, conn_id)
+            for org, conn_id in zip(orgs, connection_ids, strict=True)
+        ]
+        mock_pos_contact_repo.get_pos_contacts_for_orgs.return_value = {}
+        mock_agreement_repo.get_by_connected_org_ids.return_value = agreements
+        mock_agreement_service.get_presigned_url.return_value = "https://url"
+        mock_territory_repo.get_subdivisions_by_connection_ids.return_value = {}
+
+        result = await service.search(OrgType.MANUFACTURER, "test", rep_firms=True)
+
+        assert len(result) == 20
+        assert all(r.agreement_data is not None for r in result)
+        assert all(r.subdivisions == [] for r in result)
+        mock_pos_contact_repo.get_pos_contacts_for_orgs.assert_awaited_once()
+        mock_agreement_repo.get_by_connected_org_ids.assert_awaited_once()
+        mock_territory_repo.get_subdivisions_by_connection_ids.assert_awaited_once()
+        mock_agreement_service.get_agreement.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_search_excludes_user_own_organization(
         self,
@@ -273,10 +358,20 @@ class TestSearchForConnections:
     def mock_agreement_service(self) -> AsyncMock:
         return AsyncMock()
 
+    @pytest.fixture
+    def mock_agreement_repo(self) -> AsyncMock:
+        return AsyncMock()
+
     @pytest.fixture
     def mock_territory_repo(self) -> AsyncMock:
         return AsyncMock()
 
+    @pytest.fixture
+    def mock_alias_repo(self) -> AsyncMock:
+        alias_repo = AsyncMock()
+        alias_repo.search_connected_org_ids.return_value = []
+        return alias_repo
+
     @pytest.fixture
     def mock_auth_info(self) -> MagicMock:
         auth_info = MagicMock()
@@ -290,15 +385,19 @@ class TestSearchForConnections:
         mock_pos_contact_repo: AsyncMock,
         mock_connection_service: AsyncMock,
         mock_agreement_service: AsyncMock,
+        mock_agreement_repo: AsyncMock,
         mock_territory_repo: AsyncMock,
+        mock_alias_repo: AsyncMock,
         mock_auth_info: MagicMock,
     ) -> OrganizationSearchService:
         return OrganizationSearchService(
             org_search_repository=mock_org_search_repo,
-            pos_contact_repository=mock_pos_contact_repo,
+            pos_contact_loader=PosContactLoader(mock_pos_contact_repo),
             connection_service=mock_connection_service,
             agreement_service=mock_agreement_service,
-            territory_repository=mock_territory_repo,
+            agreement_loader=AgreementLoader(mock_agreement_repo),
+            subdivision_loader=ConnectionSubdivisionLoader(mock_territory_repo),
+            alias_repository=mock_alias_repo,
             auth_info=mock_auth_info,
         )
 
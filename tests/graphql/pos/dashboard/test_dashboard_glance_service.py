@@ -1,9 +1,13 @@
 import datetime
 import uuid
+from collections import Counter
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.graphql.connections.models import ConnectionStatus
+from app.graphql.pos.dashboard.glance_cache import DashboardGlanceCache
+from app.graphql.pos.dashboard.repositories.dashboard_repository import TenantGlance
 from app.graphql.pos.dashboard.services.dashboard_glance_service import (
     DashboardGlanceService,
 )
@@ -11,23 +15,35 @@ from app.graphql.pos.dashboard.services.dashboard_glance_service import (
 
 class TestDashboardGlanceService:
     @pytest.fixture
-    def mock_validation_issue_repository(self) -> AsyncMock:
-        return AsyncMock()
+    def org_id(self) -> uuid.UUID:
+        return uuid.uuid4()
 
     @pytest.fixture
-    def mock_connection_repository(self) -> AsyncMock:
-        return AsyncMock()
+    def mock_dashboard_repository(self) -> AsyncMock:
+        repo = AsyncMock()
+        repo.get_tenant_glance.return_value = TenantGlance(
+            blocking_sends_count=0,
+            last_sent_at=None,
+            last_sent_row_count=None,
+        )
+        return repo
 
     @pytest.fixture
-    def mock_exchange_file_repository(self) -> AsyncMock:
-        return AsyncMock()
+    def mock_connection_repository(self) -> AsyncMock:
+        repo = AsyncMock()
+        repo.count_all_by_status.return_value = Counter()
+        return repo
 
     @pytest.fixture
-    def mock_user_org_repository(self) -> AsyncMock:
+    def mock_user_org_repository(self, org_id: uuid.UUID) -> AsyncMock:
         repo = AsyncMock()
-        repo.get_user_org_id.return_value = uuid.uuid4()
+        repo.get_user_org_id.return_value = org_id
         return repo
 
+    @pytest.fixture
+    def glance_cache(self) -> DashboardGlanceCache:
+        return DashboardGlanceCache(max_entries=10, ttl_seconds=60)
+
     @pytest.fixture
     def mock_auth_info(self) -> MagicMock:
         auth_info = MagicMock()
@@ -37,17 +53,17 @@ class TestDashboardGlanceService:
     @pytest.fixture
     def service(
         self,
-        mock_validation_issue_repository: AsyncMock,
+        mock_dashboard_repository: AsyncMock,
         mock_connection_repository: AsyncMock,
-        mock_exchange_file_repository: AsyncMock,
         mock_user_org_repository: AsyncMock,
+        glance_cache: DashboardGlanceCache,
         mock_auth_info: MagicMock,
     ) -> DashboardGlanceService:
         return DashboardGlanceService(
-            validation_issue_repository=mock_validation_issue_repository,
+            dashboard_repository=mock_dashboard_repository,
             connection_repository=mock_connection_repository,
-            exchange_file_repository=mock_exchange_file_repository,
             user_org_repository=mock_user_org_repository,
+            glance_cache=glance_cache,
             auth_info=mock_auth_info,
         )
 
@@ -55,18 +71,23 @@ class TestDashboardGlanceService:
     async def test_get_glance_returns_all_metrics(
         self,
         service: DashboardGlanceService,
-        mock_validation_issue_repository: AsyncMock,
+        mock_dashboard_repository: AsyncMock,
         mock_connection_repository: AsyncMock,
-        mock_exchange_file_repository: AsyncMock,
     ) -> None:
         """Returns response with all metrics populated."""
-        mock_validation_issue_repository.count_blocking_issues_for_all_pending_files.return_value = 5
-        mock_connection_repository.count_by_status.side_effect = [3, 1]
-
-        mock_file = MagicMock()
-        mock_file.created_at = datetime.datetime(2026, 1, 28, 14, 30, tzinfo=datetime.UTC)
-        mock_file.row_count = 1234
-        mock_exchange_file_repository.get_last_sent_file.return_value = mock_file
+        sent_at = datetime.datetime(2026, 1, 28, 14, 30, tzinfo=datetime.UTC)
+        mock_dashboard_repository.get_tenant_glance.return_value = TenantGlance(
+            blocking_sends_count=5,
+            last_sent_at=sent_at,
+            last_sent_row_count=1234,
+        )
+        mock_connection_repository.count_all_by_status.return_value = Counter(
+            {
+                ConnectionStatus.ACCEPTED.value: 3,
+                ConnectionStatus.PENDING.value: 1,
+                ConnectionStatus.DECLINED.value: 2,
+            }
+        )
 
         result = await service.get_glance()
 
@@ -75,78 +96,115 @@ class TestDashboardGlanceService:
         assert result.partners.pending_count == 1
         assert result.messages.unread_count == 0
         assert result.last_delivery is not None
-        assert result.last_delivery.date == mock_file.created_at
+        assert result.last_delivery.date == sent_at
         assert result.last_delivery.record_count == 1234
 
     @pytest.mark.asyncio
-    async def test_get_glance_no_issues(
+    async def test_get_glance_no_partners(
         self,
         service: DashboardGlanceService,
-        mock_validation_issue_repository: AsyncMock,
-        mock_connection_repository: AsyncMock,
-        mock_exchange_file_repository: AsyncMock,
     ) -> None:
-        """Issues count is 0 when no blocking issues."""
-        mock_validation_issue_repository.count_blocking_issues_for_all_pending_files.return_value = 0
-        mock_connection_repository.count_by_status.side_effect = [0, 0]
-        mock_exchange_file_repository.get_last_sent_file.return_value = None
+        """Both connected and pending are 0 when no connections."""
+        result = await service.get_glance()
+
+        assert result.partners.connected_count == 0
+        assert result.partners.pending_count == 0
 
+    @pytest.mark.asyncio
+    async def test_get_glance_no_deliveries(
+        self,
+        service: DashboardGlanceService,
+    ) -> None:
+        """Issues count is 0 and last delivery is None for a new org."""
         result = await service.get_glance()
 
         assert result.issues.blocking_sends_count == 0
+        assert result.last_delivery is None
 
     @pytest.mark.asyncio
-    async def test_get_glance_no_partners(
+    async def test_get_glance_queries_each_database_once(
         self,
         service: DashboardGlanceService,
-        mock_validation_issue_repository: AsyncMock,
+        mock_dashboard_repository: AsyncMock,
         mock_connection_repository: AsyncMock,
-        mock_exchange_file_repository: AsyncMock,
+        org_id: uuid.UUID,
     ) -> None:
-        """Both connected and pending are 0 when no connections."""
-        mock_validation_issue_repository.count_blocking_issues_for_all_pending_files.return_value = 0
-        mock_connection_repository.count_by_status.side_effect = [0, 0]
-        mock_exchange_file_repository.get_last_sent_file.return_value = None
+        """One tenant query and one connection load answer the whole glance."""
+        await service.get_glance()
 
-        result = await service.get_glance()
-
-        assert result.partners.connected_count == 0
-        assert result.partners.pending_count == 0
+        mock_dashboard_repository.get_tenant_glance.assert_awaited_once_with(org_id)
+        mock_connection_repository.count_all_by_status.assert_awaited_once_with(org_id)
 
     @pytest.mark.asyncio
-    async def test_get_glance_no_deliveries(
+    async def test_repeated_glance_is_served_from_cache(
         self,
         service: DashboardGlanceService,
-        mock_validation_issue_repository: AsyncMock,
+        mock_dashboard_repository: AsyncMock,
         mock_connection_repository: AsyncMock,
-        mock_exchange_file_repository: AsyncMock,
     ) -> None:
-        """Last delivery is None when no sent files."""
-        mock_validation_issue_repository.count_blocking_issues_for_all_pending_files.return_value = 0
-        mock_connection_repository.count_by_status.side_effect = [0, 0]
-        mock_exchange_file_repository.get_last_sent_file.return_value = None
+        """A second glance for the org doesn't query either database."""
+        first = await service.get_glance()
+        second = await service.get_glance()
+
+        assert second == first
+        mock_dashboard_repository.get_tenant_glance.assert_awaited_once()
+        mock_connection_repository.count_all_by_status.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidated_glance_is_reloaded(
+        self,
+        service: DashboardGlanceService,
+        mock_dashboard_repository: AsyncMock,
+        glance_cache: DashboardGlanceCache,
+        org_id: uuid.UUID,
+    ) -> None:
+        """Numbers are loaded again after the org is invalidated."""
+        await service.get_glance()
+        mock_dashboard_repository.get_tenant_glance.return_value = TenantGlance(
+            blocking_sends_count=7,
+            last_sent_at=None,
+            last_sent_row_count=None,
+        )
+        glance_cache.invalidate(org_id)
 
         result = await service.get_glance()
 
-        assert result.last_delivery is None
+        assert result.issues.blocking_sends_count == 7
+        assert mock_dashboard_repository.get_tenant_glance.await_count == 2
 
     @pytest.mark.asyncio
-    async def test_get_glance_messages_always_zero(
+    async def test_glance_loaded_across_invalidation_is_not_cached(
         self,
         service: DashboardGlanceService,
-        mock_validation_issue_repository: AsyncMock,
-        mock_connection_repository: AsyncMock,
-        mock_exchange_file_repository: AsyncMock,
+        mock_dashboard_repository: AsyncMock,
+        glance_cache: DashboardGlanceCache,
+        org_id: uuid.UUID,
     ) -> None:
-        """Messages unread count is always 0 (hardcoded)."""
-        mock_validation_issue_repository.count_blocking_issues_for_all_pending_files.return_value = 10
-        mock_connection_repository.count_by_status.side_effect = [5, 2]
+        """A load that raced a write is returned but not cached."""
 
-        mock_file = MagicMock()
-        mock_file.created_at = datetime.datetime(2026, 1, 28, tzinfo=datetime.UTC)
-        mock_file.row_count = 500
-        mock_exchange_file_repository.get_last_sent_file.return_value = mock_file
+        async def invalidate_during_load(_org_id: uuid.UUID) -> TenantGlance:
+            glance_cache.invalidate(org_id)
+            return TenantGlance(
+                blocking_sends_count=1,
+                last_sent_at=None,
+                last_sent_row_count=None,
+            )
+
+        mock_dashboard_repository.get_tenant_glance.side_effect = invalidate_during_load
 
         result = await service.get_glance()
 
-        assert result.messages.unread_count == 0
+        assert result.issues.blocking_sends_count == 1
+        assert glance_cache.get(org_id) is None
+
+    @pytest.mark.asyncio
+    async def test_get_glance_requires_authenticated_user(
+        self,
+        service: DashboardGlanceService,
+        mock_auth_info: MagicMock,
+    ) -> None:
+        """Raises when the request has no authenticated user."""
+        mock_auth_info.auth_provider_id = None
+
+        with pytest.raises(ValueError, match="not authenticated"):
+            await service.get_glance()
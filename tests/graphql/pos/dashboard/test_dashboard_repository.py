@@ -0,0 +1,75 @@
+import datetime
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.graphql.pos.dashboard.repositories.dashboard_repository import (
+    DashboardRepository,
+    TenantGlance,
+)
+
+
+class TestDashboardRepository:
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def repository(self, mock_session: AsyncMock) -> DashboardRepository:
+        return DashboardRepository(session=mock_session)
+
+    @staticmethod
+    def _setup_row(
+        mock_session: AsyncMock,
+        blocking_sends_count: int,
+        created_at: datetime.datetime | None,
+        row_count: int | None,
+    ) -> None:
+        mock_result = MagicMock()
+        mock_result.one.return_value = MagicMock(
+            blocking_sends_count=blocking_sends_count,
+            created_at=created_at,
+            row_count=row_count,
+        )
+        mock_session.execute.return_value = mock_result
+
+    @pytest.mark.asyncio
+    async def test_get_tenant_glance_runs_one_query(
+        self,
+        repository: DashboardRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Blocking issues and the last sent file come from one CTE query."""
+        sent_at = datetime.datetime(2026, 1, 28, tzinfo=datetime.UTC)
+        self._setup_row(mock_session, 4, sent_at, 500)
+
+        result = await repository.get_tenant_glance(uuid.uuid4())
+
+        assert result == TenantGlance(
+            blocking_sends_count=4,
+            last_sent_at=sent_at,
+            last_sent_row_count=500,
+        )
+        mock_session.execute.assert_awaited_once()
+        sql = str(
+            mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert sql.startswith("WITH blocking AS")
+        assert "LEFT OUTER JOIN last_sent ON true" in sql
+
+    @pytest.mark.asyncio
+    async def test_get_tenant_glance_without_sent_files(
+        self,
+        repository: DashboardRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """The last sent columns are None when nothing has been sent."""
+        self._setup_row(mock_session, 0, None, None)
+
+        result = await repository.get_tenant_glance(uuid.uuid4())
+
+        assert result.blocking_sends_count == 0
+        assert result.last_sent_at is None
+        assert result.last_sent_row_count is None
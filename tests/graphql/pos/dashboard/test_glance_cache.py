@@ -0,0 +1,70 @@
+import uuid
+from unittest.mock import patch
+
+from app.graphql.pos.dashboard.glance_cache import (
+    DashboardGlanceCache,
+    DashboardGlanceSnapshot,
+)
+
+SNAPSHOT = DashboardGlanceSnapshot(
+    blocking_sends_count=1,
+    connected_count=2,
+    pending_count=3,
+    last_sent_at=None,
+    last_sent_row_count=None,
+)
+
+
+class TestDashboardGlanceCache:
+    def test_put_is_dropped_when_an_invalidation_raced_the_load(self) -> None:
+        """A load that started before a write does not populate the cache."""
+        cache = DashboardGlanceCache(max_entries=10, ttl_seconds=15)
+        org_id = uuid.uuid4()
+
+        version = cache.version(org_id)
+        cache.invalidate(org_id)
+        cache.put(org_id, SNAPSHOT, version)
+
+        assert cache.get(org_id) is None
+
+    def test_invalidate_drops_every_given_org(self) -> None:
+        """Connection changes drop both orgs and leave others alone."""
+        cache = DashboardGlanceCache(max_entries=10, ttl_seconds=15)
+        requester, target, other = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        for org_id in (requester, target, other):
+            cache.put(org_id, SNAPSHOT, 0)
+
+        cache.invalidate(requester, target)
+
+        assert cache.get(requester) is None
+        assert cache.get(target) is None
+        assert cache.get(other) == SNAPSHOT
+
+    def test_entries_expire_after_ttl(self) -> None:
+        """Writes made by other workers are picked up within the TTL."""
+        cache = DashboardGlanceCache(max_entries=10, ttl_seconds=15)
+        org_id = uuid.uuid4()
+
+        with patch(
+            "app.graphql.pos.dashboard.glance_cache.time.monotonic"
+        ) as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            cache.put(org_id, SNAPSHOT, 0)
+            mock_monotonic.return_value = 114.0
+            assert cache.get(org_id) == SNAPSHOT
+            mock_monotonic.return_value = 115.0
+            assert cache.get(org_id) is None
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """The cache holds at most `max_entries` orgs."""
+        cache = DashboardGlanceCache(max_entries=2, ttl_seconds=15)
+        first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        cache.put(first, SNAPSHOT, 0)
+        cache.put(second, SNAPSHOT, 0)
+        cache.get(first)
+
+        cache.put(third, SNAPSHOT, 0)
+
+        assert cache.get(first) == SNAPSHOT
+        assert cache.get(second) is None
+        assert cache.get(third) == SNAPSHOT
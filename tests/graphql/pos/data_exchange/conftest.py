@@ -0,0 +1,66 @@
+import io
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Self
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.s3.object_cache import S3ObjectCache
+
+
+class S3ClientError(Exception):
+    """Stands in for botocore's `ClientError`, carrying only the error code."""
+
+    def __init__(self, code: str) -> None:
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+class S3Body:
+    """A `get_object` body that streams `content` in chunks."""
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+    async def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+
+class S3ClientContext:
+    """What `S3Service.get_client` returns: a context yielding the client."""
+
+    def __init__(self, client: MagicMock) -> None:
+        self.client = client
+
+    async def __aenter__(self) -> MagicMock:
+        return self.client
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+
+@pytest.fixture
+def mock_s3_service(mock_client: MagicMock, stored_content: bytes) -> MagicMock:
+    """An S3 service handing out the module's `mock_client`.
+
+    Downloads return the module's `stored_content`, whatever the key.
+    """
+    s3_service = MagicMock()
+    s3_service.bucket_name = "bucket"
+    s3_service.get_full_key.side_effect = lambda key: f"tenant/{key}"
+    s3_service.get_client = AsyncMock(return_value=S3ClientContext(mock_client))
+    s3_service.download = AsyncMock(side_effect=lambda key: io.BytesIO(stored_content))
+    return s3_service
+
+
+@pytest.fixture
+def object_cache(tmp_path: Path) -> S3ObjectCache:
+    return S3ObjectCache(tmp_path / "objects", max_bytes=64 * 1024 * 1024)
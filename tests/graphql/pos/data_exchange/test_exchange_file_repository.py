@@ -2,7 +2,12 @@ import uuid
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.orm import Session
 
+from app.graphql.pos.dashboard.glance_cache import (
+    DashboardGlanceCache,
+    DashboardGlanceSnapshot,
+)
 from app.graphql.pos.data_exchange.models import ExchangeFile, ExchangeFileStatus
 from app.graphql.pos.data_exchange.repositories.exchange_file_repository import (
     ExchangeFileRepository,
@@ -12,11 +17,16 @@ from app.graphql.pos.data_exchange.repositories.exchange_file_repository import
 class TestExchangeFileRepository:
     @pytest.fixture
     def mock_session(self) -> AsyncMock:
-        return AsyncMock()
+        session = AsyncMock()
+        session.sync_session = Session()
+        return session
 
     @pytest.fixture
     def repository(self, mock_session: AsyncMock) -> ExchangeFileRepository:
-        return ExchangeFileRepository(session=mock_session)
+        return ExchangeFileRepository(
+            session=mock_session,
+            glance_cache=DashboardGlanceCache(max_entries=10, ttl_seconds=60),
+        )
 
     @staticmethod
     def _create_mock_file(
@@ -152,6 +162,54 @@ class TestExchangeFileRepository:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_pending_shas_with_targets_returns_matching_shas(
+        self,
+        repository: ExchangeFileRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Returns the SHAs already pending for a target in one query."""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = ["abc123"]
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.pending_shas_with_targets(
+            uuid.uuid4(), ["abc123", "def456"], [uuid.uuid4()]
+        )
+
+        assert result == {"abc123"}
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_pending_shas_with_targets_skips_query_without_shas(
+        self,
+        repository: ExchangeFileRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Returns an empty set without querying when no SHAs are given."""
+        result = await repository.pending_shas_with_targets(
+            uuid.uuid4(), [], [uuid.uuid4()]
+        )
+
+        assert result == set()
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_bulk_flushes_all_files_once(
+        self,
+        repository: ExchangeFileRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Adds every file and flushes them together."""
+        files = [MagicMock(spec=ExchangeFile), MagicMock(spec=ExchangeFile)]
+        mock_session.add_all = MagicMock()
+
+        result = await repository.create_bulk(files)
+
+        assert result == files
+        mock_session.add_all.assert_called_once_with(files)
+        mock_session.flush.assert_awaited_once_with(files)
+
     @pytest.mark.asyncio
     async def test_delete_pending_file(
         self,
@@ -162,7 +220,7 @@ class TestExchangeFileRepository:
         file_id = uuid.uuid4()
 
         mock_result = MagicMock()
-        mock_result.rowcount = 1
+        mock_result.scalar_one_or_none.return_value = uuid.uuid4()
         mock_session.execute.return_value = mock_result
 
         result = await repository.delete(file_id)
@@ -180,7 +238,7 @@ class TestExchangeFileRepository:
         file_id = uuid.uuid4()
 
         mock_result = MagicMock()
-        mock_result.rowcount = 0
+        mock_result.scalar_one_or_none.return_value = None
         mock_session.execute.return_value = mock_result
 
         result = await repository.delete(file_id)
@@ -261,3 +319,80 @@ class TestExchangeFileRepository:
         result = await repository.get_last_sent_file(org_id)
 
         assert result is None
+
+
+class TestExchangeFileRepositoryGlanceInvalidation:
+    SNAPSHOT = DashboardGlanceSnapshot(
+        blocking_sends_count=2,
+        connected_count=1,
+        pending_count=0,
+        last_sent_at=None,
+        last_sent_row_count=None,
+    )
+
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        session = AsyncMock()
+        session.sync_session = Session()
+        return session
+
+    @pytest.fixture
+    def cache(self) -> DashboardGlanceCache:
+        return DashboardGlanceCache(max_entries=10, ttl_seconds=60)
+
+    @pytest.fixture
+    def repository(
+        self,
+        mock_session: AsyncMock,
+        cache: DashboardGlanceCache,
+    ) -> ExchangeFileRepository:
+        return ExchangeFileRepository(session=mock_session, glance_cache=cache)
+
+    @pytest.mark.asyncio
+    async def test_send_invalidates_org_glance(
+        self,
+        repository: ExchangeFileRepository,
+        cache: DashboardGlanceCache,
+    ) -> None:
+        """Sending drops the org's cached glance and leaves other orgs alone."""
+        org_id, other_org_id = uuid.uuid4(), uuid.uuid4()
+        cache.put(org_id, self.SNAPSHOT, cache.version(org_id))
+        cache.put(other_org_id, self.SNAPSHOT, cache.version(other_org_id))
+
+        await repository.update_pending_to_sent(org_id)
+
+        assert cache.get(org_id) is None
+        assert cache.get(other_org_id) == self.SNAPSHOT
+
+    @pytest.mark.asyncio
+    async def test_glance_is_invalidated_again_on_commit(
+        self,
+        repository: ExchangeFileRepository,
+        mock_session: AsyncMock,
+        cache: DashboardGlanceCache,
+    ) -> None:
+        """A glance read between the write and the commit doesn't survive it."""
+        file = MagicMock(spec=ExchangeFile, org_id=uuid.uuid4())
+        await repository.update(file)
+        cache.put(file.org_id, self.SNAPSHOT, cache.version(file.org_id))
+
+        mock_session.sync_session.dispatch.after_commit(mock_session.sync_session)
+
+        assert cache.get(file.org_id) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_of_missing_file_keeps_glance(
+        self,
+        repository: ExchangeFileRepository,
+        mock_session: AsyncMock,
+        cache: DashboardGlanceCache,
+    ) -> None:
+        """Nothing is invalidated when no file was deleted."""
+        org_id = uuid.uuid4()
+        cache.put(org_id, self.SNAPSHOT, cache.version(org_id))
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        assert await repository.delete(uuid.uuid4()) is False
+        assert cache.get(org_id) == self.SNAPSHOT
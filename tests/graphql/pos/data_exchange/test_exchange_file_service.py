@@ -1,24 +1,31 @@
+import asyncio
+import hashlib
+import io
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from starlette.datastructures import UploadFile
 
 from app.graphql.pos.data_exchange.exceptions import (
     CannotDeleteSentFileError,
-    DuplicateFileForTargetError,
     ExchangeFileNotFoundError,
-    InvalidFileTypeError,
 )
 from app.graphql.pos.data_exchange.models import (
     ExchangeFile,
     ExchangeFileStatus,
     ExchangeFileTargetOrg,
 )
+from app.graphql.pos.data_exchange.services import exchange_file_service
 from app.graphql.pos.data_exchange.services.exchange_file_service import (
     ExchangeFileService,
 )
 
 
+def _upload(file_name: str, content: bytes) -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename=file_name)
+
+
 class TestExchangeFileService:
     @pytest.fixture
     def mock_repository(self) -> AsyncMock:
@@ -66,6 +73,7 @@ class TestExchangeFileService:
             org_search_repository=mock_org_search_repository,
             validation_issue_repository=mock_validation_issue_repository,
             auth_info=mock_auth_info,
+            delivery_service=AsyncMock(),
         )
 
     @staticmethod
@@ -98,216 +106,6 @@ class TestExchangeFileService:
 
         return mock_file
 
-    # Upload tests
-    @pytest.mark.asyncio
-    async def test_upload_file_creates_record(
-        self,
-        service: ExchangeFileService,
-        mock_repository: AsyncMock,
-        mock_s3_service: AsyncMock,
-        mock_user_org_repository: AsyncMock,
-    ) -> None:
-        """Creates file record with pending status."""
-        target_org_id = uuid.uuid4()
-        org_id = mock_user_org_repository.get_user_org_id.return_value
-        mock_file = self._create_mock_file(
-            org_id=org_id,
-            target_org_ids=[target_org_id],
-        )
-        mock_repository.has_pending_with_sha_and_target.return_value = False
-        mock_repository.create.return_value = mock_file
-
-        result = await service.upload_file(
-            file_content=b"col1,col2\nval1,val2\n",
-            file_name="test.csv",
-            reporting_period="2026-Q1",
-            is_pos=True,
-            is_pot=False,
-            target_org_ids=[target_org_id],
-        )
-
-        assert result.status == ExchangeFileStatus.PENDING.value
-        mock_repository.create.assert_called_once()
-        mock_s3_service.upload.assert_called_once()
-
-    # noinspection DuplicatedCode
-    # Test isolation: each test has explicit setup for clarity
-    @pytest.mark.asyncio
-    async def test_upload_file_validates_file_type_csv(
-        self,
-        service: ExchangeFileService,
-        mock_repository: AsyncMock,
-        mock_user_org_repository: AsyncMock,
-    ) -> None:
-        """Accepts CSV files."""
-        target_org_id = uuid.uuid4()
-        org_id = mock_user_org_repository.get_user_org_id.return_value
-        mock_file = self._create_mock_file(org_id=org_id)
-        mock_repository.has_pending_with_sha_and_target.return_value = False
-        mock_repository.create.return_value = mock_file
-
-        result = await service.upload_file(
-            file_content=b"col1,col2\nval1,val2\n",
-            file_name="test.csv",
-            reporting_period="2026-Q1",
-            is_pos=True,
-            is_pot=False,
-            target_org_ids=[target_org_id],
-        )
-
-        assert result is not None
-
-    @pytest.mark.asyncio
-    async def test_upload_file_rejects_invalid_type(
-        self,
-        service: ExchangeFileService,
-    ) -> None:
-        """Rejects non-CSV/XLS/XLSX files."""
-        with pytest.raises(InvalidFileTypeError):
-            await service.upload_file(
-                file_content=b"PDF content",
-                file_name="test.pdf",
-                reporting_period="2026-Q1",
-                is_pos=True,
-                is_pot=False,
-                target_org_ids=[uuid.uuid4()],
-            )
-
-    @pytest.mark.asyncio
-    async def test_upload_file_rejects_duplicate_sha_same_target(
-        self,
-        service: ExchangeFileService,
-        mock_repository: AsyncMock,
-    ) -> None:
-        """Rejects if pending file with same SHA targets same org."""
-        target_org_id = uuid.uuid4()
-        mock_repository.has_pending_with_sha_and_target.return_value = True
-
-        with pytest.raises(DuplicateFileForTargetError):
-            await service.upload_file(
-                file_content=b"col1,col2\nval1,val2\n",
-                file_name="test.csv",
-                reporting_period="2026-Q1",
-                is_pos=True,
-                is_pot=False,
-                target_org_ids=[target_org_id],
-            )
-
-    # noinspection DuplicatedCode
-    # Test isolation: each test has explicit setup for clarity
-    @pytest.mark.asyncio
-    async def test_upload_file_allows_same_sha_different_target(
-        self,
-        service: ExchangeFileService,
-        mock_repository: AsyncMock,
-        mock_user_org_repository: AsyncMock,
-    ) -> None:
-        """Allows same file if targeting different orgs."""
-        target_org_id = uuid.uuid4()
-        org_id = mock_user_org_repository.get_user_org_id.return_value
-        mock_file = self._create_mock_file(org_id=org_id)
-        mock_repository.has_pending_with_sha_and_target.return_value = False
-        mock_repository.create.return_value = mock_file
-
-        result = await service.upload_file(
-            file_content=b"col1,col2\nval1,val2\n",
-            file_name="test.csv",
-            reporting_period="2026-Q1",
-            is_pos=True,
-            is_pot=False,
-            target_org_ids=[target_org_id],
-        )
-
-        assert result is not None
-
-    @pytest.mark.asyncio
-    async def test_upload_file_stores_in_s3(
-        self,
-        service: ExchangeFileService,
-        mock_repository: AsyncMock,
-        mock_s3_service: AsyncMock,
-        mock_user_org_repository: AsyncMock,
-    ) -> None:
-        """Verifies S3 upload is called."""
-        target_org_id = uuid.uuid4()
-        org_id = mock_user_org_repository.get_user_org_id.return_value
-        mock_file = self._create_mock_file(org_id=org_id)
-        mock_repository.has_pending_with_sha_and_target.return_value = False
-        mock_repository.create.return_value = mock_file
-
-        await service.upload_file(
-            file_content=b"col1,col2\nval1,val2\n",
-            file_name="test.csv",
-            reporting_period="2026-Q1",
-            is_pos=True,
-            is_pot=False,
-            target_org_ids=[target_org_id],
-        )
-
-        mock_s3_service.upload.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_upload_file_computes_row_count(
-        self,
-        service: ExchangeFileService,
-        mock_repository: AsyncMock,
-    ) -> None:
-        """Counts data rows in CSV file."""
-        target_org_id = uuid.uuid4()
-        mock_repository.has_pending_with_sha_and_target.return_value = False
-
-        created_file: ExchangeFile | None = None
-
-        async def capture_create(entity: ExchangeFile) -> ExchangeFile:
-            nonlocal created_file
-            created_file = entity
-            return entity
-
-        mock_repository.create.side_effect = capture_create
-
-        await service.upload_file(
-            file_content=b"col1,col2\nval1,val2\nval3,val4\n",
-            file_name="test.csv",
-            reporting_period="2026-Q1",
-            is_pos=True,
-            is_pot=False,
-            target_org_ids=[target_org_id],
-        )
-
-        assert created_file is not None
-        assert created_file.row_count == 2  # 2 data rows (header excluded)
-
-    @pytest.mark.asyncio
-    async def test_upload_file_creates_target_org_records(
-        self,
-        service: ExchangeFileService,
-        mock_repository: AsyncMock,
-    ) -> None:
-        """Creates association records for target orgs."""
-        target_org_ids = [uuid.uuid4(), uuid.uuid4()]
-        mock_repository.has_pending_with_sha_and_target.return_value = False
-
-        created_file: ExchangeFile | None = None
-
-        async def capture_create(entity: ExchangeFile) -> ExchangeFile:
-            nonlocal created_file
-            created_file = entity
-            return entity
-
-        mock_repository.create.side_effect = capture_create
-
-        await service.upload_file(
-            file_content=b"col1,col2\nval1,val2\n",
-            file_name="test.csv",
-            reporting_period="2026-Q1",
-            is_pos=True,
-            is_pot=False,
-            target_org_ids=target_org_ids,
-        )
-
-        assert created_file is not None
-        assert len(created_file.target_organizations) == 2
-
     # Delete tests
     @pytest.mark.asyncio
     async def test_delete_file_removes_record(
@@ -419,62 +217,192 @@ class TestExchangeFileService:
         assert total_rows == 1500
         mock_repository.get_pending_stats.assert_called_once_with(org_id)
 
-    # Background validation tests
+    # Batch upload tests
     @pytest.mark.asyncio
-    async def test_upload_file_triggers_validation_task(
+    async def test_upload_files_creates_all_files_in_one_flush(
         self,
         service: ExchangeFileService,
         mock_repository: AsyncMock,
-        mock_user_org_repository: AsyncMock,
+        mock_s3_service: AsyncMock,
     ) -> None:
-        """Validation task starts after upload."""
-        target_org_id = uuid.uuid4()
-        org_id = mock_user_org_repository.get_user_org_id.return_value
-        mock_file = self._create_mock_file(org_id=org_id)
-        mock_repository.has_pending_with_sha_and_target.return_value = False
-        mock_repository.create.return_value = mock_file
+        """Accepted files are stored, inserted together and validated."""
+        mock_repository.pending_shas_with_targets.return_value = set()
 
         with patch(
             "app.graphql.pos.data_exchange.services.exchange_file_service."
             "trigger_validation_task"
         ) as mock_trigger:
-            await service.upload_file(
-                file_content=b"col1,col2\nval1,val2\n",
-                file_name="test.csv",
+            results = await service.upload_files(
+                uploads=[
+                    _upload("a.csv", b"col1\nval1\n"),
+                    _upload("b.csv", b"col1\nval2\nval3\n"),
+                ],
+                reporting_period="2026-Q1",
+                is_pos=True,
+                is_pot=False,
+                target_org_ids=[uuid.uuid4()],
+            )
+
+        assert [r.error for r in results] == [None, None]
+        created = mock_repository.create_bulk.call_args.args[0]
+        assert [f.file_name for f in created] == ["a.csv", "b.csv"]
+        assert [f.row_count for f in created] == [1, 2]
+        mock_repository.pending_shas_with_targets.assert_awaited_once()
+        mock_repository.has_pending_with_sha_and_target.assert_not_called()
+        assert mock_s3_service.upload.await_count == 2
+        assert mock_trigger.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_upload_files_reports_errors_per_file(
+        self,
+        service: ExchangeFileService,
+        mock_repository: AsyncMock,
+        mock_s3_service: AsyncMock,
+    ) -> None:
+        """Failing files get an error while the rest of the batch is created."""
+        pending = b"col1\npending\n"
+        mock_repository.pending_shas_with_targets.return_value = {
+            hashlib.sha256(pending).hexdigest()
+        }
+
+        async def upload(key: str, file_obj: io.BytesIO) -> None:
+            if file_obj.getvalue() == b"col1\nbroken\n":
+                raise RuntimeError("S3 unavailable")
+
+        mock_s3_service.upload.side_effect = upload
+
+        with patch(
+            "app.graphql.pos.data_exchange.services.exchange_file_service."
+            "trigger_validation_task"
+        ):
+            results = await service.upload_files(
+                uploads=[
+                    _upload("ok.csv", b"col1\nok\n"),
+                    _upload("notes.pdf", b"%PDF"),
+                    _upload("pending.csv", pending),
+                    _upload("copy.csv", b"col1\nok\n"),
+                    _upload("broken.csv", b"col1\nbroken\n"),
+                    _upload("latin1.csv", "col1\ncaf\u00e9\n".encode("latin-1")),
+                ],
                 reporting_period="2026-Q1",
                 is_pos=True,
                 is_pot=False,
-                target_org_ids=[target_org_id],
+                target_org_ids=[uuid.uuid4()],
             )
 
-            mock_trigger.assert_called_once_with(mock_file.id)
+        assert results[0].error is None
+        assert results[0].exchange_file is not None
+        assert results[1].error is not None
+        assert "pdf" in results[1].error
+        assert results[2].error is not None
+        assert "pending file" in results[2].error
+        assert results[3].error is not None
+        assert results[4].error == "broken.csv could not be stored"
+        assert results[5].error is not None
+        assert all(r.exchange_file is None for r in results[1:])
+        created = mock_repository.create_bulk.call_args.args[0]
+        assert [f.file_name for f in created] == ["ok.csv"]
+
+    @pytest.mark.asyncio
+    async def test_upload_files_skips_insert_when_every_file_fails(
+        self,
+        service: ExchangeFileService,
+        mock_repository: AsyncMock,
+    ) -> None:
+        """No rows are inserted when nothing in the batch is accepted."""
+        results = await service.upload_files(
+            uploads=[_upload("notes.pdf", b"%PDF")],
+            reporting_period="2026-Q1",
+            is_pos=True,
+            is_pot=False,
+            target_org_ids=[uuid.uuid4()],
+        )
+
+        assert results[0].error is not None
+        mock_repository.create_bulk.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_upload_file_returns_immediately(
+    async def test_upload_files_creates_pending_records_with_targets(
         self,
         service: ExchangeFileService,
         mock_repository: AsyncMock,
+        mock_s3_service: AsyncMock,
         mock_user_org_repository: AsyncMock,
     ) -> None:
-        """Upload returns without waiting for validation."""
-        target_org_id = uuid.uuid4()
+        """Files are recorded as pending for every target and stored as uploaded."""
         org_id = mock_user_org_repository.get_user_org_id.return_value
-        mock_file = self._create_mock_file(org_id=org_id)
-        mock_repository.has_pending_with_sha_and_target.return_value = False
-        mock_repository.create.return_value = mock_file
+        target_org_ids = [uuid.uuid4(), uuid.uuid4()]
+        content = b"col1,col2\nval1,val2\n"
+        upload = _upload("test.csv", content)
+        mock_repository.pending_shas_with_targets.return_value = set()
+
+        with patch(
+            "app.graphql.pos.data_exchange.services.exchange_file_service."
+            "trigger_validation_task"
+        ) as mock_trigger:
+            [result] = await service.upload_files(
+                uploads=[upload],
+                reporting_period="2026-Q1",
+                is_pos=True,
+                is_pot=False,
+                target_org_ids=target_org_ids,
+            )
+
+        created = result.exchange_file
+        assert created is not None
+        file_sha = hashlib.sha256(content).hexdigest()
+        assert created.status == ExchangeFileStatus.PENDING.value
+        assert created.s3_key == f"exchange-files/{org_id}/{file_sha}.csv"
+        assert created.file_size == len(content)
+        assert [t.connected_org_id for t in created.target_organizations] == (
+            target_org_ids
+        )
+        mock_s3_service.upload.assert_awaited_once_with(
+            key=created.s3_key, file_obj=upload.file
+        )
+        mock_trigger.assert_called_once_with(created.id)
+
+    @pytest.mark.asyncio
+    async def test_upload_files_reads_at_most_concurrency_files_at_once(
+        self,
+        service: ExchangeFileService,
+        mock_repository: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Files are read inside the concurrency limit, not all up front."""
+        monkeypatch.setattr(exchange_file_service, "UPLOAD_CONCURRENCY", 2)
+        mock_repository.pending_shas_with_targets.return_value = set()
+        reading = 0
+        most_reading = 0
+
+        class _TrackedUpload(UploadFile):
+            async def read(self, size: int = -1) -> bytes:
+                nonlocal reading, most_reading
+                reading += 1
+                most_reading = max(most_reading, reading)
+                await asyncio.sleep(0)
+                content = await super().read(size)
+                reading -= 1
+                return content
+
+        uploads = [
+            _TrackedUpload(
+                file=io.BytesIO(f"col1\n{i}\n".encode()), filename=f"{i}.csv"
+            )
+            for i in range(6)
+        ]
 
         with patch(
             "app.graphql.pos.data_exchange.services.exchange_file_service."
             "trigger_validation_task"
         ):
-            result = await service.upload_file(
-                file_content=b"col1,col2\nval1,val2\n",
-                file_name="test.csv",
+            results = await service.upload_files(
+                uploads=uploads,
                 reporting_period="2026-Q1",
                 is_pos=True,
                 is_pot=False,
-                target_org_ids=[target_org_id],
+                target_org_ids=[uuid.uuid4()],
             )
 
-        # File should be returned immediately with NOT_VALIDATED status
-        assert result is not None
+        assert all(r.error is None for r in results)
+        assert most_reading == 2
@@ -0,0 +1,514 @@
+import base64
+import hashlib
+import io
+import re
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from aiobotocore.session import get_session
+
+from app.core.s3.object_cache import S3ObjectCache
+from app.graphql.pos.data_exchange.exceptions import (
+    DuplicateFileForTargetError,
+    InvalidFileTypeError,
+    InvalidUploadRequestError,
+    UploadNotFoundError,
+    UploadVerificationError,
+)
+from app.graphql.pos.data_exchange.services.exchange_file_upload_service import (
+    ExchangeFileUploadService,
+    FinalizeRequest,
+    UploadRequest,
+    sha256_checksum,
+)
+from tests.graphql.pos.data_exchange.conftest import S3Body, S3ClientError
+
+CONTENT = b"invoice_date,quantity\n2024-01-02,5\n"
+CONTENT_SHA = hashlib.sha256(CONTENT).hexdigest()
+
+
+class TestExchangeFileUploadService:
+    @pytest.fixture
+    def org_id(self) -> uuid.UUID:
+        return uuid.uuid4()
+
+    @pytest.fixture
+    def mock_client(self) -> MagicMock:
+        client = MagicMock()
+        client.exceptions.ClientError = S3ClientError
+        client.generate_presigned_post = AsyncMock(
+            return_value={"url": "https://bucket.s3", "fields": {"key": "k"}}
+        )
+        client.head_object = AsyncMock(
+            return_value={
+                "ContentLength": len(CONTENT),
+                "ChecksumSHA256": sha256_checksum(CONTENT_SHA),
+            }
+        )
+        client.get_object = AsyncMock(return_value={"Body": S3Body(CONTENT)})
+        client.copy_object = AsyncMock()
+        client.delete_object = AsyncMock()
+        return client
+
+    @pytest.fixture
+    def stored_content(self) -> bytes:
+        return CONTENT
+
+    @pytest.fixture
+    def mock_exchange_file_service(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_user_org_repository(self, org_id: uuid.UUID) -> AsyncMock:
+        repo = AsyncMock()
+        repo.get_user_org_id.return_value = org_id
+        return repo
+
+    @pytest.fixture
+    def mock_settings(self) -> MagicMock:
+        settings = MagicMock()
+        settings.exchange_upload_url_ttl_seconds = 900
+        settings.exchange_upload_max_bytes = 1024
+        return settings
+
+    @pytest.fixture
+    def service(
+        self,
+        mock_exchange_file_service: AsyncMock,
+        mock_s3_service: MagicMock,
+        object_cache: S3ObjectCache,
+        mock_user_org_repository: AsyncMock,
+        mock_settings: MagicMock,
+    ) -> ExchangeFileUploadService:
+        auth_info = MagicMock()
+        auth_info.auth_provider_id = "user_01KEHRJ8JTMM2NZ2MQFX30C5T3"
+        return ExchangeFileUploadService(
+            exchange_file_service=mock_exchange_file_service,
+            s3_service=mock_s3_service,
+            object_cache=object_cache,
+            user_org_repository=mock_user_org_repository,
+            settings=mock_settings,
+            auth_info=auth_info,
+        )
+
+    @staticmethod
+    def _upload(
+        file_name: str = "sales.csv",
+        file_size: int = len(CONTENT),
+        file_sha: str = CONTENT_SHA,
+    ) -> UploadRequest:
+        return UploadRequest(
+            file_name=file_name, file_size=file_size, file_sha=file_sha
+        )
+
+    @staticmethod
+    def _finalize(org_id: uuid.UUID, key: str | None = None) -> FinalizeRequest:
+        return FinalizeRequest(
+            file_name="sales.csv",
+            file_size=len(CONTENT),
+            file_sha=CONTENT_SHA,
+            key=key or f"exchange-files/{org_id}/uploads/{uuid.uuid4()}.csv",
+        )
+
+    def test_sha256_checksum_is_base64_of_digest(self) -> None:
+        assert (
+            sha256_checksum(CONTENT_SHA)
+            == base64.b64encode(hashlib.sha256(CONTENT).digest()).decode()
+        )
+
+    @pytest.mark.asyncio
+    async def test_request_uploads_pins_staging_key_size_and_checksum(
+        self,
+        service: ExchangeFileUploadService,
+        mock_client: MagicMock,
+        org_id: uuid.UUID,
+    ) -> None:
+        tickets = await service.request_uploads([self._upload()])
+
+        assert len(tickets) == 1
+        assert tickets[0].url == "https://bucket.s3"
+        assert tickets[0].fields == {"key": "k"}
+        assert re.fullmatch(
+            rf"exchange-files/{org_id}/uploads/[0-9a-f-]{{36}}\.csv", tickets[0].key
+        )
+
+        kwargs = mock_client.generate_presigned_post.call_args.kwargs
+        assert kwargs["Bucket"] == "bucket"
+        assert kwargs["Key"] == f"tenant/{tickets[0].key}"
+        assert kwargs["ExpiresIn"] == 900
+        checksum = sha256_checksum(CONTENT_SHA)
+        assert kwargs["Fields"]["x-amz-checksum-sha256"] == checksum
+        assert {"x-amz-checksum-sha256": checksum} in kwargs["Conditions"]
+        assert [
+            "content-length-range",
+            len(CONTENT),
+            len(CONTENT),
+        ] in kwargs["Conditions"]
+
+    @pytest.mark.asyncio
+    async def test_request_uploads_gives_each_ticket_its_own_key(
+        self,
+        service: ExchangeFileUploadService,
+    ) -> None:
+        tickets = await service.request_uploads([self._upload(), self._upload()])
+
+        assert tickets[0].key != tickets[1].key
+
+    @pytest.mark.asyncio
+    async def test_request_uploads_normalizes_sha_case(
+        self,
+        service: ExchangeFileUploadService,
+    ) -> None:
+        tickets = await service.request_uploads(
+            [self._upload(file_sha=CONTENT_SHA.upper())]
+        )
+
+        assert tickets[0].file_sha == CONTENT_SHA
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "upload",
+        [
+            UploadRequest(file_name="sales.csv", file_size=10, file_sha="abc"),
+            UploadRequest(file_name="sales.csv", file_size=0, file_sha=CONTENT_SHA),
+            UploadRequest(file_name="sales.csv", file_size=2048, file_sha=CONTENT_SHA),
+        ],
+    )
+    async def test_request_uploads_rejects_invalid_declarations(
+        self,
+        service: ExchangeFileUploadService,
+        mock_client: MagicMock,
+        upload: UploadRequest,
+    ) -> None:
+        with pytest.raises(InvalidUploadRequestError):
+            await service.request_uploads([upload])
+
+        mock_client.generate_presigned_post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_request_uploads_rejects_invalid_file_type(
+        self,
+        service: ExchangeFileUploadService,
+    ) -> None:
+        with pytest.raises(InvalidFileTypeError):
+            await service.request_uploads([self._upload(file_name="sales.pdf")])
+
+    @pytest.mark.asyncio
+    async def test_finalize_uploads_creates_file_from_stored_checksum(
+        self,
+        service: ExchangeFileUploadService,
+        mock_client: MagicMock,
+        mock_exchange_file_service: AsyncMock,
+        org_id: uuid.UUID,
+    ) -> None:
+        target_org_ids = [uuid.uuid4()]
+        upload = self._finalize(org_id)
+
+        result = await service.finalize_uploads(
+            files=[upload],
+            reporting_period="2024-01",
+            is_pos=True,
+            is_pot=False,
+            target_org_ids=target_org_ids,
+        )
+
+        assert result == [mock_exchange_file_service.create_file.return_value]
+        mock_exchange_file_service.check_duplicate.assert_awaited_once_with(
+            org_id, CONTENT_SHA, target_org_ids
+        )
+        head_kwargs = mock_client.head_object.call_args.kwargs
+        assert head_kwargs["Key"] == f"tenant/{upload.key}"
+        assert head_kwargs["ChecksumMode"] == "ENABLED"
+        mock_client.get_object.assert_not_called()
+        mock_client.copy_object.assert_awaited_once_with(
+            Bucket="bucket",
+            Key=f"tenant/exchange-files/{org_id}/{CONTENT_SHA}.csv",
+            CopySource={"Bucket": "bucket", "Key": f"tenant/{upload.key}"},
+        )
+        mock_client.delete_object.assert_awaited_once_with(
+            Bucket="bucket", Key=f"tenant/{upload.key}"
+        )
+
+        kwargs = mock_exchange_file_service.create_file.call_args.kwargs
+        assert kwargs["s3_key"] == f"exchange-files/{org_id}/{CONTENT_SHA}.csv"
+        assert kwargs["file_size"] == len(CONTENT)
+        assert kwargs["file_type"] == "csv"
+        assert kwargs["row_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_finalize_uploads_rejects_csv_that_is_not_utf8(
+        self,
+        service: ExchangeFileUploadService,
+        mock_client: MagicMock,
+        mock_s3_service: MagicMock,
+        mock_exchange_file_service: AsyncMock,
+        org_id: uuid.UUID,
+    ) -> None:
+        content = "name\nCafé\n".encode("latin-1")
+        content_sha = hashlib.sha256(content).hexdigest()
+        mock_client.head_object.return_value = {
+            "ContentLength": len(content),
+            "ChecksumSHA256": sha256_checksum(content_sha),
+        }
+        mock_s3_service.download.side_effect = lambda key: io.BytesIO(content)
+        upload = FinalizeRequest(
+            file_name="sales.csv",
+            file_size=len(content),
+            file_sha=content_sha,
+            key=f"exchange-files/{org_id}/uploads/{uuid.uuid4()}.csv",
+        )
+
+        with pytest.raises(InvalidUploadRequestError, match="UTF-8"):
+            await service.finalize_uploads(
+                files=[upload],
+                reporting_period="2024-01",
+                is_pos=True,
+                is_pot=False,
+                target_org_ids=[uuid.uuid4()],
+            )
+
+        mock_client.delete_object.assert_awaited_once_with(
+            Bucket="bucket", Key=f"tenant/{upload.key}"
+        )
+        mock_client.copy_object.assert_not_called()
+        mock_exchange_file_service.create_file.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_finalize_uploads_hashes_object_without_stored_checksum(
+        self,
+        service: ExchangeFileUploadService,
+        mock_client: MagicMock,
+        mock_exchange_file_service: AsyncMock,
+        org_id: uuid.UUID,
+    ) -> None:
+        mock_client.head_object.return_value = {"ContentLength": len(CONTENT)}
+
+        await service.finalize_uploads(
+            files=[self._finalize(org_id)],
+            reporting_period="2024-01",
+            is_pos=True,
+            is_pot=False,
+            target_org_ids=[uuid.uuid4()],
+        )
+
+        mock_client.get_object.assert_awaited_once()
+        mock_exchange_file_service.create_file.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_finalize_uploads_deletes_only_mismatched_staged_object(
+        self,
+        service: ExchangeFileUploadService,
+        mock_client: MagicMock,
+        mock_exchange_file_service: AsyncMock,
+        org_id: uuid.UUID,
+    ) -> None:
+        mock_client.head_object.return_value = {"ContentLength": len(CONTENT)}
+        mock_client.get_object.return_value = {"Body": S3Body(b"something else")}
+        upload = self._finalize(org_id)
+
+        with pytest.raises(UploadVerificationError):
+            await service.finalize_uploads(
+                files=[upload],
+                reporting_period="2024-01",
+                is_pos=True,
+                is_pot=False,
+                target_org_ids=[uuid.uuid4()],
+            )
+
+        mock_client.delete_object.assert_awaited_once_with(
+            Bucket="bucket", Key=f"tenant/{upload.key}"
+        )
+        mock_client.copy_object.assert_not_called()
+        mock_exchange_file_service.create_file.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "key",
+        [
+            f"exchange-files/{uuid.uuid4()}/uploads/{uuid.uuid4()}.csv",
+            f"exchange-files/{{org_id}}/{CONTENT_SHA}.csv",
+            f"exchange-files/{{org_id}}/uploads/{uuid.uuid4()}.xlsx",
+        ],
+    )
+    async def test_finalize_uploads_rejects_foreign_keys(
+        self,
+        service: ExchangeFileUploadService,
+        mock_client: MagicMock,
+        org_id: uuid.UUID,
+        key: str,
+    ) -> None:
+        with pytest.raises(UploadNotFoundError):
+            await service.finalize_uploads(
+                files=[self._finalize(org_id, key.format(org_id=org_id))],
+                reporting_period="2024-01",
+                is_pos=True,
+                is_pot=False,
+                target_org_ids=[uuid.uuid4()],
+            )
+
+        mock_client.head_object.assert_not_called()
+        mock_client.delete_object.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_finalize_uploads_raises_when_object_missing(
+        self,
+        service: ExchangeFileUploadService,
+        mock_client: MagicMock,
+        mock_exchange_file_service: AsyncMock,
+        org_id: uuid.UUID,
+    ) -> None:
+        mock_client.head_object.side_effect = S3ClientError("404")
+
+        with pytest.raises(UploadNotFoundError):
+            await service.finalize_uploads(
+                files=[self._finalize(org_id)],
+                reporting_period="2024-01",
+                is_pos=True,
+                is_pot=False,
+                target_org_ids=[uuid.uuid4()],
+            )
+
+        mock_exchange_file_service.create_file.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_finalize_uploads_checks_duplicates_before_storage(
+        self,
+        service: ExchangeFileUploadService,
+        mock_client: MagicMock,
+        mock_exchange_file_service: AsyncMock,
+        org_id: uuid.UUID,
+    ) -> None:
+        mock_exchange_file_service.check_duplicate.side_effect = (
+            DuplicateFileForTargetError("duplicate")
+        )
+
+        with pytest.raises(DuplicateFileForTargetError):
+            await service.finalize_uploads(
+                files=[self._finalize(org_id)],
+                reporting_period="2024-01",
+                is_pos=True,
+                is_pot=False,
+                target_org_ids=[uuid.uuid4()],
+            )
+
+        mock_client.head_object.assert_not_called()
+
+
+class TestExchangeFileUploadRoundTrip:
+    """Presign, POST and finalize against moto's S3 server."""
+
+    @pytest.fixture
+    def endpoint_url(self) -> Iterator[str]:
+        moto_server = pytest.importorskip("moto.server")
+        server = moto_server.ThreadedMotoServer(ip_address="127.0.0.1", port=0)
+        server.start()
+        host, port = server.get_host_and_port()
+        yield f"http://{host}:{port}"
+        server.stop()
+
+    @pytest.fixture
+    def s3_service(self, endpoint_url: str) -> MagicMock:
+        session = get_session()
+
+        def create_client() -> Any:
+            return session.create_client(
+                "s3",
+                endpoint_url=endpoint_url,
+                region_name="us-east-1",
+                aws_access_key_id="testing",
+                aws_secret_access_key="testing",
+            )
+
+        async def download(key: str) -> io.BytesIO:
+            async with create_client() as client:
+                response = await client.get_object(Bucket="bucket", Key=f"tenant/{key}")
+                async with response["Body"] as body:
+                    return io.BytesIO(await body.read())
+
+        s3_service = MagicMock()
+        s3_service.bucket_name = "bucket"
+        s3_service.get_full_key.side_effect = lambda key: f"tenant/{key}"
+        s3_service.get_client = AsyncMock(side_effect=create_client)
+        s3_service.download = AsyncMock(side_effect=download)
+        return s3_service
+
+    @pytest.fixture
+    async def client(self, s3_service: MagicMock) -> AsyncIterator[Any]:
+        async with await s3_service.get_client() as client:
+            await client.create_bucket(Bucket="bucket")
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_posted_file_is_finalized_under_its_content_key(
+        self,
+        s3_service: MagicMock,
+        client: Any,
+        tmp_path: Path,
+    ) -> None:
+        org_id = uuid.uuid4()
+        user_org_repository = AsyncMock()
+        user_org_repository.get_user_org_id.return_value = org_id
+        settings = MagicMock()
+        settings.exchange_upload_url_ttl_seconds = 900
+        settings.exchange_upload_max_bytes = 1024
+        auth_info = MagicMock()
+        auth_info.auth_provider_id = "user_01KEHRJ8JTMM2NZ2MQFX30C5T3"
+        exchange_file_service = AsyncMock()
+        service = ExchangeFileUploadService(
+            exchange_file_service=exchange_file_service,
+            s3_service=s3_service,
+            object_cache=S3ObjectCache(tmp_path, max_bytes=1024),
+            user_org_repository=user_org_repository,
+            settings=settings,
+            auth_info=auth_info,
+        )
+
+        [ticket] = await service.request_uploads(
+            [
+                UploadRequest(
+                    file_name="sales.csv",
+                    file_size=len(CONTENT),
+                    file_sha=CONTENT_SHA,
+                )
+            ]
+        )
+        async with httpx.AsyncClient() as http:
+            response = await http.post(
+                ticket.url,
+                data=ticket.fields,
+                files={"file": ("sales.csv", CONTENT)},
+            )
+        assert response.is_success, response.text
+
+        await service.finalize_uploads(
+            files=[
+                FinalizeRequest(
+                    file_name="sales.csv",
+                    file_size=len(CONTENT),
+                    file_sha=CONTENT_SHA,
+                    key=ticket.key,
+                )
+            ],
+            reporting_period="2024-01",
+            is_pos=True,
+            is_pot=False,
+            target_org_ids=[uuid.uuid4()],
+        )
+
+        s3_key = f"exchange-files/{org_id}/{CONTENT_SHA}.csv"
+        stored = await client.get_object(Bucket="bucket", Key=f"tenant/{s3_key}")
+        async with stored["Body"] as body:
+            assert await body.read() == CONTENT
+        listed = await client.list_objects_v2(
+            Bucket="bucket", Prefix=f"tenant/exchange-files/{org_id}/uploads/"
+        )
+        assert listed.get("KeyCount", 0) == 0
+
+        kwargs = exchange_file_service.create_file.call_args.kwargs
+        assert kwargs["s3_key"] == s3_key
+        assert kwargs["row_count"] == 1
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 import strawberry
 
+from app.graphql.organizations.loaders import OrgNameLoader
 from app.graphql.pos.data_exchange.models import (
     ReceivedExchangeFile,
     ReceivedExchangeFileStatus,
@@ -64,7 +65,7 @@ class TestReceivedExchangeFileQueries:
         return await unwrapped(
             queries,
             service=service,
-            org_search_repository=org_search_repository,
+            org_name_loader=OrgNameLoader(org_search_repository),
             period=period,
             senders=senders,
             is_pos=is_pos,
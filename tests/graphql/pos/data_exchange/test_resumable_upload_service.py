@@ -0,0 +1,371 @@
+import hashlib
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.s3.object_cache import S3ObjectCache
+from app.graphql.pos.data_exchange.exceptions import (
+    DuplicateFileForTargetError,
+    IncompleteUploadError,
+    InvalidFileTypeError,
+    InvalidUploadRequestError,
+    UploadNotFoundError,
+)
+from app.graphql.pos.data_exchange.services.exchange_file_upload_service import (
+    sha256_checksum,
+)
+from app.graphql.pos.data_exchange.services.resumable_upload_service import (
+    MIN_PART_BYTES,
+    ResumableUploadService,
+)
+from app.graphql.pos.data_exchange.upload_digests import UploadDigests
+from tests.graphql.pos.data_exchange.conftest import S3Body, S3ClientError
+
+# A header line and data rows; the second part holds the last row
+PART_ONE = (b"a" * 63 + b"\n") * (MIN_PART_BYTES // 64)
+PART_TWO = b"tail"
+
+
+def _checksum(content: bytes) -> str:
+    return sha256_checksum(hashlib.sha256(content).hexdigest())
+
+
+class TestResumableUploadService:
+    @pytest.fixture
+    def org_id(self) -> uuid.UUID:
+        return uuid.uuid4()
+
+    @pytest.fixture
+    def key(self, org_id: uuid.UUID) -> str:
+        return f"exchange-files/{org_id}/uploads/{uuid.uuid4()}.csv"
+
+    @pytest.fixture
+    def mock_client(self) -> MagicMock:
+        client = MagicMock()
+        client.exceptions.ClientError = S3ClientError
+        client.create_multipart_upload = AsyncMock(return_value={"UploadId": "up-1"})
+        client.upload_part = AsyncMock(return_value={"ETag": '"etag"'})
+        client.list_parts = AsyncMock(
+            return_value={
+                "Parts": [
+                    {
+                        "PartNumber": 1,
+                        "Size": len(PART_ONE),
+                        "ETag": '"e1"',
+                        "ChecksumSHA256": _checksum(PART_ONE),
+                    },
+                    {
+                        "PartNumber": 2,
+                        "Size": len(PART_TWO),
+                        "ETag": '"e2"',
+                        "ChecksumSHA256": _checksum(PART_TWO),
+                    },
+                ],
+                "IsTruncated": False,
+            }
+        )
+        client.complete_multipart_upload = AsyncMock()
+        client.abort_multipart_upload = AsyncMock()
+        client.get_object = AsyncMock(
+            return_value={"Body": S3Body(PART_ONE + PART_TWO)}
+        )
+        client.copy_object = AsyncMock()
+        client.delete_object = AsyncMock()
+        return client
+
+    @pytest.fixture
+    def stored_content(self) -> bytes:
+        return PART_ONE + PART_TWO
+
+    @pytest.fixture
+    def mock_exchange_file_service(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def upload_digests(self) -> UploadDigests:
+        return UploadDigests(max_entries=8)
+
+    @pytest.fixture
+    def service(
+        self,
+        org_id: uuid.UUID,
+        mock_exchange_file_service: AsyncMock,
+        mock_s3_service: MagicMock,
+        object_cache: S3ObjectCache,
+        upload_digests: UploadDigests,
+    ) -> ResumableUploadService:
+        user_org_repository = AsyncMock()
+        user_org_repository.get_user_org_id.return_value = org_id
+        settings = MagicMock()
+        settings.exchange_upload_part_max_bytes = 2 * MIN_PART_BYTES
+        settings.exchange_upload_max_bytes = 4 * MIN_PART_BYTES
+        auth_info = MagicMock()
+        auth_info.auth_provider_id = "user_01KEHRJ8JTMM2NZ2MQFX30C5T3"
+        return ResumableUploadService(
+            exchange_file_service=mock_exchange_file_service,
+            s3_service=mock_s3_service,
+            object_cache=object_cache,
+            user_org_repository=user_org_repository,
+            upload_digests=upload_digests,
+            settings=settings,
+            auth_info=auth_info,
+        )
+
+    async def _complete(self, service: ResumableUploadService, key: str) -> object:
+        return await service.complete(
+            upload_id="up-1",
+            key=key,
+            file_name="sales.csv",
+            reporting_period="2024-01",
+            is_pos=True,
+            is_pot=False,
+            target_org_ids=[uuid.uuid4()],
+        )
+
+    @pytest.mark.asyncio
+    async def test_initiate_starts_multipart_upload_under_org_prefix(
+        self,
+        service: ResumableUploadService,
+        mock_client: MagicMock,
+        org_id: uuid.UUID,
+    ) -> None:
+        upload = await service.initiate("sales.xlsx")
+
+        assert upload.upload_id == "up-1"
+        assert upload.key.startswith(f"exchange-files/{org_id}/uploads/")
+        assert upload.key.endswith(".xlsx")
+        kwargs = mock_client.create_multipart_upload.call_args.kwargs
+        assert kwargs["Key"] == f"tenant/{upload.key}"
+        assert kwargs["ChecksumAlgorithm"] == "SHA256"
+
+    @pytest.mark.asyncio
+    async def test_initiate_rejects_invalid_file_type(
+        self,
+        service: ResumableUploadService,
+    ) -> None:
+        with pytest.raises(InvalidFileTypeError):
+            await service.initiate("sales.pdf")
+
+    @pytest.mark.asyncio
+    async def test_upload_part_sends_part_checksum(
+        self,
+        service: ResumableUploadService,
+        mock_client: MagicMock,
+        key: str,
+    ) -> None:
+        part = await service.upload_part("up-1", key, 2, PART_TWO)
+
+        assert part.part_number == 2
+        assert part.size == len(PART_TWO)
+        assert part.checksum == _checksum(PART_TWO)
+        kwargs = mock_client.upload_part.call_args.kwargs
+        assert kwargs["UploadId"] == "up-1"
+        assert kwargs["PartNumber"] == 2
+        assert kwargs["ChecksumSHA256"] == _checksum(PART_TWO)
+
+    @pytest.mark.asyncio
+    async def test_read_part_stops_one_byte_past_the_limit(
+        self,
+        service: ResumableUploadService,
+        mock_client: MagicMock,
+        key: str,
+    ) -> None:
+        """An oversized part is rejected after reading just past the limit."""
+        upload = AsyncMock()
+        upload.read.side_effect = lambda size: (b"x" * (3 * MIN_PART_BYTES))[:size]
+
+        content = await service.read_part(upload)
+
+        upload.read.assert_awaited_once_with(2 * MIN_PART_BYTES + 1)
+        with pytest.raises(InvalidUploadRequestError):
+            await service.upload_part("up-1", key, 1, content)
+        mock_client.upload_part.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("part_number", "content"),
+        [(0, b"x"), (10_001, b"x"), (1, b""), (1, b"x" * (2 * MIN_PART_BYTES + 1))],
+    )
+    async def test_upload_part_rejects_invalid_parts(
+        self,
+        service: ResumableUploadService,
+        mock_client: MagicMock,
+        key: str,
+        part_number: int,
+        content: bytes,
+    ) -> None:
+        with pytest.raises(InvalidUploadRequestError):
+            await service.upload_part("up-1", key, part_number, content)
+
+        mock_client.upload_part.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "foreign_key",
+        [
+            f"exchange-files/{uuid.uuid4()}/uploads/{uuid.uuid4()}.csv",
+            "exchange-files/other.csv",
+        ],
+    )
+    async def test_rejects_keys_outside_caller_org(
+        self,
+        service: ResumableUploadService,
+        mock_client: MagicMock,
+        foreign_key: str,
+    ) -> None:
+        with pytest.raises(UploadNotFoundError):
+            await service.list_parts("up-1", foreign_key)
+
+        mock_client.list_parts.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_parts_follows_pagination(
+        self,
+        service: ResumableUploadService,
+        mock_client: MagicMock,
+        key: str,
+    ) -> None:
+        mock_client.list_parts.side_effect = [
+            {
+                "Parts": [{"PartNumber": 1, "Size": 5, "ETag": "e1"}],
+                "IsTruncated": True,
+                "NextPartNumberMarker": 1,
+            },
+            {
+                "Parts": [{"PartNumber": 2, "Size": 3, "ETag": "e2"}],
+                "IsTruncated": False,
+            },
+        ]
+
+        parts = await service.list_parts("up-1", key)
+
+        assert [part.part_number for part in parts] == [1, 2]
+        assert mock_client.list_parts.call_args.kwargs["PartNumberMarker"] == 1
+
+    @pytest.mark.asyncio
+    async def test_list_parts_raises_for_unknown_upload(
+        self,
+        service: ResumableUploadService,
+        mock_client: MagicMock,
+        key: str,
+    ) -> None:
+        mock_client.list_parts.side_effect = S3ClientError("NoSuchUpload")
+
+        with pytest.raises(UploadNotFoundError):
+            await service.list_parts("up-1", key)
+
+    @pytest.mark.asyncio
+    async def test_complete_uses_running_digest(
+        self,
+        service: ResumableUploadService,
+        mock_client: MagicMock,
+        mock_exchange_file_service: AsyncMock,
+        org_id: uuid.UUID,
+        key: str,
+    ) -> None:
+        await service.upload_part("up-1", key, 1, PART_ONE)
+        await service.upload_part("up-1", key, 2, PART_TWO)
+
+        result = await self._complete(service, key)
+
+        assert result == mock_exchange_file_service.create_file.return_value
+        mock_client.get_object.assert_not_called()
+        completed = mock_client.complete_multipart_upload.call_args.kwargs
+        assert [p["PartNumber"] for p in completed["MultipartUpload"]["Parts"]] == [
+            1,
+            2,
+        ]
+        kwargs = mock_exchange_file_service.create_file.call_args.kwargs
+        assert kwargs["file_sha"] == hashlib.sha256(PART_ONE + PART_TWO).hexdigest()
+        assert kwargs["file_size"] == len(PART_ONE) + len(PART_TWO)
+        file_sha = hashlib.sha256(PART_ONE + PART_TWO).hexdigest()
+        assert kwargs["s3_key"] == f"exchange-files/{org_id}/{file_sha}.csv"
+        assert kwargs["row_count"] == MIN_PART_BYTES // 64
+        mock_client.copy_object.assert_awaited_once_with(
+            Bucket="bucket",
+            Key=f"tenant/exchange-files/{org_id}/{file_sha}.csv",
+            CopySource={"Bucket": "bucket", "Key": f"tenant/{key}"},
+        )
+        mock_client.delete_object.assert_awaited_once_with(
+            Bucket="bucket", Key=f"tenant/{key}"
+        )
+
+    @pytest.mark.asyncio
+    async def test_complete_hashes_object_without_running_digest(
+        self,
+        service: ResumableUploadService,
+        mock_client: MagicMock,
+        mock_exchange_file_service: AsyncMock,
+        key: str,
+    ) -> None:
+        await self._complete(service, key)
+
+        mock_client.get_object.assert_awaited_once()
+        kwargs = mock_exchange_file_service.create_file.call_args.kwargs
+        assert kwargs["file_sha"] == hashlib.sha256(PART_ONE + PART_TWO).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_complete_rejects_missing_part(
+        self,
+        service: ResumableUploadService,
+        mock_client: MagicMock,
+        key: str,
+    ) -> None:
+        mock_client.list_parts.return_value = {
+            "Parts": [{"PartNumber": 2, "Size": 4, "ETag": "e2"}],
+            "IsTruncated": False,
+        }
+
+        with pytest.raises(IncompleteUploadError):
+            await self._complete(service, key)
+
+        mock_client.complete_multipart_upload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_complete_rejects_small_middle_part(
+        self,
+        service: ResumableUploadService,
+        mock_client: MagicMock,
+        key: str,
+    ) -> None:
+        mock_client.list_parts.return_value = {
+            "Parts": [
+                {"PartNumber": 1, "Size": 4, "ETag": "e1"},
+                {"PartNumber": 2, "Size": 4, "ETag": "e2"},
+            ],
+            "IsTruncated": False,
+        }
+
+        with pytest.raises(InvalidUploadRequestError):
+            await self._complete(service, key)
+
+    @pytest.mark.asyncio
+    async def test_complete_deletes_duplicate_file(
+        self,
+        service: ResumableUploadService,
+        mock_client: MagicMock,
+        mock_exchange_file_service: AsyncMock,
+        key: str,
+    ) -> None:
+        mock_exchange_file_service.check_duplicate.side_effect = (
+            DuplicateFileForTargetError("duplicate")
+        )
+
+        with pytest.raises(DuplicateFileForTargetError):
+            await self._complete(service, key)
+
+        mock_client.delete_object.assert_awaited_once()
+        mock_client.copy_object.assert_not_called()
+        mock_exchange_file_service.create_file.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_abort_aborts_multipart_upload(
+        self,
+        service: ResumableUploadService,
+        mock_client: MagicMock,
+        key: str,
+    ) -> None:
+        assert await service.abort("up-1", key) is True
+
+        mock_client.abort_multipart_upload.assert_awaited_once()
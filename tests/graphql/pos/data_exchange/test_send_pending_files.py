@@ -59,6 +59,7 @@ class TestSendPendingFiles:
             org_search_repository=mock_org_search_repository,
             validation_issue_repository=mock_validation_issue_repository,
             auth_info=mock_auth_info,
+            delivery_service=AsyncMock(),
         )
 
     @pytest.mark.asyncio
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from app.graphql.organizations.repositories import OrganizationSearchRepository
+from app.graphql.pos.dashboard.glance_cache import DashboardGlanceCache
 from app.graphql.pos.data_exchange.models import ExchangeFile, ExchangeFileStatus
 from app.graphql.pos.data_exchange.repositories.exchange_file_repository import (
     ExchangeFileRepository,
@@ -29,7 +30,10 @@ class TestListSentFilesRepository:
 
     @pytest.fixture
     def repository(self, mock_session: AsyncMock) -> ExchangeFileRepository:
-        return ExchangeFileRepository(session=mock_session)
+        return ExchangeFileRepository(
+            session=mock_session,
+            glance_cache=DashboardGlanceCache(max_entries=10, ttl_seconds=60),
+        )
 
     @staticmethod
     def _create_mock_file(
@@ -203,6 +207,7 @@ class TestGetSentFilesGroupedService:
             org_search_repository=mock_org_search_repository,
             validation_issue_repository=mock_validation_issue_repository,
             auth_info=mock_auth_info,
+            delivery_service=AsyncMock(),
         )
 
     @staticmethod
@@ -0,0 +1,70 @@
+import hashlib
+
+from app.graphql.pos.data_exchange.upload_digests import UploadDigests
+
+
+class TestUploadDigests:
+    def test_in_order_parts_give_file_digest(self) -> None:
+        digests = UploadDigests(max_entries=8)
+
+        digests.add_part("u", 1, "c1", b"hello ")
+        digests.add_part("u", 2, "c2", b"world")
+
+        assert digests.hexdigest("u", ["c1", "c2"]) == (
+            hashlib.sha256(b"hello world").hexdigest()
+        )
+
+    def test_digest_must_cover_exactly_the_listed_parts(self) -> None:
+        digests = UploadDigests(max_entries=8)
+
+        digests.add_part("u", 1, "c1", b"hello ")
+        digests.add_part("u", 2, "c2", b"world")
+
+        assert digests.hexdigest("u", ["c1"]) is None
+        assert digests.hexdigest("u", ["c1", "other"]) is None
+
+    def test_out_of_order_part_drops_digest(self) -> None:
+        digests = UploadDigests(max_entries=8)
+
+        digests.add_part("u", 1, "c1", b"hello ")
+        digests.add_part("u", 3, "c3", b"!")
+
+        assert digests.hexdigest("u", ["c1"]) is None
+
+    def test_upload_not_started_at_part_one_is_not_tracked(self) -> None:
+        digests = UploadDigests(max_entries=8)
+
+        digests.add_part("u", 2, "c2", b"world")
+
+        assert digests.hexdigest("u", ["c2"]) is None
+
+    def test_retried_part_with_same_bytes_keeps_digest(self) -> None:
+        digests = UploadDigests(max_entries=8)
+
+        digests.add_part("u", 1, "c1", b"hello ")
+        digests.add_part("u", 1, "c1", b"hello ")
+        digests.add_part("u", 2, "c2", b"world")
+
+        assert digests.hexdigest("u", ["c1", "c2"]) == (
+            hashlib.sha256(b"hello world").hexdigest()
+        )
+
+    def test_replaced_part_drops_digest(self) -> None:
+        digests = UploadDigests(max_entries=8)
+
+        digests.add_part("u", 1, "c1", b"hello ")
+        digests.add_part("u", 1, "changed", b"howdy ")
+
+        assert digests.hexdigest("u", ["changed"]) is None
+
+    def test_evicts_least_recently_used_upload(self) -> None:
+        digests = UploadDigests(max_entries=2)
+
+        digests.add_part("a", 1, "c", b"a")
+        digests.add_part("b", 1, "c", b"b")
+        digests.add_part("a", 2, "d", b"a")
+        digests.add_part("c", 1, "c", b"c")
+
+        assert digests.hexdigest("a", ["c", "d"]) is not None
+        assert digests.hexdigest("b", ["c"]) is None
+        assert digests.hexdigest("c", ["c"]) is not None
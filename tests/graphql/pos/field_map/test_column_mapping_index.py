@@ -0,0 +1,89 @@
+from datetime import date
+
+import pytest
+
+from app.graphql.pos.field_map.models.field_map_config import DEFAULT_FIELD_KEYS
+from app.graphql.pos.field_map.models.field_map_enums import FieldType
+from app.graphql.pos.field_map.services.column_mapping_index import (
+    STANDARD_FIELD_INDEX,
+    sniff_field_type,
+    tokenize,
+    type_compatibility,
+)
+
+
+class TestTokenize:
+    def test_splits_camel_case_and_expands_abbreviations(self) -> None:
+        """Header spellings normalize to the words used by standard fields."""
+        assert tokenize("MfrCatNo") == ["manufacturer", "catalog", "number"]
+        assert tokenize("Branch #") == ["branch", "number"]
+        assert tokenize("Qty_Shipped") == ["quantity", "ship"]
+
+    def test_drops_stopwords_and_plurals(self) -> None:
+        assert tokenize("Unit of Measures") == ["unit", "measure"]
+
+
+class TestSniffFieldType:
+    @pytest.mark.parametrize(
+        ("values", "expected"),
+        [
+            (["2024-01-31", "1/2/24"], FieldType.DATE),
+            ([date(2024, 1, 31)], FieldType.DATE),
+            (["12", "1,200", 7], FieldType.INTEGER),
+            (["12", "$3.50"], FieldType.DECIMAL),
+            (["02134", "10001"], FieldType.TEXT),
+            (["EA", "12"], FieldType.TEXT),
+            (["", None], None),
+        ],
+    )
+    def test_detects_majority_type(
+        self,
+        values: list[object],
+        expected: FieldType | None,
+    ) -> None:
+        assert sniff_field_type(values) == expected
+
+    def test_unknown_type_is_compatible_with_everything(self) -> None:
+        assert type_compatibility(None, FieldType.DATE) == 1.0
+        assert type_compatibility(FieldType.TEXT, FieldType.DECIMAL) == 0.0
+
+
+class TestStandardFieldIndex:
+    @pytest.mark.parametrize(
+        ("header", "expected_key"),
+        [
+            ("Invoice Date", "transaction_date"),
+            ("Mfr Cat No", "manufacturer_catalog_number"),
+            ("UPC", "upc_code"),
+            ("UOM", "unit_of_measure"),
+            ("Qty Shipped", "quantity_units_sold"),
+            ("Unit Price", "distributor_unit_cost"),
+            ("Net Sales", "extended_net_price"),
+            ("Ship-From Branch", "shipping_branch_number"),
+        ],
+    )
+    def test_ranks_expected_field_first(self, header: str, expected_key: str) -> None:
+        suggestions = STANDARD_FIELD_INDEX.suggest(header)
+
+        assert suggestions[0].standard_field_key == expected_key
+
+    def test_every_standard_name_matches_itself(self) -> None:
+        """Headers copied from the standard template map back exactly."""
+        for field in STANDARD_FIELD_INDEX.fields:
+            suggestions = STANDARD_FIELD_INDEX.suggest(field.config.standard_field_name)
+            assert suggestions[0].standard_field_key == field.config.key
+            assert suggestions[0].score == 1.0
+        assert len(STANDARD_FIELD_INDEX.fields) == len(DEFAULT_FIELD_KEYS)
+
+    def test_sample_type_breaks_ties(self) -> None:
+        """A date-typed column is not suggested for a numeric field."""
+        numeric = STANDARD_FIELD_INDEX.suggest("Unit Price", FieldType.DECIMAL)
+        dated = STANDARD_FIELD_INDEX.suggest("Unit Price", FieldType.DATE)
+
+        assert dated[0].score < numeric[0].score
+
+    def test_unrelated_header_has_no_suggestions(self) -> None:
+        assert STANDARD_FIELD_INDEX.suggest("Random Notes") == []
+
+    def test_limits_number_of_suggestions(self) -> None:
+        assert len(STANDARD_FIELD_INDEX.suggest("Branch", limit=2)) == 2
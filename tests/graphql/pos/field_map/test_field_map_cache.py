@@ -0,0 +1,70 @@
+import uuid
+from unittest.mock import MagicMock, patch
+
+from app.graphql.pos.field_map.field_map_cache import (
+    FieldMapCache,
+    FieldMapCacheKey,
+    FieldMapSnapshot,
+)
+
+
+class TestFieldMapCache:
+    @staticmethod
+    def _key(tenant: str = "acme") -> FieldMapCacheKey:
+        return (tenant, uuid.uuid4(), "pos", "send")
+
+    @staticmethod
+    def _snapshot() -> FieldMapSnapshot:
+        return MagicMock(spec=FieldMapSnapshot)
+
+    def test_put_is_dropped_when_a_save_raced_the_load(self) -> None:
+        """A load that started before a save does not populate the cache."""
+        cache = FieldMapCache(max_entries=10, ttl_seconds=60)
+        key = self._key()
+
+        version = cache.version("acme")
+        cache.invalidate_tenant("acme")
+        cache.put(key, self._snapshot(), version)
+
+        assert cache.get(key) == (False, None)
+
+    def test_invalidate_tenant_leaves_other_tenants(self) -> None:
+        """Saves only drop the saving tenant's maps."""
+        cache = FieldMapCache(max_entries=10, ttl_seconds=60)
+        acme_key, other_key = self._key("acme"), self._key("other")
+        snapshot = self._snapshot()
+        cache.put(acme_key, snapshot, 0)
+        cache.put(other_key, snapshot, 0)
+
+        cache.invalidate_tenant("acme")
+
+        assert cache.get(acme_key) == (False, None)
+        assert cache.get(other_key) == (True, snapshot)
+
+    def test_entries_expire_after_ttl(self) -> None:
+        """Saves made by other workers are picked up within the TTL."""
+        cache = FieldMapCache(max_entries=10, ttl_seconds=60)
+        key = self._key()
+
+        with patch(
+            "app.graphql.pos.field_map.field_map_cache.time.monotonic"
+        ) as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            cache.put(key, None, 0)
+            mock_monotonic.return_value = 159.0
+            assert cache.get(key) == (True, None)
+            mock_monotonic.return_value = 160.0
+            assert cache.get(key) == (False, None)
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """The cache holds at most `max_entries` maps."""
+        cache = FieldMapCache(max_entries=2, ttl_seconds=60)
+        first, second, third = self._key(), self._key(), self._key()
+        cache.put(first, None, 0)
+        cache.put(second, None, 0)
+        cache.get(first)
+
+        cache.put(third, None, 0)
+
+        assert cache.get(first)[0]
+        assert not cache.get(second)[0]
@@ -62,7 +62,7 @@ class TestFieldMapQueries:
         mock_repository: AsyncMock,
     ) -> None:
         """Returns virtual defaults with id=None when no DB record exists."""
-        mock_repository.get_by_org_and_type.return_value = None
+        mock_repository.get_cached_by_org_and_type.return_value = None
 
         result = await self._call_field_map(
             queries=queries,
@@ -84,7 +84,7 @@ class TestFieldMapQueries:
     ) -> None:
         """Returns actual record with real ID when exists in DB."""
         existing_map = self._create_mock_field_map()
-        mock_repository.get_by_org_and_type.return_value = existing_map
+        mock_repository.get_cached_by_org_and_type.return_value = existing_map
 
         result = await self._call_field_map(
             queries=queries,
@@ -104,7 +104,7 @@ class TestFieldMapQueries:
         mock_repository: AsyncMock,
     ) -> None:
         """Returns virtual defaults for POT map type."""
-        mock_repository.get_by_org_and_type.return_value = None
+        mock_repository.get_cached_by_org_and_type.return_value = None
 
         result = await self._call_field_map(
             queries=queries,
@@ -125,7 +125,7 @@ class TestFieldMapQueries:
         mock_repository: AsyncMock,
     ) -> None:
         """Returns virtual defaults for RECEIVE direction."""
-        mock_repository.get_by_org_and_type.return_value = None
+        mock_repository.get_cached_by_org_and_type.return_value = None
 
         result = await self._call_field_map(
             queries=queries,
@@ -147,7 +147,7 @@ class TestFieldMapQueries:
     ) -> None:
         """Returns virtual defaults with correct organization_id."""
         org_id = uuid.uuid4()
-        mock_repository.get_by_org_and_type.return_value = None
+        mock_repository.get_cached_by_org_and_type.return_value = None
 
         result = await self._call_field_map(
             queries=queries,
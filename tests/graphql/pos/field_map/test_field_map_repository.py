@@ -2,7 +2,11 @@ import uuid
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.graphql.pos.field_map.field_map_cache import FieldMapCache
 from app.graphql.pos.field_map.models.field_map import FieldMap, FieldMapField
 from app.graphql.pos.field_map.models.field_map_enums import (
     FieldCategory,
@@ -19,11 +23,25 @@ from app.graphql.pos.field_map.repositories.field_map_repository import (
 class TestFieldMapRepository:
     @pytest.fixture
     def mock_session(self) -> AsyncMock:
-        return AsyncMock()
+        session = AsyncMock()
+        session.sync_session = Session()
+        return session
 
     @pytest.fixture
-    def repository(self, mock_session: AsyncMock) -> FieldMapRepository:
-        return FieldMapRepository(session=mock_session)
+    def cache(self) -> FieldMapCache:
+        return FieldMapCache(max_entries=10, ttl_seconds=60)
+
+    @pytest.fixture
+    def repository(
+        self,
+        mock_session: AsyncMock,
+        cache: FieldMapCache,
+    ) -> FieldMapRepository:
+        return FieldMapRepository(
+            session=mock_session,
+            cache=cache,
+            auth_info=MagicMock(tenant_name="acme"),
+        )
 
     @staticmethod
     def _create_mock_field_map(
@@ -171,13 +189,19 @@ class TestFieldMapRepository:
         field_map_id = uuid.uuid4()
         fields = [
             self._create_mock_field(
-                field_map_id, standard_field_key="field_1", standard_field_name="Field 1"
+                field_map_id,
+                standard_field_key="field_1",
+                standard_field_name="Field 1",
             ),
             self._create_mock_field(
-                field_map_id, standard_field_key="field_2", standard_field_name="Field 2"
+                field_map_id,
+                standard_field_key="field_2",
+                standard_field_name="Field 2",
             ),
             self._create_mock_field(
-                field_map_id, standard_field_key="field_3", standard_field_name="Field 3"
+                field_map_id,
+                standard_field_key="field_3",
+                standard_field_name="Field 3",
             ),
         ]
 
@@ -324,3 +348,175 @@ class TestFieldMapRepository:
 
         assert result == mock_map
         mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_cached_by_org_and_type_queries_once(
+        self,
+        repository: FieldMapRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Repeated reads are served from the cache as independent copies."""
+        org_id = uuid.uuid4()
+        mock_map = self._create_mock_field_map(organization_id=org_id)
+        mock_map.created_by_id = uuid.uuid4()
+        mock_map.fields = [self._create_mock_field(mock_map.id)]
+
+        mock_result = MagicMock()
+        mock_result.unique.return_value.scalar_one_or_none.return_value = mock_map
+        mock_session.execute.return_value = mock_result
+
+        first = await repository.get_cached_by_org_and_type(org_id, FieldMapType.POS)
+        second = await repository.get_cached_by_org_and_type(org_id, FieldMapType.POS)
+
+        mock_session.execute.assert_called_once()
+        assert first is not None
+        assert second is not None
+        assert first is not second
+        assert first.id == second.id == mock_map.id
+        assert [f.standard_field_key for f in second.fields] == ["test_field"]
+
+    @pytest.mark.asyncio
+    async def test_get_cached_by_org_and_type_caches_missing_map(
+        self,
+        repository: FieldMapRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Orgs without a map do not query again."""
+        mock_result = MagicMock()
+        mock_result.unique.return_value.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        await repository.get_cached_by_org_and_type(None, FieldMapType.POS)
+        result = await repository.get_cached_by_org_and_type(None, FieldMapType.POS)
+
+        assert result is None
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cache_and_bypass_it(
+        self,
+        repository: FieldMapRepository,
+        mock_session: AsyncMock,
+        cache: FieldMapCache,
+    ) -> None:
+        """After a write the session reads its own changes from the database."""
+        mock_result = MagicMock()
+        mock_result.unique.return_value.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+        await repository.get_cached_by_org_and_type(None, FieldMapType.POS)
+
+        await repository.update_field(self._create_mock_field(uuid.uuid4()))
+        await repository.get_cached_by_org_and_type(None, FieldMapType.POS)
+        await repository.get_cached_by_org_and_type(None, FieldMapType.POS)
+
+        assert cache.version("acme") == 1
+        assert mock_session.execute.call_count == 3
+
+    @staticmethod
+    def _create_field(field_map_id: uuid.UUID, key: str) -> FieldMapField:
+        return FieldMapField(
+            field_map_id=field_map_id,
+            standard_field_key=key,
+            category=FieldCategory.CUSTOM_COLUMNS.value,
+            standard_field_name=key.title(),
+            status=FieldStatus.OPTIONAL.value,
+            field_type=FieldType.TEXT.value,
+        )
+
+    @staticmethod
+    def _compile(statement: object) -> str:
+        return str(statement.compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_reconcile_fields_issues_one_statement_per_change_kind(
+        self,
+        repository: FieldMapRepository,
+        mock_session: AsyncMock,
+        cache: FieldMapCache,
+    ) -> None:
+        """Updates, inserts and deletes are each applied with a single statement."""
+        field_map = FieldMap(map_type=FieldMapType.POS.value)
+        kept, renamed, removed = (
+            self._create_field(field_map.id, key) for key in ("kept", "renamed", "gone")
+        )
+        set_committed_value(field_map, "fields", [kept, renamed, removed])
+        added = [self._create_field(field_map.id, key) for key in ("new_1", "new_2")]
+
+        update_result = MagicMock()
+        update_result.scalars.return_value.all.return_value = [renamed]
+        insert_result = MagicMock()
+        insert_result.scalars.return_value.all.return_value = added
+        mock_session.execute.side_effect = [update_result, insert_result, MagicMock()]
+
+        updates = [
+            {
+                "id": renamed.id,
+                "organization_field_name": "col",
+                "linked": True,
+                "manufacturer": True,
+                "rep": None,
+                "standard_field_name": "Renamed",
+                "field_type": FieldType.TEXT.value,
+            }
+        ]
+        result = await repository.reconcile_fields(
+            field_map, updates, added, [removed.id]
+        )
+
+        update_sql, insert_sql, delete_sql = (
+            self._compile(call.args[0]) for call in mock_session.execute.call_args_list
+        )
+        assert update_sql.startswith("UPDATE connect_pos.field_map_fields SET")
+        assert "FROM (VALUES" in update_sql
+        assert "RETURNING" in update_sql
+        assert insert_sql.startswith("INSERT INTO connect_pos.field_map_fields")
+        assert insert_sql.count("VALUES") == 1
+        assert insert_sql.count("(%(field_map_id_m") == 2
+        assert delete_sql.startswith("DELETE FROM connect_pos.field_map_fields")
+        assert result is field_map
+        assert result.fields == [kept, renamed, *added]
+        assert cache.version("acme") == 1
+
+    @pytest.mark.asyncio
+    async def test_reconcile_fields_inserts_no_explicit_nulls_for_unset_columns(
+        self,
+        repository: FieldMapRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Columns no new field sets are left to their defaults; ids are generated."""
+        field_map = FieldMap(map_type=FieldMapType.POS.value)
+        set_committed_value(field_map, "fields", [])
+        mapped, unmapped = (
+            self._create_field(field_map.id, key) for key in ("mapped", "unmapped")
+        )
+        mapped.organization_field_name = "col"
+        mapped.id = None  # pyright: ignore[reportAttributeAccessIssue]
+        mock_session.execute.return_value = MagicMock()
+
+        await repository.reconcile_fields(field_map, [], [mapped, unmapped], [])
+
+        insert_stmt = mock_session.execute.call_args.args[0]
+        params = insert_stmt.compile(dialect=postgresql.dialect()).params
+        assert "standard_field_name_description_m0" not in params
+        assert params["organization_field_name_m0"] == "col"
+        assert params["organization_field_name_m1"] is None
+        assert isinstance(params["id_m0"], uuid.UUID)
+
+    @pytest.mark.asyncio
+    async def test_reconcile_fields_skips_empty_change_kinds(
+        self,
+        repository: FieldMapRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Only the statements with work to do are executed."""
+        field_map = FieldMap(map_type=FieldMapType.POS.value)
+        removed = self._create_field(field_map.id, "gone")
+        set_committed_value(field_map, "fields", [removed])
+
+        result = await repository.reconcile_fields(field_map, [], [], [removed.id])
+
+        mock_session.execute.assert_awaited_once()
+        assert self._compile(mock_session.execute.call_args.args[0]).startswith(
+            "DELETE"
+        )
+        assert result.fields == []
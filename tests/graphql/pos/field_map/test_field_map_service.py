@@ -181,9 +181,23 @@ class TestFieldMapService:
 
         await service.save_fields(org_id, FieldMapType.POS, field_inputs)
 
-        mock_repository.update_field.assert_called_once()
-        assert existing_field.organization_field_name == "my_date"
-        assert existing_field.linked is True
+        mock_repository.reconcile_fields.assert_awaited_once()
+        _, updates, new_fields, deleted_ids = (
+            mock_repository.reconcile_fields.call_args.args
+        )
+        assert updates == [
+            {
+                "id": existing_field.id,
+                "organization_field_name": "my_date",
+                "linked": True,
+                "manufacturer": True,
+                "rep": True,
+                "standard_field_name": "Test Field",
+                "field_type": FieldType.TEXT.value,
+            }
+        ]
+        assert new_fields == []
+        assert deleted_ids == []
 
     @pytest.mark.asyncio
     async def test_save_fields_adds_new_custom_field(
@@ -214,7 +228,13 @@ class TestFieldMapService:
 
         await service.save_fields(org_id, FieldMapType.POS, field_inputs)
 
-        mock_repository.add_field.assert_called_once()
+        _, updates, new_fields, deleted_ids = (
+            mock_repository.reconcile_fields.call_args.args
+        )
+        assert updates == []
+        assert [field.standard_field_key for field in new_fields] == ["my_custom_field"]
+        assert new_fields[0].field_map_id == field_map_id
+        assert deleted_ids == []
 
     @pytest.mark.asyncio
     async def test_save_fields_deletes_missing_custom_field(
@@ -244,7 +264,9 @@ class TestFieldMapService:
 
         await service.save_fields(org_id, FieldMapType.POS, field_inputs)
 
-        mock_repository.delete_field.assert_called_once_with(custom_field.id)
+        mock_repository.reconcile_fields.assert_awaited_once_with(
+            existing_map, [], [], [custom_field.id]
+        )
 
     @pytest.mark.asyncio
     async def test_save_fields_cannot_delete_default_field(
@@ -265,6 +287,8 @@ class TestFieldMapService:
         with pytest.raises(CannotDeleteDefaultFieldError):
             await service.save_fields(org_id, FieldMapType.POS, field_inputs)
 
+        mock_repository.reconcile_fields.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_cannot_edit_standard_name_of_default_field(
         self,
@@ -338,7 +362,9 @@ class TestFieldMapService:
 
         await service.save_fields(org_id, FieldMapType.POS, field_inputs)
 
-        assert field.linked is True
+        updates = mock_repository.reconcile_fields.call_args.args[1]
+        assert updates[0]["id"] == field.id
+        assert updates[0]["linked"] is True
 
     @pytest.mark.asyncio
     async def test_linked_false_when_org_field_cleared(
@@ -366,7 +392,10 @@ class TestFieldMapService:
 
         await service.save_fields(org_id, FieldMapType.POS, field_inputs)
 
-        assert field.linked is False
+        updates = mock_repository.reconcile_fields.call_args.args[1]
+        assert updates[0]["id"] == field.id
+        assert updates[0]["linked"] is False
+        assert updates[0]["organization_field_name"] is None
 
     @pytest.mark.asyncio
     async def test_manufacturer_rep_required_when_linked(
@@ -394,6 +423,113 @@ class TestFieldMapService:
         with pytest.raises(LinkedFieldValidationError):
             await service.save_fields(org_id, FieldMapType.POS, field_inputs)
 
+    @pytest.mark.asyncio
+    async def test_save_fields_skips_unchanged_fields(
+        self,
+        service: FieldMapService,
+        mock_repository: AsyncMock,
+    ) -> None:
+        """Fields whose values would not change are left out of the update."""
+        org_id, _, _, existing_map = self._setup_map_with_field(
+            mock_repository,
+            standard_field_key="transaction_date",
+            is_default=True,
+        )
+
+        field_inputs = [FieldInput(standard_field_key="transaction_date")]
+
+        await service.save_fields(org_id, FieldMapType.POS, field_inputs)
+
+        mock_repository.reconcile_fields.assert_awaited_once_with(
+            existing_map, [], [], []
+        )
+
+    @pytest.mark.asyncio
+    async def test_save_fields_returns_reconciled_map_without_reload(
+        self,
+        service: FieldMapService,
+        mock_repository: AsyncMock,
+    ) -> None:
+        """The reconciled map is returned as is, with no second fetch."""
+        org_id, _, _, _ = self._setup_map_with_field(
+            mock_repository,
+            standard_field_key="transaction_date",
+            is_default=True,
+        )
+        reconciled_map = self._create_mock_field_map(organization_id=org_id)
+        mock_repository.reconcile_fields.return_value = reconciled_map
+
+        result = await service.save_fields(
+            org_id,
+            FieldMapType.POS,
+            [FieldInput(standard_field_key="transaction_date")],
+        )
+
+        assert result is reconciled_map
+        mock_repository.get_by_org_and_type.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_save_fields_gives_new_custom_fields_unique_keys(
+        self,
+        service: FieldMapService,
+        mock_repository: AsyncMock,
+    ) -> None:
+        """Two new custom fields with the same name get distinct keys."""
+        org_id = uuid.uuid4()
+        mock_repository.get_by_org_and_type.return_value = self._create_mock_field_map(
+            organization_id=org_id, fields=[]
+        )
+
+        field_inputs = [
+            FieldInput(
+                standard_field_key=f"new_{index}",
+                standard_field_name="Region",
+                field_type=FieldType.TEXT,
+                category=FieldCategory.CUSTOM_COLUMNS,
+            )
+            for index in range(2)
+        ]
+
+        await service.save_fields(org_id, FieldMapType.POS, field_inputs)
+
+        new_fields = mock_repository.reconcile_fields.call_args.args[2]
+        assert [field.standard_field_key for field in new_fields] == [
+            "region",
+            "region_2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_save_fields_validates_before_writing(
+        self,
+        service: FieldMapService,
+        mock_repository: AsyncMock,
+    ) -> None:
+        """An invalid field later in the list prevents every write."""
+        org_id, _, _, _ = self._setup_map_with_field(
+            mock_repository,
+            standard_field_key="custom_field",
+            is_default=False,
+        )
+
+        field_inputs = [
+            FieldInput(
+                standard_field_key="custom_field",
+                standard_field_name="Renamed",
+            ),
+            FieldInput(
+                standard_field_key="another_field",
+                standard_field_name="Another",
+                field_type=FieldType.TEXT,
+                category=FieldCategory.CUSTOM_COLUMNS,
+                organization_field_name="col",
+            ),
+        ]
+
+        with pytest.raises(LinkedFieldValidationError):
+            await service.save_fields(org_id, FieldMapType.POS, field_inputs)
+
+        mock_repository.reconcile_fields.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_or_create_with_direction(
         self,
@@ -0,0 +1,83 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.graphql.pos.data_exchange.exceptions import InvalidFileTypeError
+from app.graphql.pos.field_map.models.field_map_enums import FieldType
+from app.graphql.pos.field_map.services.field_mapping_suggestion_service import (
+    CSV_SAMPLE_BYTES,
+    FieldMappingSuggestionService,
+    read_header_sample,
+)
+
+
+class TestReadHeaderSample:
+    def test_reads_header_and_limited_rows(self) -> None:
+        content = b"Invoice Date,Qty\n" + b"2024-01-02,5\n" * 100
+
+        sample = read_header_sample(content, "csv", max_rows=3)
+
+        assert sample.headers == ["Invoice Date", "Qty"]
+        assert sample.rows == [["2024-01-02", "5"]] * 3
+
+    def test_strips_bom_and_drops_truncated_line(self) -> None:
+        """Only the head of a large file is decoded, without a partial last row."""
+        row = b"1,ABCDEFGHIJ\n"
+        content = b"\xef\xbb\xbfQty,Code\n" + row * (CSV_SAMPLE_BYTES // len(row) + 10)
+
+        sample = read_header_sample(content, "csv", max_rows=10_000)
+
+        assert sample.headers == ["Qty", "Code"]
+        assert all(values == ["1", "ABCDEFGHIJ"] for values in sample.rows)
+
+
+class TestFieldMappingSuggestionService:
+    @pytest.fixture
+    def service(self) -> FieldMappingSuggestionService:
+        return FieldMappingSuggestionService()
+
+    def test_suggest_ranks_fields_per_column(
+        self,
+        service: FieldMappingSuggestionService,
+    ) -> None:
+        content = b"Invoice Date,,Mfr Cat No,Ext Price\n2024-01-02,x,AB-1,10.50\n"
+
+        columns = service.suggest(content, "csv")
+
+        assert [c.column_index for c in columns] == [0, 2, 3]
+        assert [c.detected_type for c in columns] == [
+            FieldType.DATE,
+            FieldType.TEXT,
+            FieldType.DECIMAL,
+        ]
+        assert [c.suggestions[0].standard_field_key for c in columns] == [
+            "transaction_date",
+            "manufacturer_catalog_number",
+            "extended_net_price",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_suggest_for_upload_reads_only_csv_head(
+        self,
+        service: FieldMappingSuggestionService,
+    ) -> None:
+        upload = MagicMock(filename="sales.CSV")
+        upload.read = AsyncMock(return_value=b"UPC\n012345678905\n")
+
+        columns = await service.suggest_for_upload(upload)
+
+        upload.read.assert_awaited_once_with(CSV_SAMPLE_BYTES + 1)
+        assert columns[0].suggestions[0].standard_field_key == "upc_code"
+
+    @pytest.mark.asyncio
+    async def test_suggest_for_upload_rejects_unsupported_files(
+        self,
+        service: FieldMappingSuggestionService,
+    ) -> None:
+        upload = MagicMock(filename="notes.txt")
+        upload.read = AsyncMock()
+
+        with pytest.raises(InvalidFileTypeError):
+            await service.suggest_for_upload(upload)
+
+        upload.read.assert_not_called()
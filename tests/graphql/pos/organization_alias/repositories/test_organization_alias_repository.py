@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.graphql.connections.models import ConnectionStatus
 from app.graphql.pos.organization_alias.models import OrganizationAlias
 from app.graphql.pos.organization_alias.repositories.organization_alias_repository import (
     OrganizationAliasRepository,
@@ -18,15 +19,21 @@ class TestOrganizationAliasRepository:
     def mock_orgs_session(self) -> AsyncMock:
         return AsyncMock()
 
+    @pytest.fixture
+    def mock_connection_graph(self) -> AsyncMock:
+        return AsyncMock()
+
     @pytest.fixture
     def repository(
         self,
         mock_session: AsyncMock,
         mock_orgs_session: AsyncMock,
+        mock_connection_graph: AsyncMock,
     ) -> OrganizationAliasRepository:
         return OrganizationAliasRepository(
             session=mock_session,
             orgs_session=mock_orgs_session,
+            connection_graph=mock_connection_graph,
         )
 
     @staticmethod
@@ -211,3 +218,117 @@ class TestOrganizationAliasRepository:
         result = await repository.delete(alias_id)
 
         assert result is False
+
+    @pytest.mark.asyncio
+    async def test_search_connected_org_ids_returns_matches(
+        self,
+        repository: OrganizationAliasRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Returns connected org ids of matching aliases, best match first."""
+        org_id = uuid.uuid4()
+        connected_org_ids = [uuid.uuid4(), uuid.uuid4()]
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = connected_org_ids
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.search_connected_org_ids(org_id, "acme", limit=5)
+
+        assert result == connected_org_ids
+        query = str(mock_session.execute.call_args[0][0].compile())
+        assert "similarity(connect_pos.organization_aliases.alias" in query
+        assert "LIMIT" in query
+
+    @pytest.mark.asyncio
+    async def test_get_connected_orgs_by_name_uses_connection_graph(
+        self,
+        repository: OrganizationAliasRepository,
+        mock_orgs_session: AsyncMock,
+        mock_connection_graph: AsyncMock,
+    ) -> None:
+        """Only orgs with an accepted connection in the graph are queried."""
+        user_org_id = uuid.uuid4()
+        connected_org_id = uuid.uuid4()
+        mock_connection_graph.connected_org_ids.return_value = {connected_org_id}
+        mock_org = MagicMock()
+        mock_org.name = "Acme Corp"
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [mock_org]
+        mock_orgs_session.execute.return_value = mock_result
+
+        result = await repository.get_connected_orgs_by_name(user_org_id, ["ACME CORP"])
+
+        assert result == {"acme corp": mock_org}
+        mock_connection_graph.connected_org_ids.assert_awaited_once_with(
+            mock_orgs_session, user_org_id, ConnectionStatus.ACCEPTED
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_connected_orgs_by_name_skips_query_without_connections(
+        self,
+        repository: OrganizationAliasRepository,
+        mock_orgs_session: AsyncMock,
+        mock_connection_graph: AsyncMock,
+    ) -> None:
+        """Orgs with no accepted connections never query the orgs table."""
+        mock_connection_graph.connected_org_ids.return_value = set()
+
+        result = await repository.get_connected_orgs_by_name(uuid.uuid4(), ["Acme"])
+
+        assert result == {}
+        mock_orgs_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_returns_inserted_connected_org_ids(
+        self,
+        repository: OrganizationAliasRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Inserts all aliases in one statement and returns the inserted orgs."""
+        connected_org_id = uuid.uuid4()
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [connected_org_id]
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.bulk_create(
+            uuid.uuid4(),
+            {connected_org_id: "Acme", uuid.uuid4(): "Beta"},
+            created_by_id=uuid.uuid4(),
+        )
+
+        assert result == {connected_org_id}
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_with_no_aliases_skips_query(
+        self,
+        repository: OrganizationAliasRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """An empty mapping never reaches the database."""
+        result = await repository.bulk_create(
+            uuid.uuid4(), {}, created_by_id=uuid.uuid4()
+        )
+
+        assert result == set()
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_connected_org_names_returns_accepted_orgs(
+        self,
+        repository: OrganizationAliasRepository,
+        mock_orgs_session: AsyncMock,
+        mock_connection_graph: AsyncMock,
+    ) -> None:
+        """Names are returned for the orgs the graph reports as connected."""
+        connected_org_id = uuid.uuid4()
+        mock_connection_graph.connected_org_ids.return_value = {connected_org_id}
+        mock_result = MagicMock()
+        row = MagicMock(id=connected_org_id)
+        row.name = "Acme"
+        mock_result.all.return_value = [row]
+        mock_orgs_session.execute.return_value = mock_result
+
+        result = await repository.get_connected_org_names(uuid.uuid4())
+
+        assert result == {connected_org_id: "Acme"}
@@ -3,10 +3,6 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from app.graphql.pos.organization_alias.exceptions import (
-    AliasAlreadyExistsError,
-    OrganizationNotConnectedError,
-)
 from app.graphql.pos.organization_alias.models import OrganizationAlias
 from app.graphql.pos.organization_alias.services.organization_alias_bulk_service import (
     OrganizationAliasBulkService,
@@ -14,13 +10,12 @@ from app.graphql.pos.organization_alias.services.organization_alias_bulk_service
 
 
 class TestOrganizationAliasBulkService:
-    @pytest.fixture
-    def mock_alias_service(self) -> AsyncMock:
-        return AsyncMock()
-
     @pytest.fixture
     def mock_repository(self) -> AsyncMock:
-        return AsyncMock()
+        repo = AsyncMock()
+        repo.get_all_by_org.return_value = []
+        repo.bulk_create.side_effect = lambda _org_id, aliases, **_: set(aliases)
+        return repo
 
     @pytest.fixture
     def mock_user_org_repository(self) -> AsyncMock:
@@ -37,13 +32,11 @@ class TestOrganizationAliasBulkService:
     @pytest.fixture
     def service(
         self,
-        mock_alias_service: AsyncMock,
         mock_repository: AsyncMock,
         mock_user_org_repository: AsyncMock,
         mock_auth_info: MagicMock,
     ) -> OrganizationAliasBulkService:
         return OrganizationAliasBulkService(
-            alias_service=mock_alias_service,
             repository=mock_repository,
             user_org_repository=mock_user_org_repository,
             auth_info=mock_auth_info,
@@ -71,10 +64,9 @@ class TestOrganizationAliasBulkService:
     async def test_bulk_create_succeeds(
         self,
         service: OrganizationAliasBulkService,
-        mock_alias_service: AsyncMock,
         mock_repository: AsyncMock,
     ) -> None:
-        """Creates multiple aliases successfully."""
+        """Creates multiple aliases with a single bulk insert."""
         org_id_1 = uuid.uuid4()
         org_id_2 = uuid.uuid4()
 
@@ -83,20 +75,20 @@ class TestOrganizationAliasBulkService:
             "beta inc": MagicMock(id=org_id_2, name="Beta Inc"),
         }
 
-        mock_alias_service.create_alias.side_effect = [
-            self._create_mock_alias(org_id_1, "Acme"),
-            self._create_mock_alias(org_id_2, "Beta"),
-        ]
-
-        csv_content = self._create_csv_content([
-            ("Acme Corp", "Acme"),
-            ("Beta Inc", "Beta"),
-        ])
+        csv_content = self._create_csv_content(
+            [
+                ("Acme Corp", "Acme"),
+                ("Beta Inc", "Beta"),
+            ]
+        )
 
         result = await service.bulk_create_from_csv(csv_content)
 
         assert result.inserted_count == 2
         assert len(result.failures) == 0
+        mock_repository.bulk_create.assert_awaited_once()
+        _, aliases = mock_repository.bulk_create.call_args.args
+        assert aliases == {org_id_1: "Acme", org_id_2: "Beta"}
 
     @pytest.mark.asyncio
     async def test_bulk_create_reports_org_not_found(
@@ -104,69 +96,102 @@ class TestOrganizationAliasBulkService:
         service: OrganizationAliasBulkService,
         mock_repository: AsyncMock,
     ) -> None:
-        """Reports failure when organization not found."""
+        """Reports failure when organization not found or not connected."""
         mock_repository.get_connected_orgs_by_name.return_value = {}
 
-        csv_content = self._create_csv_content([
-            ("Unknown Corp", "Unknown"),
-        ])
+        csv_content = self._create_csv_content(
+            [
+                ("Unknown Corp", "Unknown"),
+            ]
+        )
 
         result = await service.bulk_create_from_csv(csv_content)
 
         assert result.inserted_count == 0
         assert len(result.failures) == 1
         assert result.failures[0].reason == "Organization not found"
+        mock_repository.bulk_create.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_bulk_create_reports_not_connected(
+    async def test_bulk_create_reports_alias_exists(
         self,
         service: OrganizationAliasBulkService,
-        mock_alias_service: AsyncMock,
         mock_repository: AsyncMock,
     ) -> None:
-        """Reports failure when organization not connected."""
+        """Reports failure when the alias is already used by the org."""
         org_id = uuid.uuid4()
         mock_repository.get_connected_orgs_by_name.return_value = {
             "acme corp": MagicMock(id=org_id, name="Acme Corp"),
         }
-        mock_alias_service.create_alias.side_effect = OrganizationNotConnectedError(
-            "Not connected"
-        )
+        mock_repository.get_all_by_org.return_value = [
+            self._create_mock_alias(uuid.uuid4(), "ACME"),
+        ]
 
-        csv_content = self._create_csv_content([
-            ("Acme Corp", "Acme"),
-        ])
+        csv_content = self._create_csv_content(
+            [
+                ("Acme Corp", "Acme"),
+            ]
+        )
 
         result = await service.bulk_create_from_csv(csv_content)
 
         assert result.inserted_count == 0
         assert len(result.failures) == 1
-        assert result.failures[0].reason == "Organization not connected"
+        assert result.failures[0].reason == "Alias already exists"
 
     @pytest.mark.asyncio
-    async def test_bulk_create_reports_alias_exists(
+    async def test_bulk_create_reports_org_already_aliased(
         self,
         service: OrganizationAliasBulkService,
-        mock_alias_service: AsyncMock,
         mock_repository: AsyncMock,
     ) -> None:
-        """Reports failure when alias already exists."""
+        """Each connected org holds one alias, from the database or the file."""
         org_id = uuid.uuid4()
         mock_repository.get_connected_orgs_by_name.return_value = {
             "acme corp": MagicMock(id=org_id, name="Acme Corp"),
         }
-        mock_alias_service.create_alias.side_effect = AliasAlreadyExistsError(
-            "Already exists"
+
+        csv_content = self._create_csv_content(
+            [
+                ("Acme Corp", "Acme"),
+                ("Acme Corp", "Acme Inc"),
+            ]
         )
 
-        csv_content = self._create_csv_content([
-            ("Acme Corp", "Acme"),
-        ])
+        result = await service.bulk_create_from_csv(csv_content)
+
+        assert result.inserted_count == 1
+        assert [failure.row_number for failure in result.failures] == [3]
+        assert result.failures[0].reason == "Alias already exists"
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_reports_conflicts_skipped_by_insert(
+        self,
+        service: OrganizationAliasBulkService,
+        mock_repository: AsyncMock,
+    ) -> None:
+        """Rows the insert skips on conflict are reported as existing."""
+        org_id_1 = uuid.uuid4()
+        org_id_2 = uuid.uuid4()
+        mock_repository.get_connected_orgs_by_name.return_value = {
+            "acme corp": MagicMock(id=org_id_1, name="Acme Corp"),
+            "beta inc": MagicMock(id=org_id_2, name="Beta Inc"),
+        }
+        mock_repository.bulk_create.side_effect = None
+        mock_repository.bulk_create.return_value = {org_id_1}
+
+        csv_content = self._create_csv_content(
+            [
+                ("Acme Corp", "Acme"),
+                ("Beta Inc", "Beta"),
+            ]
+        )
 
         result = await service.bulk_create_from_csv(csv_content)
 
-        assert result.inserted_count == 0
+        assert result.inserted_count == 1
         assert len(result.failures) == 1
+        assert result.failures[0].organization_name == "Beta Inc"
         assert result.failures[0].reason == "Alias already exists"
 
     @pytest.mark.asyncio
@@ -193,30 +218,27 @@ class TestOrganizationAliasBulkService:
     async def test_bulk_create_partial_success(
         self,
         service: OrganizationAliasBulkService,
-        mock_alias_service: AsyncMock,
         mock_repository: AsyncMock,
     ) -> None:
-        """Some rows succeed, some fail, returns correct counts."""
+        """Some rows succeed, some fail, failures keep file order."""
         org_id_1 = uuid.uuid4()
-        org_id_2 = uuid.uuid4()
 
         mock_repository.get_connected_orgs_by_name.return_value = {
             "acme corp": MagicMock(id=org_id_1, name="Acme Corp"),
-            "beta inc": MagicMock(id=org_id_2, name="Beta Inc"),
         }
 
-        mock_alias_service.create_alias.side_effect = [
-            self._create_mock_alias(org_id_1, "Acme"),
-            AliasAlreadyExistsError("Already exists"),
-        ]
-
-        csv_content = self._create_csv_content([
-            ("Acme Corp", "Acme"),
-            ("Beta Inc", "Beta"),
-        ])
+        csv_content = self._create_csv_content(
+            [
+                ("Unknown Corp", "Unknown"),
+                ("Acme Corp", "Acme"),
+                ("Beta Inc", "Beta"),
+            ]
+        )
 
         result = await service.bulk_create_from_csv(csv_content)
 
         assert result.inserted_count == 1
-        assert len(result.failures) == 1
-        assert result.failures[0].organization_name == "Beta Inc"
+        assert [failure.organization_name for failure in result.failures] == [
+            "Unknown Corp",
+            "Beta Inc",
+        ]
@@ -0,0 +1,87 @@
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.graphql.pos.agreement.loaders.agreement_loader import AgreementLoader
+from app.graphql.pos.agreement.models.agreement import Agreement
+
+
+class TestAgreementLoader:
+    @pytest.fixture
+    def mock_repository(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def loader(self, mock_repository: AsyncMock) -> AgreementLoader:
+        return AgreementLoader(repository=mock_repository)
+
+    @staticmethod
+    def _create_mock_agreement(connected_org_id: uuid.UUID) -> MagicMock:
+        mock_agreement = MagicMock(spec=Agreement)
+        mock_agreement.connected_org_id = connected_org_id
+        return mock_agreement
+
+    @pytest.mark.asyncio
+    async def test_load_many_issues_single_query(
+        self,
+        loader: AgreementLoader,
+        mock_repository: AsyncMock,
+    ) -> None:
+        """All keys are fetched with one repository call, in key order."""
+        org_ids = [uuid.uuid4() for _ in range(3)]
+        agreements = [self._create_mock_agreement(org_id) for org_id in org_ids]
+        mock_repository.get_by_connected_org_ids.return_value = list(
+            reversed(agreements)
+        )
+
+        result = await loader.load_many(org_ids)
+
+        assert result == agreements
+        mock_repository.get_by_connected_org_ids.assert_awaited_once_with(org_ids)
+
+    @pytest.mark.asyncio
+    async def test_missing_keys_resolve_to_none(
+        self,
+        loader: AgreementLoader,
+        mock_repository: AsyncMock,
+    ) -> None:
+        """Orgs without an agreement resolve to None."""
+        mock_repository.get_by_connected_org_ids.return_value = []
+
+        result = await loader.load(uuid.uuid4())
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_are_coalesced_and_cached(
+        self,
+        loader: AgreementLoader,
+        mock_repository: AsyncMock,
+    ) -> None:
+        """Loads in the same tick share a batch; repeated keys hit the cache."""
+        first, second = uuid.uuid4(), uuid.uuid4()
+        mock_repository.get_by_connected_org_ids.return_value = [
+            self._create_mock_agreement(first),
+            self._create_mock_agreement(second),
+        ]
+
+        await asyncio.gather(loader.load(first), loader.load(second))
+        await loader.load(first)
+
+        mock_repository.get_by_connected_org_ids.assert_awaited_once_with(
+            [first, second]
+        )
+
+    @pytest.mark.asyncio
+    async def test_load_many_with_no_keys_skips_query(
+        self,
+        loader: AgreementLoader,
+        mock_repository: AsyncMock,
+    ) -> None:
+        """Empty key lists never reach the database."""
+        result = await loader.load_many([])
+
+        assert result == []
+        mock_repository.get_by_connected_org_ids.assert_not_called()
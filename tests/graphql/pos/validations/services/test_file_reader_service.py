@@ -1,9 +1,12 @@
+import hashlib
 import io
 import uuid
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.core.s3.object_cache import S3ObjectCache
 from app.graphql.pos.field_map.models.field_map import FieldMap, FieldMapField
 from app.graphql.pos.field_map.models.field_map_enums import (
     FieldCategory,
@@ -22,8 +25,15 @@ class TestFileReaderService:
         return AsyncMock()
 
     @pytest.fixture
-    def service(self, mock_s3_service: AsyncMock) -> FileReaderService:
-        return FileReaderService(s3_service=mock_s3_service)
+    def service(
+        self,
+        mock_s3_service: AsyncMock,
+        tmp_path: Path,
+    ) -> FileReaderService:
+        return FileReaderService(
+            s3_service=mock_s3_service,
+            object_cache=S3ObjectCache(tmp_path, max_bytes=1024),
+        )
 
     @staticmethod
     def _create_field_map_field(
@@ -66,6 +76,28 @@ class TestFileReaderService:
         assert rows[1].row_number == 3
         assert rows[1].data == {"Name": "Bob", "Amount": "200", "Date": "2026-01-02"}
 
+    @pytest.mark.asyncio
+    async def test_read_file_with_sha_reads_through_object_cache(
+        self,
+        mock_s3_service: AsyncMock,
+        tmp_path: Path,
+    ) -> None:
+        """Reading the same file twice downloads it once."""
+        csv_content = b"Name,Amount\nAlice,100\n"
+        file_sha = hashlib.sha256(csv_content).hexdigest()
+        mock_s3_service.download.return_value = io.BytesIO(csv_content)
+        service = FileReaderService(
+            s3_service=mock_s3_service,
+            object_cache=S3ObjectCache(tmp_path, max_bytes=1024),
+        )
+
+        first = await service.read_file("test.csv", "csv", file_sha=file_sha)
+        second = await service.read_file("test.csv", "csv", file_sha=file_sha)
+
+        assert first == second
+        assert first[0].data == {"Name": "Alice", "Amount": "100"}
+        mock_s3_service.download.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_read_xlsx_file_returns_rows(
         self,
@@ -0,0 +1,103 @@
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.graphql.pos.field_map.models.field_map import FieldMap
+from app.graphql.pos.organization_alias.models import OrganizationAlias
+from app.graphql.pos.validations.services.file_reader_service import FileRow
+from app.graphql.pos.validations.services.organization_alias_resolution import (
+    OrganizationAliasResolutionStage,
+    OrganizationNameIndex,
+    ResolvedOrganization,
+)
+
+
+class TestOrganizationAliasResolutionStage:
+    @pytest.fixture
+    def acme_id(self) -> uuid.UUID:
+        return uuid.uuid4()
+
+    @pytest.fixture
+    def beta_id(self) -> uuid.UUID:
+        return uuid.uuid4()
+
+    @pytest.fixture
+    def stage(
+        self,
+        acme_id: uuid.UUID,
+        beta_id: uuid.UUID,
+    ) -> OrganizationAliasResolutionStage:
+        alias = MagicMock(spec=OrganizationAlias)
+        alias.alias = "ACME Electric"
+        alias.connected_org_id = acme_id
+        index = OrganizationNameIndex.build(
+            {acme_id: "Acme Corp", beta_id: "Beta Supply"},
+            [alias],
+        )
+        return OrganizationAliasResolutionStage(index)
+
+    @pytest.fixture
+    def field_map(self) -> MagicMock:
+        return MagicMock(spec=FieldMap)
+
+    def test_resolves_alias_case_insensitively(
+        self,
+        stage: OrganizationAliasResolutionStage,
+        field_map: MagicMock,
+        acme_id: uuid.UUID,
+    ) -> None:
+        """Aliases match regardless of case and spacing."""
+        row = FileRow(row_number=2, data={"manufacturer_name": " acme  ELECTRIC "})
+
+        issues = stage.transform(row, field_map)
+
+        assert issues == []
+        assert stage.index.resolve(" acme  ELECTRIC ") == acme_id
+        assert row.data == {"manufacturer_name": " acme  ELECTRIC "}
+        assert list(stage.resolutions.values()) == [
+            ResolvedOrganization("manufacturer_name", "acme electric", acme_id)
+        ]
+
+    def test_resolves_connected_org_name(
+        self,
+        stage: OrganizationAliasResolutionStage,
+        field_map: MagicMock,
+        beta_id: uuid.UUID,
+    ) -> None:
+        """Names of connected orgs resolve without an alias."""
+        row = FileRow(row_number=2, data={"distributor_name": "beta supply"})
+
+        issues = stage.transform(row, field_map)
+
+        assert issues == []
+        assert stage.index.resolve("beta supply") == beta_id
+
+    def test_flags_unresolved_name(
+        self,
+        stage: OrganizationAliasResolutionStage,
+        field_map: MagicMock,
+    ) -> None:
+        """Names matching no connected org or alias are reported."""
+        row = FileRow(row_number=3, data={"manufacturer_name": "Gamma"})
+
+        issues = stage.transform(row, field_map)
+
+        assert len(issues) == 1
+        assert issues[0].validation_key == "unresolved_organization"
+        assert issues[0].column_name == "manufacturer_name"
+        assert issues[0].row_data == {"manufacturer_name": "Gamma"}
+        assert stage.resolutions == {}
+
+    def test_skips_rows_without_name_columns(
+        self,
+        stage: OrganizationAliasResolutionStage,
+        field_map: MagicMock,
+    ) -> None:
+        """Files without name columns are left untouched."""
+        row = FileRow(row_number=2, data={"manufacturer_name": "", "other": "x"})
+
+        issues = stage.transform(row, field_map)
+
+        assert issues == []
+        assert row.data == {"manufacturer_name": "", "other": "x"}
@@ -33,6 +33,17 @@ class TestValidationExecutionService:
     def mock_field_map_repository(self) -> AsyncMock:
         return AsyncMock()
 
+    @pytest.fixture
+    def mock_alias_repository(self) -> AsyncMock:
+        repo = AsyncMock()
+        repo.get_connected_org_names.return_value = {}
+        repo.get_all_by_org.return_value = []
+        return repo
+
+    @pytest.fixture
+    def mock_resolution_repository(self) -> AsyncMock:
+        return AsyncMock()
+
     @pytest.fixture
     def service(
         self,
@@ -40,12 +51,16 @@ class TestValidationExecutionService:
         mock_file_reader_service: AsyncMock,
         mock_validation_issue_repository: AsyncMock,
         mock_field_map_repository: AsyncMock,
+        mock_alias_repository: AsyncMock,
+        mock_resolution_repository: AsyncMock,
     ) -> ValidationExecutionService:
         return ValidationExecutionService(
             exchange_file_repository=mock_exchange_file_repository,
             file_reader_service=mock_file_reader_service,
             validation_issue_repository=mock_validation_issue_repository,
             field_map_repository=mock_field_map_repository,
+            alias_repository=mock_alias_repository,
+            resolution_repository=mock_resolution_repository,
         )
 
     @staticmethod
@@ -88,7 +103,7 @@ class TestValidationExecutionService:
         field_map = self._create_mock_field_map()
 
         mock_exchange_file_repository.get_by_id.return_value = file
-        mock_field_map_repository.get_by_org_and_type.return_value = field_map
+        mock_field_map_repository.get_cached_by_org_and_type.return_value = field_map
         mock_file_reader_service.read_file.return_value = []
 
         statuses_seen: list[str] = []
@@ -119,7 +134,7 @@ class TestValidationExecutionService:
         rows = [FileRow(row_number=2, data={"field": "value"})]
 
         mock_exchange_file_repository.get_by_id.return_value = file
-        mock_field_map_repository.get_by_org_and_type.return_value = field_map
+        mock_field_map_repository.get_cached_by_org_and_type.return_value = field_map
         mock_file_reader_service.read_file.return_value = rows
 
         blocking_issue = ValidationIssue(
@@ -150,7 +165,7 @@ class TestValidationExecutionService:
         field_map = self._create_mock_field_map()
 
         mock_exchange_file_repository.get_by_id.return_value = file
-        mock_field_map_repository.get_by_org_and_type.return_value = field_map
+        mock_field_map_repository.get_cached_by_org_and_type.return_value = field_map
         mock_file_reader_service.read_file.return_value = []
 
         with patch.object(service, "_run_validation", return_value=([], False)):
@@ -172,7 +187,7 @@ class TestValidationExecutionService:
         field_map = self._create_mock_field_map()
 
         mock_exchange_file_repository.get_by_id.return_value = file
-        mock_field_map_repository.get_by_org_and_type.return_value = field_map
+        mock_field_map_repository.get_cached_by_org_and_type.return_value = field_map
         mock_file_reader_service.read_file.return_value = []
 
         issues = [
@@ -203,7 +218,7 @@ class TestValidationExecutionService:
         field_map = self._create_mock_field_map()
 
         mock_exchange_file_repository.get_by_id.return_value = file
-        mock_field_map_repository.get_by_org_and_type.return_value = field_map
+        mock_field_map_repository.get_cached_by_org_and_type.return_value = field_map
         mock_file_reader_service.read_file.return_value = []
 
         await service.validate_file(file.id)
@@ -233,7 +248,7 @@ class TestValidationExecutionService:
         }
 
         mock_exchange_file_repository.get_by_id.return_value = file
-        mock_field_map_repository.get_by_org_and_type.return_value = field_map
+        mock_field_map_repository.get_cached_by_org_and_type.return_value = field_map
         mock_file_reader_service.read_file.return_value = [
             FileRow(row_number=2, data=row_data)
         ]
@@ -268,13 +283,103 @@ class TestValidationExecutionService:
         field_map = self._create_mock_field_map()
 
         mock_exchange_file_repository.get_by_id.return_value = file
-        mock_field_map_repository.get_by_org_and_type.return_value = field_map
+        mock_field_map_repository.get_cached_by_org_and_type.return_value = field_map
         mock_file_reader_service.read_file.return_value = []
 
         with patch.object(service, "_run_validation", return_value=([], False)):
             await service.validate_file(file.id)
 
         # Verify repository was called with explicit SEND direction
-        mock_field_map_repository.get_by_org_and_type.assert_called_with(
+        mock_field_map_repository.get_cached_by_org_and_type.assert_called_with(
             file.org_id, FieldMapType.POS, FieldMapDirection.SEND
         )
+
+    @pytest.mark.asyncio
+    async def test_validation_skips_name_index_without_name_columns(
+        self,
+        service: ValidationExecutionService,
+        mock_exchange_file_repository: AsyncMock,
+        mock_file_reader_service: AsyncMock,
+        mock_field_map_repository: AsyncMock,
+        mock_alias_repository: AsyncMock,
+    ) -> None:
+        """Files mapping no organization name column skip the alias lookups."""
+        file = self._create_mock_file()
+        field_map = self._create_mock_field_map()
+        field_map.fields = [MagicMock(standard_field_key="invoice_date")]
+
+        mock_exchange_file_repository.get_by_id.return_value = file
+        mock_field_map_repository.get_cached_by_org_and_type.return_value = field_map
+        mock_file_reader_service.read_file.return_value = []
+
+        await service.validate_file(file.id)
+
+        mock_alias_repository.get_connected_org_names.assert_not_called()
+        mock_alias_repository.get_all_by_org.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_validation_flags_unresolved_mapped_name_column(
+        self,
+        service: ValidationExecutionService,
+        mock_exchange_file_repository: AsyncMock,
+        mock_file_reader_service: AsyncMock,
+        mock_field_map_repository: AsyncMock,
+        mock_validation_issue_repository: AsyncMock,
+        mock_alias_repository: AsyncMock,
+    ) -> None:
+        """A mapped name column builds the index and flags unknown names."""
+        file = self._create_mock_file()
+        field_map = self._create_mock_field_map()
+        field_map.fields = [MagicMock(standard_field_key="distributor_name")]
+        rows = [FileRow(row_number=2, data={"distributor_name": "Gamma"})]
+
+        mock_exchange_file_repository.get_by_id.return_value = file
+        mock_field_map_repository.get_cached_by_org_and_type.return_value = field_map
+        mock_file_reader_service.read_file.return_value = rows
+
+        await service.validate_file(file.id)
+
+        mock_alias_repository.get_connected_org_names.assert_awaited_once_with(
+            file.org_id
+        )
+        created_issues = mock_validation_issue_repository.create_bulk.call_args[0][0]
+        assert [issue.validation_key for issue in created_issues] == [
+            "unresolved_organization"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_validation_stores_resolved_organizations(
+        self,
+        service: ValidationExecutionService,
+        mock_exchange_file_repository: AsyncMock,
+        mock_file_reader_service: AsyncMock,
+        mock_field_map_repository: AsyncMock,
+        mock_alias_repository: AsyncMock,
+        mock_resolution_repository: AsyncMock,
+    ) -> None:
+        """Each distinct resolved name is stored with the file's connected org."""
+        file = self._create_mock_file()
+        field_map = self._create_mock_field_map()
+        field_map.fields = [MagicMock(standard_field_key="manufacturer_name")]
+        acme_id = uuid.uuid4()
+        rows = [
+            FileRow(row_number=2, data={"manufacturer_name": "Acme Corp"}),
+            FileRow(row_number=3, data={"manufacturer_name": " ACME  corp"}),
+            FileRow(row_number=4, data={"manufacturer_name": "Gamma"}),
+        ]
+
+        mock_exchange_file_repository.get_by_id.return_value = file
+        mock_field_map_repository.get_cached_by_org_and_type.return_value = field_map
+        mock_file_reader_service.read_file.return_value = rows
+        mock_alias_repository.get_connected_org_names.return_value = {
+            acme_id: "Acme Corp"
+        }
+
+        await service.validate_file(file.id)
+
+        mock_resolution_repository.delete_by_file_id.assert_awaited_once_with(file.id)
+        [resolution] = mock_resolution_repository.create_bulk.call_args[0][0]
+        assert resolution.exchange_file_id == file.id
+        assert resolution.column_name == "manufacturer_name"
+        assert resolution.organization_name == "acme corp"
+        assert resolution.connected_org_id == acme_id
@@ -6,6 +6,7 @@ from app.graphql.pos.validations.models.enums import ValidationType
 from app.graphql.pos.validations.services.file_reader_service import FileRow
 from app.graphql.pos.validations.services.validation_pipeline import ValidationPipeline
 from app.graphql.pos.validations.services.validators.base import (
+    BaseRowTransform,
     BaseValidator,
     ValidationIssue,
 )
@@ -37,6 +38,18 @@ class MockWarningValidator(BaseValidator):
         return self.issues
 
 
+class MockTransform(BaseRowTransform):
+    validation_key = "mock_transform"
+    validation_type = ValidationType.VALIDATION_WARNING
+
+    def __init__(self, issues: list[ValidationIssue] | None = None) -> None:
+        self.issues = issues or []
+
+    def transform(self, row: FileRow, field_map: FieldMap) -> list[ValidationIssue]:
+        row.data["transformed"] = True
+        return self.issues
+
+
 def create_field_map() -> MagicMock:
     field_map = MagicMock(spec=FieldMap)
     field_map.id = uuid.uuid4()
@@ -144,3 +157,36 @@ class TestValidationPipeline:
         issues = pipeline.validate_row(row, field_map)
 
         assert len(issues) == 2
+
+    def test_pipeline_runs_transforms_even_with_blocking_errors(self) -> None:
+        """Transforms always run first and their issues are kept."""
+        transform_issue = ValidationIssue(
+            row_number=2,
+            column_name="field",
+            validation_key="mock_transform",
+            message="Unresolved",
+        )
+        blocking_issue = ValidationIssue(
+            row_number=2,
+            column_name="field",
+            validation_key="mock_blocking",
+            message="Error",
+        )
+        transform = MockTransform(issues=[transform_issue])
+
+        pipeline = ValidationPipeline(
+            blocking_validators=[MockBlockingValidator(issues=[blocking_issue])],
+            warning_validators=[],
+            transforms=[transform],
+        )
+
+        row = FileRow(row_number=2, data={"field": "value"})
+        field_map = create_field_map()
+
+        issues = pipeline.validate_row(row, field_map)
+
+        assert row.data["transformed"] is True
+        assert [issue.validation_key for issue in issues] == [
+            "mock_transform",
+            "mock_blocking",
+        ]
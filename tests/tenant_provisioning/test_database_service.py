@@ -1,5 +1,6 @@
 from unittest.mock import AsyncMock, patch
 
+import asyncpg
 import pytest
 
 from app.tenant_provisioning.database_service import DatabaseCreationService
@@ -83,3 +84,54 @@ class TestDatabaseCreationService:
         call_args = mock_conn.execute.call_args[0][0]
         # Should use quoted identifier
         assert '"tenant-with-hyphen"' in call_args
+
+    @pytest.mark.asyncio
+    async def test_create_database_from_template(
+        self,
+        service: DatabaseCreationService,
+    ) -> None:
+        """Copies the template when one is given."""
+        mock_conn = AsyncMock()
+
+        with patch.object(service, "_get_connection", return_value=mock_conn):
+            await service.create_database("new_tenant_db", template="tenant_template")
+
+        call_args = mock_conn.execute.call_args[0][0]
+        assert call_args == 'CREATE DATABASE "new_tenant_db" TEMPLATE "tenant_template"'
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [asyncpg.ObjectInUseError, asyncpg.InvalidCatalogNameError],
+    )
+    async def test_clone_database_returns_false_when_template_unavailable(
+        self,
+        service: DatabaseCreationService,
+        error: type[Exception],
+    ) -> None:
+        """A template being refreshed or missing is reported, not raised."""
+        mock_conn = AsyncMock()
+        mock_conn.execute.side_effect = error("template unavailable")
+
+        with patch.object(service, "_get_connection", return_value=mock_conn):
+            result = await service.clone_database("new_tenant_db", "tenant_template")
+
+        assert result is False
+        mock_conn.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_set_template_connections(
+        self,
+        service: DatabaseCreationService,
+    ) -> None:
+        """Marks the database as a template and toggles connections."""
+        mock_conn = AsyncMock()
+
+        with patch.object(service, "_get_connection", return_value=mock_conn):
+            await service.set_template_connections("tenant_template", allow=False)
+
+        call_args = mock_conn.execute.call_args[0][0]
+        assert call_args == (
+            'ALTER DATABASE "tenant_template" '
+            "WITH IS_TEMPLATE true ALLOW_CONNECTIONS false"
+        )
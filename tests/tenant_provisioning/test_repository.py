@@ -78,6 +78,7 @@ class TestTenantRepository:
     ) -> None:
         """Creates new tenant row with correct fields."""
         mock_tenant = self._create_mock_tenant()
+        mock_session.begin_nested = MagicMock(return_value=AsyncMock())
 
         result = await repository.create(mock_tenant)
 
@@ -135,3 +136,31 @@ class TestTenantRepository:
         result = await repository.get_by_url("nonexistent")
 
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_lock_org_takes_advisory_lock(
+        self,
+        repository: TenantRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Provisioning for an org is serialized with a transaction lock."""
+        await repository.lock_org("org_123")
+
+        stmt = str(mock_session.execute.call_args[0][0])
+        assert "pg_advisory_xact_lock" in stmt
+
+    @pytest.mark.asyncio
+    async def test_get_urls_with_prefix(
+        self,
+        repository: TenantRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Fetches the base url and its suffixed variants in one query."""
+        mock_result = MagicMock(spec=Result)
+        mock_result.scalars.return_value.all.return_value = ["acme", "acme-1"]
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.get_urls_with_prefix("acme")
+
+        assert result == {"acme", "acme-1"}
+        mock_session.execute.assert_called_once()
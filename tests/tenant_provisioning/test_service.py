@@ -4,8 +4,10 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from commons.db.models.tenant import Tenant
+from sqlalchemy.exc import IntegrityError
 
 from app.tenant_provisioning.service import (
+    URL_RESERVE_ATTEMPTS,
     DatabaseServiceProtocol,
     MigrationServiceProtocol,
     ProvisioningStatus,
@@ -68,7 +70,7 @@ class TestTenantProvisioningService:
     ) -> None:
         """Full provisioning flow for new organization."""
         mock_repository.get_by_org_id.return_value = None
-        mock_repository.get_by_url.return_value = None
+        mock_repository.get_urls_with_prefix.return_value = set()
         mock_repository.create.return_value = self._create_mock_tenant()
         mock_database_service.database_exists.return_value = False
         mock_migration_service.run_migrations.return_value = "abc123"
@@ -76,6 +78,7 @@ class TestTenantProvisioningService:
         result = await service.provision(org_id="org_123", org_name="Acme Corp")
 
         assert result.status == ProvisioningStatus.CREATED
+        mock_repository.lock_org.assert_called_once_with("org_123")
         mock_repository.get_by_org_id.assert_called_once_with("org_123")
         mock_repository.create.assert_called_once()
         mock_database_service.create_database.assert_called_once()
@@ -111,7 +114,7 @@ class TestTenantProvisioningService:
     ) -> None:
         """If database exists, skip creation but run migrations."""
         mock_repository.get_by_org_id.return_value = None
-        mock_repository.get_by_url.return_value = None
+        mock_repository.get_urls_with_prefix.return_value = set()
         mock_repository.create.return_value = self._create_mock_tenant()
         mock_database_service.database_exists.return_value = True
         mock_migration_service.run_migrations.return_value = "abc123"
@@ -122,6 +125,147 @@ class TestTenantProvisioningService:
         mock_database_service.create_database.assert_not_called()
         mock_migration_service.run_migrations.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_provision_copies_current_template_without_migrating(
+        self,
+        service: TenantProvisioningService,
+        mock_repository: AsyncMock,
+        mock_database_service: AsyncMock,
+        mock_migration_service: AsyncMock,
+    ) -> None:
+        """A copy of a template at head needs no migrations."""
+        service.template_database = "tenant_template"
+        tenant = self._create_mock_tenant()
+        mock_repository.get_by_org_id.return_value = None
+        mock_repository.get_urls_with_prefix.return_value = set()
+        mock_repository.create.return_value = tenant
+        mock_database_service.database_exists.return_value = False
+        mock_database_service.clone_database.return_value = True
+        mock_migration_service.get_current_revision.return_value = "abc123"
+        mock_migration_service.get_head_revision.return_value = "abc123"
+
+        result = await service.provision(org_id="org_123", org_name="Acme Corp")
+
+        assert result.status == ProvisioningStatus.CREATED
+        mock_database_service.clone_database.assert_called_once_with(
+            "acme-corp", "tenant_template"
+        )
+        mock_database_service.create_database.assert_not_called()
+        mock_migration_service.run_migrations.assert_not_called()
+        mock_repository.update_initialize.assert_called_once_with(
+            tenant.id, initialize=True, alembic_version="abc123"
+        )
+
+    @pytest.mark.asyncio
+    async def test_provision_migrates_copy_of_stale_template(
+        self,
+        service: TenantProvisioningService,
+        mock_repository: AsyncMock,
+        mock_database_service: AsyncMock,
+        mock_migration_service: AsyncMock,
+    ) -> None:
+        """A copy of a template behind head runs the remaining migrations."""
+        service.template_database = "tenant_template"
+        mock_repository.get_by_org_id.return_value = None
+        mock_repository.get_urls_with_prefix.return_value = set()
+        mock_repository.create.return_value = self._create_mock_tenant()
+        mock_database_service.database_exists.return_value = False
+        mock_database_service.clone_database.return_value = True
+        mock_migration_service.get_current_revision.return_value = "old123"
+        mock_migration_service.get_head_revision.return_value = "abc123"
+        mock_migration_service.run_migrations.return_value = "abc123"
+
+        await service.provision(org_id="org_123", org_name="Acme Corp")
+
+        mock_migration_service.run_migrations.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_provision_falls_back_when_template_unavailable(
+        self,
+        service: TenantProvisioningService,
+        mock_repository: AsyncMock,
+        mock_database_service: AsyncMock,
+        mock_migration_service: AsyncMock,
+    ) -> None:
+        """An uncopyable template means an empty database and all migrations."""
+        service.template_database = "tenant_template"
+        mock_repository.get_by_org_id.return_value = None
+        mock_repository.get_urls_with_prefix.return_value = set()
+        mock_repository.create.return_value = self._create_mock_tenant()
+        mock_database_service.database_exists.return_value = False
+        mock_database_service.clone_database.return_value = False
+        mock_migration_service.run_migrations.return_value = "abc123"
+
+        await service.provision(org_id="org_123", org_name="Acme Corp")
+
+        mock_database_service.create_database.assert_called_once_with("acme-corp")
+        mock_migration_service.get_current_revision.assert_not_called()
+        mock_migration_service.run_migrations.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("taken", "expected"),
+        [
+            (set(), "abc-electric"),
+            ({"abc-electric"}, "abc-electric-1"),
+            ({"abc-electric", "abc-electric-1", "abc-electric-2"}, "abc-electric-3"),
+            ({"abc-electric", "abc-electric-2", "abc-electric-co"}, "abc-electric-1"),
+        ],
+    )
+    async def test_unique_url_uses_lowest_free_suffix(
+        self,
+        service: TenantProvisioningService,
+        mock_repository: AsyncMock,
+        taken: set[str],
+        expected: str,
+    ) -> None:
+        """Collisions are resolved from one query, however many there are."""
+        mock_repository.get_urls_with_prefix.return_value = taken
+
+        assert await service._generate_unique_url("ABC Electric") == expected
+        mock_repository.get_urls_with_prefix.assert_called_once_with("abc-electric")
+
+    @pytest.mark.asyncio
+    async def test_provision_retries_url_taken_concurrently(
+        self,
+        service: TenantProvisioningService,
+        mock_repository: AsyncMock,
+        mock_database_service: AsyncMock,
+        mock_migration_service: AsyncMock,
+    ) -> None:
+        """A unique violation on the url picks the next free url."""
+        mock_repository.get_by_org_id.return_value = None
+        mock_repository.get_urls_with_prefix.side_effect = [set(), {"acme-corp"}]
+        mock_repository.create.side_effect = [
+            IntegrityError("INSERT", {}, Exception("duplicate key")),
+            self._create_mock_tenant(url="acme-corp-1"),
+        ]
+        mock_database_service.database_exists.return_value = False
+        mock_migration_service.run_migrations.return_value = "abc123"
+
+        result = await service.provision(org_id="org_123", org_name="Acme Corp")
+
+        assert result.status == ProvisioningStatus.CREATED
+        urls = [call.args[0].url for call in mock_repository.create.call_args_list]
+        assert urls == ["acme-corp", "acme-corp-1"]
+
+    @pytest.mark.asyncio
+    async def test_provision_gives_up_after_repeated_url_conflicts(
+        self,
+        service: TenantProvisioningService,
+        mock_repository: AsyncMock,
+    ) -> None:
+        mock_repository.get_by_org_id.return_value = None
+        mock_repository.get_urls_with_prefix.return_value = set()
+        mock_repository.create.side_effect = IntegrityError(
+            "INSERT", {}, Exception("duplicate key")
+        )
+
+        with pytest.raises(IntegrityError):
+            await service.provision(org_id="org_123", org_name="Acme Corp")
+
+        assert mock_repository.create.call_count == URL_RESERVE_ATTEMPTS
+
 
 class TestGenerateTenantUrl:
     """Tests for the static generate_tenant_url method."""
@@ -0,0 +1,87 @@
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.webhooks.workos.event_store import WebhookEventStore
+
+
+class TestWebhookEventStore:
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        session = AsyncMock()
+        session.__aenter__.return_value = session
+        session.begin = MagicMock(return_value=AsyncMock())
+        return session
+
+    @pytest.fixture
+    def store(self, mock_session: AsyncMock) -> WebhookEventStore:
+        return WebhookEventStore(
+            MagicMock(return_value=mock_session),
+            stale_after=timedelta(minutes=30),
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("returned", "expected"), [("event_1", True), (None, False)]
+    )
+    async def test_save_reports_whether_event_is_new(
+        self,
+        store: WebhookEventStore,
+        mock_session: AsyncMock,
+        returned: str | None,
+        expected: bool,
+    ) -> None:
+        """The insert is skipped on conflict, so no row means a duplicate."""
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = returned
+        mock_session.execute.return_value = result
+
+        assert await store.save("event_1", "organization.created", "{}") is expected
+
+        stmt = str(mock_session.execute.call_args[0][0])
+        assert "ON CONFLICT" in stmt
+
+    @pytest.mark.asyncio
+    async def test_claim_skips_locked_events(
+        self,
+        store: WebhookEventStore,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Claimed rows are returned as stored events."""
+        mock_session.execute.return_value = [
+            SimpleNamespace(event_id="event_1", payload="{}", attempts=2)
+        ]
+
+        events = await store.claim(10)
+
+        assert [(e.event_id, e.attempts) for e in events] == [("event_1", 2)]
+        stmt = mock_session.execute.call_args[0][0].compile(
+            dialect=postgresql.dialect()
+        )
+        assert "FOR UPDATE SKIP LOCKED" in str(stmt)
+
+    @pytest.mark.asyncio
+    async def test_create_table_is_idempotent_under_concurrency(self) -> None:
+        """Table and index DDL is IF NOT EXISTS and runs under an advisory lock."""
+        conn = AsyncMock()
+        engine = MagicMock()
+        engine.begin.return_value.__aenter__.return_value = conn
+
+        await WebhookEventStore.create_table(engine)
+
+        statements = [
+            str(call.args[0].compile(dialect=postgresql.dialect()))
+            for call in conn.execute.call_args_list
+        ]
+        assert "pg_advisory_xact_lock" in statements[0]
+        assert (
+            statements[1]
+            .strip()
+            .startswith("CREATE TABLE IF NOT EXISTS workos_webhook_events")
+        )
+        assert statements[2].startswith(
+            "CREATE INDEX IF NOT EXISTS ix_workos_webhook_events_status"
+        )
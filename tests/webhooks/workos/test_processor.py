@@ -0,0 +1,138 @@
+import asyncio
+import json
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.webhooks.workos.event_store import StoredEvent
+from app.webhooks.workos.processor import MAX_RETRY_DELAY, WebhookEventProcessor
+from app.webhooks.workos.schemas import WorkOSEvent
+
+PAYLOAD = json.dumps(
+    {
+        "id": "event_01ABC123",
+        "event": "organization.created",
+        "created_at": "2026-01-27T14:00:00Z",
+        "data": {
+            "id": "org_01XYZ789",
+            "name": "Acme Corp",
+            "created_at": "2026-01-27T14:00:00Z",
+            "updated_at": "2026-01-27T14:00:00Z",
+        },
+    }
+)
+
+
+class TestWebhookEventProcessor:
+    @pytest.fixture
+    def mock_store(self) -> AsyncMock:
+        mock: Any = AsyncMock()
+        mock.save.return_value = True
+        mock.claim.return_value = []
+        return mock
+
+    @pytest.fixture
+    def mock_provisioning_service(self) -> AsyncMock:
+        mock: Any = AsyncMock()
+        return mock
+
+    @pytest.fixture
+    def processor(
+        self,
+        mock_store: AsyncMock,
+        mock_provisioning_service: AsyncMock,
+    ) -> WebhookEventProcessor:
+        return WebhookEventProcessor(
+            store=mock_store,
+            provisioning_service=mock_provisioning_service,
+            poll_interval_seconds=60.0,
+            max_attempts=3,
+        )
+
+    @pytest.mark.asyncio
+    async def test_enqueue_stores_event(
+        self,
+        processor: WebhookEventProcessor,
+        mock_store: AsyncMock,
+    ) -> None:
+        """New events are stored under their event id."""
+        event = WorkOSEvent.model_validate_json(PAYLOAD)
+
+        assert await processor.enqueue(event, PAYLOAD) is True
+
+        mock_store.save.assert_called_once_with(
+            "event_01ABC123", "organization.created", PAYLOAD
+        )
+
+    @pytest.mark.asyncio
+    async def test_process_pending_provisions_and_marks_done(
+        self,
+        processor: WebhookEventProcessor,
+        mock_store: AsyncMock,
+        mock_provisioning_service: AsyncMock,
+    ) -> None:
+        """Claimed events are handled and marked done."""
+        mock_store.claim.return_value = [StoredEvent("event_01ABC123", PAYLOAD, 1)]
+
+        assert await processor.process_pending() == 1
+
+        mock_provisioning_service.provision.assert_called_once_with(
+            org_id="org_01XYZ789",
+            org_name="Acme Corp",
+        )
+        mock_store.mark_done.assert_called_once_with("event_01ABC123")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("attempts", "retry_in"),
+        [(1, timedelta(seconds=30)), (2, timedelta(seconds=60)), (3, None)],
+    )
+    async def test_failed_event_is_retried_with_backoff(
+        self,
+        processor: WebhookEventProcessor,
+        mock_store: AsyncMock,
+        mock_provisioning_service: AsyncMock,
+        attempts: int,
+        retry_in: timedelta | None,
+    ) -> None:
+        """Failures back off exponentially and stop at max_attempts."""
+        mock_store.claim.return_value = [
+            StoredEvent("event_01ABC123", PAYLOAD, attempts)
+        ]
+        mock_provisioning_service.provision.side_effect = RuntimeError("db down")
+
+        await processor.process_pending()
+
+        mock_store.mark_failed.assert_called_once_with(
+            "event_01ABC123", "db down", retry_in
+        )
+        mock_store.mark_done.assert_not_called()
+
+    def test_retry_delay_is_capped(self, processor: WebhookEventProcessor) -> None:
+        processor.max_attempts = 100
+
+        assert processor._retry_delay(50) == MAX_RETRY_DELAY
+
+    @pytest.mark.asyncio
+    async def test_enqueue_wakes_running_processor(
+        self,
+        processor: WebhookEventProcessor,
+        mock_store: AsyncMock,
+        mock_provisioning_service: AsyncMock,
+    ) -> None:
+        """A stored event is processed without waiting for the next poll."""
+        processor.start()
+        await asyncio.sleep(0)
+
+        mock_store.claim.side_effect = [
+            [StoredEvent("event_01ABC123", PAYLOAD, 1)],
+            [],
+        ]
+        await processor.enqueue(WorkOSEvent.model_validate_json(PAYLOAD), PAYLOAD)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await processor.stop()
+
+        mock_provisioning_service.provision.assert_called_once()
@@ -1,6 +1,6 @@
 import time
 from typing import Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi import FastAPI
@@ -16,20 +16,21 @@ class TestWorkOSWebhookRouter:
         return "whsec_test_secret_key_12345"
 
     @pytest.fixture
-    def mock_provisioning_service(self) -> AsyncMock:
+    def mock_event_processor(self) -> AsyncMock:
         mock: Any = AsyncMock()
+        mock.enqueue.return_value = True
         return mock
 
     @pytest.fixture
     def app(
         self,
         webhook_secret: str,
-        mock_provisioning_service: AsyncMock,
+        mock_event_processor: AsyncMock,
     ) -> FastAPI:
         app = FastAPI()
         router = create_workos_webhook_router(
             webhook_secret,
-            provisioning_service=mock_provisioning_service,
+            event_processor=mock_event_processor,
         )
         app.include_router(router)
         return app
@@ -67,18 +68,14 @@ class TestWorkOSWebhookRouter:
             webhook_secret,
         )
 
-        with patch(
-            "app.webhooks.workos.router.handle_organization_created",
-            new_callable=AsyncMock,
-        ):
-            response = client.post(
-                "/webhooks/workos",
-                content=payload_bytes,
-                headers={
-                    "WorkOS-Signature": signature,
-                    "Content-Type": "application/json",
-                },
-            )
+        response = client.post(
+            "/webhooks/workos",
+            content=payload_bytes,
+            headers={
+                "WorkOS-Signature": signature,
+                "Content-Type": "application/json",
+            },
+        )
 
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
@@ -172,38 +169,58 @@ class TestWorkOSWebhookRouter:
         assert response.status_code == 200
         assert response.json() == {"status": "ok", "message": "Event ignored"}
 
-    def test_webhook_organization_created_triggers_handler(
+    def test_webhook_organization_created_is_enqueued(
         self,
         client: TestClient,
         webhook_secret: str,
         organization_created_payload: dict,
-        mock_provisioning_service: AsyncMock,
+        mock_event_processor: AsyncMock,
     ) -> None:
-        """organization.created event calls the handler."""
+        """organization.created event is stored for background processing."""
         signature, payload_bytes = generate_workos_signature(
             organization_created_payload,
             webhook_secret,
         )
 
-        with patch(
-            "app.webhooks.workos.router.handle_organization_created",
-            new_callable=AsyncMock,
-        ) as mock_handler:
-            response = client.post(
-                "/webhooks/workos",
-                content=payload_bytes,
-                headers={
-                    "WorkOS-Signature": signature,
-                    "Content-Type": "application/json",
-                },
-            )
+        response = client.post(
+            "/webhooks/workos",
+            content=payload_bytes,
+            headers={
+                "WorkOS-Signature": signature,
+                "Content-Type": "application/json",
+            },
+        )
 
         assert response.status_code == 200
-        mock_handler.assert_called_once()
-        call_args = mock_handler.call_args[0]
-        event = call_args[0]
-        provisioning_service = call_args[1]
+        mock_event_processor.enqueue.assert_called_once()
+        event, payload = mock_event_processor.enqueue.call_args[0]
         assert event.event == "organization.created"
         assert event.data.id == "org_01XYZ789"
         assert event.data.name == "Acme Corp"
-        assert provisioning_service is mock_provisioning_service
+        assert payload == payload_bytes.decode()
+
+    def test_webhook_duplicate_event_is_acknowledged(
+        self,
+        client: TestClient,
+        webhook_secret: str,
+        organization_created_payload: dict,
+        mock_event_processor: AsyncMock,
+    ) -> None:
+        """Redelivered events return 200 without being processed again."""
+        mock_event_processor.enqueue.return_value = False
+        signature, payload_bytes = generate_workos_signature(
+            organization_created_payload,
+            webhook_secret,
+        )
+
+        response = client.post(
+            "/webhooks/workos",
+            content=payload_bytes,
+            headers={
+                "WorkOS-Signature": signature,
+                "Content-Type": "application/json",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok", "message": "Duplicate event"}
@@ -6,7 +6,9 @@ webhook to our endpoint, without requiring a running server or actual
 WorkOS integration.
 """
 
+import asyncio
 import uuid
+from datetime import timedelta
 from typing import Any
 from unittest.mock import AsyncMock
 
@@ -18,10 +20,48 @@ from app.tenant_provisioning.service import (
     ProvisioningResult,
     ProvisioningStatus,
 )
+from app.webhooks.workos.event_store import StoredEvent
+from app.webhooks.workos.processor import WebhookEventProcessor
 from app.webhooks.workos.router import create_workos_webhook_router
 from tests.webhooks.workos.conftest import generate_workos_signature
 
 
+class InMemoryEventStore:
+    """Stands in for the database-backed event store."""
+
+    def __init__(self) -> None:
+        self.events: dict[str, StoredEvent] = {}
+        self.done: set[str] = set()
+        self.retries: dict[str, timedelta | None] = {}
+
+    async def save(self, event_id: str, event_type: str, payload: str) -> bool:
+        if event_id in self.events:
+            return False
+        self.events[event_id] = StoredEvent(event_id, payload, attempts=0)
+        return True
+
+    async def claim(self, limit: int) -> list[StoredEvent]:
+        claimed = [
+            event
+            for event in self.events.values()
+            if event.event_id not in self.done and event.event_id not in self.retries
+        ][:limit]
+        for event in claimed:
+            event.attempts += 1
+        return claimed
+
+    async def mark_done(self, event_id: str) -> None:
+        self.done.add(event_id)
+
+    async def mark_failed(
+        self,
+        event_id: str,
+        error: str,
+        retry_in: timedelta | None,
+    ) -> None:
+        self.retries[event_id] = retry_in
+
+
 class TestWebhookIntegration:
     """Simulates the full webhook flow from WorkOS to tenant provisioning."""
 
@@ -38,16 +78,34 @@ class TestWebhookIntegration:
         )
         return mock
 
+    @pytest.fixture
+    def event_store(self) -> InMemoryEventStore:
+        return InMemoryEventStore()
+
+    @pytest.fixture
+    def event_processor(
+        self,
+        event_store: InMemoryEventStore,
+        mock_provisioning_service: AsyncMock,
+    ) -> WebhookEventProcessor:
+        store: Any = event_store
+        return WebhookEventProcessor(
+            store=store,
+            provisioning_service=mock_provisioning_service,
+            poll_interval_seconds=1.0,
+            max_attempts=3,
+        )
+
     @pytest.fixture
     def app(
         self,
         webhook_secret: str,
-        mock_provisioning_service: AsyncMock,
+        event_processor: WebhookEventProcessor,
     ) -> FastAPI:
         app = FastAPI()
         router = create_workos_webhook_router(
             webhook_secret,
-            provisioning_service=mock_provisioning_service,
+            event_processor=event_processor,
         )
         app.include_router(router)
         return app
@@ -60,6 +118,7 @@ class TestWebhookIntegration:
         self,
         client: TestClient,
         webhook_secret: str,
+        event_processor: WebhookEventProcessor,
         mock_provisioning_service: AsyncMock,
     ) -> None:
         """
@@ -67,9 +126,9 @@ class TestWebhookIntegration:
 
         Verifies:
         1. Signature is validated
-        2. Event is parsed correctly
-        3. Provisioning service is called with correct params
-        4. Response is 200 OK
+        2. Response is 200 OK before provisioning starts
+        3. The stored event is processed in the background
+        4. Provisioning service is called with correct params
         """
         payload = {
             "id": "event_integration_test",
@@ -99,6 +158,9 @@ class TestWebhookIntegration:
 
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
+        mock_provisioning_service.provision.assert_not_called()
+
+        assert asyncio.run(event_processor.process_pending()) == 1
 
         # Verify provisioning was called with correct parameters
         mock_provisioning_service.provision.assert_called_once_with(
@@ -147,10 +209,53 @@ class TestWebhookIntegration:
         # Should still return 200 - webhook was processed successfully
         assert response.status_code == 200
 
+    def test_redelivered_event_provisions_once(
+        self,
+        client: TestClient,
+        webhook_secret: str,
+        event_processor: WebhookEventProcessor,
+        mock_provisioning_service: AsyncMock,
+    ) -> None:
+        """WorkOS retries of the same event are deduplicated by event id."""
+        payload = {
+            "id": "event_retry_test",
+            "event": "organization.created",
+            "created_at": "2026-01-27T15:00:00Z",
+            "data": {
+                "id": "org_retry_321",
+                "name": "Retry Corp",
+                "object": "organization",
+                "external_id": None,
+                "domains": [],
+                "created_at": "2026-01-27T15:00:00Z",
+                "updated_at": "2026-01-27T15:00:00Z",
+            },
+        }
+
+        for _ in range(2):
+            signature, payload_bytes = generate_workos_signature(
+                payload, webhook_secret
+            )
+            response = client.post(
+                "/webhooks/workos",
+                content=payload_bytes,
+                headers={
+                    "WorkOS-Signature": signature,
+                    "Content-Type": "application/json",
+                },
+            )
+            assert response.status_code == 200
+
+        asyncio.run(event_processor.process_pending())
+
+        mock_provisioning_service.provision.assert_called_once()
+
     def test_webhook_flow_provisioning_failure_still_returns_200(
         self,
         client: TestClient,
         webhook_secret: str,
+        event_store: InMemoryEventStore,
+        event_processor: WebhookEventProcessor,
         mock_provisioning_service: AsyncMock,
     ) -> None:
         """
@@ -160,9 +265,8 @@ class TestWebhookIntegration:
         We don't want retries for provisioning failures - they should be
         handled internally.
         """
-        mock_provisioning_service.provision.return_value = ProvisioningResult(
-            status=ProvisioningStatus.FAILED,
-            error="Database creation failed",
+        mock_provisioning_service.provision.side_effect = RuntimeError(
+            "Database creation failed"
         )
 
         payload = {
@@ -193,3 +297,7 @@ class TestWebhookIntegration:
 
         # Should return 200 to prevent WorkOS retries
         assert response.status_code == 200
+
+        # The failure is retried by the processor instead
+        asyncio.run(event_processor.process_pending())
+        assert event_store.retries == {"event_failure_test": timedelta(seconds=30)}